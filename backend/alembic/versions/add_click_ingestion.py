@@ -0,0 +1,30 @@
+"""add_click_ingestion
+
+Revision ID: add_click_ingestion
+Revises: add_push_delivery
+Create Date: 2026-10-19 00:00:06.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_click_ingestion'
+down_revision = 'add_push_delivery'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE outbound_clicks ADD COLUMN IF NOT EXISTS client_event_id VARCHAR(64)")
+    # 버퍼 적재 멱등성: 같은 세션의 같은 클라이언트 클릭은 1건만 (ID가 없는 기존/구버전 클릭은 제외)
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_clicks_session_event "
+        "ON outbound_clicks (session_id, client_event_id) "
+        "WHERE session_id IS NOT NULL AND client_event_id IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS uq_clicks_session_event")
+    op.execute("ALTER TABLE outbound_clicks DROP COLUMN IF EXISTS client_event_id")
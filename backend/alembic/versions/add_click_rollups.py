@@ -0,0 +1,95 @@
+"""add_click_rollups
+
+Revision ID: add_click_rollups
+Revises: add_click_ingestion
+Create Date: 2026-10-19 00:00:07.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_click_rollups'
+down_revision = 'add_click_ingestion'
+branch_labels = None
+depends_on = None
+
+_CAMPAIGN_ID_SQL = (
+    "CASE WHEN c.meta->>'campaign_id' ~* "
+    "'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$' "
+    "THEN (c.meta->>'campaign_id')::uuid END"
+)
+
+
+def _create_rollup_table(table_name: str) -> None:
+    op.create_table(table_name,
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('product_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('offer_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('source', sa.String(length=20), nullable=False),
+        sa.Column('campaign_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('pet_species', sa.String(length=10), nullable=True),
+        sa.Column('click_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('converted_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('estimated_commission', sa.Numeric(14, 2), server_default='0', nullable=False),
+        sa.Column('actual_commission', sa.Numeric(14, 2), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    # UPSERT 대상 + 기간 조회용 (NULL 차원도 같은 그룹으로 보도록 NULLS NOT DISTINCT, PostgreSQL 15+)
+    op.execute(
+        f"CREATE UNIQUE INDEX uq_{table_name}_dims ON {table_name} "
+        "(bucket_start, product_id, offer_id, source, campaign_id, pet_species) NULLS NOT DISTINCT"
+    )
+
+
+def _backfill(table_name: str, unit: str) -> None:
+    op.execute(
+        f"""
+        INSERT INTO {table_name} (
+            bucket_start, product_id, offer_id, source, campaign_id, pet_species,
+            click_count, converted_count, estimated_commission, actual_commission
+        )
+        SELECT date_trunc('{unit}', c.clicked_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+               c.product_id, c.offer_id, c.source, {_CAMPAIGN_ID_SQL}, pet.species::text,
+               COUNT(*),
+               COUNT(c.actual_commission),
+               COALESCE(SUM(c.estimated_commission), 0),
+               COALESCE(SUM(c.actual_commission), 0)
+        FROM outbound_clicks c
+        LEFT JOIN pets pet ON pet.id = c.pet_id
+        WHERE c.created_at <= (SELECT watermark FROM analytics_watermarks WHERE name = 'click_rollups')
+        GROUP BY 1, 2, 3, 4, 5, 6
+        """
+    )
+
+
+def upgrade() -> None:
+    op.create_table('analytics_watermarks',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('watermark', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+    _create_rollup_table('click_rollups_hourly')
+    _create_rollup_table('click_rollups_daily')
+
+    # 워터마크 스캔 / 기간 재집계용
+    op.execute("CREATE INDEX IF NOT EXISTS idx_clicks_created_at ON outbound_clicks (created_at)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_clicks_clicked_at ON outbound_clicks (clicked_at)")
+
+    # 기존 클릭으로 롤업 백필 (이후로는 클릭 롤업 워커가 워터마크부터 증분 갱신)
+    op.execute("INSERT INTO analytics_watermarks (name, watermark) VALUES ('click_rollups', now())")
+    _backfill('click_rollups_hourly', 'hour')
+    _backfill('click_rollups_daily', 'day')
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_clicks_clicked_at")
+    op.execute("DROP INDEX IF EXISTS idx_clicks_created_at")
+    op.drop_table('click_rollups_daily')
+    op.drop_table('click_rollups_hourly')
+    op.drop_table('analytics_watermarks')
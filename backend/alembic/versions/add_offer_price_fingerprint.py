@@ -0,0 +1,41 @@
+"""add_offer_price_fingerprint
+
+Revision ID: add_offer_price_fingerprint
+Revises: add_price_rollups
+Create Date: 2026-10-19 00:00:02.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_offer_price_fingerprint'
+down_revision = 'add_price_rollups'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 마지막 관측값 지문 (같으면 스냅샷/요약 갱신 생략)
+    op.execute("ALTER TABLE product_offers ADD COLUMN IF NOT EXISTS price_fingerprint VARCHAR(64)")
+
+    # 최신 스냅샷으로 백필 (PriceService.fingerprint와 같은 형식)
+    op.execute(
+        """
+        UPDATE product_offers o
+        SET price_fingerprint = concat_ws(':',
+            s.final_price, CASE WHEN s.is_sold_out THEN 1 ELSE 0 END,
+            s.listed_price, s.shipping_fee, s.coupon_discount, s.card_discount)
+        FROM (
+            SELECT DISTINCT ON (offer_id) offer_id, final_price, is_sold_out,
+                   listed_price, shipping_fee, coupon_discount, card_discount
+            FROM price_snapshots
+            ORDER BY offer_id, captured_at DESC
+        ) s
+        WHERE s.offer_id = o.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE product_offers DROP COLUMN IF EXISTS price_fingerprint")
@@ -0,0 +1,76 @@
+"""add_price_rollups
+
+Revision ID: add_price_rollups
+Revises: add_price_summary_windows
+Create Date: 2026-10-19 00:00:01.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'add_price_rollups'
+down_revision = 'add_price_summary_windows'
+branch_labels = None
+depends_on = None
+
+
+def _create_rollup_table(table_name: str) -> None:
+    op.create_table(table_name,
+        sa.Column('offer_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('open_price', sa.Integer(), nullable=False),
+        sa.Column('min_price', sa.Integer(), nullable=False),
+        sa.Column('max_price', sa.Integer(), nullable=False),
+        sa.Column('close_price', sa.Integer(), nullable=False),
+        sa.Column('sample_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('open_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('close_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['offer_id'], ['product_offers.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('offer_id', 'bucket_start')
+    )
+    # 보존 기간 정리용
+    op.create_index(f'idx_{table_name}_bucket', table_name, ['bucket_start'])
+
+
+def _backfill(table_name: str, unit: str) -> None:
+    op.execute(
+        f"""
+        INSERT INTO {table_name} (
+            offer_id, bucket_start, open_price, min_price, max_price, close_price,
+            sample_count, open_at, close_at
+        )
+        SELECT offer_id,
+               date_trunc('{unit}', captured_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+               (ARRAY_AGG(final_price ORDER BY captured_at ASC))[1],
+               MIN(final_price),
+               MAX(final_price),
+               (ARRAY_AGG(final_price ORDER BY captured_at DESC))[1],
+               COUNT(*),
+               MIN(captured_at),
+               MAX(captured_at)
+        FROM price_snapshots
+        GROUP BY offer_id, date_trunc('{unit}', captured_at AT TIME ZONE 'UTC')
+        """
+    )
+
+
+def upgrade() -> None:
+    _create_rollup_table('price_rollups_hourly')
+    _create_rollup_table('price_rollups_daily')
+
+    # 기존 원본 스냅샷으로 롤업 백필 (이후로는 수집 시 증분 갱신)
+    _backfill('price_rollups_hourly', 'hour')
+    _backfill('price_rollups_daily', 'day')
+
+    # 원본 스냅샷 보존 기간 정리용
+    op.execute("CREATE INDEX IF NOT EXISTS idx_price_snapshots_captured_at ON price_snapshots (captured_at)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_price_snapshots_captured_at")
+    op.drop_index('idx_price_rollups_daily_bucket', table_name='price_rollups_daily')
+    op.drop_table('price_rollups_daily')
+    op.drop_index('idx_price_rollups_hourly_bucket', table_name='price_rollups_hourly')
+    op.drop_table('price_rollups_hourly')
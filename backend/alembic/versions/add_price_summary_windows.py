@@ -0,0 +1,121 @@
+"""add_price_summary_windows
+
+Revision ID: add_price_summary_windows
+Revises: add_mission_progress
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_price_summary_windows'
+down_revision = 'add_mission_progress'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 오퍼당 1행 → (오퍼, 윈도우)당 1행 (7/30/90일)
+    op.execute("ALTER TABLE price_summaries DROP CONSTRAINT IF EXISTS price_summaries_pkey")
+    op.execute("ALTER TABLE price_summaries ADD PRIMARY KEY (offer_id, window_days)")
+
+    # 증분 계산용 상태 컬럼
+    op.execute("ALTER TABLE price_summaries ADD COLUMN IF NOT EXISTS sum_final_price BIGINT NOT NULL DEFAULT 0")
+    op.execute("ALTER TABLE price_summaries ADD COLUMN IF NOT EXISTS sample_count INTEGER NOT NULL DEFAULT 0")
+    op.execute("ALTER TABLE price_summaries ADD COLUMN IF NOT EXISTS buckets JSONB NOT NULL DEFAULT '{}'::jsonb")
+
+    # 기존 스냅샷으로 윈도우별 일 버킷 백필 (이후로는 수집 시 증분 갱신)
+    # PriceService._apply_observation과 같은 규칙:
+    # - 첫 관측일(또는 윈도우 시작일)부터 오늘까지 매일 버킷을 만들고,
+    #   그날 0시에 유지되던 가격(전날까지 마지막 관측값)을 1건으로 넣은 뒤 그날 관측값을 더함
+    # - 평균은 일 버킷 평균의 평균
+    op.execute(
+        """
+        WITH windows(days) AS (VALUES (7), (30), (90)),
+        observed AS (
+            SELECT offer_id,
+                   (captured_at AT TIME ZONE 'UTC')::date AS day,
+                   SUM(final_price) AS day_sum,
+                   COUNT(*) AS day_count,
+                   MIN(final_price) AS day_min,
+                   MAX(final_price) AS day_max,
+                   (array_agg(final_price ORDER BY captured_at DESC))[1] AS day_close
+            FROM price_snapshots
+            GROUP BY offer_id, (captured_at AT TIME ZONE 'UTC')::date
+        ),
+        calendar AS (
+            SELECT f.offer_id, w.days, g.day::date AS day
+            FROM (SELECT offer_id, MIN(day) AS first_day FROM observed GROUP BY offer_id) f
+            CROSS JOIN windows w
+            CROSS JOIN LATERAL generate_series(
+                GREATEST(f.first_day, (NOW() AT TIME ZONE 'UTC')::date - w.days + 1),
+                (NOW() AT TIME ZONE 'UTC')::date,
+                interval '1 day'
+            ) AS g(day)
+        ),
+        daily AS (
+            SELECT c.offer_id,
+                   c.days,
+                   c.day,
+                   COALESCE(o.day_sum, 0) + COALESCE(held.price, 0) AS day_sum,
+                   COALESCE(o.day_count, 0) + (held.price IS NOT NULL)::int AS day_count,
+                   LEAST(o.day_min, held.price) AS day_min,
+                   GREATEST(o.day_max, held.price) AS day_max
+            FROM calendar c
+            LEFT JOIN observed o ON o.offer_id = c.offer_id AND o.day = c.day
+            LEFT JOIN LATERAL (
+                SELECT prev.day_close AS price
+                FROM observed prev
+                WHERE prev.offer_id = c.offer_id AND prev.day < c.day
+                ORDER BY prev.day DESC
+                LIMIT 1
+            ) held ON true
+        ),
+        latest AS (
+            SELECT DISTINCT ON (offer_id) offer_id, final_price, captured_at
+            FROM price_snapshots
+            ORDER BY offer_id, captured_at DESC
+        )
+        INSERT INTO price_summaries (
+            offer_id, window_days, avg_final_price, min_final_price, max_final_price,
+            last_final_price, last_captured_at, sum_final_price, sample_count, buckets, updated_at
+        )
+        SELECT d.offer_id,
+               d.days,
+               ROUND(AVG(d.day_sum::numeric / d.day_count))::int,
+               MIN(d.day_min),
+               MAX(d.day_max),
+               latest.final_price,
+               latest.captured_at,
+               SUM(d.day_sum),
+               SUM(d.day_count),
+               jsonb_object_agg(
+                   to_char(d.day, 'YYYY-MM-DD'),
+                   jsonb_build_array(d.day_sum, d.day_count, d.day_min, d.day_max)
+               ),
+               NOW()
+        FROM daily d
+        JOIN latest ON latest.offer_id = d.offer_id
+        GROUP BY d.offer_id, d.days, latest.final_price, latest.captured_at
+        ON CONFLICT (offer_id, window_days) DO UPDATE SET
+            avg_final_price = EXCLUDED.avg_final_price,
+            min_final_price = EXCLUDED.min_final_price,
+            max_final_price = EXCLUDED.max_final_price,
+            last_final_price = EXCLUDED.last_final_price,
+            last_captured_at = EXCLUDED.last_captured_at,
+            sum_final_price = EXCLUDED.sum_final_price,
+            sample_count = EXCLUDED.sample_count,
+            buckets = EXCLUDED.buckets,
+            updated_at = NOW()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM price_summaries WHERE window_days <> 30")
+    op.execute("ALTER TABLE price_summaries DROP COLUMN IF EXISTS buckets")
+    op.execute("ALTER TABLE price_summaries DROP COLUMN IF EXISTS sample_count")
+    op.execute("ALTER TABLE price_summaries DROP COLUMN IF EXISTS sum_final_price")
+    op.execute("ALTER TABLE price_summaries DROP CONSTRAINT IF EXISTS price_summaries_pkey")
+    op.execute("ALTER TABLE price_summaries ADD PRIMARY KEY (offer_id)")
@@ -0,0 +1,26 @@
+"""add_product_keyset_indexes
+
+Revision ID: add_product_keyset_indexes
+Revises: add_offer_price_fingerprint
+Create Date: 2026-10-19 00:00:03.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_product_keyset_indexes'
+down_revision = 'add_offer_price_fingerprint'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 키셋 커서 조건 (created_at, id) < (:c, :id) / (brand_name, product_name, id) > (...) 용
+    op.execute("CREATE INDEX IF NOT EXISTS idx_products_created_id ON products (created_at, id)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_products_brand_name_id ON products (brand_name, product_name, id)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_products_brand_name_id")
+    op.execute("DROP INDEX IF EXISTS idx_products_created_id")
@@ -0,0 +1,55 @@
+"""add_product_search
+
+Revision ID: add_product_search
+Revises: add_product_keyset_indexes
+Create Date: 2026-10-19 00:00:04.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_product_search'
+down_revision = 'add_product_keyset_indexes'
+branch_labels = None
+depends_on = None
+
+# app/models/product.py의 _SEARCH_SOURCE_SQL과 동일해야 함
+SEARCH_SOURCE_SQL = (
+    "regexp_replace(regexp_replace(lower(normalize("
+    "coalesce(brand_name, '') || ' ' || coalesce(product_name, '') || ' ' || coalesce(size_label, ''), NFKC)), "
+    "'(킬로그램|킬로|키로)', 'kg', 'g'), '[^0-9A-Za-z가-힣.]+', ' ', 'g')"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # 생성 컬럼: 상품 INSERT/UPDATE 시 DB가 계산 (애플리케이션 쓰기 경로 변경 불필요)
+    op.execute(
+        f"""
+        ALTER TABLE products
+        ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS (to_tsvector('simple'::regconfig, {SEARCH_SOURCE_SQL})) STORED
+        """
+    )
+    op.execute(
+        f"""
+        ALTER TABLE products
+        ADD COLUMN IF NOT EXISTS search_compact text
+            GENERATED ALWAYS AS (replace({SEARCH_SOURCE_SQL}, ' ', '')) STORED
+        """
+    )
+
+    op.execute("CREATE INDEX IF NOT EXISTS idx_products_search_vector ON products USING gin (search_vector)")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_products_search_compact_trgm "
+        "ON products USING gin (search_compact gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_products_search_compact_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_products_search_vector")
+    op.execute("ALTER TABLE products DROP COLUMN IF EXISTS search_compact")
+    op.execute("ALTER TABLE products DROP COLUMN IF EXISTS search_vector")
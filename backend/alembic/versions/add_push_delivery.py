@@ -0,0 +1,59 @@
+"""add_push_delivery
+
+Revision ID: add_push_delivery
+Revises: add_product_search
+Create Date: 2026-10-19 00:00:05.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_push_delivery'
+down_revision = 'add_product_search'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 새 enum 값은 같은 트랜잭션에서 쓸 수 없으므로 별도 커밋
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE alerteventstatus ADD VALUE IF NOT EXISTS 'PENDING' BEFORE 'SENT'")
+
+    op.execute("ALTER TABLE alert_events ADD COLUMN IF NOT EXISTS delivery_attempts SMALLINT NOT NULL DEFAULT 0")
+    op.execute("ALTER TABLE alert_events ADD COLUMN IF NOT EXISTS delivery_error TEXT")
+    # 발송 대기 건 복구 조회용 (대부분 SENT이므로 부분 인덱스)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_alert_events_pending ON alert_events (sent_at) "
+        "WHERE status = 'PENDING'"
+    )
+
+    op.create_table(
+        'push_tokens',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('provider', sa.Enum('FCM', 'APNS', name='pushprovider'), nullable=False),
+        sa.Column('token', sa.String(length=512), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true')),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('deactivated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('token'),
+    )
+    op.create_index('idx_push_tokens_user_active', 'push_tokens', ['user_id', 'is_active'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_push_tokens_user_active', table_name='push_tokens')
+    op.drop_table('push_tokens')
+    op.execute("DROP TYPE IF EXISTS pushprovider")
+    op.execute("DROP INDEX IF EXISTS idx_alert_events_pending")
+    op.execute("ALTER TABLE alert_events DROP COLUMN IF EXISTS delivery_error")
+    op.execute("ALTER TABLE alert_events DROP COLUMN IF EXISTS delivery_attempts")
+    # enum 값 PENDING은 PostgreSQL에서 제거할 수 없으므로 남겨 둠 (남은 대기 건만 정리)
+    op.execute("UPDATE alert_events SET status = 'SENT' WHERE status = 'PENDING'")
@@ -0,0 +1,63 @@
+"""fix_product_search_charset
+
+Revision ID: fix_product_search_charset
+Revises: add_click_rollups
+Create Date: 2026-10-19 00:00:08.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'fix_product_search_charset'
+down_revision = 'add_click_rollups'
+branch_labels = None
+depends_on = None
+
+# app/models/product.py의 _SEARCH_SOURCE_SQL과 동일해야 함
+# [:alnum:]은 C/POSIX 콜레이션 DB에서 한글을 문자로 보지 않으므로 명시적 문자 집합 사용
+SEARCH_SOURCE_SQL = (
+    "regexp_replace(regexp_replace(lower(normalize("
+    "coalesce(brand_name, '') || ' ' || coalesce(product_name, '') || ' ' || coalesce(size_label, ''), NFKC)), "
+    "'(킬로그램|킬로|키로)', 'kg', 'g'), '[^0-9A-Za-z가-힣.]+', ' ', 'g')"
+)
+
+PREVIOUS_SEARCH_SOURCE_SQL = (
+    "regexp_replace(regexp_replace(lower(normalize("
+    "coalesce(brand_name, '') || ' ' || coalesce(product_name, '') || ' ' || coalesce(size_label, ''), NFKC)), "
+    "'(킬로그램|킬로|키로)', 'kg', 'g'), '[^[:alnum:].]+', ' ', 'g')"
+)
+
+
+def _recreate_search_columns(source_sql: str) -> None:
+    # 생성 컬럼의 식은 변경할 수 없으므로 다시 만듦 (컬럼 삭제 시 인덱스도 함께 삭제됨)
+    op.execute("ALTER TABLE products DROP COLUMN IF EXISTS search_compact")
+    op.execute("ALTER TABLE products DROP COLUMN IF EXISTS search_vector")
+    op.execute(
+        f"""
+        ALTER TABLE products
+        ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (to_tsvector('simple'::regconfig, {source_sql})) STORED
+        """
+    )
+    op.execute(
+        f"""
+        ALTER TABLE products
+        ADD COLUMN search_compact text
+            GENERATED ALWAYS AS (replace({source_sql}, ' ', '')) STORED
+        """
+    )
+    op.execute("CREATE INDEX idx_products_search_vector ON products USING gin (search_vector)")
+    op.execute(
+        "CREATE INDEX idx_products_search_compact_trgm "
+        "ON products USING gin (search_compact gin_trgm_ops)"
+    )
+
+
+def upgrade() -> None:
+    # add_product_search를 수정 전 식으로 이미 적용한 DB 재계산 (새 DB는 같은 식으로 다시 만들어질 뿐)
+    _recreate_search_columns(SEARCH_SOURCE_SQL)
+
+
+def downgrade() -> None:
+    _recreate_search_columns(PREVIOUS_SEARCH_SOURCE_SQL)
@@ -5,8 +5,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 import logging
 from pydantic import BaseModel
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
+from app.core.pagination import InvalidCursorError
 from app.db.session import get_db
 from app.schemas.product import ProductRead, ProductCreate, ProductUpdate
 from app.schemas.admin import (
@@ -15,7 +16,12 @@ from app.schemas.admin import (
     AllergenCodeRead, ProductAllergenRead, ProductAllergenCreate, ProductAllergenUpdate,
     ClaimCodeRead, ProductClaimRead, ProductClaimCreate, ProductClaimUpdate,
     ProductListRead, ProductListResponse, ProductImagesUpdate,
-    OfferRead, OfferCreate, OfferUpdate
+    OfferRead, OfferCreate, OfferUpdate,
+    PriceIngestRequest, PriceIngestResponse
+)
+from app.schemas.analytics import (
+    ClickTimeseriesResponse, ClickBreakdownResponse, ClickRollupStatus,
+    ClickRollupRebuildRequest, ClickRollupRebuildResponse
 )
 from app.schemas.campaign import (
     CampaignRead, CampaignCreate, CampaignUpdate,
@@ -25,6 +31,7 @@ from app.schemas.campaign import (
 from app.services.product_service import ProductService
 from app.services.admin_service import AdminService
 from app.services.campaign_service import CampaignService
+from app.services.click_analytics_service import ClickAnalyticsService
 from app.services.ingredient_ai_service import analyze_ingredients_with_ai
 
 logger = logging.getLogger(__name__)
@@ -40,13 +47,15 @@ async def get_all_products(
     has_image: Optional[str] = Query(None, description="이미지 여부 (YES/NO/ALL)"),
     has_offers: Optional[str] = Query(None, description="판매처 여부 (YES/NO/ALL)"),
     sort: str = Query("UPDATED_DESC", description="정렬 (UPDATED_DESC/BRAND_ASC/INCOMPLETE_FIRST)"),
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    page: int = Query(1, ge=1, description="페이지 번호 (cursor가 없을 때만 사용)"),
     size: int = Query(30, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (키셋 페이지네이션)"),
+    include_total: bool = Query(True, description="전체 개수 포함 여부 (무한 스크롤이면 false)"),
     db: AsyncSession = Depends(get_db)
 ):
     """상품 목록 조회 (필터링/정렬/페이지네이션)"""
     try:
-        products, total = await ProductService.get_products_with_filters(
+        products, total, next_cursor = await ProductService.get_products_with_filters(
             db=db,
             query=query,
             species=species,
@@ -56,7 +65,9 @@ async def get_all_products(
             has_offers=has_offers,
             sort=sort,
             page=page,
-            size=size
+            size=size,
+            cursor=cursor,
+            include_total=include_total
         )
         
         # Computed fields 계산
@@ -103,7 +114,9 @@ async def get_all_products(
                 # 개별 상품 처리 실패 시 스킵하고 계속 진행
                 continue
         
-        return ProductListResponse(items=items, total=total, page=page, size=size)
+        return ProductListResponse(items=items, total=total, page=page, size=size, next_cursor=next_cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error in get_all_products: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -245,6 +258,74 @@ async def delete_offer(
     return None
 
 
+# ========== 가격 대량 적재 ==========
+@router.post("/prices/ingest", response_model=PriceIngestResponse)
+async def ingest_prices(
+    request: PriceIngestRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    가격 관측값 대량 적재 (외부 수집기/백필용)
+
+    PRICE_INGEST_BATCH_SIZE 단위로 나눠 배치마다
+    스냅샷 COPY + 오퍼/요약/롤업 집합 UPSERT를 한 트랜잭션으로 커밋하고 가격 이벤트 발행.
+    존재하지 않는 오퍼의 관측값은 건너뜀.
+    """
+    import time
+    from sqlalchemy import select
+    from app.core.config import settings
+    from app.models.offer import ProductOffer
+    from app.services.price_service import PriceService
+    from app.services.price_event_stream import PriceEventStream
+    from app.services.hot_deal_index import HotDealIndex
+
+    start_time = time.time()
+    requested_ids = list({obs.offer_id for obs in request.observations})
+    result = await db.execute(select(ProductOffer.id).where(ProductOffer.id.in_(requested_ids)))
+    known_ids = set(result.scalars().all())
+
+    observations = []
+    for obs in request.observations:
+        if obs.offer_id not in known_ids:
+            continue
+        row = obs.model_dump()
+        if row["listed_price"] is None:
+            row["listed_price"] = row["final_price"]
+        if row["captured_at"].tzinfo is None:
+            row["captured_at"] = row["captured_at"].replace(tzinfo=timezone.utc)
+        observations.append(row)
+
+    batch_size = settings.PRICE_INGEST_BATCH_SIZE
+    batches = 0
+    for start in range(0, len(observations), batch_size):
+        try:
+            events = await PriceService.ingest_observations(db, observations[start:start + batch_size])
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"[AdminAPI] ❌ 가격 적재 실패 (batch={batches}): {e}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"가격 적재 실패: 앞선 {start}건까지 커밋됨"
+            )
+        changed_product_ids = list({event["product_id"] for event in events})
+        await PriceEventStream.publish(events)
+        await HotDealIndex.refresh_products(db, changed_product_ids)
+        await ProductService.refresh_detail_read_models(db, changed_product_ids)
+        batches += 1
+
+    duration_ms = int((time.time() - start_time) * 1000)
+    logger.info(
+        f"[AdminAPI] ✅ 가격 적재 완료: {len(observations)}건, 배치={batches}, 소요시간={duration_ms}ms"
+    )
+    return PriceIngestResponse(
+        ingested=len(observations),
+        skipped_unknown_offers=len(request.observations) - len(observations),
+        batches=batches,
+        duration_ms=duration_ms
+    )
+
+
 # ========== 성분 정보 ==========
 @router.get("/products/{product_id}/ingredient", response_model=IngredientProfileRead | None)
 async def get_ingredient_profile(
@@ -956,3 +1037,88 @@ async def get_impressions(
         })
     
     return result
+
+
+# ========== 캐시 모니터링 ==========
+@router.get("/cache/metrics")
+async def get_cache_metrics():
+    """캐시 네임스페이스별 히트/미스/지연/크기 + Redis 서킷/풀 상태"""
+    from app.core.cache.cache_metrics import CacheMetrics
+    return CacheMetrics.snapshot()
+
+
+# ========== 클릭/커미션 분석 (롤업 조회) ==========
+def _analytics_range(start: Optional[datetime], end: Optional[datetime]) -> tuple:
+    """기본 기간: 최근 7일 (타임존 없는 값은 UTC로 간주)"""
+    end = end or datetime.now(timezone.utc)
+    start = start or end - timedelta(days=7)
+    return (
+        start if start.tzinfo else start.replace(tzinfo=timezone.utc),
+        end if end.tzinfo else end.replace(tzinfo=timezone.utc),
+    )
+
+
+@router.get("/analytics/clicks/timeseries", response_model=ClickTimeseriesResponse)
+async def get_click_timeseries(
+    start: Optional[datetime] = Query(None, description="시작 (버킷 시작 시각 기준, 기본 end - 7일)"),
+    end: Optional[datetime] = Query(None, description="끝 (미포함, 기본 현재)"),
+    granularity: str = Query("day", description="버킷 단위 (hour/day)"),
+    group_by: Optional[str] = Query(None, description="차원별 분리 (product/offer/source/campaign/species)"),
+    product_id: Optional[UUID] = Query(None),
+    offer_id: Optional[UUID] = Query(None),
+    source: Optional[str] = Query(None, description="유입 경로 (HOME/DETAIL/ALERT)"),
+    campaign_id: Optional[UUID] = Query(None),
+    species: Optional[str] = Query(None, description="펫 종 (DOG/CAT)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """클릭/커미션 시계열 (시간/일 롤업)"""
+    start, end = _analytics_range(start, end)
+    filters = {
+        "product": product_id, "offer": offer_id, "source": source,
+        "campaign": campaign_id, "species": species,
+    }
+    try:
+        return await ClickAnalyticsService.get_timeseries(db, start, end, granularity, group_by, filters)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/analytics/clicks/breakdown", response_model=ClickBreakdownResponse)
+async def get_click_breakdown(
+    dimension: str = Query("product", description="집계 차원 (product/offer/source/campaign/species)"),
+    start: Optional[datetime] = Query(None, description="시작 (버킷 시작 시각 기준, 기본 end - 7일)"),
+    end: Optional[datetime] = Query(None, description="끝 (미포함, 기본 현재)"),
+    order_by: str = Query("actual_commission", description="정렬 (actual_commission/estimated_commission/clicks)"),
+    limit: int = Query(20, ge=1, le=200),
+    source: Optional[str] = Query(None, description="유입 경로 (HOME/DETAIL/ALERT)"),
+    campaign_id: Optional[UUID] = Query(None),
+    species: Optional[str] = Query(None, description="펫 종 (DOG/CAT)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """차원별 상위 N개 클릭/커미션 + 기간 전체 합계"""
+    start, end = _analytics_range(start, end)
+    filters = {"source": source, "campaign": campaign_id, "species": species}
+    try:
+        return await ClickAnalyticsService.get_breakdown(db, start, end, dimension, order_by, limit, filters)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/analytics/clicks/status", response_model=ClickRollupStatus)
+async def get_click_rollup_status(db: AsyncSession = Depends(get_db)):
+    """롤업 워터마크 / 지연 확인"""
+    return await ClickAnalyticsService.get_status(db)
+
+
+@router.post("/analytics/clicks/rebuild", response_model=ClickRollupRebuildResponse)
+async def rebuild_click_rollups(
+    request: ClickRollupRebuildRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """기간 롤업 재집계 (커미션 정산 반영 등 원본 클릭이 수정된 경우)"""
+    try:
+        counts = await ClickAnalyticsService.rebuild(db, request.start_date, request.end_date)
+        await db.commit()
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return ClickRollupRebuildResponse(start_date=request.start_date, end_date=request.end_date, **counts)
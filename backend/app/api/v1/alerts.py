@@ -1,11 +1,14 @@
 """알림 API 라우터 - 라우팅만 담당"""
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 from uuid import UUID
 
+from app.core.pagination import InvalidCursorError
 from app.db.session import get_db
-from app.schemas.alert import AlertCreate, AlertRead
+from app.schemas.alert import AlertCreate, AlertRead, NotificationInboxResponse, UnreadCountResponse
 from app.services.alert_service import AlertService
+from app.services.notification_inbox_service import NotificationInboxService
 
 router = APIRouter()
 
@@ -32,6 +35,59 @@ async def create_alert(
     return AlertRead.model_validate(alert)
 
 
+@router.get("/inbox", response_model=NotificationInboxResponse)
+async def get_inbox(
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(20, ge=1, le=50, description="조회할 알림 수"),
+    db: AsyncSession = Depends(get_db),
+    # TODO: 실제 인증 구현 후 user: User = Depends(get_current_user)
+):
+    """알림함 조회 (최신순, 커서 페이지네이션)"""
+    # TODO: 실제 user_id 기반 필터링 구현
+    mock_user_id = UUID("00000000-0000-0000-0000-000000000000")
+    try:
+        return await NotificationInboxService.get_page(db, mock_user_id, cursor=cursor, limit=limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/inbox/unread-count", response_model=UnreadCountResponse)
+async def get_unread_count(
+    db: AsyncSession = Depends(get_db),
+    # TODO: 실제 인증 구현 후 user: User = Depends(get_current_user)
+):
+    """안 읽은 알림 수 (앱 배지)"""
+    # TODO: 실제 user_id 기반 필터링 구현
+    mock_user_id = UUID("00000000-0000-0000-0000-000000000000")
+    unread_count = await NotificationInboxService.get_unread_count(db, mock_user_id)
+    return UnreadCountResponse(unread_count=unread_count)
+
+
+@router.post("/inbox/read-all", status_code=status.HTTP_204_NO_CONTENT)
+async def mark_inbox_all_read(
+    db: AsyncSession = Depends(get_db),
+    # TODO: 실제 인증 구현 후 user: User = Depends(get_current_user)
+):
+    """알림함 전체 읽음 처리"""
+    # TODO: 실제 user_id 기반 필터링 구현
+    mock_user_id = UUID("00000000-0000-0000-0000-000000000000")
+    await NotificationInboxService.mark_all_read(db, mock_user_id)
+    return None
+
+
+@router.patch("/inbox/{event_id}/read", status_code=status.HTTP_204_NO_CONTENT)
+async def mark_notification_read(
+    event_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    # TODO: 실제 인증 구현 후 user: User = Depends(get_current_user)
+):
+    """알림함 항목 읽음 처리"""
+    # TODO: 실제 user_id 기반 필터링 구현
+    mock_user_id = UUID("00000000-0000-0000-0000-000000000000")
+    await NotificationInboxService.mark_read(db, mock_user_id, [event_id])
+    return None
+
+
 @router.get("/{alert_id}", response_model=AlertRead)
 async def get_alert(
     alert_id: UUID,
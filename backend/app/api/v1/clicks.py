@@ -16,7 +16,7 @@ async def create_click(
     db: AsyncSession = Depends(get_db),
     # TODO: 실제 인증 구현 후 user: User = Depends(get_current_user)
 ):
-    """클릭 이벤트 생성"""
+    """클릭 이벤트 생성 (클릭 스트림에 넣고 바로 응답, DB 적재는 클릭 적재 워커가 배치로)"""
     # TODO: 실제 user_id 설정 구현
     mock_user_id = UUID("00000000-0000-0000-0000-000000000000")
     click = await ClickService.create_click(mock_user_id, click_data, db)
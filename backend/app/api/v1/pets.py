@@ -61,57 +61,9 @@ async def get_pets(
             detail=f"펫 조회 중 오류가 발생했습니다: {str(e)}"
         )
     
-    # 각 펫에 대해 PetSummaryResponse 생성
-    result = []
+    # 각 펫에 대해 PetSummaryResponse 생성 (부가 정보는 전체 펫 대상 IN 조회)
     try:
-        for pet in pets:
-            try:
-                # Health concerns 조회
-                health_result = await db.execute(
-                    select(PetHealthConcern.concern_code).where(
-                        PetHealthConcern.pet_id == pet.id
-                    )
-                )
-                health_concerns = [row[0] for row in health_result.all()]
-                
-                # Food allergies 조회
-                food_result = await db.execute(
-                    select(PetFoodAllergy.allergen_code).where(
-                        PetFoodAllergy.pet_id == pet.id
-                    )
-                )
-                food_allergies = [row[0] for row in food_result.all()]
-                
-                # Other allergies 조회
-                other_result = await db.execute(
-                    select(PetOtherAllergy.other_text).where(
-                        PetOtherAllergy.pet_id == pet.id
-                    )
-                )
-                other_allergy_row = other_result.first()
-                other_allergies = other_allergy_row[0] if other_allergy_row else None
-                
-                result.append(PetSummaryResponse(
-                    id=pet.id,
-                    name=pet.name or '',
-                    species=pet.species.value if pet.species else '',
-                    age_stage=pet.age_stage.value if pet.age_stage else None,
-                    approx_age_months=pet.approx_age_months,
-                    weight_kg=float(pet.weight_kg) if pet.weight_kg is not None else 0.0,
-                    health_concerns=health_concerns,
-                    photo_url=pet.photo_url,
-                    breed_code=pet.breed_code,
-                    is_neutered=pet.is_neutered,
-                    sex=pet.sex.value if pet.sex else None,
-                    food_allergies=food_allergies,
-                    other_allergies=other_allergies,
-                    is_primary=pet.is_primary,
-                ))
-            except Exception as e:
-                logger.error(f"[Pets API] 펫 {pet.id} 처리 중 오류: {str(e)}", exc_info=True)
-                # 개별 펫 처리 실패해도 계속 진행
-                continue
-        
+        result = await PetService.build_pet_summaries(pets, db)
         logger.info(f"[Pets API] 총 {len(result)}개 펫 반환")
         return result
     except Exception as e:
@@ -172,47 +124,8 @@ async def get_primary_pet(
             detail="Primary pet not found"
         )
     
-    # Health concerns 조회
-    health_result = await db.execute(
-        select(PetHealthConcern.concern_code).where(
-            PetHealthConcern.pet_id == pet.id
-        )
-    )
-    health_concerns = [row[0] for row in health_result.all()]
-    
-    # Food allergies 조회
-    food_result = await db.execute(
-        select(PetFoodAllergy.allergen_code).where(
-            PetFoodAllergy.pet_id == pet.id
-        )
-    )
-    food_allergies = [row[0] for row in food_result.all()]
-    
-    # Other allergies 조회
-    other_result = await db.execute(
-        select(PetOtherAllergy.other_text).where(
-            PetOtherAllergy.pet_id == pet.id
-        )
-    )
-    other_allergy_row = other_result.first()
-    other_allergies = other_allergy_row[0] if other_allergy_row else None
-    
-    return PetSummaryResponse(
-        id=pet.id,
-        name=pet.name or '',
-        species=pet.species.value if pet.species else '',
-        age_stage=pet.age_stage.value if pet.age_stage else None,
-        approx_age_months=pet.approx_age_months,
-        weight_kg=float(pet.weight_kg),
-        health_concerns=health_concerns,
-        photo_url=pet.photo_url,
-        breed_code=pet.breed_code,
-        is_neutered=pet.is_neutered,
-        sex=pet.sex.value if pet.sex else None,
-        food_allergies=food_allergies,
-        other_allergies=other_allergies,
-        is_primary=pet.is_primary,
-    )
+    summaries = await PetService.build_pet_summaries([pet], db)
+    return summaries[0]
 
 
 @router.get("/{pet_id}", response_model=PetRead)
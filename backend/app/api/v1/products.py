@@ -7,12 +7,17 @@ from typing import List, Optional
 import logging
 import time
 
+from app.core.pagination import InvalidCursorError
 from app.db.session import get_db
-from app.schemas.product import ProductRead, RecommendationResponse, ProductMatchScoreResponse, ProductDetailResponse
+from app.schemas.product import (
+    ProductRead, RecommendationResponse, ProductMatchScoreResponse, ProductDetailResponse, PriceHistoryRead,
+    ProductSearchResponse, SearchSuggestion
+)
 from app.schemas.section import (
     SectionRequest, SectionResponse, BatchSectionRequest, BatchSectionResponse
 )
 from app.services.product_service import ProductService
+from app.services.product_search_service import ProductSearchService
 from app.services.section_service import SectionService
 from app.models.offer import ProductOffer
 from app.models.section import SectionType, ProductCategory
@@ -28,13 +33,36 @@ async def get_products(db: AsyncSession = Depends(get_db)):
     return [ProductRead.model_validate(p) for p in products]
 
 
+@router.get("/search", response_model=ProductSearchResponse)
+async def search_products(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (브랜드/상품명/용량)"),
+    category: ProductCategory = Query(ProductCategory.ALL, description="카테고리 필터"),
+    limit: int = Query(20, ge=1, le=50, description="조회할 상품 수"),
+    offset: int = Query(0, ge=0, description="페이지네이션 오프셋"),
+    db: AsyncSession = Depends(get_db)
+):
+    """상품 검색 (띄어쓰기/전각/중량 표기 차이 무시, 관련도순)"""
+    return await ProductSearchService.search(db, q, category=category, limit=limit, offset=offset)
+
+
+@router.get("/search/autocomplete", response_model=List[SearchSuggestion])
+async def autocomplete_products(
+    q: str = Query(..., min_length=1, max_length=50, description="입력 중인 검색어"),
+    limit: int = Query(10, ge=1, le=20, description="제안 개수"),
+    db: AsyncSession = Depends(get_db)
+):
+    """검색어 자동완성 (브랜드 우선, 이후 상품명)"""
+    return await ProductSearchService.autocomplete(db, q, limit=limit)
+
+
 @router.get("/sections/{section_type}", response_model=SectionResponse)
 async def get_section(
     section_type: SectionType,
     category: ProductCategory = Query(ProductCategory.ALL, description="카테고리 필터"),
     limit: Optional[int] = Query(None, ge=1, le=50, description="조회할 상품 수"),
     offset: Optional[int] = Query(0, ge=0, description="페이지네이션 오프셋"),
-    time_range: Optional[str] = Query(None, description="인기 섹션용: 24h, 7d, 30d"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (무한 스크롤)"),
+    time_range: Optional[str] = Query(None, description="인기 섹션용: 1h, 24h, 7d, 30d (슬라이딩 윈도우), trending (시간 감쇠)"),
     days: Optional[int] = Query(None, description="신상품 섹션용: 신상품 기준 일수"),
     min_reviews: Optional[int] = Query(None, description="리뷰 베스트 섹션용: 최소 리뷰 수"),
     user_id: Optional[UUID] = Query(None, description="개인화 섹션용: 사용자 ID"),
@@ -54,6 +82,7 @@ async def get_section(
             category=category,
             limit=limit,
             offset=offset,
+            cursor=cursor,
             time_range=time_range,
             days=days,
             min_reviews=min_reviews,
@@ -68,6 +97,8 @@ async def get_section(
             f"products={len(result.products)}개, cached={result.cached}, 소요시간={duration_ms}ms"
         )
         return result
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         duration_ms = int((time.time() - start_time) * 1000)
         logger.error(
@@ -97,6 +128,8 @@ async def get_batch_sections(
             f"소요시간={duration_ms}ms"
         )
         return BatchSectionResponse(sections=results)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         duration_ms = int((time.time() - start_time) * 1000)
         logger.error(
@@ -263,6 +296,16 @@ async def get_product_detail(
     return await ProductService.get_product_detail(product_id, db)
 
 
+@router.get("/{product_id}/price-history", response_model=List[PriceHistoryRead])
+async def get_product_price_history(
+    product_id: UUID,
+    days: int = Query(30, ge=1, le=365, description="조회 기간 (일)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """가격 히스토리 조회 (1일: 원본, 14일 이하: 시간 단위, 그 이상: 일 단위)"""
+    return await ProductService.get_price_history(product_id, days, db)
+
+
 @router.get("/{product_id}/offers")
 async def get_product_offers(
     product_id: UUID,
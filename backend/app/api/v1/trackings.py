@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app.db.session import get_db
-from app.schemas.tracking import TrackingCreate, TrackingRead
+from app.schemas.tracking import TrackingCreate, TrackingRead, WatchlistResponse
 from app.services.tracking_service import TrackingService
 
 router = APIRouter()
@@ -35,6 +35,17 @@ async def create_tracking(
     return TrackingRead.model_validate(tracking)
 
 
+@router.get("/watchlist", response_model=WatchlistResponse)
+async def get_watchlist(
+    db: AsyncSession = Depends(get_db),
+    # TODO: 실제 인증 구현 후 user: User = Depends(get_current_user)
+):
+    """관심 상품 목록 조회 (상품 요약, 현재가, 30일 평균 대비 변동, 알림 상태)"""
+    # TODO: 실제 user_id 기반 필터링 구현
+    mock_user_id = UUID("00000000-0000-0000-0000-000000000000")
+    return await TrackingService.get_watchlist(mock_user_id, db)
+
+
 @router.get("/{tracking_id}", response_model=TrackingRead)
 async def get_tracking(
     tracking_id: UUID,
@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.db.session import get_db
 from app.api.deps import get_device_uid
+from app.models.push_token import PushProvider
 from app.services.user_service import UserService
 
 router = APIRouter()
@@ -47,6 +48,51 @@ async def get_current_user(
     )
 
 
+class PushTokenRequest(BaseModel):
+    """푸시 토큰 등록/해제 요청"""
+    provider: PushProvider = PushProvider.FCM
+    token: str = Field(..., min_length=1, max_length=512)
+
+
+async def _require_current_user(device_uid: Optional[str], db: AsyncSession):
+    if not device_uid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="X-Device-UID header is required"
+        )
+    user = await UserService.get_user_by_device_uid(device_uid, db)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    return user
+
+
+@router.post("/me/push-tokens", status_code=status.HTTP_204_NO_CONTENT)
+async def register_push_token(
+    request: PushTokenRequest,
+    device_uid: Optional[str] = Depends(get_device_uid),
+    db: AsyncSession = Depends(get_db),
+):
+    """푸시 토큰 등록 (앱 실행/토큰 갱신 시 호출)"""
+    user = await _require_current_user(device_uid, db)
+    await UserService.register_push_token(user.id, request.provider, request.token, db)
+    return None
+
+
+@router.post("/me/push-tokens/unregister", status_code=status.HTTP_204_NO_CONTENT)
+async def unregister_push_token(
+    request: PushTokenRequest,
+    device_uid: Optional[str] = Depends(get_device_uid),
+    db: AsyncSession = Depends(get_db),
+):
+    """푸시 토큰 해제 (로그아웃/알림 끄기)"""
+    user = await _require_current_user(device_uid, db)
+    await UserService.unregister_push_token(user.id, request.token, db)
+    return None
+
+
 @router.get("/")
 async def get_users(db: AsyncSession = Depends(get_db)):
     """사용자 목록 조회"""
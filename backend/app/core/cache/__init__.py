@@ -1,5 +1,11 @@
 """캐시 관련 모듈"""
 from .cache_keys import CacheKeys
+from .cache_metrics import CacheMetrics, CacheNamespace
 from .recommendation_cache_service import RecommendationCacheService
+from .negative_cache_service import NegativeCacheService
+from .product_detail_cache_service import ProductDetailCacheService
 
-__all__ = ["CacheKeys", "RecommendationCacheService"]
+__all__ = [
+    "CacheKeys", "CacheMetrics", "CacheNamespace", "RecommendationCacheService",
+    "NegativeCacheService", "ProductDetailCacheService",
+]
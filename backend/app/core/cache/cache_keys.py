@@ -21,6 +21,16 @@ class CacheKeys:
         """추천 태그 캐시 키 (무효화용)"""
         return f"{CacheKeys.NAMESPACE}:rec:tags:{pet_id}"
     
+    @staticmethod
+    def recommendation_candidates(pet_id: UUID) -> str:
+        """추천 후보 목록 캐시 키 (점수순 상위 N개, 개인화 섹션 페이지네이션용)"""
+        return f"{CacheKeys.NAMESPACE}:rec:candidates:{pet_id}"
+    
+    @staticmethod
+    def recommendation_section_keys(pet_id: UUID) -> str:
+        """펫 후보로 만든 개인화 섹션 캐시 키 목록 (SET, 추천 재계산/무효화 시 함께 삭제)"""
+        return f"{CacheKeys.NAMESPACE}:rec:sections:{pet_id}"
+    
     @staticmethod
     def pet_summary(pet_id: UUID) -> str:
         """펫 프로필 캐시 키"""
@@ -33,5 +43,130 @@ class CacheKeys:
     
     @staticmethod
     def product_detail(product_id: UUID) -> str:
-        """상품 상세 정보 캐시 키"""
+        """상품 상세 읽기 모델 캐시 키 (상품당 JSON 문서)"""
         return f"{CacheKeys.NAMESPACE}:product:detail:{product_id}"
+    
+    @staticmethod
+    def product_detail_version(product_id: UUID) -> str:
+        """상품 상세 읽기 모델 버전 (관리자 수정 시 INCR, 문서에 기록된 버전과 다르면 미스)"""
+        return f"{CacheKeys.NAMESPACE}:product:detail_version:{product_id}"
+    
+    @staticmethod
+    def admin_product_count(filter_digest: str, catalog_version) -> str:
+        """관리자 상품 목록 필터별 전체 개수 캐시 키 (카탈로그 버전 포함)"""
+        return f"{CacheKeys.NAMESPACE}:admin:product_count:{catalog_version}:{filter_digest}"
+    
+    @staticmethod
+    def catalog_version() -> str:
+        """카탈로그 버전 카운터 키 (상품 변경 시 INCR)"""
+        return f"{CacheKeys.NAMESPACE}:catalog:version"
+    
+    @staticmethod
+    def negative_recommendation(pet_id: UUID) -> str:
+        """빈 추천 결과 네거티브 캐시 키"""
+        return f"{CacheKeys.NAMESPACE}:neg:rec:{pet_id}"
+    
+    @staticmethod
+    def negative_product(product_id: UUID) -> str:
+        """존재하지 않는 상품 네거티브 캐시 키"""
+        return f"{CacheKeys.NAMESPACE}:neg:product:{product_id}"
+    
+    @staticmethod
+    def negative_pet(pet_id: UUID) -> str:
+        """존재하지 않는 펫 네거티브 캐시 키"""
+        return f"{CacheKeys.NAMESPACE}:neg:pet:{pet_id}"
+    
+    @staticmethod
+    def price_refresh_queue() -> str:
+        """가격 재수집 우선순위 큐 (ZSET: member=offer_id, score=due 시각 epoch)"""
+        return f"{CacheKeys.NAMESPACE}:price:refresh_queue"
+    
+    @staticmethod
+    def hot_deal_index(category) -> str:
+        """카테고리별 핫딜 랭킹 (ZSET: member=product_id, score=할인율/가격 점수)"""
+        return f"{CacheKeys.NAMESPACE}:hotdeal:{category.value}"
+    
+    @staticmethod
+    def price_event_stream() -> str:
+        """가격 변경 이벤트 스트림 (Redis Stream, 알림 평가 등 소비자 그룹이 읽음)"""
+        return f"{CacheKeys.NAMESPACE}:stream:price_events"
+    
+    @staticmethod
+    def push_delivery_stream() -> str:
+        """푸시 발송 대기 스트림 (Redis Stream, app.workers.push_delivery가 소비자 그룹으로 읽음)"""
+        return f"{CacheKeys.NAMESPACE}:stream:push_deliveries"
+    
+    @staticmethod
+    def click_stream() -> str:
+        """클릭 적재 대기 스트림 (Redis Stream, app.workers.click_ingest가 소비자 그룹으로 읽어 COPY)"""
+        return f"{CacheKeys.NAMESPACE}:stream:clicks"
+    
+    @staticmethod
+    def push_delivery_retry() -> str:
+        """푸시 재시도 대기열 (ZSET: member=발송 건 JSON, score=재시도 시각 epoch)"""
+        return f"{CacheKeys.NAMESPACE}:push:retry"
+    
+    @staticmethod
+    def push_dedupe(user_id, product_id) -> str:
+        """사용자×상품 마지막 푸시 가격 (쿨다운 동안 유지, 더 낮은 가격만 다시 발송)"""
+        return f"{CacheKeys.NAMESPACE}:push:sent:{user_id}:{product_id}"
+    
+    @staticmethod
+    def notification_inbox(user_id: UUID) -> str:
+        """사용자 알림함 (LIST: 최신순 JSON 항목, 최대 NOTIFICATION_INBOX_MAX_ITEMS개)"""
+        return f"{CacheKeys.NAMESPACE}:inbox:{user_id}:items"
+    
+    @staticmethod
+    def notification_inbox_unread(user_id: UUID) -> str:
+        """안 읽은 알림 (HASH: field=alert_event_id, value=alert_id, HLEN이 배지 수)"""
+        return f"{CacheKeys.NAMESPACE}:inbox:{user_id}:unread"
+    
+    @staticmethod
+    def notification_inbox_seq(user_id: UUID) -> str:
+        """알림함 항목 순번 카운터 (커서 페이지네이션용)"""
+        return f"{CacheKeys.NAMESPACE}:inbox:{user_id}:seq"
+    
+    @staticmethod
+    def notification_inbox_built(user_id: UUID) -> str:
+        """알림함이 DB 기준으로 구성되었음을 나타내는 표시 (없으면 조회 시 재구성)"""
+        return f"{CacheKeys.NAMESPACE}:inbox:{user_id}:built"
+    
+    @staticmethod
+    def notification_inbox_building(user_id: UUID) -> str:
+        """알림함 재구성 진행 중 표시 (DB 조회 ~ 교체 사이, 짧은 TTL)"""
+        return f"{CacheKeys.NAMESPACE}:inbox:{user_id}:building"
+    
+    @staticmethod
+    def notification_inbox_pending(user_id: UUID) -> str:
+        """재구성 중 들어온 알림 (LIST: event_id, alert_id, payload 반복, 교체 시 병합)"""
+        return f"{CacheKeys.NAMESPACE}:inbox:{user_id}:pending"
+    
+    @staticmethod
+    def popularity_bucket(category, bucket_seconds: int, bucket_start: int) -> str:
+        """카테고리별 클릭 시간 버킷 (ZSET: member=product_id, score=클릭 수, TTL로 소멸)"""
+        return f"{CacheKeys.NAMESPACE}:popular:{category.value}:b{bucket_seconds}:{bucket_start}"
+    
+    @staticmethod
+    def popularity_view(category, time_range: str) -> str:
+        """윈도우(1h/24h/7d/30d) 버킷 합산 뷰 (ZUNIONSTORE 결과, 짧은 TTL)"""
+        return f"{CacheKeys.NAMESPACE}:popular:{category.value}:view:{time_range}"
+    
+    @staticmethod
+    def popularity_decay(category) -> str:
+        """카테고리별 시간 감쇠 인기 점수 (ZSET)"""
+        return f"{CacheKeys.NAMESPACE}:popular:{category.value}:decay"
+    
+    @staticmethod
+    def popularity_decay_anchor() -> str:
+        """감쇠 점수 기준 시각 (epoch초, 재기준 시 이동)"""
+        return f"{CacheKeys.NAMESPACE}:popular:decay_anchor"
+    
+    @staticmethod
+    def popularity_layout() -> str:
+        """인기 카운터 구성 버전 (버킷 구성이 바뀌면 캐시 워머가 클릭 이력으로 재구성)"""
+        return f"{CacheKeys.NAMESPACE}:popular:layout"
+    
+    @staticmethod
+    def cache_warmer_slot(job: str) -> str:
+        """캐시 워머 작업 실행 슬롯 (SET NX EX, 여러 API 프로세스 중 주기당 1곳만 실행)"""
+        return f"{CacheKeys.NAMESPACE}:warmer:slot:{job}"
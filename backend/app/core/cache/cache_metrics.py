@@ -0,0 +1,165 @@
+"""캐시 계층 메트릭 (Prometheus 카운터/히스토그램)"""
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from prometheus_client import Counter, Histogram, Gauge, REGISTRY
+
+from app.core.redis import circuit_breaker, get_redis_pool_stats
+
+
+class CacheNamespace:
+    """메트릭 라벨로 쓰는 캐시 네임스페이스"""
+    RECOMMENDATION = "recommendation"
+    RECOMMENDATION_CANDIDATES = "recommendation_candidates"  # 개인화 섹션용 후보 목록 (추천 결과 히트율과 분리)
+    PET_SUMMARY = "pet_summary"
+    PRODUCT_MATCH_SCORE = "product_match_score"
+    SECTION = "section"
+    NEGATIVE_RECOMMENDATION = "negative_recommendation"
+    NEGATIVE_PRODUCT = "negative_product"
+    NEGATIVE_PET = "negative_pet"
+    PRODUCT_DETAIL = "product_detail"
+
+
+CACHE_HITS = Counter(
+    "cache_hits_total", "캐시 히트 수", ["namespace"]
+)
+CACHE_MISSES = Counter(
+    "cache_misses_total", "캐시 미스 수", ["namespace"]
+)
+CACHE_STALE_SERVES = Counter(
+    "cache_stale_serves_total", "캐시 미스 후 이전 계산 결과(PostgreSQL 등)로 응답한 수", ["namespace"]
+)
+CACHE_GET_FAILURES = Counter(
+    "cache_get_failures_total", "캐시 조회 실패 수 (Redis 에러/서킷 OPEN)", ["namespace"]
+)
+CACHE_SET_FAILURES = Counter(
+    "cache_set_failures_total", "캐시 저장 실패 수 (Redis 에러/서킷 OPEN)", ["namespace"]
+)
+CACHE_PAYLOAD_BYTES = Histogram(
+    "cache_payload_bytes", "캐시 값 크기 (바이트)", ["namespace", "op"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576),
+)
+CACHE_LATENCY_SECONDS = Histogram(
+    "cache_operation_seconds", "캐시 get/set 지연 시간 (초)", ["namespace", "op"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+REDIS_CIRCUIT_OPEN = Gauge(
+    "redis_circuit_open", "Redis 서킷 상태 (0=CLOSED, 1=OPEN/HALF_OPEN)"
+)
+REDIS_CIRCUIT_SHORT_CIRCUITED = Gauge(
+    "redis_circuit_short_circuited_total", "서킷 OPEN으로 건너뛴 Redis 호출 누적 수"
+)
+REDIS_POOL_IN_USE = Gauge(
+    "redis_pool_in_use_connections", "사용 중인 Redis 커넥션 수"
+)
+
+_METRIC_NAMES = (
+    "cache_hits",
+    "cache_misses",
+    "cache_stale_serves",
+    "cache_get_failures",
+    "cache_set_failures",
+)
+
+
+class CacheMetrics:
+    """캐시 서비스에서 호출하는 메트릭 기록 헬퍼"""
+
+    @staticmethod
+    def record_hit(namespace: str, payload_bytes: Optional[int] = None) -> None:
+        CACHE_HITS.labels(namespace).inc()
+        if payload_bytes is not None:
+            CACHE_PAYLOAD_BYTES.labels(namespace, "get").observe(payload_bytes)
+
+    @staticmethod
+    def record_miss(namespace: str) -> None:
+        CACHE_MISSES.labels(namespace).inc()
+
+    @staticmethod
+    def record_stale(namespace: str) -> None:
+        CACHE_STALE_SERVES.labels(namespace).inc()
+
+    @staticmethod
+    def record_get_failure(namespace: str) -> None:
+        CACHE_GET_FAILURES.labels(namespace).inc()
+
+    @staticmethod
+    def record_set(namespace: str, payload_bytes: int) -> None:
+        CACHE_PAYLOAD_BYTES.labels(namespace, "set").observe(payload_bytes)
+
+    @staticmethod
+    def record_set_failure(namespace: str) -> None:
+        CACHE_SET_FAILURES.labels(namespace).inc()
+
+    @staticmethod
+    @contextmanager
+    def timer(namespace: str, op: str):
+        """get/set 지연 시간 측정 (예외가 나도 기록)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            CACHE_LATENCY_SECONDS.labels(namespace, op).observe(time.perf_counter() - start)
+
+    @staticmethod
+    def refresh_redis_gauges() -> None:
+        """스크레이프 직전에 Redis 서킷/풀 상태를 게이지로 반영"""
+        breaker = circuit_breaker.snapshot()
+        REDIS_CIRCUIT_OPEN.set(0 if breaker["state"] == "CLOSED" else 1)
+        REDIS_CIRCUIT_SHORT_CIRCUITED.set(breaker["total_short_circuited"])
+        pool = get_redis_pool_stats()
+        REDIS_POOL_IN_USE.set(pool.get("in_use_connections", 0))
+
+    @staticmethod
+    def snapshot() -> dict:
+        """관리자용 JSON 뷰: 네임스페이스별 카운터 + 지연/크기 평균"""
+        namespaces: dict = {}
+
+        def ns_entry(namespace: str) -> dict:
+            return namespaces.setdefault(namespace, {
+                "hits": 0, "misses": 0, "stale_serves": 0,
+                "get_failures": 0, "set_failures": 0,
+                "hit_ratio": None, "latency_ms": {}, "payload_bytes": {},
+            })
+
+        for metric in REGISTRY.collect():
+            if metric.name in _METRIC_NAMES:
+                field = metric.name[len("cache_"):]
+                for sample in metric.samples:
+                    if sample.name.endswith("_total"):
+                        ns_entry(sample.labels["namespace"])[field] = int(sample.value)
+            elif metric.name in ("cache_operation_seconds", "cache_payload_bytes"):
+                sums: dict = {}
+                counts: dict = {}
+                for sample in metric.samples:
+                    key = (sample.labels["namespace"], sample.labels["op"])
+                    if sample.name.endswith("_sum"):
+                        sums[key] = sample.value
+                    elif sample.name.endswith("_count"):
+                        counts[key] = sample.value
+                for (namespace, op), count in counts.items():
+                    entry = ns_entry(namespace)
+                    if metric.name == "cache_operation_seconds":
+                        entry["latency_ms"][op] = {
+                            "count": int(count),
+                            "avg": round(sums.get((namespace, op), 0) / count * 1000, 3) if count else None,
+                        }
+                    else:
+                        entry["payload_bytes"][op] = {
+                            "count": int(count),
+                            "avg": int(sums.get((namespace, op), 0) / count) if count else None,
+                        }
+
+        for entry in namespaces.values():
+            lookups = entry["hits"] + entry["misses"]
+            entry["hit_ratio"] = round(entry["hits"] / lookups, 4) if lookups else None
+
+        return {
+            "namespaces": namespaces,
+            "redis": {
+                "circuit_breaker": circuit_breaker.snapshot(),
+                "pool": get_redis_pool_stats(),
+            },
+        }
@@ -0,0 +1,158 @@
+"""
+네거티브 캐시 서비스
+
+"결과 없음"도 짧게 캐싱해서 같은 요청이 매번 PostgreSQL/스코어링을 타지 않도록 한다.
+- 빈 추천 결과 (상품 없음 / 종 불일치 / 전부 필터링)
+- 존재하지 않는 펫 (404)
+- 존재하지 않는 상품 (404)
+
+항목에는 저장 시점의 카탈로그 버전을 함께 기록하고, 조회 시 현재 버전과 다르면 미스로 취급한다.
+상품 생성/수정/삭제 시 bump_catalog_version()으로 버전을 올리면
+모든 네거티브 항목이 키 삭제 없이 한 번에 무효화된다.
+"""
+import json
+import logging
+from typing import Optional, Tuple
+from uuid import UUID
+
+import redis.asyncio as redis
+
+from app.core.redis import get_redis
+from app.core.cache.cache_keys import CacheKeys
+from app.core.cache.cache_metrics import CacheMetrics, CacheNamespace
+from app.schemas.product import RecommendationResponse
+
+logger = logging.getLogger(__name__)
+
+
+class NegativeCacheService:
+    """네거티브 캐시 (빈 결과 / 404) 서비스"""
+    
+    # TTL 설정 (초) - 데이터가 생기면 빨리 보이도록 짧게 유지
+    EMPTY_RECOMMENDATION_TTL = 5 * 60  # 5분
+    MISSING_PRODUCT_TTL = 5 * 60  # 5분
+    MISSING_PET_TTL = 60  # 1분 (펫 생성 직후 조회와 겹칠 수 있어 더 짧게)
+    
+    @staticmethod
+    async def _get_entry(namespace: str, cache_key: str) -> Optional[dict]:
+        """카탈로그 버전과 항목을 MGET 한 번에 조회, 버전이 다르면 None"""
+        try:
+            redis_client = await get_redis()
+            with CacheMetrics.timer(namespace, "get"):
+                current_version, cached_data = await redis_client.mget(
+                    CacheKeys.catalog_version(), cache_key
+                )
+            if not cached_data:
+                CacheMetrics.record_miss(namespace)
+                return None
+            
+            entry = json.loads(cached_data)
+            if str(entry.get("catalog_version")) != str(current_version or 0):
+                # 카탈로그가 바뀐 뒤의 항목은 신뢰하지 않음
+                CacheMetrics.record_miss(namespace)
+                return None
+            
+            CacheMetrics.record_hit(namespace, len(cached_data.encode()))
+            return entry
+        except redis.RedisError as e:
+            CacheMetrics.record_get_failure(namespace)
+            logger.warning(f"[NegativeCache] Redis 조회 실패: {e}")
+            return None
+        except Exception as e:
+            CacheMetrics.record_get_failure(namespace)
+            logger.error(f"[NegativeCache] 예상치 못한 에러: {e}", exc_info=True)
+            return None
+    
+    @staticmethod
+    async def _set_entry(namespace: str, cache_key: str, ttl: int, value: Optional[dict] = None) -> bool:
+        """현재 카탈로그 버전을 붙여서 저장"""
+        try:
+            redis_client = await get_redis()
+            current_version = await redis_client.get(CacheKeys.catalog_version())
+            payload = json.dumps(
+                {"catalog_version": str(current_version or 0), "value": value},
+                default=str
+            )
+            with CacheMetrics.timer(namespace, "set"):
+                await redis_client.setex(cache_key, ttl, payload)
+            CacheMetrics.record_set(namespace, len(payload.encode()))
+            return True
+        except redis.RedisError as e:
+            CacheMetrics.record_set_failure(namespace)
+            logger.warning(f"[NegativeCache] Redis 저장 실패: {e}")
+            return False
+        except Exception as e:
+            CacheMetrics.record_set_failure(namespace)
+            logger.error(f"[NegativeCache] 예상치 못한 에러: {e}", exc_info=True)
+            return False
+    
+    @staticmethod
+    async def get_empty_recommendation(pet_id: UUID) -> Optional[RecommendationResponse]:
+        """캐싱된 빈 추천 응답 조회"""
+        entry = await NegativeCacheService._get_entry(
+            CacheNamespace.NEGATIVE_RECOMMENDATION,
+            CacheKeys.negative_recommendation(pet_id)
+        )
+        if not entry or not entry.get("value"):
+            return None
+        logger.info(f"[NegativeCache] ✅ 빈 추천 캐시 히트: pet_id={pet_id}")
+        return RecommendationResponse(**entry["value"])
+    
+    @staticmethod
+    async def set_empty_recommendation(pet_id: UUID, response: RecommendationResponse) -> bool:
+        """빈 추천 응답 저장 (메시지 포함)"""
+        return await NegativeCacheService._set_entry(
+            CacheNamespace.NEGATIVE_RECOMMENDATION,
+            CacheKeys.negative_recommendation(pet_id),
+            NegativeCacheService.EMPTY_RECOMMENDATION_TTL,
+            response.model_dump(mode='json')
+        )
+    
+    @staticmethod
+    async def is_missing_pet(pet_id: UUID) -> bool:
+        """최근 404였던 펫인지 확인"""
+        entry = await NegativeCacheService._get_entry(
+            CacheNamespace.NEGATIVE_PET,
+            CacheKeys.negative_pet(pet_id)
+        )
+        return entry is not None
+    
+    @staticmethod
+    async def mark_missing_pet(pet_id: UUID) -> bool:
+        return await NegativeCacheService._set_entry(
+            CacheNamespace.NEGATIVE_PET,
+            CacheKeys.negative_pet(pet_id),
+            NegativeCacheService.MISSING_PET_TTL
+        )
+    
+    @staticmethod
+    async def is_missing_product(product_id: UUID) -> bool:
+        """최근 404였던 상품인지 확인"""
+        entry = await NegativeCacheService._get_entry(
+            CacheNamespace.NEGATIVE_PRODUCT,
+            CacheKeys.negative_product(product_id)
+        )
+        return entry is not None
+    
+    @staticmethod
+    async def mark_missing_product(product_id: UUID) -> bool:
+        return await NegativeCacheService._set_entry(
+            CacheNamespace.NEGATIVE_PRODUCT,
+            CacheKeys.negative_product(product_id),
+            NegativeCacheService.MISSING_PRODUCT_TTL
+        )
+    
+    @staticmethod
+    async def bump_catalog_version() -> Optional[int]:
+        """카탈로그 버전 증가 → 모든 네거티브 항목 무효화"""
+        try:
+            redis_client = await get_redis()
+            version = await redis_client.incr(CacheKeys.catalog_version())
+            logger.info(f"[NegativeCache] 🔄 카탈로그 버전 증가: {version}")
+            return version
+        except redis.RedisError as e:
+            logger.warning(f"[NegativeCache] 카탈로그 버전 증가 실패: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"[NegativeCache] 예상치 못한 에러: {e}", exc_info=True)
+            return None
@@ -0,0 +1,173 @@
+"""
+상품 상세 읽기 모델 캐시
+
+상품 상세(상품 + 판매처 + 가격 요약 + 7일 히스토리 + 성분/영양/클레임)를
+상품당 JSON 문서 1개로 저장해 상세 조회를 키 조회 1회로 끝낸다.
+
+- 가격 히스토리는 [{date, price}, ...] 대신 {"t": [epoch초...], "p": [가격...]} 배열로 압축 저장
+- 문서에 상품별 버전을 기록: 관리자가 그 상품을 수정하면(invalidate → 버전 증가) 미스 → 다음 조회 때 재구성
+  (카탈로그 버전은 네거티브 캐시용으로 두고, 상품 하나 수정이 모든 상세 문서를 무효화하지 않도록 분리)
+- 버전은 재구성 시작 전에 읽어 두고 그 값을 기록 → 재구성 중에 수정되면 저장된 문서는 바로 미스
+- 가격 적재 후에는 캐시에 있던 상품 문서만 즉시 재구성 (ProductService.refresh_detail_read_models)
+"""
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.core.cache.cache_keys import CacheKeys
+from app.core.cache.cache_metrics import CacheMetrics, CacheNamespace
+from app.schemas.product import ProductDetailResponse, PriceHistoryRead
+
+logger = logging.getLogger(__name__)
+
+
+class ProductDetailCacheService:
+    """상품 상세 읽기 모델 (상품당 JSON 문서)"""
+
+    @staticmethod
+    def _encode(detail: ProductDetailResponse, version: str) -> str:
+        history = detail.price_history
+        document = {
+            "version": version,
+            "detail": detail.model_dump(mode="json", exclude={"price_history"}),
+            "history": {
+                "t": [int(point.date.timestamp()) for point in history],
+                "p": [point.price for point in history],
+            },
+        }
+        return json.dumps(document, separators=(",", ":"), ensure_ascii=False)
+
+    @staticmethod
+    def _decode(document: dict) -> ProductDetailResponse:
+        history = document.get("history") or {}
+        price_history = [
+            PriceHistoryRead(date=datetime.fromtimestamp(ts, tz=timezone.utc), price=price)
+            for ts, price in zip(history.get("t", []), history.get("p", []))
+        ]
+        return ProductDetailResponse(**document["detail"], price_history=price_history)
+
+    @staticmethod
+    async def get(product_id: UUID) -> Optional[ProductDetailResponse]:
+        """상품 버전과 문서를 MGET 한 번에 조회, 버전이 다르면 None"""
+        namespace = CacheNamespace.PRODUCT_DETAIL
+        try:
+            redis_client = await get_redis()
+            with CacheMetrics.timer(namespace, "get"):
+                current_version, cached_data = await redis_client.mget(
+                    CacheKeys.product_detail_version(product_id), CacheKeys.product_detail(product_id)
+                )
+            if not cached_data:
+                CacheMetrics.record_miss(namespace)
+                return None
+
+            document = json.loads(cached_data)
+            if str(document.get("version")) != str(current_version or 0):
+                CacheMetrics.record_miss(namespace)
+                return None
+
+            CacheMetrics.record_hit(namespace, len(cached_data.encode()))
+            return ProductDetailCacheService._decode(document)
+        except redis.RedisError as e:
+            CacheMetrics.record_get_failure(namespace)
+            logger.warning(f"[ProductDetailCache] Redis 조회 실패: {e}")
+            return None
+        except Exception as e:
+            CacheMetrics.record_get_failure(namespace)
+            logger.error(f"[ProductDetailCache] 예상치 못한 에러: {e}", exc_info=True)
+            return None
+
+    @staticmethod
+    async def versions(product_ids: Iterable[UUID]) -> Dict[UUID, str]:
+        """재구성 시작 전 상품별 버전 (MGET 1회, Redis 장애 시 빈 dict → 저장하지 않음)"""
+        product_ids = list(set(product_ids))
+        if not product_ids:
+            return {}
+        try:
+            redis_client = await get_redis()
+            values = await redis_client.mget(
+                [CacheKeys.product_detail_version(product_id) for product_id in product_ids]
+            )
+            return {product_id: str(value or 0) for product_id, value in zip(product_ids, values)}
+        except redis.RedisError as e:
+            logger.warning(f"[ProductDetailCache] 버전 조회 실패: {e}")
+            return {}
+
+    @staticmethod
+    async def set_many(details: Dict[UUID, ProductDetailResponse], versions: Dict[UUID, str]) -> int:
+        """
+        재구성 전에 읽은 버전(versions)을 붙여 파이프라인 SET EX 한 번으로 저장
+
+        재구성 중 관리자 수정으로 버전이 바뀌었으면 저장된 문서는 조회 시 미스가 된다.
+        """
+        details = {product_id: detail for product_id, detail in details.items() if product_id in versions}
+        if not details:
+            return 0
+        namespace = CacheNamespace.PRODUCT_DETAIL
+        try:
+            redis_client = await get_redis()
+            ttl = settings.PRODUCT_DETAIL_CACHE_TTL_SECONDS
+            with CacheMetrics.timer(namespace, "set"):
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for product_id, detail in details.items():
+                        payload = ProductDetailCacheService._encode(detail, versions[product_id])
+                        pipe.setex(CacheKeys.product_detail(product_id), ttl, payload)
+                        CacheMetrics.record_set(namespace, len(payload.encode()))
+                    await pipe.execute()
+            return len(details)
+        except redis.RedisError as e:
+            CacheMetrics.record_set_failure(namespace)
+            logger.warning(f"[ProductDetailCache] Redis 저장 실패: {e}")
+            return 0
+        except Exception as e:
+            CacheMetrics.record_set_failure(namespace)
+            logger.error(f"[ProductDetailCache] 예상치 못한 에러: {e}", exc_info=True)
+            return 0
+
+    @staticmethod
+    async def set(product_id: UUID, detail: ProductDetailResponse, versions: Dict[UUID, str]) -> bool:
+        return await ProductDetailCacheService.set_many({product_id: detail}, versions) == 1
+
+    @staticmethod
+    async def filter_cached(product_ids: Iterable[UUID]) -> List[UUID]:
+        """캐시에 문서가 있는 상품만 (가격 적재 후 재구성 대상)"""
+        product_ids = list(set(product_ids))
+        if not product_ids:
+            return []
+        try:
+            redis_client = await get_redis()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for product_id in product_ids:
+                    pipe.exists(CacheKeys.product_detail(product_id))
+                flags = await pipe.execute()
+            return [product_id for product_id, exists in zip(product_ids, flags) if exists]
+        except redis.RedisError as e:
+            logger.warning(f"[ProductDetailCache] Redis 조회 실패: {e}")
+            return []
+
+    @staticmethod
+    async def invalidate(product_ids: Iterable[UUID]) -> None:
+        """
+        상품 문서 삭제 + 버전 증가 (관리자 수정 후 호출, 진행 중인 재구성 결과도 미스가 되도록)
+
+        버전 키는 문서보다 오래 남겨, 만료로 0으로 돌아가 이전 버전 문서와 다시 일치하는 일이 없게 한다.
+        """
+        product_ids = [product_id for product_id in set(product_ids) if product_id is not None]
+        if not product_ids:
+            return
+        try:
+            redis_client = await get_redis()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for product_id in product_ids:
+                    version_key = CacheKeys.product_detail_version(product_id)
+                    pipe.incr(version_key)
+                    pipe.expire(version_key, settings.PRODUCT_DETAIL_CACHE_TTL_SECONDS * 2)
+                    pipe.delete(CacheKeys.product_detail(product_id))
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"[ProductDetailCache] 캐시 삭제 실패: {e}")
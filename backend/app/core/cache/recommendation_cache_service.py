@@ -1,7 +1,7 @@
 """추천 결과 Redis 캐싱 서비스"""
 import json
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 from datetime import datetime
 
@@ -9,10 +9,21 @@ import redis.asyncio as redis
 
 from app.core.redis import get_redis
 from app.core.cache.cache_keys import CacheKeys
+from app.core.cache.cache_metrics import CacheMetrics, CacheNamespace
 from app.schemas.product import RecommendationResponse, ProductMatchScoreResponse
 
 logger = logging.getLogger(__name__)
 
+# 펫별로 등록된 개인화 섹션 캐시와 등록 목록 삭제
+_DROP_SECTIONS_SCRIPT = """
+local keys = redis.call('SMEMBERS', KEYS[1])
+for i = 1, #keys, 500 do
+    redis.call('DEL', unpack(keys, i, math.min(i + 499, #keys)))
+end
+redis.call('DEL', KEYS[1])
+return #keys
+"""
+
 
 class RecommendationCacheService:
     """추천 결과 Redis 캐싱 서비스"""
@@ -34,8 +45,10 @@ class RecommendationCacheService:
             redis_client = await get_redis()
             cache_key = CacheKeys.recommendation_result(pet_id)
             
-            cached_data = await redis_client.get(cache_key)
+            with CacheMetrics.timer(CacheNamespace.RECOMMENDATION, "get"):
+                cached_data = await redis_client.get(cache_key)
             if cached_data:
+                CacheMetrics.record_hit(CacheNamespace.RECOMMENDATION, len(cached_data.encode()))
                 logger.info(f"[RecommendationCache] ✅ 캐시 히트: pet_id={pet_id}")
                 data = json.loads(cached_data)
                 # datetime 문자열을 datetime 객체로 변환
@@ -43,12 +56,15 @@ class RecommendationCacheService:
                     data['last_recommended_at'] = datetime.fromisoformat(data['last_recommended_at'])
                 return RecommendationResponse(**data)
             
+            CacheMetrics.record_miss(CacheNamespace.RECOMMENDATION)
             logger.debug(f"[RecommendationCache] ❌ 캐시 미스: pet_id={pet_id}")
             return None
         except redis.RedisError as e:
+            CacheMetrics.record_get_failure(CacheNamespace.RECOMMENDATION)
             logger.warning(f"[RecommendationCache] Redis 조회 실패: {e}, fallback to PostgreSQL")
             return None
         except Exception as e:
+            CacheMetrics.record_get_failure(CacheNamespace.RECOMMENDATION)
             logger.error(f"[RecommendationCache] 예상치 못한 에러: {e}", exc_info=True)
             return None
     
@@ -56,11 +72,15 @@ class RecommendationCacheService:
     async def set_recommendation(
         pet_id: UUID,
         recommendation: RecommendationResponse,
-        ttl: Optional[int] = None
+        ttl: Optional[int] = None,
+        candidates: Optional[List[Dict[str, Any]]] = None
     ) -> bool:
         """
         Redis에 추천 결과 저장
         
+        Args:
+            candidates: 점수순 추천 후보 목록 (있으면 같은 TTL로 함께 저장)
+        
         Returns:
             저장 성공 여부
         """
@@ -71,22 +91,77 @@ class RecommendationCacheService:
             
             # Pydantic 모델을 dict로 변환 (datetime 처리)
             data = recommendation.model_dump(mode='json')
+            payload = json.dumps(data, default=str)
             
-            await redis_client.setex(
-                cache_key,
-                ttl,
-                json.dumps(data, default=str)
-            )
+            candidates_payload = json.dumps(candidates, separators=(",", ":")) if candidates is not None else None
+            with CacheMetrics.timer(CacheNamespace.RECOMMENDATION, "set"):
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    pipe.setex(cache_key, ttl, payload)
+                    if candidates_payload is not None:
+                        pipe.setex(CacheKeys.recommendation_candidates(pet_id), ttl, candidates_payload)
+                        # 후보가 바뀌었으므로 이전 후보로 만든 개인화 섹션 캐시도 삭제
+                        pipe.eval(_DROP_SECTIONS_SCRIPT, 1, CacheKeys.recommendation_section_keys(pet_id))
+                    await pipe.execute()
+            CacheMetrics.record_set(CacheNamespace.RECOMMENDATION, len(payload.encode()))
+            if candidates_payload is not None:
+                CacheMetrics.record_set(CacheNamespace.RECOMMENDATION_CANDIDATES, len(candidates_payload.encode()))
             
             logger.info(f"[RecommendationCache] ✅ 캐시 저장: pet_id={pet_id}, TTL={ttl}초")
             return True
         except redis.RedisError as e:
+            CacheMetrics.record_set_failure(CacheNamespace.RECOMMENDATION)
             logger.warning(f"[RecommendationCache] Redis 저장 실패: {e}")
             return False
         except Exception as e:
+            CacheMetrics.record_set_failure(CacheNamespace.RECOMMENDATION)
             logger.error(f"[RecommendationCache] 예상치 못한 에러: {e}", exc_info=True)
             return False
     
+    @staticmethod
+    async def get_candidates(pet_id: UUID) -> Optional[List[Dict[str, Any]]]:
+        """
+        추천 후보 목록 조회
+        
+        Returns:
+            [{"id", "species", "score"}, ...] (점수순) 또는 None (캐시 미스)
+        """
+        try:
+            redis_client = await get_redis()
+            with CacheMetrics.timer(CacheNamespace.RECOMMENDATION_CANDIDATES, "get"):
+                cached_data = await redis_client.get(CacheKeys.recommendation_candidates(pet_id))
+            if cached_data is None:
+                CacheMetrics.record_miss(CacheNamespace.RECOMMENDATION_CANDIDATES)
+                return None
+            CacheMetrics.record_hit(CacheNamespace.RECOMMENDATION_CANDIDATES, len(cached_data.encode()))
+            return json.loads(cached_data)
+        except redis.RedisError as e:
+            CacheMetrics.record_get_failure(CacheNamespace.RECOMMENDATION_CANDIDATES)
+            logger.warning(f"[RecommendationCache] 추천 후보 조회 실패: {e}")
+            return None
+    
+    @staticmethod
+    async def set_candidates(
+        pet_id: UUID,
+        candidates: List[Dict[str, Any]],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """추천 후보 목록만 저장 (PostgreSQL 추천 이력에서 복구할 때)"""
+        try:
+            redis_client = await get_redis()
+            payload = json.dumps(candidates, separators=(",", ":"))
+            with CacheMetrics.timer(CacheNamespace.RECOMMENDATION_CANDIDATES, "set"):
+                await redis_client.setex(
+                    CacheKeys.recommendation_candidates(pet_id),
+                    ttl or RecommendationCacheService.RECOMMENDATION_TTL,
+                    payload
+                )
+            CacheMetrics.record_set(CacheNamespace.RECOMMENDATION_CANDIDATES, len(payload.encode()))
+            return True
+        except redis.RedisError as e:
+            CacheMetrics.record_set_failure(CacheNamespace.RECOMMENDATION_CANDIDATES)
+            logger.warning(f"[RecommendationCache] 추천 후보 저장 실패: {e}")
+            return False
+    
     @staticmethod
     async def invalidate_recommendation(pet_id: UUID) -> bool:
         """
@@ -100,8 +175,13 @@ class RecommendationCacheService:
             cache_key = CacheKeys.recommendation_result(pet_id)
             meta_key = CacheKeys.recommendation_meta(pet_id)
             tags_key = CacheKeys.recommendation_tags(pet_id)
+            negative_key = CacheKeys.negative_recommendation(pet_id)
+            candidates_key = CacheKeys.recommendation_candidates(pet_id)
             
-            deleted = await redis_client.delete(cache_key, meta_key, tags_key)
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.delete(cache_key, meta_key, tags_key, negative_key, candidates_key)
+                pipe.eval(_DROP_SECTIONS_SCRIPT, 1, CacheKeys.recommendation_section_keys(pet_id))
+                deleted, _sections = await pipe.execute()
             logger.info(f"[RecommendationCache] ✅ 캐시 무효화: pet_id={pet_id}, deleted={deleted}개 키")
             return deleted > 0
         except redis.RedisError as e:
@@ -127,6 +207,12 @@ class RecommendationCacheService:
             async for key in redis_client.scan_iter(match=pattern):
                 keys.append(key)
             
+            # 펫별로 등록된 개인화 섹션 캐시도 함께 삭제
+            section_prefix = CacheKeys.recommendation_section_keys("")
+            for key in keys:
+                if key.startswith(section_prefix):
+                    await redis_client.eval(_DROP_SECTIONS_SCRIPT, 1, key)
+            
             if keys:
                 deleted = await redis_client.delete(*keys)
                 logger.info(f"[RecommendationCache] ✅ 전체 캐시 무효화: {deleted}개 키 삭제")
@@ -146,12 +232,16 @@ class RecommendationCacheService:
         try:
             redis_client = await get_redis()
             cache_key = CacheKeys.pet_summary(pet_id)
-            cached_data = await redis_client.get(cache_key)
+            with CacheMetrics.timer(CacheNamespace.PET_SUMMARY, "get"):
+                cached_data = await redis_client.get(cache_key)
             
             if cached_data:
+                CacheMetrics.record_hit(CacheNamespace.PET_SUMMARY, len(cached_data.encode()))
                 return json.loads(cached_data)
+            CacheMetrics.record_miss(CacheNamespace.PET_SUMMARY)
             return None
         except Exception as e:
+            CacheMetrics.record_get_failure(CacheNamespace.PET_SUMMARY)
             logger.warning(f"[RecommendationCache] 펫 프로필 캐시 조회 실패: {e}")
             return None
     
@@ -162,14 +252,14 @@ class RecommendationCacheService:
             redis_client = await get_redis()
             cache_key = CacheKeys.pet_summary(pet_id)
             ttl = ttl or RecommendationCacheService.PET_SUMMARY_TTL
+            payload = json.dumps(summary, default=str)
             
-            await redis_client.setex(
-                cache_key,
-                ttl,
-                json.dumps(summary, default=str)
-            )
+            with CacheMetrics.timer(CacheNamespace.PET_SUMMARY, "set"):
+                await redis_client.setex(cache_key, ttl, payload)
+            CacheMetrics.record_set(CacheNamespace.PET_SUMMARY, len(payload.encode()))
             return True
         except Exception as e:
+            CacheMetrics.record_set_failure(CacheNamespace.PET_SUMMARY)
             logger.warning(f"[RecommendationCache] 펫 프로필 캐시 저장 실패: {e}")
             return False
     
@@ -200,8 +290,10 @@ class RecommendationCacheService:
             redis_client = await get_redis()
             cache_key = CacheKeys.product_match_score(product_id, pet_id)
             
-            cached_data = await redis_client.get(cache_key)
+            with CacheMetrics.timer(CacheNamespace.PRODUCT_MATCH_SCORE, "get"):
+                cached_data = await redis_client.get(cache_key)
             if cached_data:
+                CacheMetrics.record_hit(CacheNamespace.PRODUCT_MATCH_SCORE, len(cached_data.encode()))
                 logger.info(f"[RecommendationCache] ✅ 맞춤 점수 캐시 히트: product_id={product_id}, pet_id={pet_id}")
                 data = json.loads(cached_data)
                 # datetime 문자열을 datetime 객체로 변환
@@ -209,12 +301,15 @@ class RecommendationCacheService:
                     data['calculated_at'] = datetime.fromisoformat(data['calculated_at'])
                 return ProductMatchScoreResponse(**data)
             
+            CacheMetrics.record_miss(CacheNamespace.PRODUCT_MATCH_SCORE)
             logger.debug(f"[RecommendationCache] ❌ 맞춤 점수 캐시 미스: product_id={product_id}, pet_id={pet_id}")
             return None
         except redis.RedisError as e:
+            CacheMetrics.record_get_failure(CacheNamespace.PRODUCT_MATCH_SCORE)
             logger.warning(f"[RecommendationCache] 맞춤 점수 Redis 조회 실패: {e}, fallback to calculation")
             return None
         except Exception as e:
+            CacheMetrics.record_get_failure(CacheNamespace.PRODUCT_MATCH_SCORE)
             logger.error(f"[RecommendationCache] 맞춤 점수 조회 예상치 못한 에러: {e}", exc_info=True)
             return None
     
@@ -238,19 +333,20 @@ class RecommendationCacheService:
             
             # Pydantic 모델을 dict로 변환 (datetime 처리)
             data = match_score.model_dump(mode='json')
+            payload = json.dumps(data, default=str)
             
-            await redis_client.setex(
-                cache_key,
-                ttl,
-                json.dumps(data, default=str)
-            )
+            with CacheMetrics.timer(CacheNamespace.PRODUCT_MATCH_SCORE, "set"):
+                await redis_client.setex(cache_key, ttl, payload)
+            CacheMetrics.record_set(CacheNamespace.PRODUCT_MATCH_SCORE, len(payload.encode()))
             
             logger.info(f"[RecommendationCache] ✅ 맞춤 점수 캐시 저장: product_id={product_id}, pet_id={pet_id}, TTL={ttl}초")
             return True
         except redis.RedisError as e:
+            CacheMetrics.record_set_failure(CacheNamespace.PRODUCT_MATCH_SCORE)
             logger.warning(f"[RecommendationCache] 맞춤 점수 Redis 저장 실패: {e}")
             return False
         except Exception as e:
+            CacheMetrics.record_set_failure(CacheNamespace.PRODUCT_MATCH_SCORE)
             logger.error(f"[RecommendationCache] 맞춤 점수 저장 예상치 못한 에러: {e}", exc_info=True)
             return False
     
@@ -0,0 +1,97 @@
+"""
+키셋(커서) 페이지네이션 헬퍼
+
+OFFSET은 깊은 페이지일수록 앞 행을 모두 건너뛰어야 하므로 느려진다.
+대신 마지막 행의 정렬 키 값을 불투명 커서로 내려주고, 다음 페이지는
+"정렬 키가 커서보다 뒤인 행"을 인덱스로 바로 찾는다.
+
+- 커서: 정렬 키 값 JSON을 base64url로 감싼 문자열 (클라이언트는 그대로 돌려주기만 함)
+- 정렬 키는 마지막에 유일 키(id)를 두어 동률에서도 순서가 결정적이어야 함
+- 정렬 방향이 모두 같으면 행 비교 (a, b, c) > (:a, :b, :c) 하나로 (복합 인덱스 범위 탐색)
+- 방향이 섞여 있으면 행 비교를 쓸 수 없으므로 OR 체인으로 펼치고, 첫 키 범위 조건을 함께 걸어
+  인덱스 탐색 시작점을 잡게 함
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, literal, or_, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+# (정렬 식, 내림차순 여부)
+SortKey = Tuple[ColumnElement, bool]
+
+
+class InvalidCursorError(ValueError):
+    """디코딩할 수 없거나 다른 정렬/목록의 커서"""
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"u": str(value)}
+    return value
+
+
+def _from_json(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "u" in value:
+            return UUID(value["u"])
+    return value
+
+
+def encode_cursor(payload: Dict[str, Any]) -> str:
+    """payload의 "k"(정렬 키 값 목록)는 datetime/UUID를 보존해 직렬화"""
+    data = dict(payload)
+    if data.get("k") is not None:
+        data["k"] = [_to_json(value) for value in data["k"]]
+    raw = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        if not isinstance(data, dict):
+            raise ValueError("cursor payload is not an object")
+        if data.get("k") is not None:
+            data["k"] = [_from_json(value) for value in data["k"]]
+        return data
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"invalid cursor: {e}") from e
+
+
+def keyset_order_by(keys: Sequence[SortKey]) -> List[ColumnElement]:
+    return [expr.desc() if descending else expr.asc() for expr, descending in keys]
+
+
+def keyset_after(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement:
+    """
+    정렬 순서상 values 다음에 오는 행 조건
+
+    - 방향이 모두 같으면: (k1, k2, ...) > (v1, v2, ...) (내림차순은 <)
+    - 섞여 있으면: k1 >= v1 AND ((k1 > v1) OR (k1 = v1 AND k2 > v2) OR ...)
+      (앞의 k1 >= v1은 중복 조건이지만 OR 체인만으로는 인덱스 범위 탐색이 되지 않아 함께 건다)
+    """
+    if len(keys) != len(values):
+        raise InvalidCursorError("cursor does not match sort keys")
+    directions = {descending for _, descending in keys}
+    if len(directions) == 1:
+        row = tuple_(*[expr for expr, _ in keys])
+        cursor = tuple_(*[literal(value, expr.type) for (expr, _), value in zip(keys, values)])
+        return row < cursor if directions.pop() else row > cursor
+
+    clauses = []
+    for i, (expr, descending) in enumerate(keys):
+        prefix = [keys[j][0] == values[j] for j in range(i)]
+        comparison = expr < values[i] if descending else expr > values[i]
+        clauses.append(and_(*prefix, comparison))
+    first_expr, first_descending = keys[0]
+    bound = first_expr <= values[0] if first_descending else first_expr >= values[0]
+    return and_(bound, or_(*clauses))
@@ -1,31 +1,235 @@
+import asyncio
+import logging
+import time
 import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
 from typing import Optional
 from app.core.config import settings
 
-_redis_client: Optional[redis.Redis] = None
+logger = logging.getLogger(__name__)
+
+_redis_pool: Optional[redis.ConnectionPool] = None
+_redis_client: Optional["CircuitBreakerRedis"] = None
+
+
+class RedisCircuitOpenError(redis.RedisError):
+    """서킷이 열려 있어 Redis 호출을 건너뜀 (호출부는 기존 RedisError fallback 경로를 탐)"""
+    pass
+
+
+class RedisCircuitBreaker:
+    """
+    Redis 서킷 브레이커
+
+    - CLOSED: 정상 호출, 연속 실패가 임계치에 도달하면 OPEN
+    - OPEN: cool-down 동안 Redis 호출 없이 즉시 실패 (요청이 타임아웃을 기다리지 않음)
+    - HALF_OPEN: cool-down 이후 시험 호출 1건만 허용, 성공하면 CLOSED / 실패하면 다시 OPEN
+    """
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    # 연결/타임아웃 계열만 장애로 판단 (WRONGTYPE 등 명령 에러는 Redis가 살아있다는 뜻)
+    FAILURE_EXCEPTIONS = (
+        redis.ConnectionError,
+        redis.TimeoutError,
+        asyncio.TimeoutError,
+        OSError,
+    )
+
+    def __init__(self, failure_threshold: int, reset_timeout_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._trial_started_at: Optional[float] = None
+        # 관측용 누적 카운터
+        self.total_failures = 0
+        self.total_short_circuited = 0
+        self.times_opened = 0
+
+    def is_open(self) -> bool:
+        """cool-down 중인지 확인 (상태 전이 없음, 건너뛴 호출로 집계)"""
+        if self.state != self.OPEN:
+            return False
+        if time.monotonic() - (self.opened_at or 0) >= self.reset_timeout_seconds:
+            return False
+        self.total_short_circuited += 1
+        return True
+
+    def allow_request(self) -> bool:
+        """이번 호출을 Redis로 보내도 되는지 판단"""
+        if self.state == self.CLOSED:
+            return True
+
+        if self.state == self.OPEN:
+            if time.monotonic() - (self.opened_at or 0) < self.reset_timeout_seconds:
+                self.total_short_circuited += 1
+                return False
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+
+        # HALF_OPEN: 시험 호출 1건만 통과 (취소 등으로 결과가 안 돌아온 시험 호출은 cool-down 후 재시도)
+        now = time.monotonic()
+        if self._trial_in_flight and now - (self._trial_started_at or 0) < self.reset_timeout_seconds:
+            self.total_short_circuited += 1
+            return False
+        self._trial_in_flight = True
+        self._trial_started_at = now
+        return True
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            logger.info("[Redis] ✅ 서킷 CLOSED: Redis 응답 회복")
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.total_failures += 1
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+                logger.warning(
+                    f"[Redis] ⚠️ 서킷 OPEN: 연속 실패 {self.consecutive_failures}회, "
+                    f"{self.reset_timeout_seconds}초 동안 캐시 호출 건너뜀"
+                )
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def snapshot(self) -> dict:
+        """현재 상태 (헬스/메트릭 엔드포인트용)"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "reset_timeout_seconds": self.reset_timeout_seconds,
+            "total_failures": self.total_failures,
+            "total_short_circuited": self.total_short_circuited,
+            "times_opened": self.times_opened,
+        }
+
+
+circuit_breaker = RedisCircuitBreaker(
+    failure_threshold=settings.REDIS_CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout_seconds=settings.REDIS_CIRCUIT_RESET_SECONDS,
+)
+
+
+class CircuitBreakerPipeline(Pipeline):
+    """파이프라인 실행 결과도 서킷 브레이커에 기록 (MGET/배치 SET 경로용)"""
+
+    async def execute(self, raise_on_error: bool = True):
+        if not circuit_breaker.allow_request():
+            await self.reset()
+            raise RedisCircuitOpenError("Redis circuit is open")
+        try:
+            result = await super().execute(raise_on_error)
+        except RedisCircuitBreaker.FAILURE_EXCEPTIONS:
+            circuit_breaker.record_failure()
+            raise
+        except redis.RedisError:
+            # 명령 에러는 Redis가 응답했다는 뜻이므로 정상으로 기록
+            circuit_breaker.record_success()
+            raise
+        circuit_breaker.record_success()
+        return result
+
+
+class CircuitBreakerRedis(redis.Redis):
+    """모든 명령 결과를 서킷 브레이커에 기록하는 Redis 클라이언트"""
+
+    def pipeline(self, transaction: bool = True, shard_hint: Optional[str] = None) -> Pipeline:
+        return CircuitBreakerPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+
+    async def execute_command(self, *args, **options):
+        if not circuit_breaker.allow_request():
+            raise RedisCircuitOpenError("Redis circuit is open")
+        try:
+            result = await super().execute_command(*args, **options)
+        except RedisCircuitBreaker.FAILURE_EXCEPTIONS:
+            circuit_breaker.record_failure()
+            raise
+        except redis.RedisError:
+            # 명령 에러는 Redis가 응답했다는 뜻이므로 정상으로 기록
+            circuit_breaker.record_success()
+            raise
+        circuit_breaker.record_success()
+        return result
 
 
 async def init_redis():
-    """Redis 연결 초기화"""
-    global _redis_client
-    _redis_client = redis.from_url(
+    """Redis 연결 초기화 (커넥션 풀 + 타임아웃 + 헬스체크)"""
+    global _redis_pool, _redis_client
+    _redis_pool = redis.ConnectionPool.from_url(
         settings.REDIS_URL,
         encoding="utf-8",
-        decode_responses=True
+        decode_responses=True,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+        retry_on_timeout=False,
     )
+    _redis_client = CircuitBreakerRedis(connection_pool=_redis_pool)
 
 
 async def close_redis():
     """Redis 연결 종료"""
-    global _redis_client
+    global _redis_pool, _redis_client
     if _redis_client:
         await _redis_client.close()
         _redis_client = None
+    if _redis_pool:
+        await _redis_pool.disconnect()
+        _redis_pool = None
 
 
 async def get_redis() -> redis.Redis:
-    """Redis 클라이언트 반환"""
+    """
+    Redis 클라이언트 반환
+
+    서킷이 열려 있으면 RedisCircuitOpenError(RedisError)를 던지므로,
+    캐시 서비스는 기존 except 경로로 바로 PostgreSQL fallback 한다.
+    """
     if _redis_client is None:
         await init_redis()
+    if circuit_breaker.is_open():
+        raise RedisCircuitOpenError("Redis circuit is open")
     return _redis_client
 
+
+def create_blocking_redis(block_seconds: float) -> redis.Redis:
+    """
+    스트림 소비 워커 전용 클라이언트 (XREADGROUP BLOCK 대기가 socket_timeout에 걸리지 않도록 별도 생성)
+
+    API 경로용 공용 클라이언트와 달리 서킷 브레이커를 거치지 않는다.
+    """
+    return redis.Redis.from_url(
+        settings.REDIS_URL,
+        encoding="utf-8",
+        decode_responses=True,
+        socket_timeout=block_seconds + 5,
+        socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+    )
+
+
+def get_redis_pool_stats() -> dict:
+    """커넥션 풀 사용 현황"""
+    if _redis_pool is None:
+        return {"initialized": False}
+    return {
+        "initialized": True,
+        "max_connections": _redis_pool.max_connections,
+        "in_use_connections": len(_redis_pool._in_use_connections),
+        "available_connections": len(_redis_pool._available_connections),
+    }
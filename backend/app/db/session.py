@@ -1,5 +1,7 @@
+import asyncio
+from contextvars import ContextVar
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Awaitable, Callable, List, Optional, TypeVar
 
 from app.core.config import settings
 from app.db.base import Base
@@ -37,3 +39,53 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+
+T = TypeVar("T")
+
+# gather_in_sessions 하위 작업 안이면 그 작업의 세션 (중첩 fan-out 방지)
+_fanout_session: ContextVar[Optional[AsyncSession]] = ContextVar("fanout_session", default=None)
+
+
+async def gather_in_sessions(
+    *calls: Callable[[AsyncSession], Awaitable[T]],
+    concurrency: Optional[int] = None,
+) -> List[T]:
+    """
+    읽기 전용 하위 조회들을 각자의 세션에서 병렬 실행 (AsyncSession은 동시 사용 불가)
+
+    호출마다 커넥션을 하나씩 빌리므로 여러 쿼리로 된 느린 독립 조회(섹션 미스, 상세 재구성 등)에만 쓰고,
+    인덱스 조회 한두 건은 요청 세션에서 차례로 실행한다.
+
+    - 호출마다 풀에서 세션을 새로 열고 끝나면 바로 반환 (커밋하지 않음, 쓰기에는 사용 금지)
+    - 동시 실행 수는 concurrency(기본 DB_FANOUT_CONCURRENCY)로 제한해 커넥션 풀 고갈 방지
+    - 하위 작업 안에서 다시 호출하면 새 세션을 열지 않고 그 작업의 세션에서 차례로 실행
+      (중첩되면 요청당 커넥션이 DB_FANOUT_CONCURRENCY²로 늘어나므로)
+    - 하나라도 실패하면 나머지를 취소하고 첫 예외를 그대로 올림, 호출부가 취소되면 하위 작업도 취소
+
+    사용 예:
+        results = await gather_in_sessions(*[
+            functools.partial(SectionService._query_section_products, request=request, limit=20, offset=0)
+            for request in missed
+        ])
+    """
+    if not calls:
+        return []
+    outer_session = _fanout_session.get()
+    if outer_session is not None:
+        return [await call(outer_session) for call in calls]
+    semaphore = asyncio.Semaphore(concurrency or settings.DB_FANOUT_CONCURRENCY)
+
+    async def run(call: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        async with semaphore:
+            async with AsyncSessionLocal() as session:
+                _fanout_session.set(session)
+                return await call(session)
+
+    tasks = [asyncio.ensure_future(run(call)) for call in calls]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -22,20 +22,25 @@ Alembic 마이그레이션 명령어:
 
 import os
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 
 from app.db.base import Base
-from app.core.redis import init_redis, close_redis
+from app.core.redis import init_redis, close_redis, circuit_breaker, get_redis_pool_stats
+from app.core.cache.cache_metrics import CacheMetrics
 from app.api.v1.router import api_router
+from app.workers.cache_warmer import start_cache_warmer, shutdown_cache_warmer
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     await init_redis()
+    start_cache_warmer()
     yield
     # Shutdown
+    shutdown_cache_warmer()
     await close_redis()
 
 
@@ -75,6 +80,24 @@ async def health_check():
     return {"status": "ok", "message": "Service is running"}
 
 
+@app.get("/health/redis")
+async def redis_health_check():
+    """Redis 커넥션 풀 / 서킷 브레이커 상태"""
+    breaker = circuit_breaker.snapshot()
+    return {
+        "status": "ok" if breaker["state"] == "CLOSED" else "degraded",
+        "circuit_breaker": breaker,
+        "pool": get_redis_pool_stats(),
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 스크레이프 엔드포인트 (캐시 히트/미스/지연 + Redis 서킷/풀 상태)"""
+    CacheMetrics.refresh_redis_gauges()
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 # Health 엔드포인트를 api_router에도 추가 (일관성을 위해)
 @api_router.get("/health")
 async def api_health_check():
@@ -17,10 +17,12 @@ from app.models.product import (
     ProductClaim
 )
 from app.models.offer import ProductOffer, Merchant
-from app.models.price import PriceSnapshot, PriceSummary
+from app.models.price import PriceSnapshot, PriceSummary, PriceRollupHourly, PriceRollupDaily
 from app.models.tracking import Tracking, TrackingStatus
 from app.models.alert import Alert, AlertEvent, AlertRuleType, AlertEventStatus
+from app.models.push_token import PushToken, PushProvider
 from app.models.outbound_click import OutboundClick, ClickSource
+from app.models.click_rollup import ClickRollupHourly, ClickRollupDaily, AnalyticsWatermark
 from app.models.recommendation import RecommendationRun, RecommendationItem, RecStrategy
 from app.models.campaign import (
     Campaign, CampaignRule, CampaignAction, 
@@ -48,10 +50,13 @@ __all__ = [
     "ProductOffer", "Merchant",
     "PriceSnapshot",
     "PriceSummary",
+    "PriceRollupHourly", "PriceRollupDaily",
     "Tracking", "TrackingStatus",
     "Alert",
     "AlertEvent", "AlertRuleType", "AlertEventStatus",
+    "PushToken", "PushProvider",
     "OutboundClick", "ClickSource",
+    "ClickRollupHourly", "ClickRollupDaily", "AnalyticsWatermark",
     "RecommendationRun", "RecommendationItem", "RecStrategy",
     "Campaign", "CampaignRule", "CampaignAction",
     "UserCampaignImpression", "UserCampaignReward", "UserMissionProgress",
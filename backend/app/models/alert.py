@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, Boolean, DateTime, ForeignKey, Enum as SQLEnum, Numeric, Index
+from sqlalchemy import Column, Integer, SmallInteger, Boolean, DateTime, ForeignKey, Enum as SQLEnum, Numeric, Index, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 import uuid
 import enum
 
@@ -15,6 +15,7 @@ class AlertRuleType(str, enum.Enum):
 
 
 class AlertEventStatus(str, enum.Enum):
+    PENDING = "PENDING"  # 기록됨, 푸시 발송 대기 (app.workers.push_delivery)
     SENT = "SENT"
     FAILED = "FAILED"
 
@@ -54,10 +55,13 @@ class AlertEvent(Base):
     opened_at = Column(DateTime(timezone=True), nullable=True)
     clicked_at = Column(DateTime(timezone=True), nullable=True)
     status = Column(SQLEnum(AlertEventStatus), nullable=False, server_default='SENT')
+    delivery_attempts = Column(SmallInteger, nullable=False, server_default='0')  # 푸시 발송 시도 횟수
+    delivery_error = Column(Text, nullable=True)  # 발송 실패/생략 사유
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     __table_args__ = (
         Index('idx_alert_events_alert_time', 'alert_id', 'sent_at', postgresql_ops={'sent_at': 'DESC'}),
+        Index('idx_alert_events_pending', 'sent_at', postgresql_where=text("status = 'PENDING'")),
     )
 
     # Relationships
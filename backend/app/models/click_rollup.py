@@ -0,0 +1,67 @@
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Index, Numeric
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+# 롤업 차원: offer/campaign/pet_species는 NULL일 수 있으므로 PK 대신 NULLS NOT DISTINCT 유니크 인덱스로 UPSERT
+CLICK_ROLLUP_DIMENSIONS = ("bucket_start", "product_id", "offer_id", "source", "campaign_id", "pet_species")
+
+
+def _rollup_table_args(table_name: str) -> tuple:
+    return (
+        Index(
+            f'uq_{table_name}_dims', *CLICK_ROLLUP_DIMENSIONS,
+            unique=True, postgresql_nulls_not_distinct=True
+        ),
+    )
+
+
+class ClickRollupHourly(Base):
+    """시간 단위 클릭/커미션 롤업 - 클릭 롤업 워커가 created_at 워터마크 기준으로 증분 갱신"""
+    __tablename__ = "click_rollups_hourly"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    bucket_start = Column(DateTime(timezone=True), nullable=False)  # 클릭 시각 기준 버킷 시작 (UTC 정시)
+    product_id = Column(UUID(as_uuid=True), ForeignKey("products.id", ondelete="CASCADE"), nullable=False)
+    offer_id = Column(UUID(as_uuid=True), nullable=True)
+    source = Column(String(20), nullable=False)  # HOME/DETAIL/ALERT
+    campaign_id = Column(UUID(as_uuid=True), nullable=True)  # outbound_clicks.meta.campaign_id
+    pet_species = Column(String(10), nullable=True)  # 클릭한 펫의 종 (펫 없는 클릭은 NULL)
+
+    click_count = Column(Integer, nullable=False, server_default='0')
+    converted_count = Column(Integer, nullable=False, server_default='0')  # actual_commission이 확정된 클릭 수
+    estimated_commission = Column(Numeric(14, 2), nullable=False, server_default='0')
+    actual_commission = Column(Numeric(14, 2), nullable=False, server_default='0')
+
+    __table_args__ = _rollup_table_args("click_rollups_hourly")
+
+
+class ClickRollupDaily(Base):
+    """일 단위 클릭/커미션 롤업 - 장기 대시보드용"""
+    __tablename__ = "click_rollups_daily"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    bucket_start = Column(DateTime(timezone=True), nullable=False)  # 클릭 시각 기준 버킷 시작 (UTC 자정)
+    product_id = Column(UUID(as_uuid=True), ForeignKey("products.id", ondelete="CASCADE"), nullable=False)
+    offer_id = Column(UUID(as_uuid=True), nullable=True)
+    source = Column(String(20), nullable=False)
+    campaign_id = Column(UUID(as_uuid=True), nullable=True)
+    pet_species = Column(String(10), nullable=True)
+
+    click_count = Column(Integer, nullable=False, server_default='0')
+    converted_count = Column(Integer, nullable=False, server_default='0')
+    estimated_commission = Column(Numeric(14, 2), nullable=False, server_default='0')
+    actual_commission = Column(Numeric(14, 2), nullable=False, server_default='0')
+
+    __table_args__ = _rollup_table_args("click_rollups_daily")
+
+
+class AnalyticsWatermark(Base):
+    """증분 집계 작업별 처리 완료 지점 (이 시각까지 created_at인 원본 행은 롤업에 반영됨)"""
+    __tablename__ = "analytics_watermarks"
+
+    name = Column(String(50), primary_key=True)  # 작업 이름 (예: click_rollups)
+    watermark = Column(DateTime(timezone=True), nullable=True)  # NULL이면 아직 한 번도 실행되지 않음
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -59,6 +59,7 @@ class ProductOffer(Base, TimestampMixin):
     current_price = Column(Integer, nullable=True)
     currency = Column(CHAR(3), nullable=False, default="KRW")
     last_seen_price = Column(Integer, nullable=True)
+    price_fingerprint = Column(String(64), nullable=True)  # 마지막 관측값 지문 (최종가/품절/할인 구성, 변경 감지용)
     is_primary = Column(Boolean, default=False, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
 
@@ -71,4 +72,4 @@ class ProductOffer(Base, TimestampMixin):
     # Relationships
     product = relationship("Product", back_populates="offers")
     price_snapshots = relationship("PriceSnapshot", back_populates="offer", cascade="all, delete-orphan")
-    price_summary = relationship("PriceSummary", back_populates="offer", uselist=False, cascade="all, delete-orphan")
+    price_summaries = relationship("PriceSummary", back_populates="offer", cascade="all, delete-orphan")
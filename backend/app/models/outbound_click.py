@@ -1,6 +1,6 @@
 from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as SQLEnum, Index, Numeric
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 import uuid
 import enum
 
@@ -25,6 +25,7 @@ class OutboundClick(Base):
     source = Column(String(20), nullable=False)  # HOME/DETAIL/ALERT
     clicked_at = Column(DateTime(timezone=True), nullable=False)
     session_id = Column(String(255), nullable=True)
+    client_event_id = Column(String(64), nullable=True)  # 클라이언트가 만든 클릭 ID (session_id와 함께 재전송 중복 방지)
     estimated_commission = Column(Numeric(10, 2), nullable=True)  # 어필리에이트 수익 분석용 예상 커미션
     actual_commission = Column(Numeric(10, 2), nullable=True)  # 어필리에이트 수익 분석용 실제 커미션
     meta = Column(JSONB, nullable=True)
@@ -33,4 +34,8 @@ class OutboundClick(Base):
     __table_args__ = (
         Index('idx_clicks_product_time', 'product_id', 'clicked_at', postgresql_ops={'clicked_at': 'DESC'}),
         Index('idx_clicks_user_time', 'user_id', 'clicked_at', postgresql_ops={'clicked_at': 'DESC'}),
+        Index(
+            'uq_clicks_session_event', 'session_id', 'client_event_id', unique=True,
+            postgresql_where=text('session_id IS NOT NULL AND client_event_id IS NOT NULL')
+        ),
     )
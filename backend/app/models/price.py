@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, Boolean
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Index, Boolean
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -33,6 +33,7 @@ class PriceSnapshot(Base):
     __table_args__ = (
         Index('idx_price_snapshots_offer_time', 'offer_id', 'captured_at', postgresql_ops={'captured_at': 'DESC'}),
         Index('idx_price_snapshots_offer_final', 'offer_id', 'final_price'),
+        Index('idx_price_snapshots_captured_at', 'captured_at'),  # 보존 기간 정리용
     )
 
     # Relationships
@@ -40,11 +41,11 @@ class PriceSnapshot(Base):
 
 
 class PriceSummary(Base):
-    """가격 요약 - window별 캐시"""
+    """가격 요약 - window별(7/30/90일) 롤링 통계, 스냅샷 수집 시 증분 갱신"""
     __tablename__ = "price_summaries"
 
     offer_id = Column(UUID(as_uuid=True), ForeignKey("product_offers.id", ondelete="CASCADE"), primary_key=True)
-    window_days = Column(Integer, default=30, nullable=False)
+    window_days = Column(Integer, primary_key=True, default=30)
     
     # final_price 기준 통계
     avg_final_price = Column(Integer, nullable=False)
@@ -53,7 +54,53 @@ class PriceSummary(Base):
     last_final_price = Column(Integer, nullable=False)
     last_captured_at = Column(DateTime(timezone=True), nullable=False)
     
+    # 증분 계산용 상태: 윈도우 합계/건수 + 일별 버킷 {"YYYY-MM-DD": [sum, count, min, max]}
+    sum_final_price = Column(BigInteger, nullable=False, server_default='0')
+    sample_count = Column(Integer, nullable=False, server_default='0')
+    buckets = Column(JSONB, nullable=False, server_default='{}')
+    
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Relationships
-    offer = relationship("ProductOffer", back_populates="price_summary")
+    offer = relationship("ProductOffer", back_populates="price_summaries")
+
+
+class PriceRollupHourly(Base):
+    """시간 단위 가격 롤업 (OHLC) - 수집 시 증분 갱신, 차트용"""
+    __tablename__ = "price_rollups_hourly"
+
+    offer_id = Column(UUID(as_uuid=True), ForeignKey("product_offers.id", ondelete="CASCADE"), primary_key=True)
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)  # 버킷 시작 시각 (UTC 정시)
+    
+    open_price = Column(Integer, nullable=False)
+    min_price = Column(Integer, nullable=False)
+    max_price = Column(Integer, nullable=False)
+    close_price = Column(Integer, nullable=False)
+    sample_count = Column(Integer, nullable=False, server_default='0')
+    # 늦게 도착한 관측값도 open/close를 올바르게 유지하기 위한 시각
+    open_at = Column(DateTime(timezone=True), nullable=False)
+    close_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index('idx_price_rollups_hourly_bucket', 'bucket_start'),  # 보존 기간 정리용
+    )
+
+
+class PriceRollupDaily(Base):
+    """일 단위 가격 롤업 (OHLC) - 장기 차트용, 보존 기간 제한 없음"""
+    __tablename__ = "price_rollups_daily"
+
+    offer_id = Column(UUID(as_uuid=True), ForeignKey("product_offers.id", ondelete="CASCADE"), primary_key=True)
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)  # 버킷 시작 시각 (UTC 자정)
+    
+    open_price = Column(Integer, nullable=False)
+    min_price = Column(Integer, nullable=False)
+    max_price = Column(Integer, nullable=False)
+    close_price = Column(Integer, nullable=False)
+    sample_count = Column(Integer, nullable=False, server_default='0')
+    open_at = Column(DateTime(timezone=True), nullable=False)
+    close_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index('idx_price_rollups_daily_bucket', 'bucket_start'),
+    )
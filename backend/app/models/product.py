@@ -1,7 +1,7 @@
-from sqlalchemy import Column, String, Boolean, ForeignKey, Enum as SQLEnum, Index, Text, SmallInteger, CheckConstraint, Integer, UniqueConstraint, DateTime
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, Boolean, ForeignKey, Enum as SQLEnum, Index, Text, SmallInteger, CheckConstraint, Integer, UniqueConstraint, DateTime, Computed
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from sqlalchemy.types import Numeric
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 import uuid
 import enum
@@ -9,6 +9,16 @@ import enum
 from app.db.base import Base, TimestampMixin
 
 
+# 검색 정규화 (ProductSearchService.normalize와 같은 규칙):
+# NFKC(전각→반각) → 소문자 → 중량 표기 통일(킬로/키로 → kg) → 영문/숫자/한글 음절/. 외에는 공백
+# (DB 로캘/콜레이션과 무관하도록 [:alnum:] 대신 명시적 문자 집합)
+_SEARCH_SOURCE_SQL = (
+    "regexp_replace(regexp_replace(lower(normalize("
+    "coalesce(brand_name, '') || ' ' || coalesce(product_name, '') || ' ' || coalesce(size_label, ''), NFKC)), "
+    "'(킬로그램|킬로|키로)', 'kg', 'g'), '[^0-9A-Za-z가-힣.]+', ' ', 'g')"
+)
+
+
 # PetSpecies는 pet.py와 공유하지만 순환 참조 방지를 위해 여기서도 정의
 class PetSpecies(str, enum.Enum):
     DOG = "DOG"
@@ -26,10 +36,18 @@ class Product(Base, TimestampMixin):
     species = Column(SQLEnum(PetSpecies), nullable=True)  # DOG/CAT 전용 사료면 지정, 공용이면 NULL
     is_active = Column(Boolean, default=True, nullable=False)
     price_per_kg = Column(Numeric(10, 2), nullable=True)  # 원/kg 단위 가격 (추천 정렬/필터링용)
+    # 검색용 생성 컬럼 (상품 쓰기 시 DB가 갱신, 목록 조회에는 로드하지 않음)
+    search_vector = deferred(Column(TSVECTOR, Computed(f"to_tsvector('simple'::regconfig, {_SEARCH_SOURCE_SQL})", persisted=True)))
+    search_compact = deferred(Column(Text, Computed(f"replace({_SEARCH_SOURCE_SQL}, ' ', '')", persisted=True)))  # 띄어쓰기 무시 부분 일치 (trigram)
 
     __table_args__ = (
         Index('idx_products_active', 'is_active'),
         Index('idx_products_brand', 'brand_name'),
+        # 키셋 페이지네이션 (최신순 섹션/관리자 목록, 브랜드순 관리자 목록)
+        Index('idx_products_created_id', 'created_at', 'id'),
+        Index('idx_products_brand_name_id', 'brand_name', 'product_name', 'id'),
+        Index('idx_products_search_vector', 'search_vector', postgresql_using='gin'),
+        Index('idx_products_search_compact_trgm', 'search_compact', postgresql_using='gin', postgresql_ops={'search_compact': 'gin_trgm_ops'}),
         UniqueConstraint('brand_name', 'product_name', 'size_label', name='unique_brand_name_size'),
     )
 
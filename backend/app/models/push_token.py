@@ -0,0 +1,28 @@
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Enum as SQLEnum, Index, Text
+from sqlalchemy.dialects.postgresql import UUID
+import uuid
+import enum
+
+from app.db.base import Base, TimestampMixin
+
+
+class PushProvider(str, enum.Enum):
+    FCM = "FCM"
+    APNS = "APNS"
+
+
+class PushToken(Base, TimestampMixin):
+    """기기 푸시 토큰 - 사용자당 여러 기기, 토큰은 전역 유일"""
+    __tablename__ = "push_tokens"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    provider = Column(SQLEnum(PushProvider), nullable=False)
+    token = Column(String(512), nullable=False, unique=True)
+    is_active = Column(Boolean, default=True, nullable=False)
+    last_error = Column(Text, nullable=True)  # 비활성화 사유 (InvalidToken 등)
+    deactivated_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index('idx_push_tokens_user_active', 'user_id', 'is_active'),
+    )
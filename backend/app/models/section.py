@@ -1,6 +1,6 @@
 """마켓 섹션 관련 모델"""
 import enum
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime, timedelta
 
 
@@ -19,13 +19,26 @@ class ProductCategory(str, enum.Enum):
     DOG = "dog"
     CAT = "cat"
 
+    @classmethod
+    def for_species(cls, species) -> List["ProductCategory"]:
+        """상품 species(PetSpecies 또는 그 값)가 노출되는 카테고리 (species가 없으면 공용)"""
+        from app.models.product import PetSpecies
+
+        species = getattr(species, "value", species)
+        categories = [cls.ALL]
+        if species is None or species == PetSpecies.DOG.value:
+            categories.append(cls.DOG)
+        if species is None or species == PetSpecies.CAT.value:
+            categories.append(cls.CAT)
+        return categories
+
 
 class SectionConfig:
     """섹션별 설정"""
     
     # 섹션별 Redis TTL (초)
     CACHE_TTL = {
-        SectionType.HOT_DEAL: 3600,  # 1시간
+        SectionType.HOT_DEAL: 300,  # 5분 (핫딜 인덱스가 가격 변경 시 갱신되므로 짧게)
         SectionType.POPULAR: 300,  # 5분
         SectionType.NEW: 1800,  # 30분
         SectionType.REVIEW_BEST: 7200,  # 2시간
@@ -143,9 +143,10 @@ class ProductListRead(BaseModel):
 class ProductListResponse(BaseModel):
     """상품 목록 페이지네이션 응답"""
     items: List[ProductListRead]
-    total: int
+    total: Optional[int] = Field(None, description="전체 개수 (include_total=false면 None, 짧게 캐시된 값)")
     page: int
     size: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 None)")
 
 # Admin Schemas for Product Images
 class ProductImagesUpdate(BaseModel):
@@ -212,7 +213,29 @@ class OfferUpdate(BaseModel):
     is_primary: Optional[bool] = None
     is_active: Optional[bool] = None
 
-# Admin Schemas for Imports
+# Admin Schemas for Price Ingest
+class PriceObservationCreate(BaseModel):
+    offer_id: UUID
+    final_price: int = Field(..., ge=0)
+    listed_price: Optional[int] = Field(None, ge=0)
+    shipping_fee: int = Field(0, ge=0)
+    coupon_discount: int = Field(0, ge=0)
+    card_discount: int = Field(0, ge=0)
+    currency: str = Field("KRW", max_length=3)
+    is_sold_out: bool = False
+    captured_at: datetime
+    captured_source: str = Field("ADMIN_INGEST", max_length=50)
+
+class PriceIngestRequest(BaseModel):
+    observations: List[PriceObservationCreate] = Field(..., min_length=1, max_length=50000)
+
+class PriceIngestResponse(BaseModel):
+    ingested: int
+    skipped_unknown_offers: int
+    batches: int
+    duration_ms: int
+
+
 from enum import Enum
 
 class ImportType(str, Enum):
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
@@ -26,3 +26,29 @@ class AlertRead(BaseModel):
 
     model_config = {"from_attributes": True}
 
+
+
+class NotificationRead(BaseModel):
+    """알림함 항목 (발송된 알림 1건)"""
+    id: UUID = Field(..., description="알림 이벤트 ID")
+    alert_id: UUID
+    product_id: UUID
+    product_name: Optional[str] = None
+    reason: AlertRuleType
+    price: int = Field(..., description="발송 시점 가격")
+    avg_price: Optional[int] = Field(None, description="발송 시점 30일 평균가")
+    delta_percent: Optional[float] = Field(None, description="평균 대비 변동률 (%)")
+    sent_at: datetime
+    is_read: bool
+
+
+class NotificationInboxResponse(BaseModel):
+    """알림함 페이지 응답"""
+    items: List[NotificationRead]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (없으면 마지막 페이지)")
+    unread_count: int
+
+
+class UnreadCountResponse(BaseModel):
+    """안 읽은 알림 수 (배지)"""
+    unread_count: int
@@ -0,0 +1,54 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from datetime import date, datetime
+
+
+class ClickMetrics(BaseModel):
+    """클릭/커미션 합계"""
+    clicks: int = 0
+    converted: int = 0  # 실제 커미션이 확정된 클릭 수
+    estimated_commission: float = 0
+    actual_commission: float = 0
+
+
+class ClickTimeseriesPoint(ClickMetrics):
+    """시계열 버킷 1개 (group_by가 있으면 차원 값별로 1개씩)"""
+    bucket_start: datetime
+    key: Optional[str] = None  # 차원 값 (product_id/offer_id/source/campaign_id/pet_species), NULL은 미지정
+
+
+class ClickTimeseriesResponse(BaseModel):
+    granularity: str  # hour | day
+    group_by: Optional[str] = None
+    points: List[ClickTimeseriesPoint]
+    watermark: Optional[datetime] = None  # 이 시각까지 적재된 클릭만 반영됨
+
+
+class ClickBreakdownItem(ClickMetrics):
+    key: Optional[str] = None
+    label: Optional[str] = None  # 상품명/캠페인 키 등 표시용
+
+
+class ClickBreakdownResponse(BaseModel):
+    dimension: str
+    items: List[ClickBreakdownItem]
+    totals: ClickMetrics  # 상위 N개가 아닌 기간 전체 합계
+    watermark: Optional[datetime] = None
+
+
+class ClickRollupStatus(BaseModel):
+    watermark: Optional[datetime] = None
+    lag_seconds: Optional[float] = None  # 지금과 워터마크 차이 (CLICK_ROLLUP_LAG_SECONDS보다 크게 벌어지면 워커 확인)
+
+
+class ClickRollupRebuildRequest(BaseModel):
+    """커미션 정산 등으로 원본 클릭이 수정된 기간 재집계 (UTC 일 단위, 양 끝 포함)"""
+    start_date: date
+    end_date: date = Field(..., description="포함")
+
+
+class ClickRollupRebuildResponse(BaseModel):
+    start_date: date
+    end_date: date
+    hourly_rows: int
+    daily_rows: int
@@ -12,6 +12,9 @@ class ClickCreate(BaseModel):
     product_id: UUID
     offer_id: UUID
     source: ClickSource
+    campaign_id: Optional[UUID] = Field(None, description="클릭을 유도한 캠페인 (outbound_clicks.meta에 저장, 캠페인별 성과 집계용)")
+    session_id: Optional[str] = Field(None, max_length=255)
+    client_event_id: Optional[str] = Field(None, max_length=64, description="클라이언트 클릭 ID (재전송 시 같은 값, session_id와 함께 중복 방지)")
 
 
 class ClickRead(BaseModel):
@@ -20,6 +20,20 @@ class ProductRead(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class ProductSearchResponse(BaseModel):
+    """상품 검색 응답 (관련도순)"""
+    query: str
+    products: List[ProductRead]
+    has_more: bool = Field(..., description="다음 페이지 존재 여부")
+
+
+class SearchSuggestion(BaseModel):
+    """검색 자동완성 항목"""
+    type: str = Field(..., description="brand 또는 product")
+    text: str
+    product_id: Optional[UUID] = Field(None, description="상품 제안일 때 상품 ID")
+
+
 class ProductCreate(BaseModel):
     """상품 생성 요청"""
     brand_name: str = Field(..., min_length=1, max_length=100)
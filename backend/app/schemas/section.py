@@ -14,7 +14,8 @@ class SectionRequest(BaseModel):
     category: ProductCategory = ProductCategory.ALL
     limit: Optional[int] = Field(None, ge=1, le=50)
     offset: Optional[int] = Field(None, ge=0)
-    time_range: Optional[str] = Field(None, description="인기 섹션용: 24h, 7d, 30d")
+    cursor: Optional[str] = Field(None, description="이전 응답의 next_cursor (있으면 offset 대신 사용)")
+    time_range: Optional[str] = Field(None, description="인기 섹션용: 1h, 24h, 7d, 30d (슬라이딩 윈도우), trending (시간 감쇠)")
     days: Optional[int] = Field(None, description="신상품 섹션용: 신상품 기준 일수")
     min_reviews: Optional[int] = Field(None, description="리뷰 베스트 섹션용: 최소 리뷰 수")
     user_id: Optional[UUID] = Field(None, description="개인화 섹션용: 사용자 ID")
@@ -29,6 +30,7 @@ class SectionResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 None)")
     cached: bool = False
     cached_at: Optional[datetime] = None
 
@@ -1,7 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
+from app.models.alert import AlertRuleType
+from app.models.offer import Merchant
+from app.models.product import PetSpecies
 from app.models.tracking import TrackingStatus
 
 
@@ -22,3 +26,36 @@ class TrackingRead(BaseModel):
 
     model_config = {"from_attributes": True}
 
+
+
+class WatchlistItem(BaseModel):
+    """관심 상품(추적) 항목 - 상품 요약 + 현재가/평균가 + 알림 상태"""
+    tracking_id: UUID
+    pet_id: UUID
+    status: TrackingStatus
+    tracked_at: datetime
+    product_id: UUID
+    brand_name: str
+    product_name: str
+    size_label: Optional[str] = None
+    species: Optional[PetSpecies] = None
+    is_active: bool
+    image_url: Optional[str] = None
+    merchant: Optional[Merchant] = Field(None, description="대표 판매처")
+    purchase_url: Optional[str] = None
+    current_price: Optional[int] = Field(None, description="현재 가격 (최종가)")
+    avg_price: Optional[int] = Field(None, description="30일 평균 가격")
+    min_price: Optional[int] = Field(None, description="30일 최저 가격")
+    delta: Optional[int] = Field(None, description="현재가 - 평균가")
+    delta_percent: Optional[float] = Field(None, description="평균 대비 변동률 (%)")
+    has_alert: bool = Field(..., description="활성 알림 존재 여부")
+    alert_rules: List[AlertRuleType] = Field(default_factory=list, description="활성 알림 규칙")
+    target_price: Optional[int] = Field(None, description="목표가 (TARGET_PRICE 알림)")
+    is_below_target: bool = Field(False, description="현재가가 목표가 이하인지")
+    last_alerted_at: Optional[datetime] = Field(None, description="마지막 알림 발송 시각")
+
+
+class WatchlistResponse(BaseModel):
+    """관심 상품 목록 응답"""
+    items: List[WatchlistItem]
+    total: int
@@ -13,6 +13,9 @@ from app.models.product import (
 )
 from app.models.pet import AllergenCode
 from app.models.offer import ProductOffer
+from app.core.cache.negative_cache_service import NegativeCacheService
+from app.core.cache.product_detail_cache_service import ProductDetailCacheService
+from app.services.hot_deal_index import HotDealIndex
 from app.schemas.admin import (
     IngredientProfileCreate, IngredientProfileUpdate,
     NutritionFactsCreate, NutritionFactsUpdate,
@@ -27,8 +30,8 @@ class AdminService:
     
     # ========== 공통 헬퍼 메서드 ==========
     @staticmethod
-    async def _commit_or_rollback(db: AsyncSession, error_message: str) -> None:
-        """커밋 또는 롤백 헬퍼"""
+    async def _commit_or_rollback(db: AsyncSession, error_message: str, product_id: UUID) -> None:
+        """커밋 또는 롤백 헬퍼 (커밋 성공 시 카탈로그 버전 증가 → 네거티브 캐시 무효화, 해당 상품 상세 문서 무효화)"""
         try:
             await db.commit()
         except IntegrityError as e:
@@ -37,6 +40,8 @@ class AdminService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"{error_message}: {str(e)}"
             )
+        await NegativeCacheService.bump_catalog_version()
+        await ProductDetailCacheService.invalidate([product_id])
     
     # ========== 성분 정보 ==========
     @staticmethod
@@ -82,7 +87,7 @@ class AdminService:
             )
             db.add(profile)
         
-        await AdminService._commit_or_rollback(db, "Failed to save ingredient profile")
+        await AdminService._commit_or_rollback(db, "Failed to save ingredient profile", product_id)
         await db.refresh(profile)
         return profile
     
@@ -145,7 +150,7 @@ class AdminService:
             )
             db.add(facts)
         
-        await AdminService._commit_or_rollback(db, "Failed to save nutrition facts")
+        await AdminService._commit_or_rollback(db, "Failed to save nutrition facts", product_id)
         await db.refresh(facts)
         return facts
     
@@ -192,7 +197,7 @@ class AdminService:
         )
         
         db.add(allergen)
-        await AdminService._commit_or_rollback(db, "Failed to add allergen")
+        await AdminService._commit_or_rollback(db, "Failed to add allergen", product_id)
         await db.refresh(allergen)
         return allergen
     
@@ -223,7 +228,7 @@ class AdminService:
         if data.source is not None:
             allergen.source = data.source
         
-        await AdminService._commit_or_rollback(db, "Failed to update allergen")
+        await AdminService._commit_or_rollback(db, "Failed to update allergen", product_id)
         await db.refresh(allergen)
         return allergen
     
@@ -250,6 +255,8 @@ class AdminService:
         
         db.delete(allergen)
         await db.commit()
+        await NegativeCacheService.bump_catalog_version()
+        await ProductDetailCacheService.invalidate([product_id])
     
     # ========== 클레임 ==========
     @staticmethod
@@ -294,7 +301,7 @@ class AdminService:
         )
         
         db.add(claim)
-        await AdminService._commit_or_rollback(db, "Failed to add claim")
+        await AdminService._commit_or_rollback(db, "Failed to add claim", product_id)
         await db.refresh(claim)
         return claim
     
@@ -325,7 +332,7 @@ class AdminService:
         if data.note is not None:
             claim.note = data.note
         
-        await AdminService._commit_or_rollback(db, "Failed to update claim")
+        await AdminService._commit_or_rollback(db, "Failed to update claim", product_id)
         await db.refresh(claim)
         return claim
     
@@ -352,6 +359,8 @@ class AdminService:
         
         db.delete(claim)
         await db.commit()
+        await NegativeCacheService.bump_catalog_version()
+        await ProductDetailCacheService.invalidate([product_id])
     
     # ========== 이미지 관리 ==========
     @staticmethod
@@ -416,7 +425,7 @@ class AdminService:
             from sqlalchemy.dialects.postgresql import JSONB
             product_obj.images = data.images
         
-        await AdminService._commit_or_rollback(db, "Failed to update product images")
+        await AdminService._commit_or_rollback(db, "Failed to update product images", product_id)
         await db.refresh(product_obj)
         return product_obj
     
@@ -477,8 +486,9 @@ class AdminService:
         )
         
         db.add(offer)
-        await AdminService._commit_or_rollback(db, "Failed to create offer")
+        await AdminService._commit_or_rollback(db, "Failed to create offer", product_id)
         await db.refresh(offer)
+        await HotDealIndex.refresh_products(db, [product_id])
         return offer
     
     @staticmethod
@@ -520,13 +530,18 @@ class AdminService:
         if data.is_active is not None:
             offer.is_active = data.is_active
         
-        await AdminService._commit_or_rollback(db, "Failed to update offer")
+        await AdminService._commit_or_rollback(db, "Failed to update offer", offer.product_id)
         await db.refresh(offer)
+        await HotDealIndex.refresh_products(db, [offer.product_id])
         return offer
     
     @staticmethod
     async def delete_offer(offer_id: UUID, db: AsyncSession) -> None:
         """판매처 삭제"""
         offer = await AdminService.get_offer_by_id(offer_id, db)
+        product_id = offer.product_id
         db.delete(offer)
-        await db.commit()
\ No newline at end of file
+        await db.commit()
+        await NegativeCacheService.bump_catalog_version()
+        await ProductDetailCacheService.invalidate([product_id])
+        await HotDealIndex.refresh_products(db, [product_id])
\ No newline at end of file
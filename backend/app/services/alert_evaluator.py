@@ -0,0 +1,240 @@
+"""
+가격 알림 평가
+
+가격 이벤트 스트림에서 읽은 변경 이벤트마다, 해당 상품 트래킹에 걸린 알림만 평가한다.
+전체 알림을 주기적으로 훑지 않고 상품→알림 인메모리 인덱스로 바로 찾으므로
+작업량이 알림 수가 아니라 가격 변경 수에 비례한다.
+
+규칙:
+- TARGET_PRICE: 가격 <= 목표가
+- BELOW_AVG: 가격이 30일 평균보다 ALERT_BELOW_AVG_PERCENT% 이상 낮음
+- NEW_LOW: 직전 가격보다 내려서 90일 최저가 이하
+
+중복 발송 방지:
+- cooldown_hours: 마지막 발송 후 쿨다운 동안은 발송하지 않음
+- last_sent_price: 쿨다운이 지나도 마지막 발송가 이상이면 발송하지 않음
+  (단, 그 사이 가격이 마지막 발송가 위로 올랐다가 다시 내려온 경우는 새 소식으로 보고 발송)
+"""
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import select, insert, update, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.alert import Alert, AlertEvent, AlertRuleType, AlertEventStatus
+from app.models.tracking import Tracking, TrackingStatus
+
+logger = logging.getLogger(__name__)
+
+
+class AlertIndex:
+    """상품 → 활성 알림 인메모리 인덱스 (ALERT_INDEX_REFRESH_SECONDS마다 전체 재적재)"""
+
+    def __init__(self):
+        self.by_product: Dict[UUID, List[Dict[str, Any]]] = {}
+        self.loaded_at: Optional[float] = None
+
+    def is_stale(self) -> bool:
+        return (
+            self.loaded_at is None
+            or time.monotonic() - self.loaded_at >= settings.ALERT_INDEX_REFRESH_SECONDS
+        )
+
+    def invalidate(self) -> None:
+        """DB와 어긋났을 수 있을 때 (커밋 실패 등) 다음 처리 전에 재적재"""
+        self.loaded_at = None
+
+    async def load(self, db: AsyncSession) -> int:
+        """활성 트래킹에 걸린 활성 알림 전체 적재 (쿼리 1회)"""
+        result = await db.execute(
+            select(
+                Alert.id,
+                Alert.rule_type,
+                Alert.target_price,
+                Alert.cooldown_hours,
+                Alert.last_triggered_at,
+                Alert.last_sent_price,
+                Tracking.product_id,
+                Tracking.user_id,
+            )
+            .join(Tracking, Tracking.id == Alert.tracking_id)
+            .where(
+                Alert.is_enabled == True,
+                Tracking.status == TrackingStatus.ACTIVE,
+            )
+        )
+
+        by_product: Dict[UUID, List[Dict[str, Any]]] = {}
+        count = 0
+        for row in result.mappings():
+            by_product.setdefault(row["product_id"], []).append(dict(row))
+            count += 1
+        self.by_product = by_product
+        self.loaded_at = time.monotonic()
+        logger.info(f"[AlertIndex] 알림 인덱스 적재: 상품 {len(by_product)}개, 알림 {count}개")
+        return count
+
+    def alerts_for(self, product_id: UUID) -> List[Dict[str, Any]]:
+        return self.by_product.get(product_id, [])
+
+
+class AlertEvaluator:
+    """가격 이벤트 → 알림 규칙 평가 → alert_events 기록"""
+
+    @staticmethod
+    def _is_suppressed(alert: Dict[str, Any], price: int, previous_price: Optional[int], now: datetime) -> bool:
+        """cooldown_hours / last_sent_price 기준 중복 발송 여부"""
+        last_triggered_at = alert["last_triggered_at"]
+        if last_triggered_at is not None and now < last_triggered_at + timedelta(hours=alert["cooldown_hours"]):
+            return True
+
+        last_sent_price = alert["last_sent_price"]
+        if last_sent_price is not None and price >= last_sent_price:
+            rebounded = previous_price is not None and previous_price > last_sent_price
+            return not rebounded
+        return False
+
+    @staticmethod
+    def evaluate_rule(
+        alert: Dict[str, Any],
+        price: int,
+        previous_price: Optional[int],
+        avg_price: Optional[int],
+        min_price: Optional[int]
+    ) -> bool:
+        """규칙 충족 여부 (중복 발송 여부는 _is_suppressed에서 별도 판단)"""
+        rule_type = alert["rule_type"]
+        if rule_type == AlertRuleType.TARGET_PRICE:
+            return alert["target_price"] is not None and price <= alert["target_price"]
+        if rule_type == AlertRuleType.BELOW_AVG:
+            if not avg_price:
+                return False
+            return price <= avg_price * (1 - settings.ALERT_BELOW_AVG_PERCENT / 100)
+        if rule_type == AlertRuleType.NEW_LOW:
+            # 요약은 이미 이번 관측값을 포함하므로 최저가 "이하" + 직전보다 하락으로 판단
+            return (
+                min_price is not None
+                and previous_price is not None
+                and price < previous_price
+                and price <= min_price
+            )
+        return False
+
+    @staticmethod
+    async def _get_price_stats(db: AsyncSession, offer_ids: List[UUID]) -> Dict[UUID, Dict[str, Optional[int]]]:
+        """오퍼별 30일 평균 / 90일 최저가 (price_summaries 조회 1회)"""
+        result = await db.execute(
+            text(
+                """
+                SELECT offer_id,
+                       MAX(avg_final_price) FILTER (WHERE window_days = 30) AS avg_30d,
+                       MAX(min_final_price) FILTER (WHERE window_days = 90) AS min_90d
+                FROM price_summaries
+                WHERE offer_id = ANY(:offer_ids) AND window_days IN (30, 90)
+                GROUP BY offer_id
+                """
+            ),
+            {"offer_ids": offer_ids}
+        )
+        return {row["offer_id"]: {"avg": row["avg_30d"], "min": row["min_90d"]} for row in result.mappings()}
+
+    @staticmethod
+    async def process_events(db: AsyncSession, index: AlertIndex, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        이벤트 배치 평가 (커밋은 호출부에서)
+
+        Returns:
+            발송(기록)한 알림 목록 (커밋 후 사용자 알림함에 반영할 항목)
+        """
+        now = datetime.now(timezone.utc)
+        # 품절/알림 없는 상품은 요약 조회 전에 걸러냄
+        candidates = [
+            event for event in events
+            if not event["is_sold_out"] and index.alerts_for(event["product_id"])
+        ]
+        if not candidates:
+            return []
+
+        stats = await AlertEvaluator._get_price_stats(db, list({event["offer_id"] for event in candidates}))
+
+        # 상품에 오퍼가 여럿이면 가장 싼 이벤트부터 평가 → 알림당 배치 내 1회, 최저가로 발송
+        candidates.sort(key=lambda event: event["final_price"])
+        fired: Dict[UUID, Dict[str, Any]] = {}
+        for event in candidates:
+            price = event["final_price"]
+            offer_stats = stats.get(event["offer_id"], {})
+            for alert in index.alerts_for(event["product_id"]):
+                if alert["id"] in fired:
+                    continue
+                if AlertEvaluator._is_suppressed(alert, price, event["previous_price"], now):
+                    continue
+                if not AlertEvaluator.evaluate_rule(
+                    alert, price, event["previous_price"], offer_stats.get("avg"), offer_stats.get("min")
+                ):
+                    continue
+
+                avg_price = offer_stats.get("avg")
+                fired[alert["id"]] = {
+                    "event_id": uuid.uuid4(),
+                    "product_id": event["product_id"],
+                    "alert": alert,
+                    "price": price,
+                    "avg_price": avg_price,
+                    "delta_percent": round((price - avg_price) / avg_price * 100, 2) if avg_price else None,
+                }
+
+        if not fired:
+            return []
+
+        # 푸시 발송이 켜져 있으면 발송 워커가 결과(SENT/FAILED)를 기록
+        status = AlertEventStatus.PENDING if settings.PUSH_API_BASE_URL else AlertEventStatus.SENT
+
+        await db.execute(
+            insert(AlertEvent),
+            [
+                {
+                    "id": item["event_id"],
+                    "alert_id": alert_id,
+                    "trigger_reason": item["alert"]["rule_type"],
+                    "price_at_trigger": item["price"],
+                    "avg_price_at_trigger": item["avg_price"],
+                    "delta_percent": item["delta_percent"],
+                    "sent_at": now,
+                    "status": status,
+                }
+                for alert_id, item in fired.items()
+            ]
+        )
+        await db.execute(
+            update(Alert),
+            [
+                {"id": alert_id, "last_triggered_at": now, "last_sent_price": item["price"]}
+                for alert_id, item in fired.items()
+            ]
+        )
+
+        # 인메모리 인덱스도 바로 반영 (재적재 전까지 같은 알림 중복 평가 방지)
+        for item in fired.values():
+            item["alert"]["last_triggered_at"] = now
+            item["alert"]["last_sent_price"] = item["price"]
+
+        return [
+            {
+                "id": item["event_id"],
+                "user_id": item["alert"]["user_id"],
+                "alert_id": alert_id,
+                "product_id": item["product_id"],
+                "reason": item["alert"]["rule_type"],
+                "price": item["price"],
+                "avg_price": item["avg_price"],
+                "delta_percent": item["delta_percent"],
+                "cooldown_hours": item["alert"]["cooldown_hours"],
+                "sent_at": now,
+            }
+            for alert_id, item in fired.items()
+        ]
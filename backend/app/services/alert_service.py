@@ -6,6 +6,7 @@ from fastapi import HTTPException, status
 
 from app.models.alert import Alert
 from app.schemas.alert import AlertCreate
+from app.services.price_refresh_scheduler import PriceRefreshScheduler
 
 
 class AlertService:
@@ -73,6 +74,9 @@ class AlertService:
         await db.commit()
         await db.refresh(alert)
         
+        # 알림이 걸린 상품은 가격 재수집을 앞당김
+        await PriceRefreshScheduler.reschedule_product(db, tracking.product_id)
+        
         # 미션 진행도 업데이트 (트리거)
         try:
             from app.services.mission_service import MissionService
@@ -97,7 +101,27 @@ class AlertService:
     
     @staticmethod
     async def mark_alert_read(alert_id: UUID, db: AsyncSession) -> Alert:
-        """알림 읽음 처리"""
+        """
+        알림 읽음 처리 (이 알림의 안 읽은 발송 건 전체)
+
+        쿨다운 때문에 알림당 안 읽은 발송 건은 보통 1~2건 → alert_events 갱신 + 알림함 HDEL 몇 번
+        """
+        from app.models.alert import AlertEvent
+        from app.models.tracking import Tracking
+        from app.services.notification_inbox_service import NotificationInboxService
+        
         alert = await AlertService.get_alert_by_id(alert_id, db)
-        # TODO: alert_events 테이블에 읽음 이벤트 기록
+        result = await db.execute(
+            select(AlertEvent.id).where(
+                AlertEvent.alert_id == alert_id,
+                AlertEvent.opened_at.is_(None)
+            )
+        )
+        event_ids = list(result.scalars().all())
+        if event_ids:
+            user_id = (
+                await db.execute(select(Tracking.user_id).where(Tracking.id == alert.tracking_id))
+            ).scalar_one()
+            await NotificationInboxService.mark_read(db, user_id, event_ids)
+            await db.refresh(alert)
         return alert
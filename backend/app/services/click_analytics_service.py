@@ -0,0 +1,344 @@
+"""
+클릭/커미션 분석 롤업
+
+outbound_clicks 원본을 매번 스캔하지 않도록 시간/일 단위 롤업을
+(버킷, 상품, 오퍼, 유입 경로, 캠페인, 펫 종) 차원으로 미리 합산해 둔다.
+
+증분 갱신 (클릭 롤업 워커, app.workers.click_rollup):
+- analytics_watermarks의 워터마크 이후 created_at인 클릭만 집계해 롤업에 더함 (UPSERT)
+- 롤업 갱신과 워터마크 전진을 한 트랜잭션에서 커밋 → 중단 후 재시작해도 같은 클릭을 두 번 더하지 않음
+- 워터마크는 now - CLICK_ROLLUP_LAG_SECONDS까지만 전진 (created_at보다 늦게 커밋되는 적재 트랜잭션 대비)
+
+재집계 (rebuild):
+- 커미션 정산처럼 이미 집계된 클릭이 나중에 수정되면 해당 기간 버킷을 지우고 원본에서 다시 합산
+"""
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.campaign import Campaign
+from app.models.click_rollup import ClickRollupDaily, ClickRollupHourly
+from app.models.product import Product
+from app.schemas.analytics import (
+    ClickBreakdownItem, ClickBreakdownResponse, ClickMetrics,
+    ClickRollupStatus, ClickTimeseriesPoint, ClickTimeseriesResponse
+)
+
+logger = logging.getLogger(__name__)
+
+# meta.campaign_id가 UUID 형식일 때만 캐스팅 (잘못된 값 1건 때문에 집계 전체가 실패하지 않도록)
+_CAMPAIGN_ID_SQL = (
+    "CASE WHEN c.meta->>'campaign_id' ~* "
+    "'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$' "
+    "THEN (c.meta->>'campaign_id')::uuid END"
+)
+
+# {table}/{unit}/{where}는 코드 상수만 들어감
+_UPSERT_ROLLUP_SQL = """
+INSERT INTO {table} AS r (
+    bucket_start, product_id, offer_id, source, campaign_id, pet_species,
+    click_count, converted_count, estimated_commission, actual_commission
+)
+SELECT date_trunc('{unit}', c.clicked_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+       c.product_id, c.offer_id, c.source, {campaign_id}, pet.species::text,
+       COUNT(*),
+       COUNT(c.actual_commission),
+       COALESCE(SUM(c.estimated_commission), 0),
+       COALESCE(SUM(c.actual_commission), 0)
+FROM outbound_clicks c
+LEFT JOIN pets pet ON pet.id = c.pet_id
+WHERE {where}
+GROUP BY 1, 2, 3, 4, 5, 6
+ON CONFLICT (bucket_start, product_id, offer_id, source, campaign_id, pet_species)
+DO UPDATE SET
+    click_count = r.click_count + EXCLUDED.click_count,
+    converted_count = r.converted_count + EXCLUDED.converted_count,
+    estimated_commission = r.estimated_commission + EXCLUDED.estimated_commission,
+    actual_commission = r.actual_commission + EXCLUDED.actual_commission
+"""
+
+_INCREMENTAL_WHERE = "c.created_at > :start AND c.created_at <= :end"
+# 재집계 범위의 클릭 중 워터마크 이후 것은 다음 증분 갱신이 더하므로 제외
+_REBUILD_WHERE = "c.clicked_at >= :start AND c.clicked_at < :end AND c.created_at <= :watermark"
+
+
+class ClickAnalyticsService:
+    """클릭/커미션 롤업 갱신 및 조회"""
+
+    WATERMARK_NAME = "click_rollups"
+    ROLLUP_TABLES = (
+        (ClickRollupHourly.__tablename__, "hour"),
+        (ClickRollupDaily.__tablename__, "day"),
+    )
+    DIMENSIONS = {
+        "product": "product_id",
+        "offer": "offer_id",
+        "source": "source",
+        "campaign": "campaign_id",
+        "species": "pet_species",
+    }
+    ORDER_METRICS = ("actual_commission", "estimated_commission", "clicks")
+
+    @staticmethod
+    async def _lock_watermark(db: AsyncSession) -> Optional[datetime]:
+        """워터마크 행 잠금 후 조회 (동시 실행되는 갱신/재집계 직렬화)"""
+        params = {"name": ClickAnalyticsService.WATERMARK_NAME}
+        await db.execute(
+            text("INSERT INTO analytics_watermarks (name) VALUES (:name) ON CONFLICT (name) DO NOTHING"),
+            params
+        )
+        return await db.scalar(
+            text("SELECT watermark FROM analytics_watermarks WHERE name = :name FOR UPDATE"),
+            params
+        )
+
+    @staticmethod
+    async def _set_watermark(db: AsyncSession, watermark: datetime) -> None:
+        await db.execute(
+            text("UPDATE analytics_watermarks SET watermark = :watermark, updated_at = now() WHERE name = :name"),
+            {"name": ClickAnalyticsService.WATERMARK_NAME, "watermark": watermark}
+        )
+
+    @staticmethod
+    async def advance(db: AsyncSession) -> Optional[Dict[str, Any]]:
+        """
+        워터마크 이후 클릭을 최대 CLICK_ROLLUP_MAX_WINDOW_HOURS 구간만큼 롤업에 반영 (커밋은 호출부에서)
+
+        Returns:
+            처리한 구간/갱신 행 수, 따라잡았으면 None
+        """
+        watermark = await ClickAnalyticsService._lock_watermark(db)
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.CLICK_ROLLUP_LAG_SECONDS)
+        if watermark is None:
+            # 첫 실행: 가장 오래된 클릭 직전부터
+            first_created_at = await db.scalar(text("SELECT MIN(created_at) FROM outbound_clicks"))
+            if first_created_at is None:
+                return None
+            watermark = first_created_at - timedelta(microseconds=1)
+        if watermark >= cutoff:
+            return None
+
+        window_end = min(cutoff, watermark + timedelta(hours=settings.CLICK_ROLLUP_MAX_WINDOW_HOURS))
+        rows = 0
+        for table_name, unit in ClickAnalyticsService.ROLLUP_TABLES:
+            result = await db.execute(
+                text(_UPSERT_ROLLUP_SQL.format(
+                    table=table_name, unit=unit, campaign_id=_CAMPAIGN_ID_SQL, where=_INCREMENTAL_WHERE
+                )),
+                {"start": watermark, "end": window_end}
+            )
+            rows += result.rowcount or 0
+        await ClickAnalyticsService._set_watermark(db, window_end)
+        return {"start": watermark, "end": window_end, "rows": rows, "caught_up": window_end >= cutoff}
+
+    @staticmethod
+    async def rebuild(db: AsyncSession, start_date: date, end_date: date) -> Dict[str, int]:
+        """
+        UTC 일 단위 기간 [start_date, end_date] 버킷을 원본 클릭에서 다시 합산 (커밋은 호출부에서)
+
+        Returns:
+            시간/일 롤업별 다시 쓴 행 수
+        """
+        if end_date < start_date:
+            raise ValueError("end_date는 start_date보다 빠를 수 없습니다")
+        watermark = await ClickAnalyticsService._lock_watermark(db)
+        start = datetime.combine(start_date, datetime.min.time(), tzinfo=timezone.utc)
+        end = datetime.combine(end_date + timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc)
+
+        counts = {}
+        for table_name, unit in ClickAnalyticsService.ROLLUP_TABLES:
+            await db.execute(
+                text(f"DELETE FROM {table_name} WHERE bucket_start >= :start AND bucket_start < :end"),
+                {"start": start, "end": end}
+            )
+            if watermark is None:
+                counts[unit] = 0
+                continue
+            result = await db.execute(
+                text(_UPSERT_ROLLUP_SQL.format(
+                    table=table_name, unit=unit, campaign_id=_CAMPAIGN_ID_SQL, where=_REBUILD_WHERE
+                )),
+                {"start": start, "end": end, "watermark": watermark}
+            )
+            counts[unit] = result.rowcount or 0
+
+        logger.info(
+            f"[ClickAnalytics] 🔁 롤업 재집계: {start_date}~{end_date}, "
+            f"시간={counts['hour']}행, 일={counts['day']}행"
+        )
+        return {"hourly_rows": counts["hour"], "daily_rows": counts["day"]}
+
+    @staticmethod
+    async def get_status(db: AsyncSession) -> ClickRollupStatus:
+        watermark = await db.scalar(
+            text("SELECT watermark FROM analytics_watermarks WHERE name = :name"),
+            {"name": ClickAnalyticsService.WATERMARK_NAME}
+        )
+        lag_seconds = (datetime.now(timezone.utc) - watermark).total_seconds() if watermark else None
+        return ClickRollupStatus(watermark=watermark, lag_seconds=lag_seconds)
+
+    @staticmethod
+    def _metric_columns(model) -> list:
+        return [
+            func.sum(model.click_count).label("clicks"),
+            func.sum(model.converted_count).label("converted"),
+            func.sum(model.estimated_commission).label("estimated_commission"),
+            func.sum(model.actual_commission).label("actual_commission"),
+        ]
+
+    @staticmethod
+    def _metrics(row) -> Dict[str, Any]:
+        return {
+            "clicks": int(row.clicks or 0),
+            "converted": int(row.converted or 0),
+            "estimated_commission": float(row.estimated_commission or 0),
+            "actual_commission": float(row.actual_commission or 0),
+        }
+
+    @staticmethod
+    def _dimension_column(model, dimension: Optional[str]):
+        if dimension is None:
+            return None
+        if dimension not in ClickAnalyticsService.DIMENSIONS:
+            raise ValueError(
+                f"지원하지 않는 차원입니다: {dimension} ({', '.join(ClickAnalyticsService.DIMENSIONS)})"
+            )
+        return getattr(model, ClickAnalyticsService.DIMENSIONS[dimension])
+
+    @staticmethod
+    def _filters(model, start: datetime, end: datetime, filters: Dict[str, Any]) -> list:
+        """기간은 버킷 시작 시각 기준 [start, end)"""
+        if end <= start:
+            raise ValueError("end는 start보다 늦어야 합니다")
+        conditions = [model.bucket_start >= start, model.bucket_start < end]
+        for dimension, value in filters.items():
+            if value is not None:
+                conditions.append(ClickAnalyticsService._dimension_column(model, dimension) == value)
+        return conditions
+
+    @staticmethod
+    async def get_timeseries(
+        db: AsyncSession,
+        start: datetime,
+        end: datetime,
+        granularity: str = "day",
+        group_by: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> ClickTimeseriesResponse:
+        """
+        기간 시계열 (시간/일 버킷, 선택한 차원별로 나눔)
+
+        Args:
+            granularity: hour(최대 CLICK_ANALYTICS_HOURLY_MAX_DAYS일) | day
+            group_by: product | offer | source | campaign | species
+            filters: 차원 → 값 (예: {"source": "ALERT"})
+        """
+        if granularity == "hour":
+            if end - start > timedelta(days=settings.CLICK_ANALYTICS_HOURLY_MAX_DAYS):
+                raise ValueError(
+                    f"시간 단위 조회는 최대 {settings.CLICK_ANALYTICS_HOURLY_MAX_DAYS}일까지 가능합니다"
+                )
+            model = ClickRollupHourly
+        elif granularity == "day":
+            model = ClickRollupDaily
+        else:
+            raise ValueError("granularity는 hour 또는 day여야 합니다")
+
+        dimension_column = ClickAnalyticsService._dimension_column(model, group_by)
+        group_columns = [model.bucket_start] + ([dimension_column] if dimension_column is not None else [])
+        result = await db.execute(
+            select(*group_columns, *ClickAnalyticsService._metric_columns(model))
+            .where(*ClickAnalyticsService._filters(model, start, end, filters or {}))
+            .group_by(*group_columns)
+            .order_by(model.bucket_start.asc())
+        )
+        points = []
+        for row in result.all():
+            key = row[1] if dimension_column is not None else None
+            points.append(ClickTimeseriesPoint(
+                bucket_start=row.bucket_start,
+                key=None if key is None else str(key),
+                **ClickAnalyticsService._metrics(row),
+            ))
+
+        status = await ClickAnalyticsService.get_status(db)
+        return ClickTimeseriesResponse(
+            granularity=granularity, group_by=group_by, points=points, watermark=status.watermark
+        )
+
+    @staticmethod
+    async def _labels(db: AsyncSession, dimension: str, keys: List[Any]) -> Dict[Any, str]:
+        """상품/캠페인 차원 표시용 이름 (IN 쿼리 1회)"""
+        keys = [key for key in keys if key is not None]
+        if not keys:
+            return {}
+        if dimension == "product":
+            result = await db.execute(
+                select(Product.id, Product.brand_name, Product.product_name, Product.size_label)
+                .where(Product.id.in_(keys))
+            )
+            return {
+                row.id: " ".join(part for part in (row.brand_name, row.product_name, row.size_label) if part)
+                for row in result.all()
+            }
+        if dimension == "campaign":
+            result = await db.execute(select(Campaign.id, Campaign.key).where(Campaign.id.in_(keys)))
+            return {row.id: row.key for row in result.all()}
+        return {}
+
+    @staticmethod
+    async def get_breakdown(
+        db: AsyncSession,
+        start: datetime,
+        end: datetime,
+        dimension: str,
+        order_by: str = "actual_commission",
+        limit: int = 20,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> ClickBreakdownResponse:
+        """
+        기간 차원별 상위 N개 + 전체 합계
+
+        기간이 CLICK_ANALYTICS_HOURLY_MAX_DAYS 이하면 시간 롤업(정시 단위 기간), 넘으면 일 롤업을 읽는다.
+        """
+        if order_by not in ClickAnalyticsService.ORDER_METRICS:
+            raise ValueError(f"order_by는 {', '.join(ClickAnalyticsService.ORDER_METRICS)} 중 하나여야 합니다")
+        model = (
+            ClickRollupHourly
+            if end - start <= timedelta(days=settings.CLICK_ANALYTICS_HOURLY_MAX_DAYS)
+            else ClickRollupDaily
+        )
+        dimension_column = ClickAnalyticsService._dimension_column(model, dimension)
+        conditions = ClickAnalyticsService._filters(model, start, end, filters or {})
+        metric_columns = ClickAnalyticsService._metric_columns(model)
+
+        result = await db.execute(
+            select(dimension_column.label("key"), *metric_columns)
+            .where(*conditions)
+            .group_by(dimension_column)
+            .order_by(text(f"{order_by} DESC"))
+            .limit(limit)
+        )
+        rows = result.all()
+        totals_row = (await db.execute(select(*metric_columns).where(*conditions))).one()
+        labels = await ClickAnalyticsService._labels(db, dimension, [row.key for row in rows])
+
+        items = [
+            ClickBreakdownItem(
+                key=None if row.key is None else str(row.key),
+                label=labels.get(row.key),
+                **ClickAnalyticsService._metrics(row),
+            )
+            for row in rows
+        ]
+        status = await ClickAnalyticsService.get_status(db)
+        return ClickBreakdownResponse(
+            dimension=dimension,
+            items=items,
+            totals=ClickMetrics(**ClickAnalyticsService._metrics(totals_row)),
+            watermark=status.watermark,
+        )
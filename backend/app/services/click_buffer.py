@@ -0,0 +1,121 @@
+"""
+클릭 적재 버퍼 (Redis Stream)
+
+클릭 API는 클릭을 스트림에 XADD만 하고 바로 응답한다.
+클릭 적재 워커(app.workers.click_ingest)가 소비자 그룹으로 묶어 읽어
+outbound_clicks에 COPY로 한 번에 적재한 뒤 XACK한다 (ClickService.ingest_clicks).
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+from uuid import UUID
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.core.cache.cache_keys import CacheKeys
+
+logger = logging.getLogger(__name__)
+
+
+class ClickBuffer:
+    """클릭 스트림 발행/소비 헬퍼"""
+
+    @staticmethod
+    def _encode(click: Dict[str, Any]) -> Dict[str, str]:
+        """스트림 필드는 문자열만 허용 (없는 값은 빈 문자열)"""
+        return {
+            key: "" if value is None else str(getattr(value, "value", value))
+            for key, value in click.items()
+        }
+
+    @staticmethod
+    def decode(fields: Dict[str, str]) -> Dict[str, Any]:
+        """스트림 필드 → 클릭 레코드"""
+        def optional_uuid(key: str):
+            return UUID(fields[key]) if fields.get(key) else None
+
+        return {
+            "id": UUID(fields["id"]),
+            "user_id": UUID(fields["user_id"]),
+            "pet_id": optional_uuid("pet_id"),
+            "product_id": UUID(fields["product_id"]),
+            "offer_id": optional_uuid("offer_id"),
+            "source": fields["source"],
+            "campaign_id": optional_uuid("campaign_id"),
+            "clicked_at": datetime.fromisoformat(fields["clicked_at"]),
+            "session_id": fields.get("session_id") or None,
+            "client_event_id": fields.get("client_event_id") or None,
+        }
+
+    @staticmethod
+    async def append(click: Dict[str, Any]) -> bool:
+        """
+        클릭 1건 버퍼에 추가
+
+        Returns:
+            성공 여부 (Redis 장애/서킷 오픈 시 False → 호출부가 DB에 바로 적재)
+        """
+        try:
+            redis_client = await get_redis()
+            await redis_client.xadd(
+                CacheKeys.click_stream(),
+                ClickBuffer._encode(click),
+                maxlen=settings.CLICK_INGEST_STREAM_MAXLEN,
+                approximate=True,
+            )
+            return True
+        except redis.RedisError as e:
+            logger.warning(f"[ClickBuffer] 클릭 버퍼 추가 실패, DB 직접 적재로 전환: {e}")
+            return False
+
+    @staticmethod
+    async def ensure_group(client: redis.Redis, group: str) -> None:
+        """소비자 그룹 생성 (스트림이 없으면 함께 생성, 이미 있으면 무시)"""
+        try:
+            await client.xgroup_create(CacheKeys.click_stream(), group, id="0", mkstream=True)
+            logger.info(f"[ClickBuffer] 소비자 그룹 생성: {group}")
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    @staticmethod
+    async def read_group(
+        client: redis.Redis,
+        group: str,
+        consumer: str,
+        count: int,
+        block_ms: int
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        """새 클릭 읽기 (없으면 block_ms 동안 대기)"""
+        response = await client.xreadgroup(
+            group, consumer, {CacheKeys.click_stream(): ">"}, count=count, block=block_ms
+        )
+        messages: List[Tuple[str, Dict[str, str]]] = []
+        for _stream, stream_messages in response or []:
+            messages.extend(stream_messages)
+        return messages
+
+    @staticmethod
+    async def claim_stale(
+        client: redis.Redis,
+        group: str,
+        consumer: str,
+        min_idle_ms: int,
+        count: int
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        """오래 ACK되지 않은 클릭 회수 (적재 중 죽은 소비자 복구)"""
+        response = await client.xautoclaim(
+            CacheKeys.click_stream(), group, consumer, min_idle_ms, start_id="0-0", count=count
+        )
+        return [(message_id, fields) for message_id, fields in response[1] if fields]
+
+    @staticmethod
+    async def ack(client: redis.Redis, group: str, message_ids: List[str]) -> None:
+        """적재 완료 클릭 ACK + 스트림에서 삭제 (클릭 스트림은 소비자 그룹이 하나라 남겨 둘 필요 없음)"""
+        if message_ids:
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.xack(CacheKeys.click_stream(), group, *message_ids)
+                pipe.xdel(CacheKeys.click_stream(), *message_ids)
+                await pipe.execute()
@@ -1,33 +1,176 @@
 """클릭 추적 관련 비즈니스 로직"""
+import logging
+import uuid
 from uuid import UUID
 from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.outbound_click import OutboundClick
+from app.core.config import settings
+from app.models.section import ProductCategory
 from app.schemas.click import ClickCreate
+from app.services.click_buffer import ClickBuffer
+from app.services.popularity_service import PopularityService
+
+logger = logging.getLogger(__name__)
+
+# (session_id, client_event_id)로 클릭 ID를 만들 때 쓰는 UUID5 네임스페이스
+_CLICK_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_DNS, "outbound-clicks.petfood")
+
+# 배치마다 만들지 않도록 커넥션 수명 동안 유지, 커밋/롤백 시 행만 비워짐
+_CREATE_STAGING_SQL = """
+CREATE TEMP TABLE IF NOT EXISTS outbound_clicks_staging (
+    id uuid,
+    user_id uuid,
+    pet_id uuid,
+    product_id uuid,
+    offer_id uuid,
+    source varchar(20),
+    campaign_id uuid,
+    clicked_at timestamptz,
+    session_id varchar(255),
+    client_event_id varchar(64)
+) ON COMMIT DELETE ROWS
+"""
+
+# 사용자/상품이 없어 적재할 수 없는 클릭 (INSERT의 JOIN에서 빠지므로 따로 세어 기록)
+_ORPHAN_CLICKS_SQL = """
+SELECT s.id, s.user_id, s.product_id, u.id IS NULL AS missing_user, p.id IS NULL AS missing_product
+FROM outbound_clicks_staging s
+LEFT JOIN users u ON u.id = s.user_id
+LEFT JOIN products p ON p.id = s.product_id
+WHERE u.id IS NULL OR p.id IS NULL
+"""
+
+# 스테이징 → outbound_clicks
+# - ON CONFLICT DO NOTHING: id(스트림 재전달)와 (session_id, client_event_id)(클라이언트 재전송) 중복을 모두 건너뜀
+# - 없는 사용자/상품 클릭은 버리고(_ORPHAN_CLICKS_SQL로 기록), 없는 펫/오퍼는 NULL로
+#   (잘못된 1건 때문에 배치 전체가 실패하지 않도록)
+# - 실제로 들어간 클릭만 돌려줘 인기 카운터에 한 번만 반영
+_INSERT_FROM_STAGING_SQL = """
+WITH inserted AS (
+    INSERT INTO outbound_clicks (
+        id, user_id, pet_id, product_id, offer_id, source, clicked_at, session_id, client_event_id, meta
+    )
+    SELECT s.id, s.user_id, pet.id, s.product_id, offer.id, s.source, s.clicked_at,
+           s.session_id, s.client_event_id,
+           CASE WHEN s.campaign_id IS NOT NULL THEN jsonb_build_object('campaign_id', s.campaign_id) END
+    FROM outbound_clicks_staging s
+    JOIN users u ON u.id = s.user_id
+    JOIN products p ON p.id = s.product_id
+    LEFT JOIN pets pet ON pet.id = s.pet_id
+    LEFT JOIN product_offers offer ON offer.id = s.offer_id
+    ON CONFLICT DO NOTHING
+    RETURNING product_id, clicked_at
+)
+SELECT i.product_id, i.clicked_at, p.species
+FROM inserted i
+JOIN products p ON p.id = i.product_id
+"""
 
 
 class ClickService:
     """클릭 추적 서비스 - 클릭 관련 비즈니스 로직만 담당"""
-    
+
+    COPY_COLUMNS = (
+        "id", "user_id", "pet_id", "product_id", "offer_id",
+        "source", "campaign_id", "clicked_at", "session_id", "client_event_id",
+    )
+
+    @staticmethod
+    def click_id(session_id: Optional[str], client_event_id: Optional[str]) -> UUID:
+        """클릭 ID (클라이언트 클릭 ID가 있으면 결정적으로 만들어 재전송해도 같은 ID를 응답)"""
+        if session_id and client_event_id:
+            return uuid.uuid5(_CLICK_ID_NAMESPACE, f"{session_id}\x1f{client_event_id}")
+        return uuid.uuid4()
+
     @staticmethod
     async def create_click(
         user_id: UUID,
         click_data: ClickCreate,
         db: AsyncSession
-    ) -> OutboundClick:
-        """클릭 이벤트 생성"""
-        click = OutboundClick(
-            user_id=user_id,
-            pet_id=click_data.pet_id,
-            product_id=click_data.product_id,
-            offer_id=click_data.offer_id,
-            source=click_data.source,
-            clicked_at=datetime.now(timezone.utc),
-        )
-        
-        db.add(click)
+    ) -> Dict[str, Any]:
+        """
+        클릭 이벤트 생성
+
+        클릭 스트림에 넣고 바로 응답한다 (DB 적재/인기 카운터 반영은 클릭 적재 워커가 배치로).
+        버퍼를 끄거나 Redis 장애 시에는 요청 안에서 같은 경로로 바로 적재하고,
+        사용자/상품이 없으면 404로 알린다 (버퍼 경로에서는 적재 워커가 건너뛰고 로그로 남김).
+        session_id + client_event_id가 있으면 재전송된 클릭도 같은 id로 응답한다.
+        """
+        click = {
+            "id": ClickService.click_id(click_data.session_id, click_data.client_event_id),
+            "user_id": user_id,
+            "pet_id": click_data.pet_id,
+            "product_id": click_data.product_id,
+            "offer_id": click_data.offer_id,
+            "source": click_data.source.value,
+            "campaign_id": click_data.campaign_id,
+            "clicked_at": datetime.now(timezone.utc),
+            "session_id": click_data.session_id,
+            "client_event_id": click_data.client_event_id,
+        }
+        if settings.CLICK_BUFFER_ENABLED and await ClickBuffer.append(click):
+            return click
+
+        inserted = await ClickService.ingest_clicks(db, [click], strict=True)
         await db.commit()
-        await db.refresh(click)
-        
+
+        # 인기 랭킹 카운터 반영 (커밋 후, Redis 장애 시 무시)
+        await PopularityService.record_clicks(inserted)
+
         return click
+
+    @staticmethod
+    async def ingest_clicks(
+        db: AsyncSession,
+        clicks: List[Dict[str, Any]],
+        strict: bool = False
+    ) -> List[Tuple[UUID, List[ProductCategory], Optional[datetime]]]:
+        """
+        클릭 배치 적재 (커밋은 호출부에서)
+
+        asyncpg COPY로 임시 스테이징 테이블에 넣은 뒤 INSERT ... SELECT 1회로 옮긴다.
+        사용자/상품이 없는 클릭은 적재하지 않고 경고 로그로 남긴다 (strict면 404).
+
+        Returns:
+            실제로 적재된 클릭의 (product_id, 노출 카테고리, 클릭 시각) 목록 (PopularityService.record_clicks 입력)
+        """
+        if not clicks:
+            return []
+        await db.execute(text(_CREATE_STAGING_SQL))
+
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            "outbound_clicks_staging",
+            records=[tuple(click[column] for column in ClickService.COPY_COLUMNS) for click in clicks],
+            columns=list(ClickService.COPY_COLUMNS),
+        )
+
+        orphans = (await db.execute(text(_ORPHAN_CLICKS_SQL))).mappings().all()
+        if orphans:
+            missing_users = sorted({str(row["user_id"]) for row in orphans if row["missing_user"]})
+            missing_products = sorted({str(row["product_id"]) for row in orphans if row["missing_product"]})
+            if strict:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="사용자를 찾을 수 없습니다" if missing_users else "상품을 찾을 수 없습니다"
+                )
+            logger.warning(
+                f"[ClickService] ⚠️ 사용자/상품이 없어 클릭 {len(orphans)}건 적재 불가 (유실): "
+                f"users={missing_users[:5]}, products={missing_products[:5]}"
+            )
+
+        result = await db.execute(text(_INSERT_FROM_STAGING_SQL))
+        inserted = [
+            (row["product_id"], ProductCategory.for_species(row["species"]), row["clicked_at"])
+            for row in result.mappings()
+        ]
+        duplicates = len(clicks) - len(orphans) - len(inserted)
+        if duplicates:
+            logger.info(f"[ClickService] 중복 클릭 {duplicates}건 건너뜀 (적재 {len(inserted)}건)")
+        return inserted
@@ -1,38 +1,237 @@
 """쿠팡 파트너스 API 클라이언트"""
-import httpx
+import asyncio
+import hashlib
+import hmac
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime, timezone
+import random
+import time
+from typing import Optional, Dict, Any, List, Callable, Tuple
+from urllib.parse import urlencode
+
+import httpx
 
 logger = logging.getLogger(__name__)
 
+try:
+    import h2  # noqa: F401  (httpx HTTP/2 지원에 필요)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class CoupangApiError(Exception):
+    """재시도 후에도 실패한 쿠팡 API 호출"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
 
 class CoupangApiClient:
-    """쿠팡 파트너스 API 클라이언트"""
-    
+    """
+    쿠팡 파트너스 API 클라이언트
+
+    - 프로세스 수명 동안 httpx.AsyncClient 1개를 재사용 (HTTP/2 + keep-alive 풀)
+    - HMAC 서명은 signed-date(초 단위) 창 안에서 같은 요청이면 재사용
+    - 가격 조회는 vendorItemId를 API 배치 한도(COUPANG_API_BATCH_SIZE)로 묶어 호출
+    - 429는 Retry-After를 따르고, 5xx/네트워크 오류는 지수 백오프로 재시도
+    """
+
     BASE_URL = "https://api-gateway.coupang.com"
-    
-    def __init__(self, access_key: str, secret_key: str):
+    PRODUCT_PATH = "/v2/providers/affiliate_open_api/apis/openapi/products/{vendor_item_id}"
+    PRODUCT_PRICES_PATH = "/v2/providers/affiliate_open_api/apis/openapi/products/prices"
+    RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        access_key: str,
+        secret_key: str,
+        base_url: Optional[str] = None,
+        timeout: float = 10.0,
+        http_client: Optional[httpx.AsyncClient] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
         """
         Args:
             access_key: 쿠팡 파트너스 API Access Key
             secret_key: 쿠팡 파트너스 API Secret Key
+            base_url: API 주소 (로컬 가짜 서버로 테스트할 때 교체)
+            timeout: 요청 타임아웃 (초)
+            http_client: 외부에서 관리하는 httpx 클라이언트 (없으면 직접 생성하고 aclose()에서 닫음)
+            transport: 직접 생성하는 클라이언트에 끼울 transport (테스트 시 httpx.MockTransport)
         """
+        from app.core.config import settings
+
         self.access_key = access_key
         self.secret_key = secret_key
-    
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.timeout = timeout
+        self.batch_size = settings.COUPANG_API_BATCH_SIZE
+        self.max_retries = settings.COUPANG_API_MAX_RETRIES
+        self.backoff_seconds = settings.COUPANG_API_BACKOFF_SECONDS
+
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or self._create_http_client(transport)
+
+        # 서명 캐시: signed-date가 바뀌면 비움
+        self._signature_window: Optional[str] = None
+        self._signature_cache: Dict[Tuple[str, str, str], str] = {}
+
+    def _create_http_client(self, transport: Optional[httpx.AsyncBaseTransport]) -> httpx.AsyncClient:
+        """keep-alive 풀 + HTTP/2 클라이언트 생성 (h2 미설치 시 HTTP/1.1)"""
+        from app.core.config import settings
+
+        use_http2 = settings.COUPANG_API_HTTP2 and HTTP2_AVAILABLE and transport is None
+        if settings.COUPANG_API_HTTP2 and not HTTP2_AVAILABLE:
+            logger.warning("[CoupangApiClient] ⚠️ h2 패키지가 없어 HTTP/1.1 keep-alive로 동작합니다")
+
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=use_http2,
+            limits=httpx.Limits(
+                max_connections=settings.COUPANG_API_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.COUPANG_API_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.COUPANG_API_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            transport=transport,
+        )
+
+    async def aclose(self) -> None:
+        """직접 생성한 httpx 클라이언트 종료 (외부에서 주입한 클라이언트는 건드리지 않음)"""
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
+    async def __aenter__(self) -> "CoupangApiClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _authorization(self, method: str, path: str, query: str) -> str:
+        """
+        CEA HMAC-SHA256 Authorization 헤더
+
+        signed-date가 초 단위라 같은 초 안의 동일 요청(재시도, 같은 청크)은 서명을 재사용한다.
+        """
+        signed_date = time.strftime("%y%m%dT%H%M%SZ", time.gmtime())
+        if signed_date != self._signature_window:
+            self._signature_window = signed_date
+            self._signature_cache.clear()
+
+        cache_key = (method, path, query)
+        header = self._signature_cache.get(cache_key)
+        if header is None:
+            message = f"{signed_date}{method}{path}{query}"
+            signature = hmac.new(
+                self.secret_key.encode("utf-8"), message.encode("utf-8"), hashlib.sha256
+            ).hexdigest()
+            header = (
+                f"CEA algorithm=HmacSHA256, access-key={self.access_key}, "
+                f"signed-date={signed_date}, signature={signature}"
+            )
+            self._signature_cache[cache_key] = header
+        return header
+
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        """429면 Retry-After 우선, 그 외 지수 백오프 + jitter"""
+        if response is not None and response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return max(float(retry_after), 0.0)
+                except ValueError:
+                    pass
+        delay = self.backoff_seconds * (2 ** attempt)
+        return delay + random.uniform(0, delay / 2)
+
+    async def _request_json(self, method: str, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        서명 + 재시도 포함 API 호출
+
+        Raises:
+            CoupangApiError: 재시도 불가 응답이거나 재시도 횟수를 모두 소진한 경우
+        """
+        query = urlencode(params or {})
+        url = f"{self.base_url}{path}?{query}" if query else f"{self.base_url}{path}"
+
+        for attempt in range(self.max_retries + 1):
+            response: Optional[httpx.Response] = None
+            try:
+                response = await self.http_client.request(
+                    method,
+                    url,
+                    headers={
+                        "Authorization": self._authorization(method, path, query),
+                        "Content-Type": "application/json",
+                    },
+                )
+                if response.status_code == 200:
+                    return response.json()
+                if response.status_code not in self.RETRYABLE_STATUS_CODES:
+                    raise CoupangApiError(
+                        f"status={response.status_code}, body={response.text[:200]}",
+                        status_code=response.status_code,
+                    )
+                error = CoupangApiError(f"status={response.status_code}", status_code=response.status_code)
+            except httpx.TransportError as e:
+                error = CoupangApiError(f"{type(e).__name__}: {e}")
+
+            if attempt >= self.max_retries:
+                raise error
+            delay = self._retry_delay(attempt, response)
+            logger.warning(
+                f"[CoupangApiClient] ⚠️ 호출 실패, {delay:.2f}초 후 재시도 "
+                f"({attempt + 1}/{self.max_retries}): {path}, {error}"
+            )
+            await asyncio.sleep(delay)
+
+        raise CoupangApiError("재시도 횟수 초과")
+
+    async def get_product_prices(self, vendor_item_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        여러 상품 가격을 배치 한도 단위로 묶어 조회
+
+        Args:
+            vendor_item_ids: 쿠팡 vendorItemId 목록 (중복은 한 번만 조회)
+
+        Returns:
+            {vendor_item_id: 가격 정보(get_product_price와 같은 형태)}
+            응답에 없는 id는 결과에서 빠짐
+
+        Raises:
+            CoupangApiError: 청크 호출이 재시도 후에도 실패한 경우
+        """
+        unique_ids = list(dict.fromkeys(vendor_item_ids))
+        prices: Dict[int, Dict[str, Any]] = {}
+
+        for start in range(0, len(unique_ids), self.batch_size):
+            chunk = unique_ids[start:start + self.batch_size]
+            data = await self._request_json(
+                "GET",
+                self.PRODUCT_PRICES_PATH,
+                {"vendorItemIds": ",".join(str(i) for i in chunk)},
+            )
+            items = data.get("data", []) if isinstance(data, dict) else data
+            for item in items or []:
+                vendor_item_id = item.get("vendorItemId")
+                if vendor_item_id is None:
+                    continue
+                prices[int(vendor_item_id)] = self._parse_price_data(item)
+
+        return prices
+
     async def get_product_price(
-        self, 
+        self,
         vendor_item_id: Optional[int] = None,
         product_url: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """
         상품 가격 정보 조회
-        
+
         Args:
             vendor_item_id: 쿠팡 vendorItemId
-            product_url: 상품 URL (vendor_item_id가 없을 때 사용)
-        
+            product_url: 상품 URL (vendor_item_id가 없을 때 사용, 현재 미지원)
+
         Returns:
             {
                 "final_price": int,  # 최종 가격
@@ -44,43 +243,28 @@ class CoupangApiClient:
                 "currency": str,  # 통화 (KRW)
             } or None (실패 시)
         """
-        try:
-            # TODO: 실제 쿠팡 파트너스 API 호출 구현
-            # 현재는 모의 데이터 반환 (실제 구현 시 아래 로직으로 교체)
-            
-            # 예시: 쿠팡 API 호출
-            # async with httpx.AsyncClient() as client:
-            #     response = await client.get(
-            #         f"{self.BASE_URL}/v2/providers/affiliate_open_api/apis/openapi/products/{vendor_item_id}",
-            #         headers={
-            #             "Authorization": f"Bearer {self._get_access_token()}",
-            #             "Content-Type": "application/json"
-            #         },
-            #         timeout=10.0
-            #     )
-            #     if response.status_code == 200:
-            #         data = response.json()
-            #         return self._parse_price_data(data)
-            
-            logger.warning(
-                "[CoupangApiClient] ⚠️ 쿠팡 API 호출이 구현되지 않았습니다. "
-                "실제 쿠팡 파트너스 API 연동이 필요합니다."
-            )
-            
-            # 임시: None 반환 (fallback으로 DB 캐시 사용)
+        if vendor_item_id is None:
+            logger.warning("[CoupangApiClient] ⚠️ vendor_item_id 없이 가격 조회 불가")
             return None
-            
+
+        try:
+            data = await self._request_json("GET", self.PRODUCT_PATH.format(vendor_item_id=vendor_item_id))
+            # 응답이 {"data": {...}} 형태면 본문만 파싱
+            if isinstance(data, dict) and isinstance(data.get("data"), dict):
+                data = data["data"]
+            return self._parse_price_data(data)
+
         except Exception as e:
-            logger.error(f"[CoupangApiClient] ❌ 가격 조회 실패: {e}", exc_info=True)
+            logger.warning(f"[CoupangApiClient] ⚠️ 가격 조회 실패: vendor_item_id={vendor_item_id}, error={e}")
             return None
-    
+
     def _parse_price_data(self, api_response: Dict[str, Any]) -> Dict[str, Any]:
         """
         쿠팡 API 응답을 가격 정보로 파싱
-        
+
         Args:
             api_response: 쿠팡 API 응답 데이터
-        
+
         Returns:
             파싱된 가격 정보
         """
@@ -94,16 +278,16 @@ class CoupangApiClient:
         #     "cardDiscount": 1000,  # 카드 할인
         #     "stockStatus": "IN_STOCK"  # 재고 상태
         # }
-        
+
         listed_price = api_response.get("rPrice", 0)
         sale_price = api_response.get("salePrice", listed_price)
         shipping_fee = api_response.get("shippingFee", 0)
         coupon_discount = api_response.get("couponDiscount", 0)
         card_discount = api_response.get("cardDiscount", 0)
         stock_status = api_response.get("stockStatus", "IN_STOCK")
-        
+
         final_price = sale_price + shipping_fee - coupon_discount - card_discount
-        
+
         return {
             "final_price": max(0, final_price),
             "listed_price": listed_price,
@@ -113,30 +297,102 @@ class CoupangApiClient:
             "is_sold_out": stock_status != "IN_STOCK",
             "currency": "KRW",
         }
-    
-    def _get_access_token(self) -> str:
-        """쿠팡 API Access Token 발급"""
-        # TODO: 실제 토큰 발급 로직 구현
-        return ""
 
 
-def get_coupang_api_client() -> Optional[CoupangApiClient]:
+def create_mock_transport(
+    price_for: Callable[[int], Optional[Dict[str, Any]]],
+    status_sequence: Optional[List[int]] = None
+) -> httpx.MockTransport:
     """
-    설정에서 쿠팡 API 키를 읽어 클라이언트 생성
-    
+    로컬 테스트용 MockTransport (네트워크 없이 클라이언트 동작 확인)
+
+    Args:
+        price_for: vendor_item_id → 쿠팡 응답 item(dict) 또는 None(응답에서 누락)
+        status_sequence: 앞쪽 요청들에 순서대로 돌려줄 상태 코드 (예: [429, 503] → 재시도 확인)
+
+    사용 예:
+        transport = create_mock_transport(lambda vid: {"rPrice": 10000, "salePrice": 9000})
+        client = CoupangApiClient("ak", "sk", transport=transport)
+        prices = await client.get_product_prices([1, 2, 3])
+    """
+    pending_statuses = list(status_sequence or [])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if pending_statuses:
+            status_code = pending_statuses.pop(0)
+            if status_code != 200:
+                return httpx.Response(status_code, headers={"Retry-After": "0"}, json={"rCode": str(status_code)})
+
+        path = request.url.path
+        if path == CoupangApiClient.PRODUCT_PRICES_PATH:
+            ids = [int(i) for i in request.url.params.get("vendorItemIds", "").split(",") if i]
+            items = []
+            for vendor_item_id in ids:
+                item = price_for(vendor_item_id)
+                if item is not None:
+                    items.append({"vendorItemId": vendor_item_id, **item})
+            return httpx.Response(200, json={"rCode": "0", "data": items})
+
+        vendor_item_id = int(path.rsplit("/", 1)[-1])
+        item = price_for(vendor_item_id)
+        if item is None:
+            return httpx.Response(404, json={"rCode": "404"})
+        return httpx.Response(200, json={"rCode": "0", "data": {"vendorItemId": vendor_item_id, **item}})
+
+    return httpx.MockTransport(handler)
+
+
+_shared_client: Optional[CoupangApiClient] = None
+
+
+def get_coupang_api_client(
+    http_client: Optional[httpx.AsyncClient] = None,
+    transport: Optional[httpx.AsyncBaseTransport] = None
+) -> Optional[CoupangApiClient]:
+    """
+    설정에서 쿠팡 API 키를 읽어 클라이언트 반환
+
+    인자 없이 호출하면 프로세스 공용 인스턴스(커넥션 풀 재사용)를 돌려준다.
+
+    Args:
+        http_client: 외부에서 관리하는 httpx 클라이언트
+        transport: 테스트용 transport (주어지면 공용 인스턴스 대신 새로 생성)
+
     Returns:
         CoupangApiClient 인스턴스 또는 None (키가 없을 때)
     """
+    global _shared_client
     from app.core.config import settings
-    
+
     access_key = settings.COUPANG_ACCESS_KEY
     secret_key = settings.COUPANG_SECRET_KEY
-    
+
     if not access_key or not secret_key:
         logger.warning(
             "[CoupangApiClient] ⚠️ 쿠팡 API 키가 설정되지 않았습니다. "
             "COUPANG_ACCESS_KEY, COUPANG_SECRET_KEY 환경변수를 설정하세요."
         )
         return None
-    
-    return CoupangApiClient(access_key, secret_key)
+
+    if http_client is None and transport is None and _shared_client is not None:
+        return _shared_client
+
+    client = CoupangApiClient(
+        access_key,
+        secret_key,
+        base_url=settings.COUPANG_API_BASE_URL,
+        timeout=settings.COUPANG_API_TIMEOUT_SECONDS,
+        http_client=http_client,
+        transport=transport
+    )
+    if http_client is None and transport is None:
+        _shared_client = client
+    return client
+
+
+async def close_coupang_api_client() -> None:
+    """공용 클라이언트 커넥션 풀 종료 (프로세스 종료 시)"""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
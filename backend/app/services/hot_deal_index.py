@@ -0,0 +1,181 @@
+"""
+핫딜 랭킹 인덱스 (카테고리별 Redis ZSET)
+
+섹션 캐시 미스마다 전체 상품 × 대표 오퍼 조인에 할인율 CASE 정렬을 하지 않도록,
+상품별 핫딜 점수를 카테고리(ALL/DOG/CAT)별 ZSET에 미리 유지한다.
+페이지 조회는 ZREVRANGE(O(log n + page)) + 해당 상품 id 조회 1회.
+
+점수 = 할인율(0.01% 단위) × 10^8 + (10^8 - 1 - 가격)
+  → 할인율 내림차순, 같은 할인율이면 가격 오름차순 (가격 없는 상품은 맨 뒤)
+
+갱신:
+- 가격 적재(수집 워커/관리자 대량 적재) 커밋 후 변경된 상품만 refresh_products
+- 관리자 상품/판매처 수정 후 해당 상품만 refresh_products
+- 수집 워커가 주기적으로 전체 rebuild (누락 복구)
+ZSET이 없거나 Redis 장애 시 SectionService는 기존 SQL 정렬로 fallback 한다.
+"""
+import logging
+import time
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.redis import get_redis
+from app.core.cache.cache_keys import CacheKeys
+from app.models.section import ProductCategory
+
+logger = logging.getLogger(__name__)
+
+_ENTRIES_SQL = """
+SELECT p.id AS product_id,
+       p.species,
+       o.current_price,
+       o.last_seen_price
+FROM products p
+LEFT JOIN product_offers o
+       ON o.product_id = p.id AND o.is_active AND o.is_primary
+WHERE p.is_active
+  {product_filter}
+"""
+
+
+class HotDealIndex:
+    """카테고리별 핫딜 ZSET 관리"""
+
+    PRICE_SCALE = 10 ** 8
+    ZADD_CHUNK_SIZE = 500
+
+    @staticmethod
+    def score(current_price: Optional[int], last_seen_price: Optional[int]) -> float:
+        """SectionService 핫딜 SQL 정렬과 같은 순서를 내는 점수"""
+        discount_bp = 0
+        if current_price is not None and last_seen_price and current_price < last_seen_price:
+            discount_bp = (last_seen_price - current_price) * 10000 // last_seen_price
+        price_rank = 0
+        if current_price is not None:
+            price_rank = HotDealIndex.PRICE_SCALE - 1 - min(current_price, HotDealIndex.PRICE_SCALE - 1)
+        return float(discount_bp * HotDealIndex.PRICE_SCALE + price_rank)
+
+    @staticmethod
+    async def _load_scores(
+        db: AsyncSession,
+        product_ids: Optional[List[UUID]] = None
+    ) -> Dict[ProductCategory, Dict[str, float]]:
+        """카테고리별 {product_id: 점수} (대표 오퍼가 여럿이면 가장 높은 점수)"""
+        params = {}
+        product_filter = ""
+        if product_ids is not None:
+            product_filter = "AND p.id = ANY(:product_ids)"
+            params["product_ids"] = list(product_ids)
+
+        result = await db.execute(text(_ENTRIES_SQL.format(product_filter=product_filter)), params)
+
+        scores: Dict[ProductCategory, Dict[str, float]] = {category: {} for category in ProductCategory}
+        for row in result.mappings():
+            member = str(row["product_id"])
+            score = HotDealIndex.score(row["current_price"], row["last_seen_price"])
+            for category in ProductCategory.for_species(row["species"]):
+                if score > scores[category].get(member, -1):
+                    scores[category][member] = score
+        return scores
+
+    @staticmethod
+    async def rebuild(db: AsyncSession) -> int:
+        """전체 재구성 (임시 키에 채운 뒤 RENAME으로 교체)"""
+        start_time = time.time()
+        scores = await HotDealIndex._load_scores(db)
+
+        try:
+            redis_client = await get_redis()
+            for category, members in scores.items():
+                key = CacheKeys.hot_deal_index(category)
+                temp_key = f"{key}:rebuild"
+                await redis_client.delete(temp_key)
+                if not members:
+                    await redis_client.delete(key)
+                    continue
+                items = list(members.items())
+                for start in range(0, len(items), HotDealIndex.ZADD_CHUNK_SIZE):
+                    await redis_client.zadd(temp_key, dict(items[start:start + HotDealIndex.ZADD_CHUNK_SIZE]))
+                await redis_client.rename(temp_key, key)
+        except redis.RedisError as e:
+            logger.warning(f"[HotDealIndex] 재구성 실패: {e}")
+            return 0
+
+        total = len(scores[ProductCategory.ALL])
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.info(f"[HotDealIndex] ✅ 핫딜 인덱스 재구성: {total}개 상품, 소요시간={duration_ms}ms")
+        return total
+
+    @staticmethod
+    async def ensure_built(db: AsyncSession) -> None:
+        """인덱스가 없을 때만 재구성 (Redis flush 직후 등)"""
+        try:
+            redis_client = await get_redis()
+            if await redis_client.exists(CacheKeys.hot_deal_index(ProductCategory.ALL)):
+                return
+        except redis.RedisError:
+            return
+        await HotDealIndex.rebuild(db)
+
+    @staticmethod
+    async def refresh_products(db: AsyncSession, product_ids: Iterable[UUID]) -> None:
+        """
+        변경된 상품만 증분 반영
+
+        비활성/삭제되었거나 species가 바뀌어 빠져야 하는 카테고리에서는 ZREM.
+        """
+        product_ids = list(set(product_ids))
+        if not product_ids:
+            return
+        try:
+            scores = await HotDealIndex._load_scores(db, product_ids)
+            redis_client = await get_redis()
+            categories = list(scores.keys())
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for category in categories:
+                    pipe.exists(CacheKeys.hot_deal_index(category))
+                exists_flags = await pipe.execute()
+
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for category, exists in zip(categories, exists_flags):
+                    # 인덱스가 아직 없으면 만들지 않음 (부분 인덱스가 SQL fallback을 가리지 않도록)
+                    if not exists:
+                        continue
+                    members = scores[category]
+                    key = CacheKeys.hot_deal_index(category)
+                    if members:
+                        pipe.zadd(key, members)
+                    removed = [str(product_id) for product_id in product_ids if str(product_id) not in members]
+                    if removed:
+                        pipe.zrem(key, *removed)
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"[HotDealIndex] 증분 갱신 실패 (다음 재구성 때 반영): {e}")
+        except Exception as e:
+            logger.error(f"[HotDealIndex] 증분 갱신 에러: {e}", exc_info=True)
+
+    @staticmethod
+    async def get_page(category: ProductCategory, limit: int, offset: int) -> Optional[List[UUID]]:
+        """
+        핫딜 순위 페이지
+
+        Returns:
+            product_id 목록, 인덱스가 없거나 Redis 사용 불가 시 None (호출부는 SQL fallback)
+        """
+        try:
+            redis_client = await get_redis()
+            key = CacheKeys.hot_deal_index(category)
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.exists(key)
+                pipe.zrevrange(key, offset, offset + limit - 1)
+                exists, members = await pipe.execute()
+            if not exists:
+                return None
+            return [UUID(member) for member in members]
+        except redis.RedisError as e:
+            logger.warning(f"[HotDealIndex] 조회 실패: {e}, SQL fallback")
+            return None
@@ -0,0 +1,453 @@
+"""
+사용자별 알림함 (fan-out on write)
+
+알림이 발송(alert_events 기록)될 때 해당 사용자의 Redis 알림함에 바로 항목을 넣어 두고,
+앱은 알림함/배지를 Alert × Tracking 조인 없이 키 조회로 읽는다.
+
+- 항목: LIST (최신이 앞, 최대 NOTIFICATION_INBOX_MAX_ITEMS개, 넘치면 오래된 것부터 제거)
+- 안 읽음: HASH (field=alert_event_id) → 배지 수는 HLEN 1회, 읽음 처리는 HDEL 1회 (둘 다 O(1))
+- 커서: 항목마다 사용자별 순번(seq)을 붙이고 리스트는 순번이 연속이므로,
+  "seq < 커서" 페이지의 시작 위치를 (최신 순번 - 커서)로 바로 계산 (새 알림이 와도 밀리지 않음)
+
+원본은 alert_events (읽음 = opened_at 기록). 알림함 키가 없으면(만료/flush) 다음 조회 때
+DB에서 최근 항목으로 재구성하고, 재구성 전에는 발송 경로가 알림함에 쓰지 않는다 (중복/누락 방지).
+재구성 중(DB 조회 ~ 교체 사이)에 들어온 알림은 대기 LIST에 모아 두었다가 교체할 때 함께 넣는다.
+Redis 장애 시에는 DB에서 직접 조회한다 (배지 수도 최근 NOTIFICATION_INBOX_MAX_ITEMS개 기준).
+"""
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy import select, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor, keyset_after, keyset_order_by
+from app.core.redis import get_redis
+from app.core.cache.cache_keys import CacheKeys
+from app.models.alert import Alert, AlertEvent
+from app.models.product import Product
+from app.models.tracking import Tracking
+from app.schemas.alert import NotificationRead, NotificationInboxResponse
+
+logger = logging.getLogger(__name__)
+
+# KEYS: [items, unread, seq, built, building, pending]
+# ARGV: [최대 항목 수, TTL, (event_id, alert_id, payload JSON)...]
+# 알림함이 아직 구성되지 않았으면 쓰지 않음 (-1, 재구성 중이면 대기 LIST에 보관), 아니면 안 읽은 수 반환
+_PUSH_SCRIPT = """
+if redis.call('EXISTS', KEYS[4]) == 0 then
+  if redis.call('EXISTS', KEYS[5]) == 1 then
+    for i = 3, #ARGV, 3 do
+      redis.call('RPUSH', KEYS[6], ARGV[i], ARGV[i + 1], ARGV[i + 2])
+    end
+    redis.call('EXPIRE', KEYS[6], redis.call('TTL', KEYS[5]) + 1)
+  end
+  return -1
+end
+local cap = tonumber(ARGV[1])
+for i = 3, #ARGV, 3 do
+  local seq = redis.call('INCR', KEYS[3])
+  redis.call('LPUSH', KEYS[1], '{"seq":' .. seq .. ',' .. string.sub(ARGV[i + 2], 2))
+  redis.call('HSET', KEYS[2], ARGV[i], ARGV[i + 1])
+end
+while redis.call('LLEN', KEYS[1]) > cap do
+  local evicted = cjson.decode(redis.call('RPOP', KEYS[1]))
+  redis.call('HDEL', KEYS[2], evicted['id'])
+end
+for i = 1, 4 do
+  redis.call('EXPIRE', KEYS[i], ARGV[2])
+end
+return redis.call('HLEN', KEYS[2])
+"""
+
+# KEYS: [items, unread, seq, built, building, pending]
+# ARGV: [최대 항목 수, TTL, 항목 수 n, payload JSON x n (최신순), (event_id, alert_id) 안 읽음 쌍...]
+# DB 스냅샷으로 알림함을 교체하고, 재구성 중 대기 LIST에 쌓인 알림 중 스냅샷에 없는 것을 이어 붙임
+# 다른 재구성이 먼저 끝났으면(built 존재) 그쪽이 이후 알림까지 반영하고 있으므로 교체하지 않음 (-1)
+_SWAP_SCRIPT = """
+if redis.call('EXISTS', KEYS[4]) == 1 then
+  return -1
+end
+local cap = tonumber(ARGV[1])
+local n = tonumber(ARGV[3])
+redis.call('DEL', KEYS[1], KEYS[2])
+local seen = {}
+local seq = 0
+for i = 3 + n, 4, -1 do
+  seq = seq + 1
+  redis.call('LPUSH', KEYS[1], '{"seq":' .. seq .. ',' .. string.sub(ARGV[i], 2))
+  seen[cjson.decode(ARGV[i])['id']] = true
+end
+for i = 4 + n, #ARGV, 2 do
+  redis.call('HSET', KEYS[2], ARGV[i], ARGV[i + 1])
+end
+local pending = redis.call('LRANGE', KEYS[6], 0, -1)
+for i = 1, #pending, 3 do
+  if not seen[pending[i]] then
+    seen[pending[i]] = true
+    seq = seq + 1
+    redis.call('LPUSH', KEYS[1], '{"seq":' .. seq .. ',' .. string.sub(pending[i + 2], 2))
+    redis.call('HSET', KEYS[2], pending[i], pending[i + 1])
+  end
+end
+while redis.call('LLEN', KEYS[1]) > cap do
+  local evicted = cjson.decode(redis.call('RPOP', KEYS[1]))
+  redis.call('HDEL', KEYS[2], evicted['id'])
+end
+redis.call('SET', KEYS[3], seq, 'EX', ARGV[2])
+redis.call('SET', KEYS[4], 1, 'EX', ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+redis.call('DEL', KEYS[5], KEYS[6])
+return seq
+"""
+
+
+class NotificationInboxService:
+    """사용자별 알림함 (Redis LIST + 안 읽음 HASH)"""
+
+    # 재구성 진행 중 표시 유지 시간 (DB 조회 ~ 교체가 이보다 길어지면 그사이 알림은 다음 재구성 때 반영)
+    REBUILD_MARKER_SECONDS = 60
+
+    @staticmethod
+    def _keys(user_id: UUID) -> List[str]:
+        return [
+            CacheKeys.notification_inbox(user_id),
+            CacheKeys.notification_inbox_unread(user_id),
+            CacheKeys.notification_inbox_seq(user_id),
+            CacheKeys.notification_inbox_built(user_id),
+            CacheKeys.notification_inbox_building(user_id),
+            CacheKeys.notification_inbox_pending(user_id),
+        ]
+
+    @staticmethod
+    def _payload(notification: Dict[str, Any]) -> str:
+        sent_at = notification["sent_at"]
+        return json.dumps(
+            {
+                "id": str(notification["id"]),
+                "alert_id": str(notification["alert_id"]),
+                "product_id": str(notification["product_id"]),
+                "reason": getattr(notification["reason"], "value", notification["reason"]),
+                "price": notification["price"],
+                "avg_price": notification["avg_price"],
+                "delta_percent": (
+                    float(notification["delta_percent"]) if notification["delta_percent"] is not None else None
+                ),
+                "sent_at": int(sent_at.timestamp()),
+            },
+            separators=(",", ":")
+        )
+
+    @staticmethod
+    async def push_many(notifications: Iterable[Dict[str, Any]]) -> int:
+        """
+        발송된 알림을 사용자별 알림함에 추가 (alert_events 커밋 후 호출)
+
+        notification: {id, user_id, alert_id, product_id, reason, price, avg_price, delta_percent, sent_at}
+        Returns:
+            알림함에 반영한 사용자 수
+        """
+        by_user: Dict[UUID, List[Dict[str, Any]]] = {}
+        for notification in notifications:
+            by_user.setdefault(notification["user_id"], []).append(notification)
+        if not by_user:
+            return 0
+
+        try:
+            redis_client = await get_redis()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for user_id, items in by_user.items():
+                    args = []
+                    # 오래된 것부터 LPUSH해야 최신이 맨 앞
+                    for item in sorted(items, key=lambda n: n["sent_at"]):
+                        args.extend([str(item["id"]), str(item["alert_id"]), NotificationInboxService._payload(item)])
+                    pipe.eval(
+                        _PUSH_SCRIPT,
+                        6,
+                        *NotificationInboxService._keys(user_id),
+                        settings.NOTIFICATION_INBOX_MAX_ITEMS,
+                        settings.NOTIFICATION_INBOX_TTL_SECONDS,
+                        *args,
+                    )
+                results = await pipe.execute()
+            return sum(1 for result in results if result != -1)
+        except redis.RedisError as e:
+            # alert_events는 이미 기록됨 → 알림함 만료 후 재구성 때 반영
+            logger.warning(f"[NotificationInbox] 알림함 반영 실패 ({len(by_user)}명): {e}")
+            return 0
+
+    @staticmethod
+    def _recent_events_query(user_id: UUID):
+        return (
+            select(
+                AlertEvent.id,
+                AlertEvent.alert_id,
+                AlertEvent.trigger_reason,
+                AlertEvent.price_at_trigger,
+                AlertEvent.avg_price_at_trigger,
+                AlertEvent.delta_percent,
+                AlertEvent.sent_at,
+                AlertEvent.opened_at,
+                Tracking.product_id,
+            )
+            .join(Alert, Alert.id == AlertEvent.alert_id)
+            .join(Tracking, Tracking.id == Alert.tracking_id)
+            .where(Tracking.user_id == user_id)
+        )
+
+    @staticmethod
+    def _event_keys():
+        return [(AlertEvent.sent_at, True), (AlertEvent.id, True)]
+
+    @staticmethod
+    def _row_to_notification(row) -> Dict[str, Any]:
+        return {
+            "id": row["id"],
+            "alert_id": row["alert_id"],
+            "product_id": row["product_id"],
+            "reason": row["trigger_reason"],
+            "price": row["price_at_trigger"],
+            "avg_price": row["avg_price_at_trigger"],
+            "delta_percent": row["delta_percent"],
+            "sent_at": row["sent_at"],
+        }
+
+    @staticmethod
+    async def _rebuild(db: AsyncSession, redis_client: redis.Redis, user_id: UUID) -> None:
+        """
+        DB의 최근 알림으로 알림함 재구성 (Lua로 원자적 교체)
+
+        DB 조회 전에 재구성 중 표시를 걸어 두면, 조회 이후 커밋된 알림은 발송 경로가 대기 LIST에 넣고
+        교체 스크립트가 스냅샷에 없는 것만 이어 붙인다 (조회 ~ 교체 사이 알림 누락 방지).
+        """
+        keys = NotificationInboxService._keys(user_id)
+        await redis_client.set(keys[4], 1, ex=NotificationInboxService.REBUILD_MARKER_SECONDS)
+
+        result = await db.execute(
+            NotificationInboxService._recent_events_query(user_id)
+            .order_by(*keyset_order_by(NotificationInboxService._event_keys()))
+            .limit(settings.NOTIFICATION_INBOX_MAX_ITEMS)
+        )
+        rows = result.mappings().all()
+
+        # 순번은 스크립트가 오래된 것부터 1, 2, ... (rows는 최신순)
+        payloads = []
+        unread = []
+        for row in rows:
+            payloads.append(NotificationInboxService._payload(NotificationInboxService._row_to_notification(row)))
+            if row["opened_at"] is None:
+                unread.extend([str(row["id"]), str(row["alert_id"])])
+
+        total = await redis_client.eval(
+            _SWAP_SCRIPT,
+            6,
+            *keys,
+            settings.NOTIFICATION_INBOX_MAX_ITEMS,
+            settings.NOTIFICATION_INBOX_TTL_SECONDS,
+            len(payloads),
+            *payloads,
+            *unread,
+        )
+        if total == -1:
+            return
+        logger.info(
+            f"[NotificationInbox] 알림함 재구성: user_id={user_id}, 항목={total}개 "
+            f"(스냅샷 {len(rows)}개), 안 읽음={len(unread) // 2}개"
+        )
+
+    @staticmethod
+    async def _ensure_built(db: AsyncSession, redis_client: redis.Redis, user_id: UUID) -> None:
+        if not await redis_client.exists(CacheKeys.notification_inbox_built(user_id)):
+            await NotificationInboxService._rebuild(db, redis_client, user_id)
+
+    @staticmethod
+    async def _product_names(db: AsyncSession, product_ids: Iterable[str]) -> Dict[str, str]:
+        """페이지 항목의 상품명 (IN 조회 1회, 알림함에는 id만 저장해 이름 변경을 따라감)"""
+        product_ids = {UUID(product_id) for product_id in product_ids}
+        if not product_ids:
+            return {}
+        result = await db.execute(
+            select(Product.id, Product.brand_name, Product.product_name).where(Product.id.in_(product_ids))
+        )
+        return {str(row.id): f"{row.brand_name} {row.product_name}" for row in result}
+
+    @staticmethod
+    def _to_read(entry: Dict[str, Any], is_read: bool, product_names: Dict[str, str]) -> NotificationRead:
+        return NotificationRead(
+            id=entry["id"],
+            alert_id=entry["alert_id"],
+            product_id=entry["product_id"],
+            product_name=product_names.get(entry["product_id"]),
+            reason=entry["reason"],
+            price=entry["price"],
+            avg_price=entry["avg_price"],
+            delta_percent=entry["delta_percent"],
+            sent_at=datetime.fromtimestamp(entry["sent_at"], tz=timezone.utc),
+            is_read=is_read,
+        )
+
+    @staticmethod
+    async def get_page(
+        db: AsyncSession,
+        user_id: UUID,
+        cursor: Optional[str] = None,
+        limit: int = 20
+    ) -> NotificationInboxResponse:
+        """알림함 페이지 (최신순) + 안 읽은 수"""
+        position = None
+        if cursor:
+            payload = decode_cursor(cursor)
+            if payload.get("k") is not None:
+                # Redis 장애 중 DB 경로에서 발급된 커서
+                return await NotificationInboxService._get_page_from_db(db, user_id, payload["k"], limit)
+            if not isinstance(payload.get("s"), int):
+                raise InvalidCursorError("cursor is not an inbox cursor")
+            position = payload["s"]
+
+        try:
+            redis_client = await get_redis()
+            await NotificationInboxService._ensure_built(db, redis_client, user_id)
+            items_key, unread_key, seq_key = NotificationInboxService._keys(user_id)[:3]
+
+            start = 0
+            if position is not None:
+                head_seq = int(await redis_client.get(seq_key) or 0)
+                start = max(head_seq - position + 1, 0)
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.lrange(items_key, start, start + limit)  # limit + 1개 (다음 페이지 여부)
+                pipe.hlen(unread_key)
+                raw_entries, unread_count = await pipe.execute()
+
+            entries = [json.loads(raw) for raw in raw_entries]
+            has_more = len(entries) > limit
+            entries = entries[:limit]
+            unread_flags = []
+            if entries:
+                unread_flags = await redis_client.hmget(unread_key, [entry["id"] for entry in entries])
+        except redis.RedisError as e:
+            logger.warning(f"[NotificationInbox] Redis 조회 실패, DB 조회: {e}")
+            if position is not None:
+                # 순번 커서는 DB 경로에서 이어 갈 수 없음 → 빈 페이지
+                return NotificationInboxResponse(items=[], next_cursor=None, unread_count=0)
+            return await NotificationInboxService._get_page_from_db(db, user_id, None, limit)
+
+        product_names = await NotificationInboxService._product_names(db, [entry["product_id"] for entry in entries])
+        items = [
+            NotificationInboxService._to_read(entry, flag is None, product_names)
+            for entry, flag in zip(entries, unread_flags)
+        ]
+        next_cursor = encode_cursor({"s": entries[-1]["seq"]}) if has_more else None
+        return NotificationInboxResponse(items=items, next_cursor=next_cursor, unread_count=unread_count)
+
+    @staticmethod
+    async def _get_page_from_db(
+        db: AsyncSession,
+        user_id: UUID,
+        after: Optional[List[Any]],
+        limit: int
+    ) -> NotificationInboxResponse:
+        """Redis 장애 시 alert_events에서 직접 조회 (키셋 커서)"""
+        keys = NotificationInboxService._event_keys()
+        query = NotificationInboxService._recent_events_query(user_id)
+        if after is not None:
+            query = query.where(keyset_after(keys, after))
+        result = await db.execute(query.order_by(*keyset_order_by(keys)).limit(limit + 1))
+        rows = result.mappings().all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        product_names = await NotificationInboxService._product_names(db, [str(row["product_id"]) for row in rows])
+        items = []
+        for row in rows:
+            entry = json.loads(NotificationInboxService._payload(NotificationInboxService._row_to_notification(row)))
+            items.append(NotificationInboxService._to_read(entry, row["opened_at"] is not None, product_names))
+
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_cursor({"k": [rows[-1]["sent_at"], rows[-1]["id"]]})
+        unread_count = await NotificationInboxService._count_unread_from_db(db, user_id)
+        return NotificationInboxResponse(items=items, next_cursor=next_cursor, unread_count=unread_count)
+
+    @staticmethod
+    async def _count_unread_from_db(db: AsyncSession, user_id: UUID) -> int:
+        """최근 NOTIFICATION_INBOX_MAX_ITEMS개 중 안 읽은 수 (알림함 안 읽음 HASH와 같은 범위)"""
+        recent = (
+            NotificationInboxService._recent_events_query(user_id)
+            .order_by(*keyset_order_by(NotificationInboxService._event_keys()))
+            .limit(settings.NOTIFICATION_INBOX_MAX_ITEMS)
+            .subquery()
+        )
+        result = await db.execute(
+            select(func.count()).select_from(recent).where(recent.c.opened_at.is_(None))
+        )
+        return result.scalar() or 0
+
+    @staticmethod
+    async def get_unread_count(db: AsyncSession, user_id: UUID) -> int:
+        """배지 수 (HLEN 1회, 알림함이 없을 때만 재구성)"""
+        try:
+            redis_client = await get_redis()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.exists(CacheKeys.notification_inbox_built(user_id))
+                pipe.hlen(CacheKeys.notification_inbox_unread(user_id))
+                built, unread_count = await pipe.execute()
+            if built:
+                return unread_count
+            await NotificationInboxService._rebuild(db, redis_client, user_id)
+            return await redis_client.hlen(CacheKeys.notification_inbox_unread(user_id))
+        except redis.RedisError as e:
+            logger.warning(f"[NotificationInbox] Redis 조회 실패, DB 집계: {e}")
+            return await NotificationInboxService._count_unread_from_db(db, user_id)
+
+    @staticmethod
+    def _user_alert_ids(user_id: UUID):
+        return select(Alert.id).join(Tracking, Tracking.id == Alert.tracking_id).where(Tracking.user_id == user_id)
+
+    @staticmethod
+    async def mark_read(db: AsyncSession, user_id: UUID, event_ids: List[UUID]) -> None:
+        """
+        알림 읽음 처리: alert_events.opened_at 기록 → 커밋 → 안 읽음 HASH에서 HDEL (항목당 O(1))
+        """
+        if not event_ids:
+            return
+        await db.execute(
+            update(AlertEvent)
+            .where(
+                AlertEvent.id.in_(event_ids),
+                AlertEvent.opened_at.is_(None),
+                AlertEvent.alert_id.in_(NotificationInboxService._user_alert_ids(user_id)),
+            )
+            .values(opened_at=datetime.now(timezone.utc))
+        )
+        await db.commit()
+        try:
+            redis_client = await get_redis()
+            await redis_client.hdel(
+                CacheKeys.notification_inbox_unread(user_id), *[str(event_id) for event_id in event_ids]
+            )
+        except redis.RedisError as e:
+            # DB에는 읽음으로 기록됨 → 알림함 재구성 때 반영
+            logger.warning(f"[NotificationInbox] 읽음 반영 실패: {e}")
+
+    @staticmethod
+    async def mark_all_read(db: AsyncSession, user_id: UUID) -> None:
+        """전체 읽음 (안 읽음 HASH 삭제)"""
+        await db.execute(
+            update(AlertEvent)
+            .where(
+                AlertEvent.opened_at.is_(None),
+                AlertEvent.alert_id.in_(NotificationInboxService._user_alert_ids(user_id)),
+            )
+            .values(opened_at=datetime.now(timezone.utc))
+        )
+        await db.commit()
+        try:
+            redis_client = await get_redis()
+            await redis_client.delete(CacheKeys.notification_inbox_unread(user_id))
+        except redis.RedisError as e:
+            logger.warning(f"[NotificationInbox] 전체 읽음 반영 실패: {e}")
@@ -1,12 +1,14 @@
 """반려동물 관련 비즈니스 로직"""
 from uuid import UUID
 from datetime import datetime
+from typing import Dict, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from fastapi import HTTPException, status
 
-from app.models.pet import Pet, AgeStage, AgeInputMode, PetHealthConcern
+from app.models.pet import Pet, AgeStage, AgeInputMode, PetHealthConcern, PetFoodAllergy, PetOtherAllergy
 from app.schemas.pet import PetCreate, PetRead
+from app.schemas.pet_summary import PetSummaryResponse
 from app.services.user_service import UserService
 
 
@@ -21,6 +23,61 @@ class PetService:
         )
         return list(result.scalars().all())
     
+    @staticmethod
+    async def build_pet_summaries(pets: List[Pet], db: AsyncSession) -> List[PetSummaryResponse]:
+        """
+        펫 목록 → PetSummaryResponse 목록
+        
+        건강 고민/음식 알레르기/기타 알레르기를 펫마다 3번씩 조회하지 않고,
+        전체 펫에 대해 IN 조회 3개를 요청 세션에서 차례로 실행한다 (인덱스 조회라 커넥션을 더 빌리지 않음).
+        """
+        if not pets:
+            return []
+        pet_ids = [pet.id for pet in pets]
+        
+        health_rows = (await db.execute(
+            select(PetHealthConcern.pet_id, PetHealthConcern.concern_code)
+            .where(PetHealthConcern.pet_id.in_(pet_ids))
+        )).all()
+        food_rows = (await db.execute(
+            select(PetFoodAllergy.pet_id, PetFoodAllergy.allergen_code)
+            .where(PetFoodAllergy.pet_id.in_(pet_ids))
+        )).all()
+        other_rows = (await db.execute(
+            select(PetOtherAllergy.pet_id, PetOtherAllergy.other_text)
+            .where(PetOtherAllergy.pet_id.in_(pet_ids))
+        )).all()
+        
+        health_concerns: Dict[UUID, List[str]] = {}
+        for pet_id, code in health_rows:
+            health_concerns.setdefault(pet_id, []).append(code)
+        food_allergies: Dict[UUID, List[str]] = {}
+        for pet_id, code in food_rows:
+            food_allergies.setdefault(pet_id, []).append(code)
+        other_allergies: Dict[UUID, str] = {}
+        for pet_id, text in other_rows:
+            other_allergies.setdefault(pet_id, text)
+        
+        return [
+            PetSummaryResponse(
+                id=pet.id,
+                name=pet.name or '',
+                species=pet.species.value if pet.species else '',
+                age_stage=pet.age_stage.value if pet.age_stage else None,
+                approx_age_months=pet.approx_age_months,
+                weight_kg=float(pet.weight_kg) if pet.weight_kg is not None else 0.0,
+                health_concerns=health_concerns.get(pet.id, []),
+                photo_url=pet.photo_url,
+                breed_code=pet.breed_code,
+                is_neutered=pet.is_neutered,
+                sex=pet.sex.value if pet.sex else None,
+                food_allergies=food_allergies.get(pet.id, []),
+                other_allergies=other_allergies.get(pet.id),
+                is_primary=pet.is_primary,
+            )
+            for pet in pets
+        ]
+    
     @staticmethod
     async def get_pet_by_id(pet_id: UUID, db: AsyncSession) -> Pet:
         """반려동물 ID로 조회"""
@@ -0,0 +1,321 @@
+"""
+실시간 인기 랭킹 (클릭 기반 Redis ZSET)
+
+outbound_clicks를 매번 집계하지 않도록, 클릭이 기록될 때마다 카테고리(ALL/DOG/CAT)별
+ZSET 카운터를 올려 두고 인기 섹션은 ZREVRANGE(O(log n + page))로 바로 읽는다.
+
+슬라이딩 윈도우 (time_range 1h / 24h / 7d / 30d):
+- 클릭은 시간 버킷 ZSET에 ZINCRBY (1h 윈도우는 5분 버킷, 24h/7d는 1시간 버킷, 30d는 1일 버킷,
+  윈도우가 지나면 TTL로 소멸)
+- 조회 시 윈도우에 해당하는 버킷들을 ZUNIONSTORE로 합친 뷰를 POPULARITY_VIEW_TTL_SECONDS 동안 재사용
+- 30d는 감쇠 점수(반감기 24h)로는 사실상 최근 며칠 랭킹이 되므로 1일 버킷 30개를 합쳐 실제 30일 클릭 수로 응답
+  (SQL fallback의 30일 클릭 수 집계와 같은 순위)
+
+시간 감쇠 (time_range trending):
+- forward decay: 클릭마다 2^((now - anchor) / 반감기)를 더함 → 최근 클릭일수록 큰 가중치
+- 지수가 커지면 Lua 스크립트 안에서 모든 카테고리 점수에 같은 배율을 곱하고 anchor를 옮김 (순위 불변)
+
+Redis가 비었거나 장애 시 SectionService는 outbound_clicks 집계 SQL로 fallback 하고
+(윈도우는 클릭 수, trending은 같은 반감기의 감쇠 가중합),
+캐시 워머가 최근 클릭으로 카운터를 복구한다 (rebuild_from_clicks).
+"""
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.core.cache.cache_keys import CacheKeys
+from app.models.section import ProductCategory
+
+logger = logging.getLogger(__name__)
+
+# KEYS: [anchor, decay(ALL), decay(DOG), decay(CAT)]
+# ARGV: [now, 반감기(초), member, 최대 지수, 증가시킬 KEYS 인덱스...]
+_DECAY_INCREMENT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local half_life = tonumber(ARGV[2])
+local anchor = tonumber(redis.call('GET', KEYS[1]))
+if not anchor then
+  anchor = now
+  redis.call('SET', KEYS[1], now)
+end
+local exponent = (now - anchor) / half_life
+if exponent > tonumber(ARGV[4]) then
+  local weight = 2 ^ (-exponent)
+  for i = 2, #KEYS do
+    if redis.call('EXISTS', KEYS[i]) == 1 then
+      redis.call('ZUNIONSTORE', KEYS[i], 1, KEYS[i], 'WEIGHTS', weight)
+    end
+  end
+  redis.call('SET', KEYS[1], now)
+  exponent = 0
+end
+local increment = 2 ^ exponent
+for i = 5, #ARGV do
+  redis.call('ZINCRBY', KEYS[tonumber(ARGV[i])], increment, ARGV[3])
+end
+return tostring(increment)
+"""
+
+_BUCKET_COUNTS_SQL = """
+SELECT c.product_id,
+       p.species,
+       floor(extract(epoch FROM c.clicked_at) / :bucket_seconds)::bigint * :bucket_seconds AS bucket_start,
+       COUNT(*) AS clicks
+FROM outbound_clicks c
+JOIN products p ON p.id = c.product_id
+WHERE c.clicked_at >= :since
+GROUP BY 1, 2, 3
+"""
+
+_DECAY_SCORES_SQL = """
+SELECT c.product_id,
+       p.species,
+       SUM(power(2, (extract(epoch FROM c.clicked_at) - :anchor) / :half_life)) AS score
+FROM outbound_clicks c
+JOIN products p ON p.id = c.product_id
+WHERE c.clicked_at >= :since
+GROUP BY 1, 2
+"""
+
+
+class PopularityService:
+    """클릭 기반 인기 카운터 관리 / 조회"""
+
+    # time_range → (버킷 크기(초), 버킷 수)
+    WINDOWS: Dict[str, Tuple[int, int]] = {
+        "1h": (300, 12),
+        "24h": (3600, 24),
+        "7d": (3600, 24 * 7),
+        "30d": (86400, 30),
+    }
+    # 감쇠 랭킹으로 응답하는 time_range
+    DECAY_RANGES = ("trending",)
+    DEFAULT_TIME_RANGE = "24h"
+    # 지수가 이 값을 넘으면 재기준 (2^64 배율, float 정밀도 여유)
+    MAX_DECAY_EXPONENT = 64
+    # 감쇠 점수 재구성/SQL fallback 집계 구간 (기본 반감기 24h면 30일 전 클릭의 가중치는 2^-30)
+    DECAY_LOOKBACK_DAYS = 30
+    # 버킷 구성이 바뀌면 올림 (ensure_built가 클릭 이력으로 새 버킷을 채움)
+    LAYOUT_VERSION = "2"
+    ZADD_CHUNK_SIZE = 500
+
+    @staticmethod
+    def normalize_time_range(time_range: Optional[str]) -> str:
+        """지원하지 않는 값은 기본 윈도우(24h)로"""
+        if time_range in PopularityService.WINDOWS or time_range in PopularityService.DECAY_RANGES:
+            return time_range
+        return PopularityService.DEFAULT_TIME_RANGE
+
+    @staticmethod
+    def window_seconds(time_range: str) -> int:
+        """SQL fallback 집계 구간 (감쇠 랭킹은 rebuild_from_clicks와 같은 30일)"""
+        if time_range in PopularityService.WINDOWS:
+            bucket_seconds, bucket_count = PopularityService.WINDOWS[time_range]
+            return bucket_seconds * bucket_count
+        return PopularityService.DECAY_LOOKBACK_DAYS * 86400
+
+    @staticmethod
+    def _bucket_sizes() -> List[int]:
+        return sorted({bucket_seconds for bucket_seconds, _ in PopularityService.WINDOWS.values()})
+
+    @staticmethod
+    def _bucket_ttl(bucket_seconds: int) -> int:
+        """가장 긴 윈도우가 끝날 때까지 + 버킷 하나"""
+        longest = max(
+            bucket_seconds * bucket_count
+            for size, bucket_count in PopularityService.WINDOWS.values()
+            if size == bucket_seconds
+        )
+        return longest + bucket_seconds
+
+    @staticmethod
+    def _decay_keys() -> List[str]:
+        return [
+            CacheKeys.popularity_decay(category)
+            for category in (ProductCategory.ALL, ProductCategory.DOG, ProductCategory.CAT)
+        ]
+
+    @staticmethod
+    async def record_clicks(
+        clicks: Iterable[Tuple[UUID, List[ProductCategory], Optional[datetime]]]
+    ) -> int:
+        """(product_id, 노출 카테고리, 클릭 시각) 목록을 버킷/감쇠 카운터에 반영"""
+        clicks = list(clicks)
+        if not clicks:
+            return 0
+        order = (ProductCategory.ALL, ProductCategory.DOG, ProductCategory.CAT)
+        half_life = settings.POPULARITY_DECAY_HALF_LIFE_HOURS * 3600
+        try:
+            redis_client = await get_redis()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for product_id, categories, clicked_at in clicks:
+                    member = str(product_id)
+                    ts = (clicked_at or datetime.now(timezone.utc)).timestamp()
+                    for bucket_seconds in PopularityService._bucket_sizes():
+                        bucket_start = int(ts // bucket_seconds) * bucket_seconds
+                        ttl = PopularityService._bucket_ttl(bucket_seconds)
+                        for category in categories:
+                            key = CacheKeys.popularity_bucket(category, bucket_seconds, bucket_start)
+                            pipe.zincrby(key, 1, member)
+                            pipe.expire(key, ttl)
+                    targets = [str(order.index(category) + 2) for category in categories]
+                    pipe.eval(
+                        _DECAY_INCREMENT_SCRIPT,
+                        4,
+                        CacheKeys.popularity_decay_anchor(),
+                        *PopularityService._decay_keys(),
+                        ts, half_life, member, PopularityService.MAX_DECAY_EXPONENT,
+                        *targets,
+                    )
+                await pipe.execute()
+            return len(clicks)
+        except redis.RedisError as e:
+            logger.warning(f"[PopularityService] 클릭 카운터 반영 실패 ({len(clicks)}건): {e}")
+            return 0
+
+    @staticmethod
+    async def _window_view(
+        redis_client: redis.Redis,
+        category: ProductCategory,
+        time_range: str
+    ) -> str:
+        """윈도우 버킷 합산 뷰 키 (없으면 ZUNIONSTORE로 생성)"""
+        view_key = CacheKeys.popularity_view(category, time_range)
+        if await redis_client.exists(view_key):
+            return view_key
+
+        bucket_seconds, bucket_count = PopularityService.WINDOWS[time_range]
+        current = int(time.time() // bucket_seconds) * bucket_seconds
+        bucket_keys = [
+            CacheKeys.popularity_bucket(category, bucket_seconds, current - i * bucket_seconds)
+            for i in range(bucket_count)
+        ]
+        async with redis_client.pipeline(transaction=False) as pipe:
+            # 없는 버킷은 빈 집합으로 취급됨; 결과가 비면 키가 생기지 않으므로 EXPIRE는 무해
+            pipe.zunionstore(view_key, bucket_keys)
+            pipe.expire(view_key, settings.POPULARITY_VIEW_TTL_SECONDS)
+            await pipe.execute()
+        return view_key
+
+    @staticmethod
+    async def get_page(
+        category: ProductCategory,
+        limit: int,
+        offset: int,
+        time_range: str = DEFAULT_TIME_RANGE
+    ) -> Optional[Tuple[List[UUID], int]]:
+        """
+        인기 순위 페이지
+
+        Returns:
+            (product_id 목록, 랭킹에 오른 전체 상품 수),
+            카운터가 아직 없거나(복구 전) Redis 사용 불가 시 None (호출부는 SQL fallback)
+        """
+        time_range = PopularityService.normalize_time_range(time_range)
+        try:
+            redis_client = await get_redis()
+            if not await redis_client.exists(CacheKeys.popularity_decay_anchor()):
+                return None
+            if time_range in PopularityService.WINDOWS:
+                key = await PopularityService._window_view(redis_client, category, time_range)
+            else:
+                key = CacheKeys.popularity_decay(category)
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.zrevrange(key, offset, offset + limit - 1)
+                pipe.zcard(key)
+                members, total = await pipe.execute()
+            return [UUID(member) for member in members], total
+        except redis.RedisError as e:
+            logger.warning(f"[PopularityService] 조회 실패: {e}, SQL fallback")
+            return None
+
+    @staticmethod
+    async def rebuild_from_clicks(db: AsyncSession) -> int:
+        """
+        최근 클릭으로 카운터 재구성 (Redis flush 직후 등)
+
+        버킷은 outbound_clicks를 버킷 단위로 집계해 ZADD,
+        감쇠 점수는 현재 시각을 anchor로 DECAY_LOOKBACK_DAYS일치 가중합을 계산해 교체한다.
+        """
+        start_time = time.time()
+        now = datetime.now(timezone.utc)
+        half_life = settings.POPULARITY_DECAY_HALF_LIFE_HOURS * 3600
+
+        buckets: Dict[str, Tuple[int, Dict[str, float]]] = {}
+        for bucket_seconds in PopularityService._bucket_sizes():
+            ttl = PopularityService._bucket_ttl(bucket_seconds)
+            result = await db.execute(
+                text(_BUCKET_COUNTS_SQL),
+                {"bucket_seconds": bucket_seconds, "since": now - timedelta(seconds=ttl)}
+            )
+            for row in result.mappings():
+                for category in ProductCategory.for_species(row["species"]):
+                    key = CacheKeys.popularity_bucket(category, bucket_seconds, int(row["bucket_start"]))
+                    buckets.setdefault(key, (bucket_seconds, {}))[1][str(row["product_id"])] = float(row["clicks"])
+
+        decay: Dict[str, Dict[str, float]] = {key: {} for key in PopularityService._decay_keys()}
+        result = await db.execute(
+            text(_DECAY_SCORES_SQL),
+            {
+                "anchor": now.timestamp(),
+                "half_life": half_life,
+                "since": now - timedelta(days=PopularityService.DECAY_LOOKBACK_DAYS),
+            }
+        )
+        for row in result.mappings():
+            for category in ProductCategory.for_species(row["species"]):
+                decay[CacheKeys.popularity_decay(category)][str(row["product_id"])] = float(row["score"])
+
+        try:
+            redis_client = await get_redis()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for key, (bucket_seconds, members) in buckets.items():
+                    pipe.delete(key)
+                    items = list(members.items())
+                    for start in range(0, len(items), PopularityService.ZADD_CHUNK_SIZE):
+                        pipe.zadd(key, dict(items[start:start + PopularityService.ZADD_CHUNK_SIZE]))
+                    pipe.expire(key, PopularityService._bucket_ttl(bucket_seconds))
+                for key, members in decay.items():
+                    pipe.delete(key)
+                    items = list(members.items())
+                    for start in range(0, len(items), PopularityService.ZADD_CHUNK_SIZE):
+                        pipe.zadd(key, dict(items[start:start + PopularityService.ZADD_CHUNK_SIZE]))
+                pipe.set(CacheKeys.popularity_decay_anchor(), now.timestamp())
+                pipe.set(CacheKeys.popularity_layout(), PopularityService.LAYOUT_VERSION)
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"[PopularityService] 재구성 실패: {e}")
+            return 0
+
+        total = len(decay[CacheKeys.popularity_decay(ProductCategory.ALL)])
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.info(f"[PopularityService] ✅ 인기 카운터 재구성: {total}개 상품, 소요시간={duration_ms}ms")
+        return total
+
+    @staticmethod
+    async def ensure_built(db: AsyncSession) -> None:
+        """
+        카운터가 없을 때만 재구성
+
+        anchor 키가 없으면 Redis가 비워진 것으로, 구성 버전이 다르면 버킷 구성이 바뀐 것으로 본다
+        (예: 30d 1일 버킷 추가 후 첫 실행 시 지난 30일 클릭으로 채움).
+        """
+        try:
+            redis_client = await get_redis()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.exists(CacheKeys.popularity_decay_anchor())
+                pipe.get(CacheKeys.popularity_layout())
+                has_anchor, layout = await pipe.execute()
+            if has_anchor and layout == PopularityService.LAYOUT_VERSION:
+                return
+        except redis.RedisError:
+            return
+        await PopularityService.rebuild_from_clicks(db)
@@ -0,0 +1,122 @@
+"""
+가격 변경 이벤트 스트림 (Redis Stream)
+
+가격 적재 경로(수집 워커, 관리자 대량 적재)가 커밋 후 오퍼별 가격 변경 이벤트를 XADD하고,
+알림 평가 등 소비자는 소비자 그룹(XREADGROUP)으로 읽어 처리 후 XACK한다.
+처리 도중 죽은 소비자의 이벤트는 일정 시간 뒤 XAUTOCLAIM으로 다른 소비자가 회수한다.
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+from uuid import UUID
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.core.cache.cache_keys import CacheKeys
+
+logger = logging.getLogger(__name__)
+
+
+class PriceEventStream:
+    """가격 이벤트 발행/소비 헬퍼"""
+
+    @staticmethod
+    def _encode(event: Dict[str, Any]) -> Dict[str, str]:
+        """스트림 필드는 문자열만 허용"""
+        previous_price = event.get("previous_price")
+        return {
+            "offer_id": str(event["offer_id"]),
+            "product_id": str(event["product_id"]),
+            "final_price": str(event["final_price"]),
+            "previous_price": "" if previous_price is None else str(previous_price),
+            "is_sold_out": "1" if event.get("is_sold_out") else "0",
+            "captured_at": event["captured_at"].isoformat(),
+        }
+
+    @staticmethod
+    def decode(fields: Dict[str, str]) -> Dict[str, Any]:
+        """스트림 필드 → 이벤트 dict"""
+        return {
+            "offer_id": UUID(fields["offer_id"]),
+            "product_id": UUID(fields["product_id"]),
+            "final_price": int(fields["final_price"]),
+            "previous_price": int(fields["previous_price"]) if fields.get("previous_price") else None,
+            "is_sold_out": fields.get("is_sold_out") == "1",
+            "captured_at": datetime.fromisoformat(fields["captured_at"]),
+        }
+
+    @staticmethod
+    async def publish(events: List[Dict[str, Any]]) -> int:
+        """
+        이벤트 발행 (DB 커밋 후 호출)
+
+        Redis 장애 시 경고만 남긴다. 가격/통계는 이미 DB에 반영되어 있고,
+        해당 변경에 대한 알림만 누락된다.
+        """
+        if not events:
+            return 0
+        try:
+            redis_client = await get_redis()
+            stream_key = CacheKeys.price_event_stream()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for event in events:
+                    pipe.xadd(
+                        stream_key,
+                        PriceEventStream._encode(event),
+                        maxlen=settings.PRICE_EVENT_STREAM_MAXLEN,
+                        approximate=True,
+                    )
+                await pipe.execute()
+            return len(events)
+        except redis.RedisError as e:
+            logger.warning(f"[PriceEventStream] 이벤트 발행 실패 ({len(events)}건): {e}")
+            return 0
+
+    @staticmethod
+    async def ensure_group(client: redis.Redis, group: str) -> None:
+        """소비자 그룹 생성 (스트림이 없으면 함께 생성, 이미 있으면 무시)"""
+        try:
+            await client.xgroup_create(CacheKeys.price_event_stream(), group, id="0", mkstream=True)
+            logger.info(f"[PriceEventStream] 소비자 그룹 생성: {group}")
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    @staticmethod
+    async def read_group(
+        client: redis.Redis,
+        group: str,
+        consumer: str,
+        count: int,
+        block_ms: int
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        """새 이벤트 읽기 (없으면 block_ms 동안 대기)"""
+        response = await client.xreadgroup(
+            group, consumer, {CacheKeys.price_event_stream(): ">"}, count=count, block=block_ms
+        )
+        messages: List[Tuple[str, Dict[str, str]]] = []
+        for _stream, stream_messages in response or []:
+            messages.extend(stream_messages)
+        return messages
+
+    @staticmethod
+    async def claim_stale(
+        client: redis.Redis,
+        group: str,
+        consumer: str,
+        min_idle_ms: int,
+        count: int
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        """오래 ACK되지 않은 이벤트 회수 (처리 중 죽은 소비자 복구)"""
+        response = await client.xautoclaim(
+            CacheKeys.price_event_stream(), group, consumer, min_idle_ms, start_id="0-0", count=count
+        )
+        # [다음 시작 id, [(id, fields), ...], (Redis 7+) 삭제된 id 목록]
+        return [(message_id, fields) for message_id, fields in response[1] if fields]
+
+    @staticmethod
+    async def ack(client: redis.Redis, group: str, message_ids: List[str]) -> None:
+        if message_ids:
+            await client.xack(CacheKeys.price_event_stream(), group, *message_ids)
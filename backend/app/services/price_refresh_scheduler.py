@@ -0,0 +1,292 @@
+"""
+가격 재수집 우선순위 스케줄러
+
+모든 오퍼를 같은 주기로 수집하지 않고, 오퍼마다 다음 수집 시각(due)을 계산해
+Redis ZSET(member=offer_id, score=due epoch)에 보관한다.
+
+다음 수집 간격을 결정하는 요소:
+- 수요: 상품의 ACTIVE 트래킹 수 + 활성 알림 수 (많을수록 짧게)
+- 변동성: 최근 7일 하루 평균 가격 변경 횟수 (클수록 짧게)
+  (스냅샷은 가격이 바뀔 때만 쌓이므로 폴링 대비 비율이 아니라 변경 빈도로 계산)
+- 마지막 수집 상태: FAILED면 간격을 늘려 백오프, 미수집이면 즉시
+
+Redis가 죽어 있으면 워커는 기존 SQL due 조회(last_fetched_at 기준)로 동작한다.
+"""
+import logging
+import math
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy import text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.core.cache.cache_keys import CacheKeys
+from app.models.offer import OfferFetchStatus
+from app.models.tracking import Tracking, TrackingStatus
+
+logger = logging.getLogger(__name__)
+
+# due가 지난 오퍼를 꺼내면서 score를 lease 시각으로 미뤄 다른 워커와 중복 수집 방지 (원자적)
+_CLAIM_DUE_SCRIPT = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+for _, id in ipairs(ids) do
+    redis.call('ZADD', KEYS[1], ARGV[3], id)
+end
+return ids
+"""
+
+_PRIORITY_SQL = """
+WITH target AS (
+    SELECT o.id, o.product_id, o.last_fetched_at, o.last_fetch_status
+    FROM product_offers o
+    WHERE o.is_active
+      AND o.merchant = 'COUPANG'
+      AND o.vendor_item_id IS NOT NULL
+      {offer_filter}
+),
+demand AS (
+    SELECT t.product_id,
+           COUNT(DISTINCT t.id) AS tracking_count,
+           COUNT(a.id) FILTER (WHERE a.is_enabled) AS alert_count
+    FROM trackings t
+    LEFT JOIN alerts a ON a.tracking_id = t.id
+    WHERE t.status = 'ACTIVE'
+      AND t.product_id IN (SELECT product_id FROM target)
+    GROUP BY t.product_id
+),
+changes AS (
+    SELECT offer_id,
+           COUNT(*) FILTER (WHERE final_price <> prev_price) AS changed
+    FROM (
+        SELECT offer_id, final_price,
+               LAG(final_price) OVER (PARTITION BY offer_id ORDER BY captured_at) AS prev_price
+        FROM price_snapshots
+        WHERE offer_id IN (SELECT id FROM target)
+          AND captured_at >= NOW() - INTERVAL '7 days'
+    ) s
+    WHERE prev_price IS NOT NULL
+    GROUP BY offer_id
+)
+SELECT target.id AS offer_id,
+       target.product_id,
+       target.last_fetched_at,
+       target.last_fetch_status,
+       COALESCE(demand.tracking_count, 0) AS tracking_count,
+       COALESCE(demand.alert_count, 0) AS alert_count,
+       LEAST(COALESCE(changes.changed, 0)::float / (7 * {saturation_changes_per_day}), 1.0) AS volatility
+FROM target
+LEFT JOIN demand ON demand.product_id = target.product_id
+LEFT JOIN changes ON changes.offer_id = target.id
+"""
+
+
+class PriceRefreshScheduler:
+    """오퍼별 다음 수집 시각 계산 + Redis 우선순위 큐 관리"""
+
+    # 알림은 트래킹보다 "가격 변화를 바로 알고 싶다"는 신호가 강하므로 가중치를 더 줌
+    ALERT_WEIGHT = 2
+    # 변동성 100%일 때 간격을 최대 60%까지 줄임
+    VOLATILITY_WEIGHT = 0.6
+    # 하루 평균 이 횟수 이상 가격이 바뀌면 변동성 100%
+    VOLATILITY_SATURATION_CHANGES_PER_DAY = 4
+    ZADD_CHUNK_SIZE = 500
+
+    @staticmethod
+    def compute_interval(
+        tracking_count: int,
+        alert_count: int,
+        volatility: float,
+        last_fetch_status: Optional[str]
+    ) -> timedelta:
+        """수요/변동성/수집 상태로 다음 수집 간격 계산"""
+        min_minutes = settings.PRICE_REFRESH_MIN_INTERVAL_MINUTES
+        max_minutes = settings.PRICE_REFRESH_MAX_INTERVAL_MINUTES
+
+        demand = tracking_count + PriceRefreshScheduler.ALERT_WEIGHT * alert_count
+        if demand <= 0:
+            minutes = max_minutes
+        else:
+            # 수요 1 → 기본 주기의 1/2, 수요 7 → 1/4 (로그 스케일로 완만하게 감소)
+            minutes = settings.PRICE_COLLECTOR_INTERVAL_MINUTES / (1 + math.log2(1 + demand))
+
+        minutes *= 1 - PriceRefreshScheduler.VOLATILITY_WEIGHT * min(max(volatility, 0.0), 1.0)
+
+        if last_fetch_status == OfferFetchStatus.FAILED.value:
+            # 실패한 오퍼는 같은 간격으로 계속 두드리지 않도록 백오프
+            minutes *= 2
+
+        return timedelta(minutes=min(max(minutes, min_minutes), max_minutes))
+
+    @staticmethod
+    async def compute_due_times(
+        db: AsyncSession,
+        offer_ids: Optional[List[UUID]] = None
+    ) -> Dict[UUID, Dict]:
+        """
+        오퍼별 다음 수집 시각 계산 (집합 쿼리 1회)
+
+        Returns:
+            {offer_id: {"product_id": UUID, "due_at": datetime}}
+        """
+        params = {}
+        offer_filter = ""
+        if offer_ids is not None:
+            if not offer_ids:
+                return {}
+            offer_filter = "AND o.id = ANY(:offer_ids)"
+            params["offer_ids"] = list(offer_ids)
+
+        sql = _PRIORITY_SQL.format(
+            offer_filter=offer_filter,
+            saturation_changes_per_day=PriceRefreshScheduler.VOLATILITY_SATURATION_CHANGES_PER_DAY,
+        )
+        result = await db.execute(text(sql), params)
+
+        now = datetime.now(timezone.utc)
+        due_times: Dict[UUID, Dict] = {}
+        for row in result.mappings():
+            status = row["last_fetch_status"]
+            if row["last_fetched_at"] is None or status == OfferFetchStatus.NOT_FETCHED.value:
+                due_at = now
+            else:
+                interval = PriceRefreshScheduler.compute_interval(
+                    row["tracking_count"], row["alert_count"], row["volatility"], status
+                )
+                due_at = row["last_fetched_at"] + interval
+            due_times[row["offer_id"]] = {"product_id": row["product_id"], "due_at": due_at}
+        return due_times
+
+    @staticmethod
+    async def _zadd(due_times: Dict[UUID, Dict], key: str, lt: bool = False) -> None:
+        """due 시각을 청크 단위 파이프라인으로 ZADD"""
+        redis_client = await get_redis()
+        items = [(str(offer_id), info["due_at"].timestamp()) for offer_id, info in due_times.items()]
+        for start in range(0, len(items), PriceRefreshScheduler.ZADD_CHUNK_SIZE):
+            chunk = dict(items[start:start + PriceRefreshScheduler.ZADD_CHUNK_SIZE])
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.zadd(key, chunk, lt=lt)
+                await pipe.execute()
+
+    @staticmethod
+    async def rebuild_queue(db: AsyncSession) -> int:
+        """전체 오퍼 due 재계산 후 큐 교체 (비활성화된 오퍼는 자연스럽게 빠짐)"""
+        start_time = time.time()
+        due_times = await PriceRefreshScheduler.compute_due_times(db)
+        queue_key = CacheKeys.price_refresh_queue()
+        temp_key = f"{queue_key}:rebuild"
+
+        try:
+            redis_client = await get_redis()
+            await redis_client.delete(temp_key)
+            if due_times:
+                await PriceRefreshScheduler._zadd(due_times, temp_key)
+                await redis_client.rename(temp_key, queue_key)
+            else:
+                await redis_client.delete(queue_key)
+        except redis.RedisError as e:
+            logger.warning(f"[PriceRefreshScheduler] 큐 재구성 실패: {e}")
+            return 0
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.info(
+            f"[PriceRefreshScheduler] ✅ 우선순위 큐 재구성: {len(due_times)}개 오퍼, 소요시간={duration_ms}ms"
+        )
+        return len(due_times)
+
+    @staticmethod
+    async def claim_due(limit: int) -> Optional[List[UUID]]:
+        """
+        due가 지난 오퍼를 가장 오래 밀린 순으로 꺼냄
+
+        Returns:
+            offer_id 목록, Redis 사용 불가 시 None (호출부는 SQL 조회로 fallback)
+        """
+        now = time.time()
+        lease_until = now + settings.PRICE_REFRESH_CLAIM_LEASE_SECONDS
+        try:
+            redis_client = await get_redis()
+            ids = await redis_client.eval(
+                _CLAIM_DUE_SCRIPT, 1, CacheKeys.price_refresh_queue(), now, limit, lease_until
+            )
+            return [UUID(offer_id) for offer_id in ids]
+        except redis.RedisError as e:
+            logger.warning(f"[PriceRefreshScheduler] 큐 조회 실패: {e}, SQL due 조회로 fallback")
+            return None
+
+    @staticmethod
+    async def remove(offer_ids: List[UUID]) -> None:
+        """비활성/삭제된 오퍼를 큐에서 제거"""
+        if not offer_ids:
+            return
+        try:
+            redis_client = await get_redis()
+            await redis_client.zrem(CacheKeys.price_refresh_queue(), *[str(i) for i in offer_ids])
+        except redis.RedisError as e:
+            logger.warning(f"[PriceRefreshScheduler] 큐 제거 실패: {e}")
+
+    @staticmethod
+    async def is_queue_empty() -> bool:
+        try:
+            redis_client = await get_redis()
+            return await redis_client.zcard(CacheKeys.price_refresh_queue()) == 0
+        except redis.RedisError:
+            return False
+
+    @staticmethod
+    async def schedule_offers(db: AsyncSession, offer_ids: List[UUID]) -> None:
+        """
+        수집 직후 호출: 해당 오퍼들의 다음 due를 계산해 큐와 트래킹 next_check_at에 반영
+        (커밋은 호출부 트랜잭션에서)
+        """
+        due_times = await PriceRefreshScheduler.compute_due_times(db, offer_ids)
+        if not due_times:
+            return
+
+        # 상품별 가장 이른 due를 트래킹 next_check_at으로 사용
+        product_due: Dict[UUID, datetime] = {}
+        for info in due_times.values():
+            current = product_due.get(info["product_id"])
+            if current is None or info["due_at"] < current:
+                product_due[info["product_id"]] = info["due_at"]
+        for product_id, due_at in product_due.items():
+            await db.execute(
+                update(Tracking)
+                .where(
+                    Tracking.product_id == product_id,
+                    Tracking.status == TrackingStatus.ACTIVE
+                )
+                .values(next_check_at=due_at)
+            )
+
+        try:
+            await PriceRefreshScheduler._zadd(due_times, CacheKeys.price_refresh_queue())
+        except redis.RedisError as e:
+            logger.warning(f"[PriceRefreshScheduler] 큐 갱신 실패 (다음 재구성 때 반영): {e}")
+
+    @staticmethod
+    async def reschedule_product(db: AsyncSession, product_id: UUID) -> None:
+        """
+        트래킹/알림이 생겼을 때 호출: 상품 오퍼의 due를 당김 (늦추지는 않음)
+        """
+        try:
+            result = await db.execute(
+                text(
+                    "SELECT id FROM product_offers "
+                    "WHERE product_id = :product_id AND is_active"
+                ),
+                {"product_id": product_id}
+            )
+            offer_ids = [row[0] for row in result.all()]
+            due_times = await PriceRefreshScheduler.compute_due_times(db, offer_ids)
+            if due_times:
+                # LT: 이미 더 이른 due가 잡혀 있으면 유지
+                await PriceRefreshScheduler._zadd(due_times, CacheKeys.price_refresh_queue(), lt=True)
+        except redis.RedisError as e:
+            logger.warning(f"[PriceRefreshScheduler] 상품 재스케줄 실패: {e}")
+        except Exception as e:
+            logger.error(f"[PriceRefreshScheduler] 상품 재스케줄 에러: {e}", exc_info=True)
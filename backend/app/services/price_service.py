@@ -1,3 +1,612 @@
-# 가격 스냅샷 & 평균 계산 서비스
-# TODO: 구현 필요
+"""가격 스냅샷 & 평균 계산 서비스"""
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Tuple
+from uuid import UUID
 
+from sqlalchemy import update, select, func, case, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.offer import ProductOffer
+from app.models.price import PriceSnapshot, PriceSummary, PriceRollupHourly, PriceRollupDaily
+from app.schemas.product import PriceHistoryRead
+from app.models.tracking import Tracking, TrackingStatus
+
+logger = logging.getLogger(__name__)
+
+
+class PriceService:
+    """가격 수집 결과 저장 / 가격 통계 서비스"""
+
+    # 롤링 통계 윈도우 (일)
+    WINDOWS = (7, 30, 90)
+    DEFAULT_WINDOW_DAYS = 30
+    # 히스토리 조회 해상도: 기간이 길수록 거친 롤업을 읽어 반환 행 수를 버킷 수로 제한
+    RAW_HISTORY_MAX_DAYS = 1
+    HOURLY_HISTORY_MAX_DAYS = 14
+
+    # COPY로 적재하는 스냅샷 컬럼 (id는 클라이언트에서 생성, created_at은 DB 기본값)
+    SNAPSHOT_COPY_COLUMNS = (
+        "id", "offer_id", "listed_price", "shipping_fee", "coupon_discount", "card_discount",
+        "final_price", "currency", "is_sold_out", "captured_at", "captured_source",
+    )
+
+    @staticmethod
+    def fingerprint(price_data: Dict[str, Any]) -> str:
+        """관측값 지문: 최종가/품절/표시가/배송비/쿠폰/카드 할인 (하나라도 바뀌면 다른 지문)"""
+        return ":".join(
+            str(value) for value in (
+                price_data["final_price"],
+                int(bool(price_data.get("is_sold_out", False))),
+                price_data.get("listed_price", price_data["final_price"]),
+                price_data.get("shipping_fee", 0),
+                price_data.get("coupon_discount", 0),
+                price_data.get("card_discount", 0),
+            )
+        )
+
+    @staticmethod
+    async def save_fetch_results(
+        db: AsyncSession,
+        results: List[Dict[str, Any]],
+        fetched_at: datetime,
+        next_check_interval: timedelta
+    ) -> Dict[str, Any]:
+        """
+        가격 수집 결과 저장
+
+        - 지문이 바뀐 관측값: bulk ingest (스냅샷/오퍼/요약/롤업/트래킹)
+        - 지문이 같은 관측값: last_fetched_at만 UPDATE 1회 (스냅샷/알림 평가 생략, 요약은 날이 바뀐 오퍼만 갱신)
+        - 실패: 상태만 갱신
+
+        Args:
+            results: [{"offer_id", "product_id", "source", "price_data"(dict|None), "error"(str|None),
+                       "previous_fingerprint"(str|None)}, ...]
+            fetched_at: 이번 수집 시각
+            next_check_interval: 트래킹 next_check_at 갱신 간격
+
+        Returns:
+            {"snapshots": 저장된 스냅샷 수, "unchanged": 변경 없는 오퍼 수, "failed": 실패 오퍼 수,
+             "events": 가격 이벤트 목록 (변경된 오퍼만, 커밋 후 발행)}
+        """
+        observations = []
+        unchanged_ids = []
+        failures = []
+        for r in results:
+            if not r.get("price_data"):
+                failures.append(r)
+            elif PriceService.fingerprint(r["price_data"]) == r.get("previous_fingerprint"):
+                unchanged_ids.append(r["offer_id"])
+            else:
+                observations.append({
+                    **r["price_data"],
+                    "offer_id": r["offer_id"],
+                    "captured_at": fetched_at,
+                    "captured_source": r.get("source", "COUPANG_API"),
+                })
+
+        events = await PriceService.ingest_observations(db, observations, next_check_interval)
+        await PriceService.touch_offers(db, unchanged_ids, fetched_at)
+        await PriceService.mark_fetch_failures(db, failures, fetched_at)
+
+        return {
+            "snapshots": len(observations),
+            "unchanged": len(unchanged_ids),
+            "failed": len(failures),
+            "events": events,
+        }
+
+    @staticmethod
+    async def touch_offers(db: AsyncSession, offer_ids: List[UUID], fetched_at: datetime) -> None:
+        """
+        가격 변화 없는 오퍼: 수집 시각/상태만 갱신 (UPDATE 1회)
+
+        그날(UTC) 첫 수집인 오퍼는 롤링 통계도 오늘까지 이어 붙인다 (유지된 가격으로 일 버킷 채움 + 만료).
+        가격이 오래 그대로인 오퍼의 7/30/90일 통계가 마지막 가격 변경 시점에 멈추지 않도록.
+        """
+        if not offer_ids:
+            return
+        result = await db.execute(
+            text(
+                """
+                UPDATE product_offers AS o
+                SET last_fetched_at = :fetched_at,
+                    last_fetch_status = 'SUCCESS',
+                    last_fetch_error = NULL
+                FROM product_offers AS prev
+                WHERE o.id = ANY(:offer_ids)
+                  AND prev.id = o.id
+                RETURNING o.id AS offer_id, o.current_price,
+                          prev.last_fetched_at IS NULL
+                          OR (prev.last_fetched_at AT TIME ZONE 'UTC')::date
+                             < (CAST(:fetched_at AS timestamptz) AT TIME ZONE 'UTC')::date AS new_day
+                """
+            ),
+            {"fetched_at": fetched_at, "offer_ids": list(offer_ids)}
+        )
+        carried = [
+            (row["offer_id"], row["current_price"], fetched_at)
+            for row in result.mappings()
+            if row["new_day"] and row["current_price"] is not None
+        ]
+        await PriceService.update_rolling_stats(db, carried, carry=True)
+
+    @staticmethod
+    async def ingest_observations(
+        db: AsyncSession,
+        observations: List[Dict[str, Any]],
+        next_check_interval: Optional[timedelta] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        가격 관측값 배치 적재 (호출부 트랜잭션 1개, 커밋은 호출부에서)
+
+        1. price_snapshots: COPY
+        2. product_offers: unnest 배열로 UPDATE 1회 (오퍼별 최신 관측값 + 지문, 가격 변경 시 직전 가격)
+        3. price_summaries: 롤링 통계 증분 UPSERT
+        4. price_rollups_hourly/daily: UPSERT
+        5. trackings: last_checked_at(/next_check_at) UPDATE 1회
+
+        Args:
+            observations: [{"offer_id", "final_price", "captured_at", "listed_price"?, "shipping_fee"?,
+                            "coupon_discount"?, "card_discount"?, "currency"?, "is_sold_out"?,
+                            "captured_source"?}, ...]
+            next_check_interval: 주어지면 트래킹 next_check_at = 관측 시각 + 간격
+
+        Returns:
+            가격 이벤트 목록 (오퍼별 최신 관측값, 커밋 후 PriceEventStream.publish로 발행)
+            [{"offer_id", "product_id", "final_price", "previous_price", "is_sold_out", "captured_at"}, ...]
+        """
+        if not observations:
+            return []
+
+        # 1. 스냅샷 COPY
+        await PriceService._copy_snapshots(db, observations)
+
+        # 2. 오퍼 현재가 갱신 (같은 오퍼가 여러 번 오면 가장 최근 관측값만)
+        latest: Dict[UUID, Dict[str, Any]] = {}
+        for obs in observations:
+            current = latest.get(obs["offer_id"])
+            if current is None or obs["captured_at"] >= current["captured_at"]:
+                latest[obs["offer_id"]] = obs
+        # prev는 UPDATE 전 스냅샷이라 RETURNING으로 직전 가격을 함께 받음
+        result = await db.execute(
+            text(
+                """
+                UPDATE product_offers AS o
+                SET current_price = v.final_price,
+                    -- 가격이 바뀌면 직전 가격을 보관 (핫딜 할인율 기준)
+                    last_seen_price = CASE
+                        WHEN prev.current_price IS DISTINCT FROM v.final_price THEN prev.current_price
+                        ELSE o.last_seen_price
+                    END,
+                    price_fingerprint = v.fingerprint,
+                    last_fetched_at = v.captured_at,
+                    last_fetch_status = 'SUCCESS',
+                    last_fetch_error = NULL
+                FROM unnest(
+                    CAST(:offer_ids AS uuid[]),
+                    CAST(:final_prices AS integer[]),
+                    CAST(:captured_ats AS timestamptz[]),
+                    CAST(:fingerprints AS text[]),
+                    CAST(:sold_outs AS boolean[])
+                ) AS v(offer_id, final_price, captured_at, fingerprint, is_sold_out)
+                JOIN product_offers AS prev ON prev.id = v.offer_id
+                WHERE o.id = v.offer_id
+                  AND (o.last_fetched_at IS NULL OR o.last_fetched_at <= v.captured_at)
+                RETURNING o.id AS offer_id, o.product_id, v.final_price,
+                          prev.current_price AS previous_price, v.is_sold_out, v.captured_at
+                """
+            ),
+            {
+                "offer_ids": list(latest.keys()),
+                "final_prices": [obs["final_price"] for obs in latest.values()],
+                "captured_ats": [obs["captured_at"] for obs in latest.values()],
+                "fingerprints": [PriceService.fingerprint(obs) for obs in latest.values()],
+                "sold_outs": [bool(obs.get("is_sold_out", False)) for obs in latest.values()],
+            }
+        )
+        events = [dict(row) for row in result.mappings()]
+
+        # 3~4. 롤링 통계 / 롤업 증분 갱신 (스냅샷 이력 재집계 없음)
+        price_points = [(obs["offer_id"], obs["final_price"], obs["captured_at"]) for obs in observations]
+        await PriceService.update_rolling_stats(db, price_points)
+        await PriceService.update_rollups(db, price_points)
+
+        # 5. 관측된 오퍼의 상품에 걸린 ACTIVE 트래킹 확인 시각 갱신
+        checked_at = max(obs["captured_at"] for obs in observations)
+        tracking_values = {"last_checked_at": checked_at}
+        if next_check_interval is not None:
+            tracking_values["next_check_at"] = checked_at + next_check_interval
+        await db.execute(
+            update(Tracking)
+            .where(
+                Tracking.product_id.in_(
+                    select(ProductOffer.product_id).where(ProductOffer.id.in_(list(latest.keys())))
+                ),
+                Tracking.status == TrackingStatus.ACTIVE
+            )
+            .values(**tracking_values)
+        )
+
+        return events
+
+    @staticmethod
+    async def _copy_snapshots(db: AsyncSession, observations: List[Dict[str, Any]]) -> None:
+        """asyncpg COPY로 스냅샷 적재 (세션과 같은 커넥션/트랜잭션 사용)"""
+        records = [
+            (
+                uuid.uuid4(),
+                obs["offer_id"],
+                obs.get("listed_price", obs["final_price"]),
+                obs.get("shipping_fee", 0),
+                obs.get("coupon_discount", 0),
+                obs.get("card_discount", 0),
+                obs["final_price"],
+                obs.get("currency", "KRW"),
+                obs.get("is_sold_out", False),
+                obs["captured_at"],
+                obs.get("captured_source", "COUPANG_API"),
+            )
+            for obs in observations
+        ]
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            PriceSnapshot.__tablename__,
+            records=records,
+            columns=list(PriceService.SNAPSHOT_COPY_COLUMNS),
+        )
+
+    @staticmethod
+    async def mark_fetch_failures(
+        db: AsyncSession,
+        failures: List[Dict[str, Any]],
+        fetched_at: datetime
+    ) -> None:
+        """수집 실패 오퍼 상태 갱신 (UPDATE 1회, 다음 주기까지 재시도하지 않도록 last_fetched_at도 갱신)"""
+        if not failures:
+            return
+        await db.execute(
+            text(
+                """
+                UPDATE product_offers AS o
+                SET last_fetched_at = :fetched_at,
+                    last_fetch_status = 'FAILED',
+                    last_fetch_error = v.error
+                FROM unnest(CAST(:offer_ids AS uuid[]), CAST(:errors AS text[])) AS v(offer_id, error)
+                WHERE o.id = v.offer_id
+                """
+            ),
+            {
+                "fetched_at": fetched_at,
+                "offer_ids": [r["offer_id"] for r in failures],
+                "errors": [(r.get("error") or "empty response")[:1000] for r in failures],
+            }
+        )
+
+    @staticmethod
+    def _apply_observation(
+        state: Optional[Dict[str, Any]],
+        final_price: int,
+        captured_at: datetime,
+        window_days: int,
+        carry: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        윈도우 상태에 관측값 1건 반영 (증분)
+
+        - 일 버킷: 그날 관측값의 합계/건수/min/max
+        - 직전 관측 이후 관측이 없던 날(과 이번 관측일)은 직전 가격이 유지된 것으로 보고 직전 가격 1건으로 채움
+          (가격이 바뀔 때만 관측값이 들어와도 평균이 가격이 유지된 기간만큼 반영되도록)
+        - 합계/건수: 새 값을 더하고, 윈도우 밖으로 밀려난 일 버킷만큼 빼서 유지
+        - 최소/최대: 일 버킷별 min/max만 비교 (버킷 수 ≤ window_days, 이력 길이와 무관)
+        - carry: 가격 변화 없이 수집만 된 오퍼 (새 관측값 없이 오늘까지 채우고 만료만)
+
+        Returns:
+            갱신된 상태, 윈도우보다 오래된 관측값이거나 바뀐 것이 없으면 None
+        """
+        day = captured_at.astimezone(timezone.utc).date()
+        if state is None:
+            if carry:
+                return None
+            state = {
+                "sum": 0, "count": 0, "buckets": {},
+                "last_final_price": final_price, "last_captured_at": captured_at,
+            }
+
+        # 윈도우 기준일: 지금까지 본 가장 최근 날짜
+        last_day = state["last_captured_at"].astimezone(timezone.utc).date()
+        latest_day = max(day, last_day)
+        cutoff_day = latest_day - timedelta(days=window_days - 1)
+        cutoff = cutoff_day.isoformat()
+        if day.isoformat() < cutoff or (carry and day <= last_day):
+            return None
+
+        buckets = dict(state["buckets"])
+        total = state["sum"]
+        count = state["count"]
+
+        # 윈도우 밖 버킷 만료
+        for bucket_day in [d for d in buckets if d < cutoff]:
+            bucket_sum, bucket_count, _, _ = buckets.pop(bucket_day)
+            total -= bucket_sum
+            count -= bucket_count
+
+        # 직전 관측 이후 ~ 이번 관측일: 직전 가격이 유지된 날
+        fill_day = max(last_day + timedelta(days=1), cutoff_day)
+        held_price = state["last_final_price"]
+        while fill_day <= day:
+            if fill_day.isoformat() not in buckets:
+                buckets[fill_day.isoformat()] = [held_price, 1, held_price, held_price]
+                total += held_price
+                count += 1
+            fill_day += timedelta(days=1)
+
+        if not carry:
+            key = day.isoformat()
+            if key in buckets:
+                bucket_sum, bucket_count, bucket_min, bucket_max = buckets[key]
+                buckets[key] = [
+                    bucket_sum + final_price, bucket_count + 1,
+                    min(bucket_min, final_price), max(bucket_max, final_price),
+                ]
+            else:
+                buckets[key] = [final_price, 1, final_price, final_price]
+            total += final_price
+            count += 1
+
+        if carry:
+            last_final_price, last_captured_at = state["last_final_price"], captured_at
+        elif captured_at >= state["last_captured_at"]:
+            last_final_price, last_captured_at = final_price, captured_at
+        else:
+            last_final_price, last_captured_at = state["last_final_price"], state["last_captured_at"]
+
+        return {
+            "sum": total,
+            "count": count,
+            "buckets": buckets,
+            "last_final_price": last_final_price,
+            "last_captured_at": last_captured_at,
+        }
+
+    @staticmethod
+    async def update_rolling_stats(
+        db: AsyncSession,
+        observations: List[Tuple[UUID, int, datetime]],
+        carry: bool = False
+    ) -> None:
+        """
+        7/30/90일 롤링 통계 증분 갱신 (SELECT 1회 + UPSERT 1회)
+
+        평균은 일 버킷 평균의 평균 (하루 안에 가격이 여러 번 바뀌어도 그날이 더 무겁게 반영되지 않도록)
+
+        Args:
+            observations: [(offer_id, final_price, captured_at), ...]
+            carry: 가격 변화 없이 수집 시각만 전달된 오퍼 (통계가 있는 오퍼만 오늘까지 이어 붙임)
+        """
+        if not observations:
+            return
+
+        offer_ids = list({offer_id for offer_id, _, _ in observations})
+        result = await db.execute(
+            select(PriceSummary).where(
+                PriceSummary.offer_id.in_(offer_ids),
+                PriceSummary.window_days.in_(PriceService.WINDOWS)
+            )
+        )
+        states: Dict[Tuple[UUID, int], Optional[Dict[str, Any]]] = {
+            (summary.offer_id, summary.window_days): {
+                "sum": summary.sum_final_price,
+                "count": summary.sample_count,
+                "buckets": summary.buckets or {},
+                "last_final_price": summary.last_final_price,
+                "last_captured_at": summary.last_captured_at,
+            }
+            for summary in result.scalars().all()
+        }
+
+        changed = set()
+        for offer_id, final_price, captured_at in sorted(observations, key=lambda o: o[2]):
+            for window_days in PriceService.WINDOWS:
+                key = (offer_id, window_days)
+                new_state = PriceService._apply_observation(
+                    states.get(key), final_price, captured_at, window_days, carry
+                )
+                if new_state is not None:
+                    states[key] = new_state
+                    changed.add(key)
+
+        rows = []
+        for offer_id, window_days in changed:
+            state = states[(offer_id, window_days)]
+            bucket_values = state["buckets"].values()
+            rows.append({
+                "offer_id": offer_id,
+                "window_days": window_days,
+                "avg_final_price": round(sum(b[0] / b[1] for b in bucket_values) / len(bucket_values)),
+                "min_final_price": min(b[2] for b in bucket_values),
+                "max_final_price": max(b[3] for b in bucket_values),
+                "last_final_price": state["last_final_price"],
+                "last_captured_at": state["last_captured_at"],
+                "sum_final_price": state["sum"],
+                "sample_count": state["count"],
+                "buckets": state["buckets"],
+            })
+        if not rows:
+            return
+
+        stmt = pg_insert(PriceSummary).values(rows)
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[PriceSummary.offer_id, PriceSummary.window_days],
+                set_={
+                    column: stmt.excluded[column]
+                    for column in (
+                        "avg_final_price", "min_final_price", "max_final_price",
+                        "last_final_price", "last_captured_at",
+                        "sum_final_price", "sample_count", "buckets",
+                    )
+                } | {"updated_at": func.now()}
+            )
+        )
+
+    @staticmethod
+    async def get_summary(
+        db: AsyncSession,
+        offer_id: UUID,
+        window_days: int = DEFAULT_WINDOW_DAYS
+    ) -> Optional[PriceSummary]:
+        """윈도우별 가격 요약 조회"""
+        return await db.get(PriceSummary, (offer_id, window_days))
+
+    @staticmethod
+    async def update_rollups(
+        db: AsyncSession,
+        observations: List[Tuple[UUID, int, datetime]]
+    ) -> None:
+        """
+        시간/일 OHLC 롤업 증분 갱신 (해상도별 UPSERT 1회)
+
+        Args:
+            observations: [(offer_id, final_price, captured_at), ...]
+        """
+        if not observations:
+            return
+
+        for model, truncate in (
+            (PriceRollupHourly, lambda ts: ts.replace(minute=0, second=0, microsecond=0)),
+            (PriceRollupDaily, lambda ts: ts.replace(hour=0, minute=0, second=0, microsecond=0)),
+        ):
+            # 같은 (오퍼, 버킷) 관측값은 먼저 합침 (한 문장에서 같은 행을 두 번 갱신할 수 없음)
+            buckets: Dict[Tuple[UUID, datetime], Dict[str, Any]] = {}
+            for offer_id, final_price, captured_at in observations:
+                captured_at = captured_at.astimezone(timezone.utc)
+                key = (offer_id, truncate(captured_at))
+                row = buckets.get(key)
+                if row is None:
+                    buckets[key] = {
+                        "offer_id": offer_id,
+                        "bucket_start": key[1],
+                        "open_price": final_price,
+                        "min_price": final_price,
+                        "max_price": final_price,
+                        "close_price": final_price,
+                        "sample_count": 1,
+                        "open_at": captured_at,
+                        "close_at": captured_at,
+                    }
+                    continue
+                row["min_price"] = min(row["min_price"], final_price)
+                row["max_price"] = max(row["max_price"], final_price)
+                row["sample_count"] += 1
+                if captured_at < row["open_at"]:
+                    row["open_price"], row["open_at"] = final_price, captured_at
+                if captured_at >= row["close_at"]:
+                    row["close_price"], row["close_at"] = final_price, captured_at
+
+            table = model.__table__
+            stmt = pg_insert(model).values(list(buckets.values()))
+            excluded = stmt.excluded
+            await db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[table.c.offer_id, table.c.bucket_start],
+                    set_={
+                        "min_price": func.least(table.c.min_price, excluded.min_price),
+                        "max_price": func.greatest(table.c.max_price, excluded.max_price),
+                        "sample_count": table.c.sample_count + excluded.sample_count,
+                        "open_price": case(
+                            (excluded.open_at < table.c.open_at, excluded.open_price),
+                            else_=table.c.open_price
+                        ),
+                        "open_at": func.least(table.c.open_at, excluded.open_at),
+                        "close_price": case(
+                            (excluded.close_at >= table.c.close_at, excluded.close_price),
+                            else_=table.c.close_price
+                        ),
+                        "close_at": func.greatest(table.c.close_at, excluded.close_at),
+                    }
+                )
+            )
+
+    @staticmethod
+    async def get_price_history(
+        db: AsyncSession,
+        offer_id: UUID,
+        days: int
+    ) -> List[PriceHistoryRead]:
+        """
+        기간에 맞는 해상도로 가격 히스토리 조회
+
+        - RAW_HISTORY_MAX_DAYS 이하: 원본 스냅샷
+        - HOURLY_HISTORY_MAX_DAYS 이하: 시간 롤업 종가
+        - 그 이상: 일 롤업 종가
+
+        스냅샷/롤업은 가격이 바뀔 때만 쌓이므로 (변화 없는 수집은 touch_offers),
+        기간 시작 시점에 유지되던 가격(기간 전 마지막 점, 없으면 현재가)을 맨 앞에,
+        지금 시점의 현재가를 맨 뒤에 붙여 가격이 그대로인 오퍼도 기간 전체가 그려지게 한다.
+        """
+        now = datetime.now(timezone.utc)
+        since = now - timedelta(days=days)
+
+        if days <= PriceService.RAW_HISTORY_MAX_DAYS:
+            time_column, price_column = PriceSnapshot.captured_at, PriceSnapshot.final_price
+            offer_column = PriceSnapshot.offer_id
+        else:
+            model = PriceRollupHourly if days <= PriceService.HOURLY_HISTORY_MAX_DAYS else PriceRollupDaily
+            time_column, price_column, offer_column = model.bucket_start, model.close_price, model.offer_id
+
+        result = await db.execute(
+            select(time_column, price_column)
+            .where(offer_column == offer_id, time_column >= since)
+            .order_by(time_column.asc())
+        )
+        points = [PriceHistoryRead(date=captured_at, price=price) for captured_at, price in result.all()]
+
+        current_price = await db.scalar(select(ProductOffer.current_price).where(ProductOffer.id == offer_id))
+        opening_price = await db.scalar(
+            select(price_column)
+            .where(offer_column == offer_id, time_column < since)
+            .order_by(time_column.desc())
+            .limit(1)
+        )
+        if opening_price is None and not points:
+            # 기간 안에 가격 변화가 없었음 → 기간 내내 현재가
+            opening_price = current_price
+
+        if opening_price is not None and (not points or points[0].date > since):
+            points.insert(0, PriceHistoryRead(date=since, price=opening_price))
+        if current_price is not None and points and points[-1].date < now:
+            points.append(PriceHistoryRead(date=now, price=current_price))
+        return points
+
+    @staticmethod
+    async def prune_batch(
+        db: AsyncSession,
+        table_name: str,
+        time_column: str,
+        cutoff: datetime,
+        batch_size: int
+    ) -> int:
+        """
+        보존 기간이 지난 행을 한 배치만 삭제 (긴 트랜잭션/락 방지, 커밋은 호출부에서)
+
+        Returns:
+            삭제된 행 수 (batch_size보다 작으면 정리 완료)
+        """
+        result = await db.execute(
+            text(
+                f"""
+                DELETE FROM {table_name}
+                WHERE ctid IN (
+                    SELECT ctid FROM {table_name}
+                    WHERE {time_column} < :cutoff
+                    LIMIT :batch_size
+                )
+                """
+            ),
+            {"cutoff": cutoff, "batch_size": batch_size}
+        )
+        return result.rowcount or 0
@@ -0,0 +1,193 @@
+"""
+상품 카탈로그 검색 (전문 검색 + trigram)
+
+products.search_vector / search_compact 생성 컬럼(DB가 상품 쓰기 시 갱신)을 인덱스로 조회한다.
+PostgreSQL에는 한국어 형태소 분석기가 없으므로:
+- search_vector: 'simple' 설정 tsvector → 토큰 접두 일치 ("로얄" → "로얄캐닌")
+- search_compact: 공백을 제거한 정규화 문자열 + pg_trgm → 띄어쓰기 차이("로얄 캐닌"), 부분 일치, 오타 허용
+
+정규화 규칙은 마이그레이션(add_product_search)의 SQL 식과 같아야 한다:
+NFKC(전각→반각) → 소문자 → 중량 표기 통일(킬로/키로 → kg) → 문자/숫자/. 외에는 공백
+"""
+import logging
+import re
+import time
+import unicodedata
+from typing import List, Optional
+
+from sqlalchemy import select, func, or_, and_, case, literal
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.product import Product
+from app.models.section import ProductCategory
+from app.schemas.product import ProductRead, ProductSearchResponse, SearchSuggestion
+from app.services.section_service import SectionService
+
+logger = logging.getLogger(__name__)
+
+_UNIT_SYNONYMS = re.compile(r"(킬로그램|킬로|키로)")
+# DB 생성 컬럼(_SEARCH_SOURCE_SQL)과 같은 명시적 문자 집합 (로캘/콜레이션에 따라 달라지는 [:alnum:]/\w 대신)
+_NON_WORD = re.compile(r"[^0-9A-Za-z가-힣.]+")
+# 입력 중인 마지막 글자가 자모 단독("로얄ㅋ")이면 접두 일치를 막으므로 제거
+_TRAILING_JAMO = re.compile(r"[ㄱ-ㆎ]+$")
+
+
+class ProductSearchService:
+    """상품 검색/자동완성"""
+
+    # trigram은 3글자 미만이면 인덱스를 타지 못하므로 그보다 짧으면 토큰 접두 일치만 사용
+    MIN_TRIGRAM_LENGTH = 3
+    # 자동완성 브랜드 후보: 일치 상품 수 상위 (limit × 배수)개 중 브랜드명이 접두 일치하는 것
+    BRAND_SCAN_FACTOR = 5
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        text = unicodedata.normalize("NFKC", text or "").lower()
+        text = _UNIT_SYNONYMS.sub("kg", text)
+        return " ".join(_NON_WORD.sub(" ", text).split())
+
+    @staticmethod
+    def compact(text: str) -> str:
+        return ProductSearchService.normalize(text).replace(" ", "")
+
+    @staticmethod
+    def _tsquery_text(normalized: str) -> Optional[str]:
+        """토큰별 접두 일치를 AND로 연결 (정규화 후에는 tsquery 특수문자가 남지 않음)"""
+        tokens = [token.strip(".") for token in normalized.split()]
+        tokens = [token for token in tokens if token]
+        if not tokens:
+            return None
+        return " & ".join(f"{token}:*" for token in tokens)
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    @staticmethod
+    def match_clause(query: str) -> Optional[ColumnElement]:
+        """
+        검색어 일치 조건 (관리자 목록 필터와 앱 검색 공용)
+
+        Returns:
+            조건식, 정규화 후 검색어가 비면 None
+        """
+        normalized = ProductSearchService.normalize(query)
+        tsquery_text = ProductSearchService._tsquery_text(normalized)
+        if tsquery_text is None:
+            return None
+
+        conditions = [Product.search_vector.op("@@")(func.to_tsquery("simple", tsquery_text))]
+        compact = normalized.replace(" ", "")
+        if len(compact) >= ProductSearchService.MIN_TRIGRAM_LENGTH:
+            conditions.append(
+                Product.search_compact.like(f"%{ProductSearchService._escape_like(compact)}%", escape="\\")
+            )
+            # 오타 허용: 검색어와 가장 비슷한 부분 문자열 기준 (pg_trgm word_similarity)
+            conditions.append(literal(compact).op("<%")(Product.search_compact))
+        return or_(*conditions)
+
+    @staticmethod
+    def _rank_expression(query: str) -> ColumnElement:
+        """토큰 일치(가중) + 부분 유사도 + 앞부분 일치 가산점"""
+        normalized = ProductSearchService.normalize(query)
+        compact = normalized.replace(" ", "")
+        tsquery = func.to_tsquery("simple", ProductSearchService._tsquery_text(normalized))
+        prefix_boost = case(
+            (Product.search_compact.like(f"{ProductSearchService._escape_like(compact)}%", escape="\\"), 1.0),
+            else_=0.0
+        )
+        return (
+            func.ts_rank(Product.search_vector, tsquery) * 2
+            + func.word_similarity(compact, Product.search_compact)
+            + prefix_boost
+        )
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        query: str,
+        category: ProductCategory = ProductCategory.ALL,
+        limit: int = 20,
+        offset: int = 0
+    ) -> ProductSearchResponse:
+        """활성 상품 검색 (관련도순)"""
+        start_time = time.time()
+        clause = ProductSearchService.match_clause(query)
+        if clause is None:
+            return ProductSearchResponse(query=query, products=[], has_more=False)
+
+        stmt = (
+            select(Product)
+            .where(and_(Product.is_active == True, clause))
+            .order_by(ProductSearchService._rank_expression(query).desc(), Product.id)
+            .limit(limit + 1)
+            .offset(offset)
+        )
+        stmt = SectionService._apply_category_filter(stmt, category)
+        result = await db.execute(stmt)
+        products = list(result.scalars().all())
+
+        has_more = len(products) > limit
+        products = products[:limit]
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.info(
+            f"[ProductSearch] 🔍 검색: query={query!r}, category={category.value}, "
+            f"결과={len(products)}개, 소요시간={duration_ms}ms"
+        )
+        return ProductSearchResponse(
+            query=query,
+            products=[ProductRead.model_validate(product) for product in products],
+            has_more=has_more
+        )
+
+    @staticmethod
+    async def autocomplete(db: AsyncSession, prefix: str, limit: int = 10) -> List[SearchSuggestion]:
+        """
+        접두 자동완성: 브랜드 먼저, 남은 자리는 상품명
+
+        브랜드는 활성 상품 수가 많은 순, 상품은 관련도순.
+        """
+        prefix = _TRAILING_JAMO.sub("", unicodedata.normalize("NFKC", prefix or "").strip())
+        normalized = ProductSearchService.normalize(prefix)
+        tsquery_text = ProductSearchService._tsquery_text(normalized)
+        if tsquery_text is None:
+            return []
+
+        matched = and_(
+            Product.is_active == True,
+            Product.search_vector.op("@@")(func.to_tsquery("simple", tsquery_text))
+        )
+        compact_prefix = normalized.replace(" ", "")
+
+        # 브랜드는 종류가 적으므로 일치 상품의 브랜드를 모은 뒤 같은 정규화로 접두 비교
+        brand_rows = await db.execute(
+            select(Product.brand_name, func.count().label("product_count"))
+            .where(matched)
+            .group_by(Product.brand_name)
+            .order_by(func.count().desc(), Product.brand_name)
+            .limit(limit * ProductSearchService.BRAND_SCAN_FACTOR)
+        )
+        suggestions = [
+            SearchSuggestion(type="brand", text=row.brand_name)
+            for row in brand_rows
+            if ProductSearchService.compact(row.brand_name).startswith(compact_prefix)
+        ][:limit]
+
+        remaining = limit - len(suggestions)
+        if remaining > 0:
+            product_rows = await db.execute(
+                select(Product.id, Product.brand_name, Product.product_name)
+                .where(matched)
+                .order_by(ProductSearchService._rank_expression(prefix).desc(), Product.id)
+                .limit(remaining)
+            )
+            suggestions.extend(
+                SearchSuggestion(
+                    type="product",
+                    text=f"{row.brand_name} {row.product_name}",
+                    product_id=row.id
+                )
+                for row in product_rows
+            )
+        return suggestions
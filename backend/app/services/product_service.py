@@ -7,10 +7,16 @@ from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from datetime import datetime, timedelta, timezone
+import functools
 import json
 import logging
 import time
 
+from app.core.config import settings
+from app.db.session import gather_in_sessions
+from app.core.pagination import (
+    InvalidCursorError, decode_cursor, encode_cursor, keyset_after, keyset_order_by
+)
 from app.models.product import Product, ProductIngredientProfile, ProductNutritionFacts, ProductAllergen, ProductClaim
 from app.models.pet import Pet, PetHealthConcern, PetFoodAllergy, PetOtherAllergy
 from app.models.recommendation import RecommendationRun, RecommendationItem, RecStrategy
@@ -19,10 +25,13 @@ from app.models.ingredient_config import HarmfulIngredient, AllergenKeyword
 from app.schemas.product import ProductRead, ProductCreate, ProductUpdate, RecommendationResponse, RecommendationItem as RecommendationItemSchema, ProductDetailResponse, OfferDetailRead, IngredientDetailRead, NutritionDetailRead, ClaimDetailRead, PriceHistoryRead
 from app.schemas.pet_summary import PetSummaryResponse
 from app.models.offer import Merchant, ProductOffer
-from app.models.price import PriceSnapshot, PriceSummary
+from app.services.price_service import PriceService
 from app.services.recommendation_scoring_service import RecommendationScoringService
 from app.services.recommendation_explanation_service import RecommendationExplanationService
-from app.services.coupang_api_client import get_coupang_api_client
+from app.core.cache.negative_cache_service import NegativeCacheService
+from app.core.cache.product_detail_cache_service import ProductDetailCacheService
+from app.services.hot_deal_index import HotDealIndex
+from app.services.product_search_service import ProductSearchService
 
 logger = logging.getLogger(__name__)
 
@@ -82,7 +91,66 @@ class ProductService:
     
     @staticmethod
     async def get_product_detail(product_id: UUID, db: AsyncSession) -> ProductDetailResponse:
-        """상품 상세 정보 조회 (일반 사용자용)"""
+        """상품 상세 정보 조회 (일반 사용자용, 읽기 모델 키 조회 1회 → 미스 시 재구성)"""
+        cached_detail = await ProductDetailCacheService.get(product_id)
+        if cached_detail is not None:
+            return cached_detail
+        
+        # 최근 404였던 상품이면 DB 조회 없이 바로 404 (카탈로그 버전이 바뀌면 자동 무효화)
+        if await NegativeCacheService.is_missing_product(product_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Product not found"
+            )
+        
+        versions = await ProductDetailCacheService.versions([product_id])
+        detail = await ProductService._build_product_detail(product_id, db)
+        if detail is None:
+            await NegativeCacheService.mark_missing_product(product_id)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Product not found"
+            )
+        
+        await ProductDetailCacheService.set(product_id, detail, versions)
+        return detail
+    
+    @staticmethod
+    async def refresh_detail_read_models(db: AsyncSession, product_ids: List[UUID]) -> int:
+        """
+        가격 적재 후 호출: 캐시에 문서가 있는 상품만 재구성
+        (캐시에 없는 상품은 다음 조회 때 만들어지므로 건드리지 않음)
+        
+        재구성은 상품별 독립 세션에서 병렬로 하므로 db는 읽지 않는다 (호출부 시그니처 유지).
+        """
+        cached_ids = await ProductDetailCacheService.filter_cached(product_ids)
+        versions = await ProductDetailCacheService.versions(cached_ids)
+        
+        async def build(session: AsyncSession, product_id: UUID) -> Optional[ProductDetailResponse]:
+            try:
+                return await ProductService._build_product_detail(product_id, session)
+            except Exception as e:
+                logger.warning(f"[ProductService] 상세 읽기 모델 재구성 실패: product_id={product_id}, error={e}")
+                return None
+        
+        # 상품별로 독립 세션에서 병렬 재구성 (한 상품 실패가 나머지를 취소하지 않도록 build에서 흡수)
+        built = await gather_in_sessions(*[
+            functools.partial(build, product_id=product_id) for product_id in cached_ids
+        ])
+        details = {}
+        missing = []
+        for product_id, detail in zip(cached_ids, built):
+            if detail is not None:
+                details[product_id] = detail
+            else:
+                missing.append(product_id)
+        if missing:
+            await ProductDetailCacheService.invalidate(missing)
+        return await ProductDetailCacheService.set_many(details, versions)
+    
+    @staticmethod
+    async def _build_product_detail(product_id: UUID, db: AsyncSession) -> Optional[ProductDetailResponse]:
+        """상품 상세 읽기 모델 구성 (DB 조회, 상품이 없으면 None)"""
         # 상품 기본 정보 조회 (관계 포함)
         from app.models.product import ProductClaim, ProductAllergen
         result = await db.execute(
@@ -99,10 +167,7 @@ class ProductService:
         product = result.scalar_one_or_none()
         
         if product is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Product not found"
-            )
+            return None
         
         # Primary offer 찾기
         primary_offer = None
@@ -128,78 +193,20 @@ class ProductService:
         if primary_offer:
             purchase_url = primary_offer.affiliate_url or primary_offer.url
             
-            # 1. 쿠팡 API로 실시간 가격 fetch
-            realtime_price_data = None
-            if primary_offer.merchant == Merchant.COUPANG:
-                coupang_client = get_coupang_api_client()
-                if coupang_client and primary_offer.vendor_item_id:
-                    logger.info(
-                        f"[ProductService] 🛒 쿠팡 API로 실시간 가격 조회: "
-                        f"vendor_item_id={primary_offer.vendor_item_id}"
-                    )
-                    realtime_price_data = await coupang_client.get_product_price(
-                        vendor_item_id=primary_offer.vendor_item_id
-                    )
-                    
-                    if realtime_price_data:
-                        current_price = realtime_price_data.get("final_price")
-                        logger.info(
-                            f"[ProductService] ✅ 쿠팡 API 가격 조회 성공: "
-                            f"final_price={current_price}"
-                        )
-                        
-                        # 백그라운드에서 PriceSnapshot 저장 (비동기, 에러 무시)
-                        try:
-                            await ProductService._save_price_snapshot(
-                                db, primary_offer, realtime_price_data
-                            )
-                        except Exception as e:
-                            logger.warning(
-                                f"[ProductService] ⚠️ PriceSnapshot 저장 실패 (무시): {e}"
-                            )
+            # 1. 현재 가격: 가격 수집 워커가 갱신한 값 사용 (요청 경로에서 판매처 API 호출 없음)
+            current_price = primary_offer.current_price
             
-            # 2. 실시간 가격이 없으면 DB 캐시 사용 (fallback)
-            if current_price is None:
-                logger.info(
-                    f"[ProductService] ℹ️ 실시간 가격 없음, DB 캐시 사용: "
-                    f"offer_id={primary_offer.id}"
-                )
-                current_price = primary_offer.current_price
-            
-            # 3. PriceSummary에서 통계 가져오기
-            price_summary = await db.get(PriceSummary, primary_offer.id)
+            # 2. PriceSummary 통계(30일 윈도우) + 3. 최근 7일 가격 히스토리(시간 롤업, 최대 168개 포인트)
+            #    둘 다 PK/인덱스 조회라 커넥션을 더 빌리지 않고 같은 세션에서 차례로
+            price_summary = await PriceService.get_summary(db, primary_offer.id)
+            price_history = await PriceService.get_price_history(db, primary_offer.id, days=7)
             if price_summary:
                 average_price = price_summary.avg_final_price
                 min_price = price_summary.min_final_price
                 max_price = price_summary.max_final_price
-                # 실시간 가격이 없고 캐시도 없으면 PriceSummary의 last_final_price 사용
+                # 오퍼에 현재 가격이 없으면 PriceSummary의 last_final_price 사용
                 if current_price is None:
                     current_price = price_summary.last_final_price
-            
-            # 4. 최근 7일 가격 히스토리 조회
-            seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
-            history_result = await db.execute(
-                select(PriceSnapshot)
-                .where(
-                    PriceSnapshot.offer_id == primary_offer.id,
-                    PriceSnapshot.captured_at >= seven_days_ago
-                )
-                .order_by(PriceSnapshot.captured_at.asc())
-            )
-            snapshots = history_result.scalars().all()
-            price_history = [
-                PriceHistoryRead(date=s.captured_at, price=s.final_price)
-                for s in snapshots
-            ]
-            
-            # 실시간 가격이 있으면 히스토리에 추가 (최신 데이터)
-            if realtime_price_data and current_price:
-                price_history.append(
-                    PriceHistoryRead(
-                        date=datetime.now(timezone.utc),
-                        price=current_price
-                    )
-                )
         
         # Offers 목록
         offers = [
@@ -340,97 +347,21 @@ class ProductService:
         )
     
     @staticmethod
-    async def _save_price_snapshot(
-        db: AsyncSession,
-        offer: ProductOffer,
-        price_data: dict
-    ) -> None:
-        """
-        가격 스냅샷 저장 및 통계 업데이트
-        
-        Args:
-            db: 데이터베이스 세션
-            offer: ProductOffer 인스턴스
-            price_data: 쿠팡 API에서 받은 가격 데이터
-        """
-        try:
-            now = datetime.now(timezone.utc)
-            
-            # PriceSnapshot 저장
-            snapshot = PriceSnapshot(
-                offer_id=offer.id,
-                listed_price=price_data.get("listed_price", 0),
-                shipping_fee=price_data.get("shipping_fee", 0),
-                coupon_discount=price_data.get("coupon_discount", 0),
-                card_discount=price_data.get("card_discount", 0),
-                final_price=price_data.get("final_price", 0),
-                currency=price_data.get("currency", "KRW"),
-                is_sold_out=price_data.get("is_sold_out", False),
-                captured_at=now,
-                captured_source="COUPANG_API"
-            )
-            db.add(snapshot)
-            
-            # ProductOffer.current_price 업데이트
-            offer.current_price = price_data.get("final_price")
-            offer.last_fetched_at = now
-            from app.models.offer import OfferFetchStatus
-            offer.last_fetch_status = OfferFetchStatus.SUCCESS
-            
-            # PriceSummary 업데이트 (30일 윈도우 기준)
-            price_summary = await db.get(PriceSummary, offer.id)
-            if price_summary and price_summary.window_days == 30:
-                # 기존 통계 유지하고 last_final_price만 업데이트
-                price_summary.last_final_price = price_data.get("final_price", 0)
-                price_summary.last_captured_at = now
-            else:
-                # 새로운 PriceSummary 생성 또는 재계산
-                # 최근 30일 스냅샷으로 통계 계산
-                thirty_days_ago = now - timedelta(days=30)
-                stats_result = await db.execute(
-                    select(
-                        func.avg(PriceSnapshot.final_price).label("avg"),
-                        func.min(PriceSnapshot.final_price).label("min"),
-                        func.max(PriceSnapshot.final_price).label("max")
-                    )
-                    .where(
-                        PriceSnapshot.offer_id == offer.id,
-                        PriceSnapshot.captured_at >= thirty_days_ago
-                    )
-                )
-                stats = stats_result.first()
-                
-                if price_summary:
-                    price_summary.avg_final_price = int(stats.avg or price_data.get("final_price", 0))
-                    price_summary.min_final_price = int(stats.min or price_data.get("final_price", 0))
-                    price_summary.max_final_price = int(stats.max or price_data.get("final_price", 0))
-                    price_summary.last_final_price = price_data.get("final_price", 0)
-                    price_summary.last_captured_at = now
-                else:
-                    final_price = price_data.get("final_price", 0)
-                    price_summary = PriceSummary(
-                        offer_id=offer.id,
-                        window_days=30,
-                        avg_final_price=int(stats.avg or final_price),
-                        min_final_price=int(stats.min or final_price),
-                        max_final_price=int(stats.max or final_price),
-                        last_final_price=final_price,
-                        last_captured_at=now
-                    )
-                    db.add(price_summary)
-            
-            await db.commit()
-            logger.info(
-                f"[ProductService] ✅ PriceSnapshot 저장 완료: "
-                f"offer_id={offer.id}, final_price={price_data.get('final_price')}"
-            )
-        except Exception as e:
-            await db.rollback()
-            logger.error(
-                f"[ProductService] ❌ PriceSnapshot 저장 실패: {e}",
-                exc_info=True
+    async def get_price_history(product_id: UUID, days: int, db: AsyncSession) -> List[PriceHistoryRead]:
+        """대표 판매처 가격 히스토리 (기간에 따라 원본/시간/일 해상도 선택)"""
+        result = await db.execute(
+            select(ProductOffer.id)
+            .where(
+                ProductOffer.product_id == product_id,
+                ProductOffer.is_active == True
             )
-            raise
+            .order_by(desc(ProductOffer.is_primary))
+            .limit(1)
+        )
+        offer_id = result.scalar_one_or_none()
+        if offer_id is None:
+            return []
+        return await PriceService.get_price_history(db, offer_id, days)
     
     @staticmethod
     async def calculate_product_match_score(
@@ -656,6 +587,16 @@ class ProductService:
                 return cached_recommendation
             
             logger.debug(f"[ProductService] ❌ Redis 캐시 미스: pet_id={pet_id}, PostgreSQL 확인")
+            
+            # 네거티브 캐시: 최근 404였던 펫 / 빈 추천 결과는 재계산하지 않음
+            if await NegativeCacheService.is_missing_pet(pet_id):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Pet not found"
+                )
+            empty_recommendation = await NegativeCacheService.get_empty_recommendation(pet_id)
+            if empty_recommendation:
+                return empty_recommendation
         
         # UPDATED: Caching & User Prefs for recommendation freshness - 캐싱 체크
         # force_refresh가 True면 캐싱 무시
@@ -783,7 +724,9 @@ class ProductService:
                 
                 logger.info(f"[ProductService] 📊 최종 recommendation_items: {len(recommendation_items)}개 (필터링됨: {filtered_count}개)")
                 
-                # 캐싱된 응답 생성
+                # 캐싱된 응답 생성 (Redis 미스 → PostgreSQL의 이전 계산 결과로 응답)
+                from app.core.cache.cache_metrics import CacheMetrics, CacheNamespace
+                CacheMetrics.record_stale(CacheNamespace.RECOMMENDATION)
                 recommendation_response = RecommendationResponse(
                     pet_id=pet_id,
                     items=recommendation_items,
@@ -793,7 +736,10 @@ class ProductService:
                 
                 # UPDATED: PostgreSQL에서 가져온 결과를 Redis에 저장
                 from app.core.cache.recommendation_cache_service import RecommendationCacheService
-                await RecommendationCacheService.set_recommendation(pet_id, recommendation_response)
+                await RecommendationCacheService.set_recommendation(
+                    pet_id, recommendation_response,
+                    candidates=(latest_run.context or {}).get("candidates")
+                )
                 logger.info(f"[ProductService] ✅ PostgreSQL → Redis 캐시 저장 완료")
                 
                 return recommendation_response
@@ -806,6 +752,7 @@ class ProductService:
         # 1. 펫 프로필 조회
         pet = await db.get(Pet, pet_id)
         if pet is None:
+            await NegativeCacheService.mark_missing_pet(pet_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Pet not found"
@@ -861,13 +808,15 @@ class ProductService:
             logger.warning("[ProductService] 추천 가능한 상품 없음 (parsed JSON이 있는 상품 없음)")
             pet_species = pet_summary.species if pet_summary.species else None
             message = "상품 정보가 준비되지 않았습니다. 잠시 후 다시 시도해주세요."
-            return RecommendationResponse(
+            empty_response = RecommendationResponse(
                 pet_id=pet_id, 
                 items=[],
                 is_cached=False,
                 last_recommended_at=None,
                 message=message
             )
+            await NegativeCacheService.set_empty_recommendation(pet_id, empty_response)
+            return empty_response
         
         # 3. 빠른 종류 체크 (스코링 전 종류 불일치 100% 확인)
         logger.info(f"[ProductService] 🔍 빠른 종류 체크 시작: {len(products)}개 상품")
@@ -886,13 +835,15 @@ class ProductService:
             logger.warning(f"[ProductService] 모든 상품이 종류 불일치 ({len(products)}개 상품 모두 제외)")
             species_name = "고양이" if pet_summary.species == "CAT" else ("강아지" if pet_summary.species == "DOG" else "반려동물")
             message = f"{species_name} 전용 사료를 찾지 못했어요. 현재 등록된 상품 중 {species_name} 전용 사료가 없습니다. 펫 정보를 확인해주세요."
-            return RecommendationResponse(
+            empty_response = RecommendationResponse(
                 pet_id=pet_id,
                 items=[],
                 is_cached=False,
                 last_recommended_at=None,
                 message=message
             )
+            await NegativeCacheService.set_empty_recommendation(pet_id, empty_response)
+            return empty_response
         
         logger.info(f"[ProductService] ✅ 종류 매칭된 상품: {species_matched_count}/{len(products)}개, 스코링 진행")
         
@@ -1077,13 +1028,15 @@ class ProductService:
                 filter_stats, pet_summary.species if pet_summary.species else None
             )
             
-            return RecommendationResponse(
+            empty_response = RecommendationResponse(
                 pet_id=pet_id, 
                 items=[],
                 is_cached=False,
                 last_recommended_at=None,
                 message=message
             )
+            await NegativeCacheService.set_empty_recommendation(pet_id, empty_response)
+            return empty_response
         
         # ADDED: User Prefs Customization - 정렬 (사용자 선호도 반영)
         logger.info(f"[ProductService] 🔄 상품 정렬 시작: {len(scored_products)}개")
@@ -1102,6 +1055,9 @@ class ProductService:
             # 기본 정렬: 총점 내림차순, 동점 시 안전성 점수 내림차순
             scored_products.sort(key=lambda x: (x[1], x[2]), reverse=True)
         
+        # 개인화 섹션용 후보 목록 (점수순 상위 N개, 추천 결과와 함께 캐시/이력 저장)
+        candidates = ProductService._build_recommendation_candidates(scored_products)
+        
         # 5. 상위 3개 선택 (최대 3개)
         max_products = min(3, len(scored_products))
         top_products = scored_products[:max_products]
@@ -1310,7 +1266,8 @@ class ProductService:
                 strategy=RecStrategy.RULE_V1,
                 context={
                     **context,
-                    "prefs_snapshot": user_prefs  # 사용자 선호도 스냅샷 저장
+                    "prefs_snapshot": user_prefs,  # 사용자 선호도 스냅샷 저장
+                    "candidates": candidates,  # Redis 미스 시 개인화 섹션 후보 복구용
                 }
             )
             db.add(recommendation_run)
@@ -1358,11 +1315,28 @@ class ProductService:
         
         # UPDATED: 새로 계산한 결과를 Redis에 저장
         from app.core.cache.recommendation_cache_service import RecommendationCacheService
-        await RecommendationCacheService.set_recommendation(pet_id, recommendation_response)
+        await RecommendationCacheService.set_recommendation(
+            pet_id, recommendation_response, candidates=candidates
+        )
         logger.info(f"[ProductService] ✅ 새 추천 계산 → Redis 캐시 저장 완료")
         
         return recommendation_response
     
+    @staticmethod
+    def _build_recommendation_candidates(
+        scored_products: List[Tuple[Product, float, float, float, List[str]]]
+    ) -> List[dict]:
+        """정렬된 스코링 결과 → 후보 목록 [{"id", "species", "score"}] (상위 RECOMMENDATION_CANDIDATE_LIMIT개)"""
+        return [
+            {
+                "id": str(product.id),
+                "species": product.species.value if product.species else None,
+                "score": round(total_score, 2),
+            }
+            for product, total_score, _safety, _fitness, _reasons
+            in scored_products[:settings.RECOMMENDATION_CANDIDATE_LIMIT]
+        ]
+    
     @staticmethod
     async def _generate_explanations_only(
         pet_id: UUID,
@@ -1783,6 +1757,9 @@ class ProductService:
                 detail=f"Failed to create product: {str(e)}"
             )
         
+        # 새 상품이 생겼으므로 빈 추천/404 네거티브 캐시 무효화
+        await NegativeCacheService.bump_catalog_version()
+        await HotDealIndex.refresh_products(db, [product.id])
         return product
     
     @staticmethod
@@ -1818,6 +1795,10 @@ class ProductService:
             # 해당 상품의 모든 맞춤 점수 캐시 삭제 (모든 펫에 대해)
             deleted_count = await RecommendationCacheService.invalidate_product_match_score(product_id)
             logger.info(f"[ProductService] ✅ 상품 업데이트 후 맞춤 점수 캐시 무효화: product_id={product_id}, deleted={deleted_count}개")
+            await NegativeCacheService.bump_catalog_version()
+            await ProductDetailCacheService.invalidate([product_id])
+            # 활성 여부/species 변경 반영
+            await HotDealIndex.refresh_products(db, [product_id])
             
         except IntegrityError as e:
             await db.rollback()
@@ -1834,6 +1815,9 @@ class ProductService:
         product = await ProductService.get_product_by_id(product_id, db)
         product.is_active = False
         await db.commit()
+        await NegativeCacheService.bump_catalog_version()
+        await ProductDetailCacheService.invalidate([product_id])
+        await HotDealIndex.refresh_products(db, [product_id])
     
     @staticmethod
     async def get_all_products(db: AsyncSession, include_inactive: bool = False) -> list[Product]:
@@ -1855,9 +1839,16 @@ class ProductService:
         has_offers: Optional[str] = None,  # 'YES', 'NO', 'ALL'
         sort: str = 'UPDATED_DESC',  # 'UPDATED_DESC', 'BRAND_ASC', 'INCOMPLETE_FIRST'
         page: int = 1,
-        size: int = 30
-    ) -> tuple[list[Product], int]:
-        """상품 목록 조회 (필터링/정렬/페이지네이션)"""
+        size: int = 30,
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> tuple[list[Product], Optional[int], Optional[str]]:
+        """
+        상품 목록 조회 (필터링/정렬/페이지네이션)
+        
+        Returns:
+            (상품 목록, 전체 개수 또는 None(include_total=False), 다음 페이지 커서)
+        """
         from sqlalchemy import func, or_, and_
         from sqlalchemy.orm import selectinload
         
@@ -1883,16 +1874,11 @@ class ProductService:
         if species and species != 'ALL':
             conditions.append(Product.species == species)
         
-        # Query text filter (brand_name, product_name, size_label)
+        # Query text filter (brand_name, product_name, size_label): 검색 인덱스 사용
         if query:
-            search_term = f"%{query}%"
-            conditions.append(
-                or_(
-                    Product.brand_name.ilike(search_term),
-                    Product.product_name.ilike(search_term),
-                    Product.size_label.ilike(search_term)
-                )
-            )
+            search_clause = ProductSearchService.match_clause(query)
+            if search_clause is not None:
+                conditions.append(search_clause)
         
         # Completion status filter (if column exists)
         if completion_status and completion_status != 'ALL':
@@ -1905,45 +1891,46 @@ class ProductService:
         if conditions:
             base_query = base_query.where(and_(*conditions))
         
-        # Count total (before pagination) - 별도 쿼리로 생성 (selectinload 제외)
-        count_base = select(Product)
-        if conditions:
-            count_base = count_base.where(and_(*conditions))
-        count_query = select(func.count()).select_from(count_base.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
-        
-        # Sorting
-        if sort == 'BRAND_ASC':
-            base_query = base_query.order_by(Product.brand_name.asc(), Product.product_name.asc())
-        elif sort == 'INCOMPLETE_FIRST':
-            # Sort by completion_status (incomplete first), then by updated_at
-            # Note: This assumes the column exists after migration
-            try:
-                from sqlalchemy import case
-                base_query = base_query.order_by(
-                    case(
-                        (Product.completion_status == 'COMPLETE', 1),
-                        else_=0
-                    ).asc(),
-                    Product.last_admin_updated_at.desc().nulls_last()
-                )
-            except AttributeError:
-                base_query = base_query.order_by(Product.brand_name.asc())
-        else:  # UPDATED_DESC (default)
-            try:
-                base_query = base_query.order_by(Product.last_admin_updated_at.desc().nulls_last())
-            except AttributeError:
-                base_query = base_query.order_by(Product.created_at.desc())
+        # Count total (optional) - 필터 조합별로 잠시 캐시 (selectinload 제외한 별도 쿼리)
+        total = None
+        if include_total:
+            count_base = select(Product)
+            if conditions:
+                count_base = count_base.where(and_(*conditions))
+            total = await ProductService._get_cached_product_count(
+                db,
+                select(func.count()).select_from(count_base.subquery()),
+                filter_key=f"{query}|{species}|{active}|{completion_status}"
+            )
         
-        # Pagination
-        offset = (page - 1) * size
-        base_query = base_query.offset(offset).limit(size)
+        # Sorting - 정렬 키 마지막에 id를 두어 키셋 커서가 결정적이도록
+        sort_spec = ProductService._admin_sort_keys(sort)
+        sort_keys = [(expr, descending) for expr, descending, _ in sort_spec]
+        base_query = base_query.order_by(*keyset_order_by(sort_keys))
+        
+        # Pagination - 커서가 있으면 키셋, 없으면 page 기반 OFFSET (하위 호환)
+        if cursor:
+            payload = decode_cursor(cursor)
+            if payload.get("s") != sort or payload.get("k") is None:
+                raise InvalidCursorError("cursor belongs to a different sort")
+            base_query = base_query.where(keyset_after(sort_keys, payload["k"]))
+        else:
+            base_query = base_query.offset((page - 1) * size)
+        base_query = base_query.limit(size)
         
         # Execute
         result = await db.execute(base_query)
         products = list(result.scalars().all())
         
+        # 다음 커서는 후처리 필터 전 마지막 행 기준 (필터로 빠진 행을 다시 읽지 않도록)
+        next_cursor = None
+        if len(products) == size:
+            last = products[-1]
+            next_cursor = encode_cursor({
+                "s": sort,
+                "k": [value_of(last) for _, _, value_of in sort_spec],
+            })
+        
         # Post-filter for has_image and has_offers (after fetching)
         if has_image == 'YES':
             products = [p for p in products if p.primary_image_url or p.thumbnail_url]
@@ -1966,7 +1953,75 @@ class ProductService:
                     products_without_offers.append(p)
             products = products_without_offers
         
-        return products, total
+        return products, total, next_cursor
+    
+    @staticmethod
+    def _admin_sort_keys(sort: str) -> list:
+        """
+        관리자 목록 정렬 키 [(식, 내림차순 여부, 상품 → 커서 값)]
+        
+        모델에 매핑되지 않은 컬럼(last_admin_updated_at, completion_status)은 created_at/브랜드순으로 대체.
+        """
+        from sqlalchemy import case
+        
+        updated_at = getattr(Product, 'last_admin_updated_at', None)
+        if updated_at is not None:
+            updated_key = (
+                func.coalesce(updated_at, Product.created_at), True,
+                lambda p: p.last_admin_updated_at or p.created_at
+            )
+        else:
+            updated_key = (Product.created_at, True, lambda p: p.created_at)
+        completion_status = getattr(Product, 'completion_status', None)
+        
+        if sort == 'BRAND_ASC' or (sort == 'INCOMPLETE_FIRST' and completion_status is None):
+            return [
+                (Product.brand_name, False, lambda p: p.brand_name),
+                (Product.product_name, False, lambda p: p.product_name),
+                (Product.id, False, lambda p: p.id),
+            ]
+        if sort == 'INCOMPLETE_FIRST':
+            return [
+                (
+                    case((completion_status == 'COMPLETE', 1), else_=0), False,
+                    lambda p: 1 if getattr(p.completion_status, 'value', p.completion_status) == 'COMPLETE' else 0
+                ),
+                updated_key,
+                (Product.id, True, lambda p: p.id),
+            ]
+        return [updated_key, (Product.id, True, lambda p: p.id)]  # UPDATED_DESC (default)
+    
+    @staticmethod
+    async def _get_cached_product_count(db: AsyncSession, count_query, filter_key: str) -> int:
+        """
+        필터 조합별 전체 개수 (ADMIN_PRODUCT_COUNT_CACHE_TTL_SECONDS 동안 재사용)
+        
+        카탈로그 버전을 키에 포함하므로 상품 생성/수정/삭제 후에는 새로 센다.
+        """
+        import hashlib
+        import redis.asyncio as redis
+        from app.core.redis import get_redis
+        from app.core.cache.cache_keys import CacheKeys
+        
+        digest = hashlib.sha1(filter_key.encode()).hexdigest()[:16]
+        cache_key = None
+        try:
+            redis_client = await get_redis()
+            version = await redis_client.get(CacheKeys.catalog_version()) or 0
+            cache_key = CacheKeys.admin_product_count(digest, version)
+            cached = await redis_client.get(cache_key)
+            if cached is not None:
+                return int(cached)
+        except redis.RedisError as e:
+            logger.warning(f"[ProductService] 상품 개수 캐시 조회 실패: {e}")
+        
+        total = (await db.execute(count_query)).scalar() or 0
+        if cache_key is not None:
+            try:
+                await redis_client.setex(cache_key, settings.ADMIN_PRODUCT_COUNT_CACHE_TTL_SECONDS, total)
+            except redis.RedisError as e:
+                logger.warning(f"[ProductService] 상품 개수 캐시 저장 실패: {e}")
+        return total
     
     @staticmethod
     async def clear_recommendation_cache(
@@ -0,0 +1,147 @@
+"""푸시 게이트웨이 클라이언트"""
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from app.models.push_token import PushProvider
+
+logger = logging.getLogger(__name__)
+
+
+class PushResult:
+    """메시지별 발송 결과"""
+    OK = "ok"
+    RETRY = "retry"  # 일시 오류 (게이트웨이 429/5xx, 네트워크, 제공자 UNAVAILABLE 등)
+    INVALID_TOKEN = "invalid_token"  # 앱 삭제/토큰 만료 → 토큰 비활성화
+    FAILED = "failed"  # 재시도해도 같은 오류 (잘못된 메시지 등)
+
+
+class PushClient:
+    """
+    푸시 게이트웨이 클라이언트
+
+    제공자(FCM/APNS)별 배치 발송 엔드포인트에 메시지를 묶어 보낸다:
+        POST {base_url}/v1/push/{provider}/send
+        {"messages": [{"token", "title", "body", "data"}, ...]}
+        → {"results": [{"status": "ok"} | {"status": "error", "error": "INVALID_TOKEN" | ...}, ...]}
+
+    - 프로세스 수명 동안 httpx.AsyncClient 1개를 재사용 (keep-alive 풀)
+    - 요청 단위 재시도는 하지 않고 결과를 RETRY로 돌려줌 → 발송 워커가 백오프 후 재시도
+    """
+
+    SEND_PATH = "/v1/push/{provider}/send"
+    RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+    INVALID_TOKEN_ERRORS = ("INVALID_TOKEN", "UNREGISTERED", "NOT_FOUND")
+    RETRYABLE_ERRORS = ("UNAVAILABLE", "INTERNAL", "QUOTA_EXCEEDED")
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        timeout: float = 10.0,
+        max_connections: int = 20,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Args:
+            base_url: 게이트웨이 주소 (로컬 테스트 시 scripts/fake_push_server.py)
+            api_key: Bearer 인증 키
+            timeout: 요청 타임아웃 (초)
+            transport: 테스트용 transport (httpx.MockTransport)
+        """
+        self.base_url = base_url.rstrip("/")
+        headers = {"Content-Type": "application/json"}
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+        self.http_client = httpx.AsyncClient(
+            timeout=timeout,
+            headers=headers,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            transport=transport,
+        )
+
+    async def aclose(self) -> None:
+        await self.http_client.aclose()
+
+    async def __aenter__(self) -> "PushClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    @staticmethod
+    def _classify(result: Dict[str, Any]) -> str:
+        if result.get("status") == "ok":
+            return PushResult.OK
+        error = str(result.get("error") or "").upper()
+        if error in PushClient.INVALID_TOKEN_ERRORS:
+            return PushResult.INVALID_TOKEN
+        if error in PushClient.RETRYABLE_ERRORS:
+            return PushResult.RETRY
+        return PushResult.FAILED
+
+    async def send_batch(self, provider: PushProvider, messages: List[Dict[str, Any]]) -> List[str]:
+        """
+        같은 제공자 메시지 묶음 발송
+
+        Returns:
+            messages와 같은 순서의 PushResult 값 목록
+        """
+        if not messages:
+            return []
+        url = f"{self.base_url}{self.SEND_PATH.format(provider=provider.value.lower())}"
+        try:
+            response = await self.http_client.post(url, json={"messages": messages})
+        except httpx.TransportError as e:
+            logger.warning(f"[PushClient] ⚠️ 발송 요청 실패: provider={provider.value}, {type(e).__name__}: {e}")
+            return [PushResult.RETRY] * len(messages)
+
+        if response.status_code in self.RETRYABLE_STATUS_CODES:
+            logger.warning(f"[PushClient] ⚠️ 게이트웨이 일시 오류: provider={provider.value}, status={response.status_code}")
+            return [PushResult.RETRY] * len(messages)
+        if response.status_code != 200:
+            logger.error(
+                f"[PushClient] ❌ 발송 거부: provider={provider.value}, "
+                f"status={response.status_code}, body={response.text[:200]}"
+            )
+            return [PushResult.FAILED] * len(messages)
+
+        results = response.json().get("results") or []
+        if len(results) != len(messages):
+            # 결과를 메시지에 대응시킬 수 없으면 전체 재시도 (중복 수신보다 누락이 더 나쁨)
+            logger.warning(f"[PushClient] ⚠️ 결과 수 불일치: 요청={len(messages)}, 응답={len(results)}")
+            return [PushResult.RETRY] * len(messages)
+        return [self._classify(result) for result in results]
+
+
+def create_mock_transport(result_for: Callable[[str], Dict[str, Any]]) -> httpx.MockTransport:
+    """
+    로컬 테스트용 MockTransport
+
+    Args:
+        result_for: 토큰 → 결과 dict (예: {"status": "ok"}, {"status": "error", "error": "INVALID_TOKEN"})
+    """
+    import json
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        messages = json.loads(request.content).get("messages", [])
+        return httpx.Response(200, json={"results": [result_for(message["token"]) for message in messages]})
+
+    return httpx.MockTransport(handler)
+
+
+def get_push_client(transport: Optional[httpx.AsyncBaseTransport] = None) -> Optional[PushClient]:
+    """설정에서 게이트웨이 주소를 읽어 클라이언트 생성 (주소가 없으면 None)"""
+    from app.core.config import settings
+
+    if not settings.PUSH_API_BASE_URL:
+        logger.warning("[PushClient] ⚠️ PUSH_API_BASE_URL이 설정되지 않았습니다. 푸시 발송이 비활성화됩니다.")
+        return None
+    return PushClient(
+        settings.PUSH_API_BASE_URL,
+        api_key=settings.PUSH_API_KEY,
+        timeout=settings.PUSH_API_TIMEOUT_SECONDS,
+        max_connections=settings.PUSH_API_MAX_CONNECTIONS,
+        transport=transport,
+    )
@@ -0,0 +1,150 @@
+"""
+푸시 발송 대기열 (Redis Stream + 재시도 ZSET)
+
+알림 평가 워커가 alert_events(PENDING) 커밋 후 발송 건을 스트림에 XADD하고,
+푸시 발송 워커(app.workers.push_delivery)가 소비자 그룹으로 읽어 배치 발송 후 XACK한다.
+일시 오류로 재시도할 발송 건은 재시도 시각을 점수로 ZSET에 넣어 두고, 워커가 due가 지난 것만 꺼낸다.
+"""
+import json
+import logging
+import time
+from typing import Any, Dict, List, Tuple
+from uuid import UUID
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.core.cache.cache_keys import CacheKeys
+
+logger = logging.getLogger(__name__)
+
+# due가 지난 재시도 건을 꺼내면서 제거 (여러 워커가 같은 건을 가져가지 않도록 원자적으로)
+_CLAIM_RETRIES_SCRIPT = """
+local items = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+if #items > 0 then
+    redis.call('ZREM', KEYS[1], unpack(items))
+end
+return items
+"""
+
+
+class PushDeliveryQueue:
+    """푸시 발송 건 발행/소비 헬퍼"""
+
+    @staticmethod
+    def _encode(notification: Dict[str, Any]) -> Dict[str, str]:
+        """스트림 필드는 문자열만 허용"""
+        avg_price = notification.get("avg_price")
+        return {
+            "event_id": str(notification["id"]),
+            "user_id": str(notification["user_id"]),
+            "product_id": str(notification["product_id"]),
+            "reason": getattr(notification["reason"], "value", notification["reason"]),
+            "price": str(notification["price"]),
+            "avg_price": "" if avg_price is None else str(avg_price),
+            "cooldown_hours": str(notification["cooldown_hours"]),
+        }
+
+    @staticmethod
+    def decode(fields: Dict[str, str]) -> Dict[str, Any]:
+        """스트림 필드 → 발송 건 (재시도 전 첫 시도)"""
+        return {
+            "event_ids": [fields["event_id"]],
+            "user_id": fields["user_id"],
+            "product_id": fields["product_id"],
+            "reason": fields["reason"],
+            "price": int(fields["price"]),
+            "avg_price": int(fields["avg_price"]) if fields.get("avg_price") else None,
+            "cooldown_hours": int(fields["cooldown_hours"]),
+            "attempt": 0,
+        }
+
+    @staticmethod
+    async def publish(notifications: List[Dict[str, Any]]) -> int:
+        """
+        발송 건 발행 (alert_events 커밋 후 호출)
+
+        Redis 장애 시 경고만 남긴다. alert_events는 PENDING으로 남아 있으므로
+        발송 워커의 복구 조회(PUSH_PENDING_RECOVERY_MINUTES)가 다시 넣는다.
+        """
+        if not notifications:
+            return 0
+        try:
+            redis_client = await get_redis()
+            stream_key = CacheKeys.push_delivery_stream()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for notification in notifications:
+                    pipe.xadd(
+                        stream_key,
+                        PushDeliveryQueue._encode(notification),
+                        maxlen=settings.PUSH_DELIVERY_STREAM_MAXLEN,
+                        approximate=True,
+                    )
+                await pipe.execute()
+            return len(notifications)
+        except redis.RedisError as e:
+            logger.warning(f"[PushDeliveryQueue] 발송 건 발행 실패 ({len(notifications)}건): {e}")
+            return 0
+
+    @staticmethod
+    async def ensure_group(client: redis.Redis, group: str) -> None:
+        """소비자 그룹 생성 (스트림이 없으면 함께 생성, 이미 있으면 무시)"""
+        try:
+            await client.xgroup_create(CacheKeys.push_delivery_stream(), group, id="0", mkstream=True)
+            logger.info(f"[PushDeliveryQueue] 소비자 그룹 생성: {group}")
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    @staticmethod
+    async def read_group(
+        client: redis.Redis,
+        group: str,
+        consumer: str,
+        count: int,
+        block_ms: int
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        """새 발송 건 읽기 (없으면 block_ms 동안 대기)"""
+        response = await client.xreadgroup(
+            group, consumer, {CacheKeys.push_delivery_stream(): ">"}, count=count, block=block_ms
+        )
+        messages: List[Tuple[str, Dict[str, str]]] = []
+        for _stream, stream_messages in response or []:
+            messages.extend(stream_messages)
+        return messages
+
+    @staticmethod
+    async def claim_stale(
+        client: redis.Redis,
+        group: str,
+        consumer: str,
+        min_idle_ms: int,
+        count: int
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        """오래 ACK되지 않은 발송 건 회수 (처리 중 죽은 소비자 복구)"""
+        response = await client.xautoclaim(
+            CacheKeys.push_delivery_stream(), group, consumer, min_idle_ms, start_id="0-0", count=count
+        )
+        return [(message_id, fields) for message_id, fields in response[1] if fields]
+
+    @staticmethod
+    async def ack(client: redis.Redis, group: str, message_ids: List[str]) -> None:
+        if message_ids:
+            await client.xack(CacheKeys.push_delivery_stream(), group, *message_ids)
+
+    @staticmethod
+    async def schedule_retries(client: redis.Redis, deliveries: List[Tuple[Dict[str, Any], float]]) -> None:
+        """(발송 건, 재시도 시각 epoch) 목록을 재시도 ZSET에 추가"""
+        if not deliveries:
+            return
+        await client.zadd(
+            CacheKeys.push_delivery_retry(),
+            {json.dumps(delivery, separators=(",", ":")): due_at for delivery, due_at in deliveries}
+        )
+
+    @staticmethod
+    async def claim_due_retries(client: redis.Redis, limit: int) -> List[Dict[str, Any]]:
+        """재시도 시각이 지난 발송 건 꺼내기"""
+        items = await client.eval(_CLAIM_RETRIES_SCRIPT, 1, CacheKeys.push_delivery_retry(), time.time(), limit)
+        return [json.loads(item) for item in items]
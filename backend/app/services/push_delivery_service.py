@@ -0,0 +1,413 @@
+"""
+알림 푸시 배치 발송
+
+인기 상품 가격이 내려가면 추적 사용자 수천 명의 알림이 한꺼번에 발송 대기열에 들어온다.
+발송 워커가 읽은 배치를 한 번에 처리한다:
+
+1. 같은 사용자×상품 발송 건 병합 (여러 알림 규칙/펫이 같은 상품에 걸린 경우 푸시 1건, 가장 낮은 가격)
+2. 사용자×상품 중복 방지 (Redis): 마지막 푸시 후 cooldown_hours 동안은 그보다 낮은 가격일 때만 다시 발송
+   (알림 평가의 알림별 cooldown/last_sent_price를 사용자 단위로 한 번 더 적용)
+   - 슬롯은 발송 중(P)으로 잡고, 발송되면 완료(S)로 바꾸고 최종 실패하면 이전 값으로 되돌린다
+   - 완료된 푸시에 걸린 건만 발송 완료(DEDUPED)로 기록하고, 발송 중인 푸시에 걸린 건은 나중에 다시 확인
+3. 토큰/상품명 IN 조회 각 1회 → 제공자별로 PUSH_BATCH_SIZE씩 묶어 동시 발송
+4. 결과를 상태별 UPDATE ... WHERE id = ANY(...) 몇 번으로 alert_events에 기록 (건별 UPDATE 없음)
+   - 일시 오류: 지수 백오프로 재시도 대기열에 넣고 PUSH_MAX_ATTEMPTS를 넘으면 FAILED
+   - 무효 토큰: push_tokens 일괄 비활성화
+"""
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.core.cache.cache_keys import CacheKeys
+from app.models.alert import Alert, AlertEvent, AlertEventStatus, AlertRuleType
+from app.models.product import Product
+from app.models.push_token import PushProvider, PushToken
+from app.models.tracking import Tracking
+from app.services.push_client import PushClient, PushResult
+from app.services.push_delivery_queue import PushDeliveryQueue
+
+logger = logging.getLogger(__name__)
+
+# KEYS: [사용자×상품 마지막 푸시 가격]  ARGV: [가격, TTL(초)]
+# 값은 "가격:P"(발송 중) 또는 "가격:S"(발송 완료), 상태가 없는 값은 발송 완료로 본다
+# 쿨다운 안에 같은 가격 이상이면 {0, 현재 값}(완료된 푸시) / {-1, 현재 값}(발송 중인 푸시),
+# 아니면 "가격:P"를 기록하고 {1, 이전 값} (실패 시 되돌리기용)
+_DEDUPE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current then
+  local sep = string.find(current, ':', 1, true)
+  local last = tonumber(sep and string.sub(current, 1, sep - 1) or current)
+  if last and tonumber(ARGV[1]) >= last then
+    if sep and string.sub(current, sep + 1) == 'P' then
+      return {-1, current}
+    end
+    return {0, current}
+  end
+end
+redis.call('SET', KEYS[1], ARGV[1] .. ':P', 'EX', ARGV[2])
+return {1, current or ''}
+"""
+
+# KEYS: [사용자×상품 마지막 푸시 가격]  ARGV: [확보한 값, 바꿀 값('' = 삭제)]
+# 그사이 다른 발송 건이 슬롯을 가져가지 않았을 때만 바꿈 (TTL 유지)
+_SETTLE_DEDUPE_SCRIPT = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+  return 0
+end
+if ARGV[2] == '' then
+  redis.call('DEL', KEYS[1])
+else
+  redis.call('SET', KEYS[1], ARGV[2], 'KEEPTTL')
+end
+return 1
+"""
+
+_RECORD_OUTCOME_SQL = """
+UPDATE alert_events
+SET status = COALESCE(CAST(:status AS alerteventstatus), status),
+    delivery_error = :error,
+    delivery_attempts = delivery_attempts + 1
+WHERE id = ANY(:event_ids)
+"""
+
+_DEACTIVATE_TOKENS_SQL = """
+UPDATE push_tokens
+SET is_active = false, last_error = :error, deactivated_at = now(), updated_at = now()
+WHERE token = ANY(:tokens) AND is_active
+"""
+
+_REASON_TEXT = {
+    AlertRuleType.TARGET_PRICE.value: "목표가에 도달했어요",
+    AlertRuleType.BELOW_AVG.value: "평소보다 저렴해요",
+    AlertRuleType.NEW_LOW.value: "최저가를 갱신했어요",
+}
+
+
+class PushDeliveryService:
+    """알림 푸시 배치 발송"""
+
+    @staticmethod
+    def merge(deliveries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """같은 사용자×상품 발송 건을 하나로 (가장 낮은 가격 기준, 이벤트 id는 모두 포함)"""
+        merged: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for delivery in deliveries:
+            key = (delivery["user_id"], delivery["product_id"])
+            current = merged.get(key)
+            if current is None:
+                merged[key] = dict(delivery)
+                continue
+            event_ids = current["event_ids"] + delivery["event_ids"]
+            if delivery["price"] < current["price"]:
+                current = merged[key] = dict(delivery)
+            current["event_ids"] = event_ids
+            current["cooldown_hours"] = max(current["cooldown_hours"], delivery["cooldown_hours"])
+        return list(merged.values())
+
+    @staticmethod
+    async def _claim_dedupe_slots(deliveries: List[Dict[str, Any]]) -> List[Tuple[int, Optional[str], Optional[str]]]:
+        """
+        사용자×상품 중복 방지 슬롯 확보 (Redis 장애 시 슬롯 없이 모두 발송)
+
+        Returns:
+            발송 건별 (상태, 확보한 값, 이전 값)
+            상태 1 = 발송, 0 = 완료된 푸시와 중복, -1 = 발송 중인 푸시와 중복
+        """
+        if not deliveries:
+            return []
+        try:
+            redis_client = await get_redis()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for delivery in deliveries:
+                    pipe.eval(
+                        _DEDUPE_SCRIPT,
+                        1,
+                        CacheKeys.push_dedupe(delivery["user_id"], delivery["product_id"]),
+                        delivery["price"],
+                        max(delivery["cooldown_hours"], 1) * 3600,
+                    )
+                results = await pipe.execute()
+            return [
+                (int(state), f"{delivery['price']}:P", value) if int(state) == 1 else (int(state), None, None)
+                for delivery, (state, value) in zip(deliveries, results)
+            ]
+        except redis.RedisError as e:
+            logger.warning(f"[PushDelivery] 중복 방지 확인 실패, 모두 발송: {e}")
+            return [(1, None, None)] * len(deliveries)
+
+    @staticmethod
+    async def _settle_dedupe_slots(settlements: List[Tuple[Dict[str, Any], str]]) -> None:
+        """
+        (발송 건, 바꿀 값) 목록으로 확보했던 슬롯 정리
+
+        발송되면 "가격:S"로 확정하고, 최종 실패하면 이전 값으로 되돌려('' = 삭제)
+        이후 같은 가격 알림이 발송되지 않은 푸시를 이유로 생략되지 않게 한다.
+        """
+        settlements = [(delivery, value) for delivery, value in settlements if delivery.get("dedupe_slot")]
+        if not settlements:
+            return
+        try:
+            redis_client = await get_redis()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for delivery, value in settlements:
+                    pipe.eval(
+                        _SETTLE_DEDUPE_SCRIPT,
+                        1,
+                        CacheKeys.push_dedupe(delivery["user_id"], delivery["product_id"]),
+                        delivery["dedupe_slot"],
+                        value,
+                    )
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"[PushDelivery] 중복 방지 슬롯 정리 실패 ({len(settlements)}건): {e}")
+
+    @staticmethod
+    async def _load_tokens(db: AsyncSession, user_ids: List[str]) -> Dict[str, List[Tuple[PushProvider, str]]]:
+        result = await db.execute(
+            select(PushToken.user_id, PushToken.provider, PushToken.token).where(
+                PushToken.user_id.in_([UUID(user_id) for user_id in user_ids]),
+                PushToken.is_active == True
+            )
+        )
+        tokens: Dict[str, List[Tuple[PushProvider, str]]] = {}
+        for row in result:
+            tokens.setdefault(str(row.user_id), []).append((row.provider, row.token))
+        return tokens
+
+    @staticmethod
+    async def _load_product_names(db: AsyncSession, product_ids: List[str]) -> Dict[str, str]:
+        result = await db.execute(
+            select(Product.id, Product.brand_name, Product.product_name).where(
+                Product.id.in_([UUID(product_id) for product_id in product_ids])
+            )
+        )
+        return {str(row.id): f"{row.brand_name} {row.product_name}" for row in result}
+
+    @staticmethod
+    def build_message(delivery: Dict[str, Any], product_name: Optional[str], token: str) -> Dict[str, Any]:
+        reason_text = _REASON_TEXT.get(delivery["reason"], "가격이 내려갔어요")
+        body = f"{product_name or '관심 상품'} {delivery['price']:,}원"
+        avg_price = delivery.get("avg_price")
+        if avg_price and delivery["price"] < avg_price:
+            body += f" (평균보다 {round((avg_price - delivery['price']) * 100 / avg_price)}%↓)"
+        return {
+            "token": token,
+            "title": f"🔔 {reason_text}",
+            "body": body,
+            "data": {
+                "type": "PRICE_ALERT",
+                "product_id": delivery["product_id"],
+                "alert_event_id": delivery["event_ids"][0],
+            },
+        }
+
+    @staticmethod
+    async def _send_all(
+        client: PushClient,
+        messages: List[Tuple[PushProvider, Dict[str, Any], int]]
+    ) -> List[str]:
+        """제공자별 PUSH_BATCH_SIZE 묶음을 동시 발송, messages 순서대로 결과 반환"""
+        by_provider: Dict[PushProvider, List[int]] = {}
+        for index, (provider, _message, _delivery_index) in enumerate(messages):
+            by_provider.setdefault(provider, []).append(index)
+
+        results: List[str] = [PushResult.RETRY] * len(messages)
+        semaphore = asyncio.Semaphore(settings.PUSH_MAX_CONCURRENCY)
+
+        async def send_chunk(provider: PushProvider, indexes: List[int]) -> None:
+            async with semaphore:
+                chunk_results = await client.send_batch(provider, [messages[i][1] for i in indexes])
+            for index, result in zip(indexes, chunk_results):
+                results[index] = result
+
+        tasks = []
+        for provider, indexes in by_provider.items():
+            for start in range(0, len(indexes), settings.PUSH_BATCH_SIZE):
+                tasks.append(send_chunk(provider, indexes[start:start + settings.PUSH_BATCH_SIZE]))
+        await asyncio.gather(*tasks)
+        return results
+
+    @staticmethod
+    def _retry_due_at(attempt: int) -> float:
+        delay = settings.PUSH_BACKOFF_SECONDS * (2 ** attempt)
+        return time.time() + delay + random.uniform(0, delay / 2)
+
+    @staticmethod
+    async def _record_outcomes(db: AsyncSession, outcomes: Dict[Tuple[Optional[str], Optional[str]], List[str]]) -> None:
+        """(상태, 사유)별 UPDATE 1회 (상태 None = 재시도 대기, PENDING 유지)"""
+        for (status, error), event_ids in outcomes.items():
+            if event_ids:
+                await db.execute(
+                    text(_RECORD_OUTCOME_SQL),
+                    {"status": status, "error": error, "event_ids": [UUID(event_id) for event_id in event_ids]}
+                )
+
+    @staticmethod
+    async def deliver(
+        db: AsyncSession,
+        client: PushClient,
+        fresh: List[Dict[str, Any]],
+        retries: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, int]:
+        """
+        발송 건 배치 처리 (커밋은 호출부에서)
+
+        Args:
+            fresh: 스트림에서 읽은 첫 시도 발송 건 (병합/중복 방지 적용)
+            retries: 재시도 대기열에서 꺼낸 발송 건
+                (이미 중복 방지 슬롯을 확보한 건, recheck면 발송 중인 푸시에 걸려 중복 방지부터 다시 확인할 건)
+        Returns:
+            {"sent", "failed", "retried", "deduped"} 발송 건(사용자×상품) 수
+        """
+        stats = {"sent": 0, "failed": 0, "retried": 0, "deduped": 0}
+        outcomes: Dict[Tuple[Optional[str], Optional[str]], List[str]] = {}
+        scheduled: List[Tuple[Dict[str, Any], float]] = []
+        settlements: List[Tuple[Dict[str, Any], str]] = []
+
+        candidates = PushDeliveryService.merge(fresh) + [d for d in retries or [] if d.get("recheck")]
+        claims = await PushDeliveryService._claim_dedupe_slots(candidates)
+        deliveries = [d for d in retries or [] if not d.get("recheck")]
+        for delivery, (state, slot, previous) in zip(candidates, claims):
+            if state == 1:
+                deliveries.append({**delivery, "recheck": False, "dedupe_slot": slot, "dedupe_previous": previous})
+            elif state == 0:
+                # 같은 사용자×상품 푸시가 쿨다운 안에 이미 나감 → 알림함에는 있으므로 발송 완료로 기록
+                outcomes.setdefault((AlertEventStatus.SENT.value, "DEDUPED"), []).extend(delivery["event_ids"])
+                stats["deduped"] += 1
+            else:
+                # 같은 사용자×상품 푸시가 아직 발송 중 → 결과가 나온 뒤 중복 방지부터 다시 확인
+                attempt = delivery.get("attempt", 0) + 1
+                if attempt < settings.PUSH_MAX_ATTEMPTS:
+                    due_at = PushDeliveryService._retry_due_at(attempt - 1)
+                    scheduled.append(({**delivery, "attempt": attempt, "recheck": True}, due_at))
+                    outcomes.setdefault((None, "DEDUPE_PENDING"), []).extend(delivery["event_ids"])
+                    stats["retried"] += 1
+                else:
+                    outcomes.setdefault((AlertEventStatus.FAILED.value, "DEDUPE_PENDING"), []).extend(
+                        delivery["event_ids"]
+                    )
+                    stats["failed"] += 1
+
+        if deliveries:
+            tokens = await PushDeliveryService._load_tokens(db, list({d["user_id"] for d in deliveries}))
+            product_names = await PushDeliveryService._load_product_names(
+                db, list({d["product_id"] for d in deliveries})
+            )
+
+            messages: List[Tuple[PushProvider, Dict[str, Any], int]] = []
+            for delivery_index, delivery in enumerate(deliveries):
+                for provider, token in tokens.get(delivery["user_id"], []):
+                    message = PushDeliveryService.build_message(
+                        delivery, product_names.get(delivery["product_id"]), token
+                    )
+                    messages.append((provider, message, delivery_index))
+            results = await PushDeliveryService._send_all(client, messages)
+
+            per_delivery: Dict[int, List[str]] = {}
+            invalid_tokens = []
+            for (_provider, message, delivery_index), result in zip(messages, results):
+                per_delivery.setdefault(delivery_index, []).append(result)
+                if result == PushResult.INVALID_TOKEN:
+                    invalid_tokens.append(message["token"])
+
+            for delivery_index, delivery in enumerate(deliveries):
+                delivery_results = per_delivery.get(delivery_index, [])
+                if not delivery_results:
+                    key = (AlertEventStatus.FAILED.value, "NO_PUSH_TOKEN")
+                elif PushResult.OK in delivery_results:
+                    key = (AlertEventStatus.SENT.value, None)
+                elif PushResult.RETRY in delivery_results:
+                    attempt = delivery["attempt"] + 1
+                    if attempt < settings.PUSH_MAX_ATTEMPTS:
+                        scheduled.append(
+                            ({**delivery, "attempt": attempt}, PushDeliveryService._retry_due_at(attempt - 1))
+                        )
+                        key = (None, "RETRY")
+                    else:
+                        key = (AlertEventStatus.FAILED.value, "MAX_ATTEMPTS")
+                elif PushResult.INVALID_TOKEN in delivery_results:
+                    key = (AlertEventStatus.FAILED.value, "INVALID_TOKEN")
+                else:
+                    key = (AlertEventStatus.FAILED.value, "REJECTED")
+                outcomes.setdefault(key, []).extend(delivery["event_ids"])
+
+                if key[0] == AlertEventStatus.SENT.value:
+                    stats["sent"] += 1
+                    settlements.append((delivery, f"{delivery['price']}:S"))
+                elif key[0] is None:
+                    stats["retried"] += 1
+                else:
+                    stats["failed"] += 1
+                    settlements.append((delivery, delivery.get("dedupe_previous") or ""))
+
+            if invalid_tokens:
+                await db.execute(text(_DEACTIVATE_TOKENS_SQL), {"tokens": invalid_tokens, "error": "INVALID_TOKEN"})
+
+        if scheduled:
+            try:
+                redis_client = await get_redis()
+                await PushDeliveryQueue.schedule_retries(redis_client, scheduled)
+            except redis.RedisError as e:
+                logger.warning(f"[PushDelivery] 재시도 예약 실패 ({len(scheduled)}건), 실패 처리: {e}")
+                failed = outcomes.setdefault((AlertEventStatus.FAILED.value, "RETRY_UNAVAILABLE"), [])
+                failed.extend(outcomes.pop((None, "RETRY"), []))
+                failed.extend(outcomes.pop((None, "DEDUPE_PENDING"), []))
+                settlements.extend(
+                    (delivery, delivery.get("dedupe_previous") or "") for delivery, _due_at in scheduled
+                )
+                stats["failed"] += stats["retried"]
+                stats["retried"] = 0
+
+        await PushDeliveryService._settle_dedupe_slots(settlements)
+        await PushDeliveryService._record_outcomes(db, outcomes)
+        return stats
+
+    @staticmethod
+    async def find_unpublished(db: AsyncSession, limit: int) -> List[Dict[str, Any]]:
+        """
+        스트림 발행이 누락된 발송 건 (PENDING이면서 한 번도 시도하지 않았고 오래된 것)
+
+        다시 발행해도 사용자×상품 중복 방지 슬롯이 이중 발송을 막는다.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(minutes=settings.PUSH_PENDING_RECOVERY_MINUTES)
+        result = await db.execute(
+            select(
+                AlertEvent.id,
+                AlertEvent.trigger_reason,
+                AlertEvent.price_at_trigger,
+                AlertEvent.avg_price_at_trigger,
+                Alert.cooldown_hours,
+                Tracking.user_id,
+                Tracking.product_id,
+            )
+            .join(Alert, Alert.id == AlertEvent.alert_id)
+            .join(Tracking, Tracking.id == Alert.tracking_id)
+            .where(
+                AlertEvent.status == AlertEventStatus.PENDING,
+                AlertEvent.delivery_attempts == 0,
+                AlertEvent.sent_at < cutoff,
+            )
+            .order_by(AlertEvent.sent_at)
+            .limit(limit)
+        )
+        return [
+            {
+                "id": row.id,
+                "user_id": row.user_id,
+                "product_id": row.product_id,
+                "reason": row.trigger_reason,
+                "price": row.price_at_trigger,
+                "avg_price": row.avg_price_at_trigger,
+                "cooldown_hours": row.cooldown_hours,
+            }
+            for row in result
+        ]
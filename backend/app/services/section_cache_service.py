@@ -1,13 +1,15 @@
 """섹션별 캐싱 서비스"""
 import json
 import logging
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 from uuid import UUID
 
 import redis.asyncio as redis
 
 from app.core.redis import get_redis
+from app.core.cache.cache_keys import CacheKeys
+from app.core.cache.cache_metrics import CacheMetrics, CacheNamespace
 from app.models.section import SectionType, ProductCategory, SectionConfig
 from app.schemas.product import ProductRead
 
@@ -56,15 +58,19 @@ class SectionCacheService:
                 section_type, category, limit, offset, **kwargs
             )
             
-            cached_data = await redis_client.get(cache_key)
+            with CacheMetrics.timer(CacheNamespace.SECTION, "get"):
+                cached_data = await redis_client.get(cache_key)
             if cached_data:
+                CacheMetrics.record_hit(CacheNamespace.SECTION, len(cached_data.encode()))
                 logger.debug(f"[SectionCache] ✅ 캐시 히트: {cache_key}")
                 products_data = json.loads(cached_data)
                 return [ProductRead(**p) for p in products_data]
             
+            CacheMetrics.record_miss(CacheNamespace.SECTION)
             logger.debug(f"[SectionCache] ❌ 캐시 미스: {cache_key}")
             return None
         except Exception as e:
+            CacheMetrics.record_get_failure(CacheNamespace.SECTION)
             logger.warning(f"[SectionCache] 캐시 조회 실패: {e}", exc_info=True)
             return None
     
@@ -86,15 +92,96 @@ class SectionCacheService:
             ttl = SectionConfig.get_cache_ttl(section_type)
             
             products_data = [p.model_dump() for p in products]
-            await redis_client.setex(
-                cache_key,
-                ttl,
-                json.dumps(products_data, default=str)
-            )
+            payload = json.dumps(products_data, default=str)
+            with CacheMetrics.timer(CacheNamespace.SECTION, "set"):
+                await redis_client.setex(cache_key, ttl, payload)
+            CacheMetrics.record_set(CacheNamespace.SECTION, len(payload.encode()))
             logger.debug(f"[SectionCache] ✅ 캐시 저장: {cache_key}, TTL={ttl}초")
         except Exception as e:
+            CacheMetrics.record_set_failure(CacheNamespace.SECTION)
             logger.warning(f"[SectionCache] 캐시 저장 실패: {e}", exc_info=True)
     
+    @staticmethod
+    async def get_cached_sections(
+        cache_keys: List[str]
+    ) -> List[Optional[List[ProductRead]]]:
+        """여러 섹션 캐시를 MGET 한 번으로 조회 (키 순서대로 반환, 미스는 None)"""
+        if not cache_keys:
+            return []
+        try:
+            redis_client = await get_redis()
+            with CacheMetrics.timer(CacheNamespace.SECTION, "mget"):
+                cached_values = await redis_client.mget(cache_keys)
+        except Exception as e:
+            for _ in cache_keys:
+                CacheMetrics.record_get_failure(CacheNamespace.SECTION)
+            logger.warning(f"[SectionCache] 배치 캐시 조회 실패: {e}", exc_info=True)
+            return [None] * len(cache_keys)
+        
+        results: List[Optional[List[ProductRead]]] = []
+        for cache_key, cached_data in zip(cache_keys, cached_values):
+            if not cached_data:
+                CacheMetrics.record_miss(CacheNamespace.SECTION)
+                results.append(None)
+                continue
+            try:
+                products_data = json.loads(cached_data)
+                results.append([ProductRead(**p) for p in products_data])
+                CacheMetrics.record_hit(CacheNamespace.SECTION, len(cached_data.encode()))
+            except Exception as e:
+                # 깨진 캐시 값은 미스로 처리 (다시 계산 후 덮어씀)
+                CacheMetrics.record_miss(CacheNamespace.SECTION)
+                logger.warning(f"[SectionCache] 캐시 파싱 실패: {cache_key}, {e}")
+                results.append(None)
+        
+        hits = sum(1 for r in results if r)
+        logger.debug(f"[SectionCache] 배치 캐시 조회: {hits}/{len(cache_keys)} 히트")
+        return results
+    
+    @staticmethod
+    async def set_cached_sections(
+        entries: List[Tuple[str, int, List[ProductRead]]]
+    ) -> None:
+        """여러 섹션 캐시를 파이프라인 SET EX 한 번으로 저장 (cache_key, ttl, products)"""
+        if not entries:
+            return
+        try:
+            redis_client = await get_redis()
+            payload_sizes = []
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for cache_key, ttl, products in entries:
+                    products_data = [p.model_dump() for p in products]
+                    payload = json.dumps(products_data, default=str)
+                    payload_sizes.append(len(payload.encode()))
+                    pipe.set(cache_key, payload, ex=ttl)
+                with CacheMetrics.timer(CacheNamespace.SECTION, "mset"):
+                    await pipe.execute()
+            for size in payload_sizes:
+                CacheMetrics.record_set(CacheNamespace.SECTION, size)
+            logger.debug(f"[SectionCache] ✅ 배치 캐시 저장: {len(entries)}개 키")
+        except Exception as e:
+            for _ in entries:
+                CacheMetrics.record_set_failure(CacheNamespace.SECTION)
+            logger.warning(f"[SectionCache] 배치 캐시 저장 실패: {e}", exc_info=True)
+    
+    @staticmethod
+    async def track_personalized_section(pet_id: UUID, cache_key: str) -> None:
+        """
+        개인화 섹션 캐시 키를 펫별 목록에 등록
+
+        추천이 재계산/무효화되면 RecommendationCacheService가 이 목록의 섹션 캐시를 함께 지운다.
+        목록은 개인화 섹션 TTL만큼 유지 (그보다 오래된 섹션 캐시는 이미 만료됨).
+        """
+        try:
+            redis_client = await get_redis()
+            tracking_key = CacheKeys.recommendation_section_keys(pet_id)
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.sadd(tracking_key, cache_key)
+                pipe.expire(tracking_key, SectionConfig.get_cache_ttl(SectionType.PERSONALIZED))
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"[SectionCache] 개인화 섹션 키 등록 실패: pet_id={pet_id}, {e}")
+    
     @staticmethod
     async def invalidate_section(
         section_type: SectionType,
@@ -1,14 +1,21 @@
 """마켓 섹션별 서비스"""
+import functools
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_, desc, func, case
 from sqlalchemy.orm import selectinload
 
+from app.core.config import settings
+from app.core.pagination import (
+    InvalidCursorError, decode_cursor, encode_cursor, keyset_after, keyset_order_by
+)
+from app.db.session import gather_in_sessions
 from app.models.product import Product, PetSpecies
 from app.models.offer import ProductOffer
+from app.models.outbound_click import OutboundClick
 from app.models.section import SectionType, ProductCategory, SectionConfig
 from app.schemas.section import SectionRequest, SectionResponse
 from app.schemas.product import ProductRead
@@ -20,6 +27,14 @@ logger = logging.getLogger(__name__)
 class SectionService:
     """마켓 섹션별 비즈니스 로직 서비스"""
     
+    # 키셋 커서를 쓰는 SQL 정렬 섹션 (최신순, id로 동률 정리)
+    # 핫딜/인기/개인화는 ZSET·후보 목록 위치 조회가 O(log n)이므로 커서에 위치(offset)만 담는다
+    KEYSET_SECTIONS = (SectionType.NEW, SectionType.REVIEW_BEST)
+    
+    @staticmethod
+    def _newest_keys():
+        return [(Product.created_at, True), (Product.id, True)]
+    
     @staticmethod
     def _apply_category_filter(query, category: ProductCategory):
         """카테고리 필터 적용"""
@@ -49,7 +64,13 @@ class SectionService:
         limit: int,
         offset: int = 0
     ) -> List[Product]:
-        """오늘의 핫딜 섹션 조회"""
+        """오늘의 핫딜 섹션 조회 (핫딜 인덱스 우선, 없으면 SQL 정렬)"""
+        from app.services.hot_deal_index import HotDealIndex
+        
+        ranked_ids = await HotDealIndex.get_page(category, limit, offset)
+        if ranked_ids is not None:
+            return await SectionService._load_products_in_order(db, ranked_ids)
+        
         # 할인이 있는 상품 우선, 없으면 일반 상품도 포함
         query = (
             select(Product)
@@ -88,6 +109,17 @@ class SectionService:
         result = await db.execute(query)
         return list(result.scalars().all())
     
+    @staticmethod
+    async def _load_products_in_order(db: AsyncSession, product_ids: List[UUID]) -> List[Product]:
+        """id 순서를 유지한 활성 상품 목록 (랭킹 인덱스 조회 결과용)"""
+        if not product_ids:
+            return []
+        result = await db.execute(
+            select(Product).where(Product.id.in_(product_ids), Product.is_active == True)
+        )
+        products_by_id = {product.id: product for product in result.scalars().all()}
+        return [products_by_id[pid] for pid in product_ids if pid in products_by_id]
+    
     @staticmethod
     async def get_popular_section(
         db: AsyncSession,
@@ -96,27 +128,85 @@ class SectionService:
         offset: int = 0,
         time_range: str = "24h"
     ) -> List[Product]:
-        """실시간 인기 사료 섹션 조회"""
-        # TODO: 실제 조회수/클릭수 집계 테이블이 있으면 사용
-        # 현재는 최근 생성된 상품 순으로 정렬 (임시)
-        query = select(Product).where(Product.is_active == True)
-        query = SectionService._apply_category_filter(query, category)
+        """
+        실시간 인기 사료 섹션 조회 (클릭 인기 ZSET 우선, 없으면 클릭 집계 SQL)
         
-        # 최근 생성된 순으로 정렬
-        query = query.order_by(desc(Product.created_at)).limit(limit).offset(offset)
+        클릭이 쌓이기 전(랭킹이 페이지를 못 채우는 경우)에는 신상품 순으로 남은 자리를 채운다.
+        """
+        from app.services.popularity_service import PopularityService
+        
+        time_range = PopularityService.normalize_time_range(time_range)
+        page = await PopularityService.get_page(category, limit, offset, time_range)
+        if page is not None:
+            ranked_ids, total_ranked = page
+            products = await SectionService._load_products_in_order(db, ranked_ids)
+            if len(ranked_ids) == limit or total_ranked > settings.POPULARITY_BACKFILL_MAX_RANKED:
+                return products
+            
+            # 랭킹 뒤에 이어지는 신상품 (랭킹에 있는 상품은 제외)
+            ranked_page = await PopularityService.get_page(category, total_ranked, 0, time_range)
+            exclude_ids = ranked_page[0] if ranked_page else ranked_ids
+            query = select(Product).where(Product.is_active == True)
+            if exclude_ids:
+                query = query.where(Product.id.notin_(exclude_ids))
+            query = SectionService._apply_category_filter(query, category)
+            query = query.order_by(desc(Product.created_at)).limit(limit - len(ranked_ids)).offset(
+                max(0, offset - total_ranked)
+            )
+            result = await db.execute(query)
+            return products + list(result.scalars().all())
+        
+        # fallback: 윈도우 내 클릭 수 집계 (idx_clicks_product_time), 클릭 없는 상품은 신상품 순
+        # 감쇠 랭킹(trending)은 Redis와 같은 반감기로 클릭마다 2^((클릭 시각 - 지금) / 반감기)를 더함
+        now = datetime.now(timezone.utc)
+        since = now - timedelta(seconds=PopularityService.window_seconds(time_range))
+        if time_range in PopularityService.DECAY_RANGES:
+            score = func.sum(func.power(
+                2.0,
+                (func.extract("epoch", OutboundClick.clicked_at) - now.timestamp())
+                / (settings.POPULARITY_DECAY_HALF_LIFE_HOURS * 3600)
+            ))
+        else:
+            score = func.count()
+        click_counts = (
+            select(OutboundClick.product_id, score.label("clicks"))
+            .where(OutboundClick.clicked_at >= since)
+            .group_by(OutboundClick.product_id)
+            .subquery()
+        )
+        query = (
+            select(Product)
+            .outerjoin(click_counts, click_counts.c.product_id == Product.id)
+            .where(Product.is_active == True)
+        )
+        query = SectionService._apply_category_filter(query, category)
+        query = query.order_by(
+            desc(func.coalesce(click_counts.c.clicks, 0)),
+            desc(Product.created_at)
+        ).limit(limit).offset(offset)
         
         result = await db.execute(query)
         return list(result.scalars().all())
     
+    @staticmethod
+    def _apply_newest_paging(query, limit: int, offset: int, after: Optional[list]):
+        """최신순 정렬 + 페이지 (키셋 커서 값이 있으면 OFFSET 없이 그 다음부터)"""
+        keys = SectionService._newest_keys()
+        query = query.order_by(*keyset_order_by(keys)).limit(limit)
+        if after is not None:
+            return query.where(keyset_after(keys, after))
+        return query.offset(offset)
+    
     @staticmethod
     async def get_new_section(
         db: AsyncSession,
         category: ProductCategory,
         limit: int,
         offset: int = 0,
-        days: int = 30
+        days: int = 30,
+        after: Optional[list] = None
     ) -> List[Product]:
-        """신상품 섹션 조회"""
+        """신상품 섹션 조회 (after가 있으면 OFFSET 대신 키셋)"""
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         
         query = select(Product).where(
@@ -126,7 +216,7 @@ class SectionService:
             )
         )
         query = SectionService._apply_category_filter(query, category)
-        query = query.order_by(desc(Product.created_at)).limit(limit).offset(offset)
+        query = SectionService._apply_newest_paging(query, limit, offset, after)
         
         result = await db.execute(query)
         return list(result.scalars().all())
@@ -137,18 +227,66 @@ class SectionService:
         category: ProductCategory,
         limit: int,
         offset: int = 0,
-        min_reviews: int = 10
+        min_reviews: int = 10,
+        after: Optional[list] = None
     ) -> List[Product]:
         """리뷰 베스트 섹션 조회"""
         # TODO: 실제 리뷰 테이블이 있으면 사용
         # 현재는 임시로 최근 생성된 상품 순으로 정렬
         query = select(Product).where(Product.is_active == True)
         query = SectionService._apply_category_filter(query, category)
-        query = query.order_by(desc(Product.created_at)).limit(limit).offset(offset)
+        query = SectionService._apply_newest_paging(query, limit, offset, after)
         
         result = await db.execute(query)
         return list(result.scalars().all())
     
+    @staticmethod
+    def _candidate_in_category(species: Optional[str], category: ProductCategory) -> bool:
+        """추천 후보의 species가 카테고리에 노출되는지 (_apply_category_filter와 같은 규칙)"""
+        if category == ProductCategory.DOG:
+            return species in (PetSpecies.DOG.value, None)
+        if category == ProductCategory.CAT:
+            return species in (PetSpecies.CAT.value, None)
+        return True
+    
+    @staticmethod
+    async def _get_recommendation_candidates(db: AsyncSession, pet_id: UUID) -> Optional[List[dict]]:
+        """캐시된 추천 후보, 미스면 최근 추천 이력(context)에서 복구 후 재캐시"""
+        from app.core.cache.recommendation_cache_service import RecommendationCacheService
+        from app.models.recommendation import RecommendationRun
+        
+        candidates = await RecommendationCacheService.get_candidates(pet_id)
+        if candidates is not None:
+            return candidates
+        
+        result = await db.execute(
+            select(RecommendationRun.context)
+            .where(RecommendationRun.pet_id == pet_id)
+            .order_by(desc(RecommendationRun.created_at))
+            .limit(1)
+        )
+        context = result.scalar_one_or_none() or {}
+        candidates = context.get("candidates")
+        if candidates is None:
+            return None
+        await RecommendationCacheService.set_candidates(pet_id, candidates)
+        return candidates
+    
+    @staticmethod
+    async def _primary_pet_id(db: AsyncSession, user_id: Optional[UUID]) -> Optional[UUID]:
+        """사용자의 대표 펫 (없으면 첫 펫)"""
+        from app.models.pet import Pet
+        
+        if user_id is None:
+            return None
+        result = await db.execute(
+            select(Pet.id)
+            .where(Pet.user_id == user_id)
+            .order_by(desc(Pet.is_primary))
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+    
     @staticmethod
     async def get_personalized_section(
         db: AsyncSession,
@@ -158,9 +296,25 @@ class SectionService:
         user_id: Optional[UUID] = None,
         pet_id: Optional[UUID] = None
     ) -> List[Product]:
-        """사용자 맞춤 추천 섹션 조회"""
-        # TODO: 실제 개인화 로직 구현 (구매 이력, 관심사 등)
-        # 현재는 최근 생성된 상품 순으로 정렬 (임시)
+        """
+        사용자 맞춤 추천 섹션 조회
+        
+        추천 계산 시 함께 캐시한 펫별 후보 목록(점수순)을 offset/limit로 잘라 보여준다.
+        pet_id가 없으면 사용자의 대표 펫, 후보가 없으면(추천 이력 없음) 최근 상품 순.
+        """
+        if pet_id is None:
+            pet_id = await SectionService._primary_pet_id(db, user_id)
+        
+        if pet_id is not None:
+            candidates = await SectionService._get_recommendation_candidates(db, pet_id)
+            if candidates is not None:
+                page_ids = [
+                    UUID(candidate["id"])
+                    for candidate in candidates
+                    if SectionService._candidate_in_category(candidate.get("species"), category)
+                ][offset:offset + limit]
+                return await SectionService._load_products_in_order(db, page_ids)
+        
         query = select(Product).where(Product.is_active == True)
         query = SectionService._apply_category_filter(query, category)
         query = query.order_by(desc(Product.created_at)).limit(limit).offset(offset)
@@ -169,18 +323,72 @@ class SectionService:
         return list(result.scalars().all())
     
     @staticmethod
-    async def get_section_products(
-        db: AsyncSession,
-        request: SectionRequest
-    ) -> SectionResponse:
-        """섹션별 상품 조회 (캐싱 포함)"""
+    def _decode_section_cursor(request: SectionRequest) -> Optional[dict]:
+        if not request.cursor:
+            return None
+        payload = decode_cursor(request.cursor)
+        if payload.get("t") != request.type.value:
+            raise InvalidCursorError("cursor belongs to a different section")
+        return payload
+    
+    @staticmethod
+    def _resolve_paging(request: SectionRequest) -> Tuple[int, int]:
+        """섹션 요청의 limit/offset 확정 (기본값 + 최대값 제한, 커서가 있으면 커서의 위치)"""
         section_type = request.type
-        category = request.category
         limit = request.limit or SectionConfig.get_default_limit(section_type)
         limit = min(limit, SectionConfig.get_max_limit(section_type))
+        payload = SectionService._decode_section_cursor(request)
+        if payload is not None:
+            return limit, max(0, int(payload.get("o", 0)))
         offset = request.offset or 0
+        return limit, offset
+    
+    @staticmethod
+    def _resolve_after(request: SectionRequest) -> Optional[list]:
+        """키셋 섹션 커서의 정렬 키 값 (없으면 OFFSET 조회)"""
+        if request.type not in SectionService.KEYSET_SECTIONS:
+            return None
+        payload = SectionService._decode_section_cursor(request)
+        return payload.get("k") if payload else None
+    
+    @staticmethod
+    async def _build_next_cursors(
+        db: AsyncSession,
+        pages: List[Tuple[SectionRequest, int, int, List[ProductRead]]]
+    ) -> List[Optional[str]]:
+        """
+        (요청, limit, offset, 결과) 목록 → 다음 페이지 커서
         
-        # 캐시 조회
+        페이지가 꽉 찬 경우에만 발급. 키셋 섹션은 마지막 상품의 정렬 키를
+        한 번의 id 조회로 모아 커서에 담는다 (캐시 히트여도 동일).
+        """
+        last_ids = [
+            products[-1].id
+            for request, limit, _offset, products in pages
+            if request.type in SectionService.KEYSET_SECTIONS and products and len(products) >= limit
+        ]
+        created_at_by_id = {}
+        if last_ids:
+            result = await db.execute(
+                select(Product.id, Product.created_at).where(Product.id.in_(set(last_ids)))
+            )
+            created_at_by_id = {row.id: row.created_at for row in result}
+        
+        cursors: List[Optional[str]] = []
+        for request, limit, offset, products in pages:
+            if not products or len(products) < limit:
+                cursors.append(None)
+                continue
+            payload = {"t": request.type.value, "o": offset + len(products)}
+            last_id = products[-1].id
+            if request.type in SectionService.KEYSET_SECTIONS and last_id in created_at_by_id:
+                payload["k"] = [created_at_by_id[last_id], last_id]
+            cursors.append(encode_cursor(payload))
+        return cursors
+    
+    @staticmethod
+    def _build_cache_kwargs(request: SectionRequest) -> dict:
+        """섹션 요청의 부가 파라미터를 캐시 키 인자로 변환"""
         cache_kwargs = {}
         if request.time_range:
             cache_kwargs["time_range"] = request.time_range
@@ -192,25 +400,23 @@ class SectionService:
             cache_kwargs["user_id"] = str(request.user_id)
         if request.pet_id:
             cache_kwargs["pet_id"] = str(request.pet_id)
+        if request.cursor and SectionService._resolve_after(request) is not None:
+            # 키셋 페이지는 위치가 같아도 기준 행이 다를 수 있으므로 커서별로 캐시
+            cache_kwargs["cursor"] = request.cursor
+        return cache_kwargs
+    
+    @staticmethod
+    async def _query_section_products(
+        db: AsyncSession,
+        request: SectionRequest,
+        limit: int,
+        offset: int
+    ) -> List[ProductRead]:
+        """섹션 타입별 DB 조회 후 ProductRead로 변환 (캐시 미사용)"""
+        section_type = request.type
+        category = request.category
+        after = SectionService._resolve_after(request)
         
-        cached_products = await SectionCacheService.get_cached_section(
-            section_type, category, limit, offset, **cache_kwargs
-        )
-        
-        if cached_products:
-            logger.debug(f"[SectionService] 캐시에서 조회: {section_type.value}")
-            return SectionResponse(
-                type=section_type,
-                category=category,
-                products=cached_products,
-                total=len(cached_products),
-                limit=limit,
-                offset=offset,
-                cached=True,
-                cached_at=datetime.utcnow()
-            )
-        
-        # DB 조회
         products: List[Product]
         if section_type == SectionType.HOT_DEAL:
             products = await SectionService.get_hot_deal_section(
@@ -222,27 +428,77 @@ class SectionService:
             )
         elif section_type == SectionType.NEW:
             products = await SectionService.get_new_section(
-                db, category, limit, offset, request.days or 30
+                db, category, limit, offset, request.days or 30, after
             )
         elif section_type == SectionType.REVIEW_BEST:
             products = await SectionService.get_review_best_section(
-                db, category, limit, offset, request.min_reviews or 10
+                db, category, limit, offset, request.min_reviews or 10, after
             )
         elif section_type == SectionType.PERSONALIZED:
+            pet_id = request.pet_id or await SectionService._primary_pet_id(db, request.user_id)
             products = await SectionService.get_personalized_section(
-                db, category, limit, offset, request.user_id, request.pet_id
+                db, category, limit, offset, pet_id=pet_id
             )
+            if pet_id is not None:
+                # 호출부가 이 키로 캐시하므로 추천 재계산 시 지울 수 있게 펫별로 등록
+                await SectionCacheService.track_personalized_section(
+                    pet_id,
+                    SectionCacheService._generate_cache_key(
+                        section_type, category, limit, offset,
+                        **SectionService._build_cache_kwargs(request)
+                    )
+                )
         else:
             raise ValueError(f"Unknown section type: {section_type}")
         
-        # ProductRead로 변환
-        product_reads = [ProductRead.model_validate(p) for p in products]
+        return [ProductRead.model_validate(p) for p in products]
+    
+    @staticmethod
+    async def get_section_products(
+        db: AsyncSession,
+        request: SectionRequest
+    ) -> SectionResponse:
+        """섹션별 상품 조회 (캐싱 포함)"""
+        section_type = request.type
+        category = request.category
+        limit, offset = SectionService._resolve_paging(request)
+        
+        # 캐시 조회
+        cache_kwargs = SectionService._build_cache_kwargs(request)
+        cached_products = await SectionCacheService.get_cached_section(
+            section_type, category, limit, offset, **cache_kwargs
+        )
+        
+        if cached_products:
+            logger.debug(f"[SectionService] 캐시에서 조회: {section_type.value}")
+            next_cursor, = await SectionService._build_next_cursors(
+                db, [(request, limit, offset, cached_products)]
+            )
+            return SectionResponse(
+                type=section_type,
+                category=category,
+                products=cached_products,
+                total=len(cached_products),
+                limit=limit,
+                offset=offset,
+                next_cursor=next_cursor,
+                cached=True,
+                cached_at=datetime.utcnow()
+            )
+        
+        # DB 조회
+        product_reads = await SectionService._query_section_products(
+            db, request, limit, offset
+        )
         
         # 캐시 저장
         await SectionCacheService.set_cached_section(
             section_type, category, product_reads, limit, offset, **cache_kwargs
         )
         
+        next_cursor, = await SectionService._build_next_cursors(
+            db, [(request, limit, offset, product_reads)]
+        )
         return SectionResponse(
             type=section_type,
             category=category,
@@ -250,6 +506,7 @@ class SectionService:
             total=len(product_reads),
             limit=limit,
             offset=offset,
+            next_cursor=next_cursor,
             cached=False
         )
     
@@ -258,8 +515,77 @@ class SectionService:
         db: AsyncSession,
         requests: List[SectionRequest]
     ) -> List[SectionResponse]:
-        """배치 섹션 조회"""
-        # 병렬 처리로 모든 섹션 조회
-        import asyncio
-        tasks = [SectionService.get_section_products(db, req) for req in requests]
-        return await asyncio.gather(*tasks)
+        """
+        배치 섹션 조회
+        
+        1. 모든 캐시 키를 만들어 MGET 한 번으로 조회
+        2. 미스난 섹션만 gather_in_sessions로 각자의 세션에서 병렬 DB 조회 (같은 키는 한 번만)
+        3. 조회 결과를 파이프라인 SET EX 한 번으로 저장
+        4. 다음 페이지 커서 발급 (키셋 섹션의 정렬 키는 id 조회 1회로 모음)
+        """
+        if not requests:
+            return []
+        
+        paging = [SectionService._resolve_paging(req) for req in requests]
+        cache_keys = [
+            SectionCacheService._generate_cache_key(
+                req.type, req.category, limit, offset,
+                **SectionService._build_cache_kwargs(req)
+            )
+            for req, (limit, offset) in zip(requests, paging)
+        ]
+        
+        cached_results = await SectionCacheService.get_cached_sections(cache_keys)
+        
+        # 미스 키별 첫 요청 인덱스 (중복 요청은 한 번만 계산)
+        miss_indexes: dict = {}
+        for idx, (cache_key, cached) in enumerate(zip(cache_keys, cached_results)):
+            if not cached and cache_key not in miss_indexes:
+                miss_indexes[cache_key] = idx
+        
+        computed: dict = {}
+        if miss_indexes:
+            logger.debug(
+                f"[SectionService] 배치 캐시 미스: {len(miss_indexes)}/{len(requests)}개 섹션 DB 조회"
+            )
+            miss_keys = list(miss_indexes.keys())
+            miss_results = await gather_in_sessions(*[
+                functools.partial(
+                    SectionService._query_section_products,
+                    request=requests[miss_indexes[key]],
+                    limit=paging[miss_indexes[key]][0],
+                    offset=paging[miss_indexes[key]][1],
+                )
+                for key in miss_keys
+            ])
+            computed = dict(zip(miss_keys, miss_results))
+            
+            await SectionCacheService.set_cached_sections([
+                (key, SectionConfig.get_cache_ttl(requests[miss_indexes[key]].type), computed[key])
+                for key in miss_keys
+            ])
+        
+        pages = [
+            (req, limit, offset, cached if cached else computed[cache_key])
+            for req, (limit, offset), cache_key, cached in zip(requests, paging, cache_keys, cached_results)
+        ]
+        next_cursors = await SectionService._build_next_cursors(db, pages)
+        
+        cached_at = datetime.utcnow()
+        responses: List[SectionResponse] = []
+        for (req, limit, offset, products), cached, next_cursor in zip(pages, cached_results, next_cursors):
+            is_cached = bool(cached)
+            responses.append(
+                SectionResponse(
+                    type=req.type,
+                    category=req.category,
+                    products=products,
+                    total=len(products),
+                    limit=limit,
+                    offset=offset,
+                    next_cursor=next_cursor,
+                    cached=is_cached,
+                    cached_at=cached_at if is_cached else None
+                )
+            )
+        return responses
@@ -1,12 +1,56 @@
 """가격 추적 관련 비즈니스 로직"""
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, text
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
 from app.models.tracking import Tracking, TrackingStatus
-from app.schemas.tracking import TrackingCreate
+from app.schemas.tracking import TrackingCreate, WatchlistItem, WatchlistResponse
+from app.services.price_refresh_scheduler import PriceRefreshScheduler
+
+# 관심 상품 목록: 추적 + 상품 + 대표 오퍼 + 30일 요약 + 알림 상태를 한 번에 조회
+# (추적마다 상품/가격/알림을 따로 읽던 N+1 대신 LATERAL 조인 쿼리 1회)
+_WATCHLIST_SQL = """
+SELECT t.id AS tracking_id,
+       t.pet_id,
+       t.status,
+       t.created_at AS tracked_at,
+       p.id AS product_id,
+       p.brand_name,
+       p.product_name,
+       p.size_label,
+       p.species,
+       p.is_active,
+       o.merchant,
+       o.platform_image_url,
+       COALESCE(o.affiliate_url, o.url) AS purchase_url,
+       COALESCE(o.current_price, s.last_final_price) AS current_price,
+       s.avg_final_price,
+       s.min_final_price,
+       a.alert_rules,
+       a.target_price,
+       a.last_triggered_at
+FROM trackings t
+JOIN products p ON p.id = t.product_id
+LEFT JOIN LATERAL (
+    SELECT id, merchant, url, affiliate_url, platform_image_url, current_price
+    FROM product_offers
+    WHERE product_id = t.product_id AND is_active
+    ORDER BY is_primary DESC, display_priority, current_price NULLS LAST
+    LIMIT 1
+) o ON TRUE
+LEFT JOIN price_summaries s ON s.offer_id = o.id AND s.window_days = 30
+LEFT JOIN LATERAL (
+    SELECT array_agg(DISTINCT rule_type::text) AS alert_rules,
+           MIN(target_price) FILTER (WHERE rule_type = 'TARGET_PRICE') AS target_price,
+           MAX(last_triggered_at) AS last_triggered_at
+    FROM alerts
+    WHERE tracking_id = t.id AND is_enabled
+) a ON TRUE
+WHERE t.user_id = :user_id AND t.status <> 'DELETED'
+ORDER BY t.created_at DESC, t.id DESC
+"""
 
 
 class TrackingService:
@@ -23,6 +67,53 @@ class TrackingService:
         )
         return list(result.scalars().all())
     
+    @staticmethod
+    def _build_watchlist_item(row) -> WatchlistItem:
+        current_price = row["current_price"]
+        avg_price = row["avg_final_price"]
+        delta = None
+        delta_percent = None
+        if current_price is not None and avg_price:
+            delta = current_price - avg_price
+            delta_percent = round(delta * 100 / avg_price, 2)
+
+        target_price = row["target_price"]
+        alert_rules = row["alert_rules"] or []
+        return WatchlistItem(
+            tracking_id=row["tracking_id"],
+            pet_id=row["pet_id"],
+            status=row["status"],
+            tracked_at=row["tracked_at"],
+            product_id=row["product_id"],
+            brand_name=row["brand_name"],
+            product_name=row["product_name"],
+            size_label=row["size_label"],
+            species=row["species"],
+            is_active=row["is_active"],
+            image_url=row["platform_image_url"],
+            merchant=row["merchant"],
+            purchase_url=row["purchase_url"],
+            current_price=current_price,
+            avg_price=avg_price,
+            min_price=row["min_final_price"],
+            delta=delta,
+            delta_percent=delta_percent,
+            has_alert=bool(alert_rules),
+            alert_rules=alert_rules,
+            target_price=target_price,
+            is_below_target=(
+                target_price is not None and current_price is not None and current_price <= target_price
+            ),
+            last_alerted_at=row["last_triggered_at"],
+        )
+    
+    @staticmethod
+    async def get_watchlist(user_id: UUID, db: AsyncSession) -> WatchlistResponse:
+        """관심 상품 목록 (상품 요약 + 현재가/평균가/변동 + 알림 상태, 쿼리 1회)"""
+        result = await db.execute(text(_WATCHLIST_SQL), {"user_id": user_id})
+        items = [TrackingService._build_watchlist_item(row) for row in result.mappings()]
+        return WatchlistResponse(items=items, total=len(items))
+    
     @staticmethod
     async def get_tracking_by_id(tracking_id: UUID, db: AsyncSession) -> Tracking:
         """추적 ID로 조회"""
@@ -76,6 +167,9 @@ class TrackingService:
             except Exception:
                 pass
             
+            # 수요가 생겼으므로 상품 가격 재수집을 앞당김
+            await PriceRefreshScheduler.reschedule_product(db, existing_tracking.product_id)
+            
             return existing_tracking
         
         # 새 tracking 생성
@@ -148,6 +242,9 @@ class TrackingService:
             except Exception:
                 pass
         
+        # 수요가 생겼으므로 상품 가격 재수집을 앞당김
+        await PriceRefreshScheduler.reschedule_product(db, tracking.product_id)
+        
         return tracking
     
     @staticmethod
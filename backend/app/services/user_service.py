@@ -1,9 +1,11 @@
 """사용자 관련 비즈니스 로직"""
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from fastapi import HTTPException, status
 
+from app.models.push_token import PushToken, PushProvider
 from app.models.user import User
 
 
@@ -62,3 +64,37 @@ class UserService:
                 await db.refresh(user)
         
         return user
+    
+    @staticmethod
+    async def register_push_token(
+        user_id: UUID,
+        provider: PushProvider,
+        token: str,
+        db: AsyncSession
+    ) -> None:
+        """푸시 토큰 등록 (같은 토큰이 다른 사용자/비활성 상태로 있으면 이 사용자로 재활성화)"""
+        stmt = pg_insert(PushToken).values(user_id=user_id, provider=provider, token=token, is_active=True)
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[PushToken.token],
+                set_={
+                    "user_id": stmt.excluded.user_id,
+                    "provider": stmt.excluded.provider,
+                    "is_active": True,
+                    "last_error": None,
+                    "deactivated_at": None,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+        await db.commit()
+    
+    @staticmethod
+    async def unregister_push_token(user_id: UUID, token: str, db: AsyncSession) -> None:
+        """푸시 토큰 해제 (로그아웃/알림 끄기)"""
+        await db.execute(
+            update(PushToken)
+            .where(PushToken.user_id == user_id, PushToken.token == token)
+            .values(is_active=False, deactivated_at=func.now(), last_error="UNREGISTERED")
+        )
+        await db.commit()
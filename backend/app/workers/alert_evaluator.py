@@ -0,0 +1,137 @@
+"""
+가격 알림 평가 워커
+
+가격 이벤트 스트림(PriceEventStream)을 소비자 그룹으로 읽어 알림을 평가한다.
+가격이 바뀐 뒤 수 초 안에 alert_events가 기록되며, 여러 프로세스를 띄우면
+같은 그룹 안에서 이벤트가 나뉘어 처리된다.
+
+1. 오래 ACK되지 않은 이벤트 회수 (XAUTOCLAIM, 죽은 소비자 복구)
+2. 새 이벤트 읽기 (XREADGROUP BLOCK)
+3. 상품→알림 인메모리 인덱스로 해당 상품 알림만 평가 → alert_events/alerts 기록 → 커밋
+4. 발송한 알림을 사용자 알림함(Redis)에 반영, 푸시 발송 대기열에 발행 → XACK
+
+커밋 후 ACK 전에 죽으면 이벤트가 재전달되지만, 발송한 알림은 cooldown/last_sent_price로 걸러진다.
+
+실행:
+    python -m app.workers.alert_evaluator
+"""
+import asyncio
+import logging
+import os
+import signal
+import socket
+import time
+from typing import Dict, List, Tuple
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.core.redis import create_blocking_redis
+from app.db.session import AsyncSessionLocal
+from app.services.alert_evaluator import AlertEvaluator, AlertIndex
+from app.services.notification_inbox_service import NotificationInboxService
+from app.services.push_delivery_queue import PushDeliveryQueue
+from app.services.price_event_stream import PriceEventStream
+
+logger = logging.getLogger(__name__)
+
+
+class AlertEvaluatorWorker:
+    """가격 이벤트 소비 루프"""
+
+    def __init__(self):
+        self.group = settings.ALERT_EVALUATOR_GROUP
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self.index = AlertIndex()
+        self.last_claim_at = 0.0
+
+    async def _next_messages(self, client: redis.Redis) -> List[Tuple[str, Dict[str, str]]]:
+        """회수할 이벤트가 있으면 먼저, 없으면 새 이벤트 대기"""
+        if time.monotonic() - self.last_claim_at >= settings.ALERT_EVALUATOR_CLAIM_IDLE_MS / 1000:
+            self.last_claim_at = time.monotonic()
+            claimed = await PriceEventStream.claim_stale(
+                client, self.group, self.consumer,
+                settings.ALERT_EVALUATOR_CLAIM_IDLE_MS, settings.ALERT_EVALUATOR_BATCH_SIZE
+            )
+            if claimed:
+                logger.info(f"[AlertEvaluator] 미처리 이벤트 회수: {len(claimed)}건")
+                return claimed
+        return await PriceEventStream.read_group(
+            client, self.group, self.consumer,
+            settings.ALERT_EVALUATOR_BATCH_SIZE, settings.ALERT_EVALUATOR_BLOCK_MS
+        )
+
+    async def handle(self, client: redis.Redis, messages: List[Tuple[str, Dict[str, str]]]) -> int:
+        """이벤트 배치 평가 → 커밋 → ACK"""
+        start_time = time.time()
+        events = []
+        for message_id, fields in messages:
+            try:
+                events.append(PriceEventStream.decode(fields))
+            except (KeyError, ValueError) as e:
+                # 형식이 깨진 이벤트는 재시도해도 같으므로 로그만 남기고 ACK
+                logger.warning(f"[AlertEvaluator] ⚠️ 잘못된 이벤트 건너뜀: id={message_id}, error={e}")
+
+        if self.index.is_stale():
+            async with AsyncSessionLocal() as session:
+                await self.index.load(session)
+
+        async with AsyncSessionLocal() as session:
+            try:
+                notifications = await AlertEvaluator.process_events(session, self.index, events)
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                # 인메모리 상태가 DB보다 앞섰을 수 있으므로 재적재
+                self.index.invalidate()
+                raise
+
+        fired = len(notifications)
+        if notifications:
+            await NotificationInboxService.push_many(notifications)
+            if settings.PUSH_API_BASE_URL:
+                await PushDeliveryQueue.publish(notifications)
+
+        await PriceEventStream.ack(client, self.group, [message_id for message_id, _ in messages])
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        if fired:
+            logger.info(
+                f"[AlertEvaluator] 🔔 알림 발송: {fired}건 (이벤트 {len(events)}건, 소요시간={duration_ms}ms)"
+            )
+        return fired
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        client = create_blocking_redis(settings.ALERT_EVALUATOR_BLOCK_MS / 1000)
+        try:
+            await PriceEventStream.ensure_group(client, self.group)
+            logger.info(f"[AlertEvaluator] ✅ 워커 시작: group={self.group}, consumer={self.consumer}")
+
+            while not stop_event.is_set():
+                try:
+                    messages = await self._next_messages(client)
+                    if messages:
+                        await self.handle(client, messages)
+                except redis.RedisError as e:
+                    logger.warning(f"[AlertEvaluator] Redis 오류, 1초 후 재시도: {e}")
+                    await asyncio.sleep(1)
+                except Exception as e:
+                    # ACK하지 않았으므로 claim idle 이후 다시 처리됨
+                    logger.error(f"[AlertEvaluator] ❌ 이벤트 처리 실패: {e}", exc_info=True)
+                    await asyncio.sleep(1)
+        finally:
+            await client.close()
+            logger.info("[AlertEvaluator] 워커 종료")
+
+
+async def _main() -> None:
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+    await AlertEvaluatorWorker().run(stop_event)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main())
@@ -0,0 +1,264 @@
+"""
+캐시 워머 - 배포/Redis flush 직후 콜드 캐시 방지
+
+1. 홈 섹션: 개인화를 제외한 모든 SectionType × ProductCategory 기본 페이지를 미리 계산
+   (개인화 섹션은 펫별 후보가 있어야 의미가 있으므로 워밍하지 않음)
+2. 추천: 최근 N일 내 활동한 펫(RecommendationRun / outbound_clicks 기준)을 최신순으로 재계산
+
+앱 startup 시 1회 + 주기적으로 실행되며, 라이브 트래픽을 굶기지 않도록
+펫 단위로 순차 처리하고 요청 사이에 지연을 둔다.
+스케줄러는 API 프로세스마다 뜨지만, 작업마다 Redis 실행 슬롯(SET NX EX)을 잡은 프로세스만 실행한다.
+
+단독 실행 (1회 워밍):
+    python -m app.workers.cache_warmer
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from uuid import UUID
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy import select, func, union_all, desc
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.core.cache.cache_keys import CacheKeys
+from app.db.session import AsyncSessionLocal
+from app.models.outbound_click import OutboundClick
+from app.models.recommendation import RecommendationRun
+from app.models.section import SectionType, ProductCategory
+from app.schemas.section import SectionRequest
+
+logger = logging.getLogger(__name__)
+
+# 동시에 두 번 돌지 않도록 (startup 워밍과 스케줄 워밍이 겹치는 경우)
+_warm_lock = asyncio.Lock()
+_scheduler: Optional[AsyncIOScheduler] = None
+
+
+class CacheWarmer:
+    """섹션/추천 캐시 워밍"""
+
+    @staticmethod
+    async def warm_sections() -> int:
+        """모든 섹션 × 카테고리 기본 페이지 워밍 (캐시 미스인 것만 DB 조회)"""
+        from app.services.section_service import SectionService
+        from app.services.hot_deal_index import HotDealIndex
+        from app.services.popularity_service import PopularityService
+
+        # Redis flush 직후면 핫딜/인기 인덱스부터 복구 (없으면 해당 섹션이 SQL로 계산됨)
+        async with AsyncSessionLocal() as session:
+            await HotDealIndex.ensure_built(session)
+            await PopularityService.ensure_built(session)
+
+        requests = [
+            SectionRequest(type=section_type, category=category)
+            for section_type in SectionType
+            if section_type != SectionType.PERSONALIZED
+            for category in ProductCategory
+        ]
+
+        start_time = time.time()
+        async with AsyncSessionLocal() as session:
+            responses = await SectionService.get_batch_sections(session, requests)
+
+        warmed = sum(1 for r in responses if not r.cached)
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.info(
+            f"[CacheWarmer] ✅ 섹션 워밍 완료: {warmed}/{len(requests)}개 새로 계산, 소요시간={duration_ms}ms"
+        )
+        return warmed
+
+    @staticmethod
+    async def get_active_pet_ids(days: int, limit: int) -> List[UUID]:
+        """최근 N일 내 추천/클릭 활동이 있는 펫 ID (최근 활동순)"""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+
+        activity = union_all(
+            select(
+                RecommendationRun.pet_id.label("pet_id"),
+                RecommendationRun.created_at.label("active_at"),
+            ).where(RecommendationRun.created_at >= cutoff),
+            select(
+                OutboundClick.pet_id.label("pet_id"),
+                OutboundClick.clicked_at.label("active_at"),
+            ).where(
+                OutboundClick.clicked_at >= cutoff,
+                OutboundClick.pet_id.isnot(None),
+            ),
+        ).subquery()
+
+        query = (
+            select(activity.c.pet_id)
+            .group_by(activity.c.pet_id)
+            .order_by(desc(func.max(activity.c.active_at)))
+            .limit(limit)
+        )
+
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(query)
+            return [row[0] for row in result.all()]
+
+    @staticmethod
+    async def warm_recommendations(
+        days: Optional[int] = None,
+        max_pets: Optional[int] = None,
+        delay_seconds: Optional[float] = None
+    ) -> int:
+        """활성 펫 추천 캐시 워밍 (펫 단위 순차 처리 + 지연으로 rate limit)"""
+        from app.core.cache.recommendation_cache_service import RecommendationCacheService
+        from app.services.product_service import ProductService
+
+        days = days or settings.CACHE_WARMER_ACTIVE_PET_DAYS
+        max_pets = max_pets or settings.CACHE_WARMER_MAX_PETS
+        delay_seconds = settings.CACHE_WARMER_PET_DELAY_SECONDS if delay_seconds is None else delay_seconds
+
+        pet_ids = await CacheWarmer.get_active_pet_ids(days, max_pets)
+        logger.info(f"[CacheWarmer] 🔥 추천 워밍 시작: 활성 펫 {len(pet_ids)}개 (최근 {days}일)")
+
+        start_time = time.time()
+        warmed = 0
+        for pet_id in pet_ids:
+            # 이미 Redis에 있으면 건너뜀 (DB/스코링 부하 없음)
+            if await RecommendationCacheService.get_recommendation(pet_id):
+                continue
+
+            try:
+                async with AsyncSessionLocal() as session:
+                    await ProductService.get_recommendations(pet_id, session)
+                warmed += 1
+            except Exception as e:
+                # 삭제된 펫 등 개별 실패는 무시하고 계속 진행
+                logger.warning(f"[CacheWarmer] ⚠️ 추천 워밍 실패 (무시): pet_id={pet_id}, error={e}")
+
+            if delay_seconds > 0:
+                await asyncio.sleep(delay_seconds)
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.info(
+            f"[CacheWarmer] ✅ 추천 워밍 완료: {warmed}/{len(pet_ids)}개 새로 계산, 소요시간={duration_ms}ms"
+        )
+        return warmed
+
+    @staticmethod
+    async def warm_all() -> None:
+        """섹션 + 추천 전체 워밍 (이미 실행 중이면 건너뜀)"""
+        if _warm_lock.locked():
+            logger.info("[CacheWarmer] ⏭️ 이전 워밍이 실행 중이라 건너뜀")
+            return
+
+        async with _warm_lock:
+            try:
+                await CacheWarmer.warm_sections()
+            except Exception as e:
+                logger.error(f"[CacheWarmer] ❌ 섹션 워밍 실패: {e}", exc_info=True)
+            try:
+                await CacheWarmer.warm_recommendations()
+            except Exception as e:
+                logger.error(f"[CacheWarmer] ❌ 추천 워밍 실패: {e}", exc_info=True)
+
+    @staticmethod
+    async def _claim_slot(job: str, interval_seconds: int) -> bool:
+        """
+        이번 주기 실행 슬롯 확보 (API 워커 N개가 같은 스케줄을 돌려도 1곳만 실행)
+
+        슬롯은 주기보다 약간 짧게 유지해 다음 주기에는 어느 프로세스든 다시 잡을 수 있다.
+        Redis 장애 시에는 채울 캐시도 없으므로 건너뛴다.
+        """
+        try:
+            redis_client = await get_redis()
+            acquired = await redis_client.set(
+                CacheKeys.cache_warmer_slot(job), "1", nx=True, ex=max(1, int(interval_seconds * 0.9))
+            )
+        except redis.RedisError as e:
+            logger.warning(f"[CacheWarmer] 실행 슬롯 확인 실패, 이번 주기 건너뜀: job={job}, error={e}")
+            return False
+        if not acquired:
+            logger.debug(f"[CacheWarmer] ⏭️ 다른 프로세스가 실행 중/실행함: job={job}")
+        return bool(acquired)
+
+    @staticmethod
+    async def _warm_all_job(job: str, interval_seconds: int) -> None:
+        """스케줄 작업: 슬롯을 잡은 프로세스만 전체 워밍"""
+        if await CacheWarmer._claim_slot(job, interval_seconds):
+            await CacheWarmer.warm_all()
+
+    @staticmethod
+    async def _warm_sections_job() -> None:
+        """스케줄 작업: 섹션만 워밍 (TTL이 짧아 더 자주 실행)"""
+        if not await CacheWarmer._claim_slot("sections", settings.CACHE_WARMER_SECTION_INTERVAL_MINUTES * 60):
+            return
+        try:
+            await CacheWarmer.warm_sections()
+        except Exception as e:
+            logger.error(f"[CacheWarmer] ❌ 섹션 워밍 실패: {e}", exc_info=True)
+
+
+def start_cache_warmer() -> Optional[AsyncIOScheduler]:
+    """앱 startup 시 호출: 최초 워밍 예약 + 주기 스케줄 등록"""
+    global _scheduler
+    if not settings.CACHE_WARMER_ENABLED:
+        logger.info("[CacheWarmer] 비활성화됨 (CACHE_WARMER_ENABLED=false)")
+        return None
+
+    _scheduler = AsyncIOScheduler(timezone="UTC")
+    now = datetime.now(timezone.utc)
+
+    # startup 직후 전체 워밍 (서버가 요청을 받기 시작한 뒤 실행되도록 약간 지연)
+    _scheduler.add_job(
+        CacheWarmer._warm_all_job,
+        "date",
+        run_date=now + timedelta(seconds=settings.CACHE_WARMER_STARTUP_DELAY_SECONDS),
+        args=["startup", settings.CACHE_WARMER_SECTION_INTERVAL_MINUTES * 60],
+        id="cache_warmer_startup",
+    )
+    _scheduler.add_job(
+        CacheWarmer._warm_sections_job,
+        "interval",
+        minutes=settings.CACHE_WARMER_SECTION_INTERVAL_MINUTES,
+        id="cache_warmer_sections",
+        max_instances=1,
+        coalesce=True,
+    )
+    _scheduler.add_job(
+        CacheWarmer._warm_all_job,
+        "interval",
+        minutes=settings.CACHE_WARMER_INTERVAL_MINUTES,
+        args=["all", settings.CACHE_WARMER_INTERVAL_MINUTES * 60],
+        id="cache_warmer_all",
+        max_instances=1,
+        coalesce=True,
+    )
+    _scheduler.start()
+    logger.info(
+        f"[CacheWarmer] ✅ 스케줄 등록: 섹션 {settings.CACHE_WARMER_SECTION_INTERVAL_MINUTES}분, "
+        f"전체 {settings.CACHE_WARMER_INTERVAL_MINUTES}분 주기"
+    )
+    return _scheduler
+
+
+def shutdown_cache_warmer() -> None:
+    """앱 shutdown 시 호출"""
+    global _scheduler
+    if _scheduler:
+        _scheduler.shutdown(wait=False)
+        _scheduler = None
+
+
+async def _main() -> None:
+    from app.core.redis import init_redis, close_redis
+
+    await init_redis()
+    try:
+        await CacheWarmer.warm_all()
+    finally:
+        await close_redis()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main())
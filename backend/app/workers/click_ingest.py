@@ -0,0 +1,121 @@
+"""
+클릭 적재 워커
+
+클릭 API가 스트림에 넣어 둔 클릭을 소비자 그룹으로 묶어 읽어 outbound_clicks에 COPY로 적재한다.
+알림 일괄 발송 직후처럼 클릭이 몰려도 API는 XADD만 하고, DB 쓰기는 배치 크기만큼 묶여 일정하게 유지된다.
+
+1. 오래 ACK되지 않은 클릭 회수 (XAUTOCLAIM, 죽은 소비자 복구)
+2. 새 클릭 읽기 (XREADGROUP BLOCK, 최대 CLICK_INGEST_BATCH_SIZE건)
+3. COPY → 스테이징에서 중복 제외 INSERT → 커밋 → XACK
+4. 실제로 적재된 클릭만 인기 랭킹 카운터에 반영
+
+실행:
+    python -m app.workers.click_ingest
+"""
+import asyncio
+import logging
+import os
+import signal
+import socket
+import time
+from typing import Dict, List, Tuple
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.core.redis import create_blocking_redis
+from app.db.session import AsyncSessionLocal
+from app.services.click_buffer import ClickBuffer
+from app.services.click_service import ClickService
+from app.services.popularity_service import PopularityService
+
+logger = logging.getLogger(__name__)
+
+
+class ClickIngestWorker:
+    """클릭 적재 소비 루프"""
+
+    def __init__(self):
+        self.group = settings.CLICK_INGEST_GROUP
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self.last_claim_at = 0.0
+
+    async def _next_messages(self, client: redis.Redis) -> List[Tuple[str, Dict[str, str]]]:
+        """회수할 클릭이 있으면 먼저, 없으면 새 클릭 대기"""
+        if time.monotonic() - self.last_claim_at >= settings.CLICK_INGEST_CLAIM_IDLE_MS / 1000:
+            self.last_claim_at = time.monotonic()
+            claimed = await ClickBuffer.claim_stale(
+                client, self.group, self.consumer,
+                settings.CLICK_INGEST_CLAIM_IDLE_MS, settings.CLICK_INGEST_BATCH_SIZE
+            )
+            if claimed:
+                logger.info(f"[ClickIngest] 미처리 클릭 회수: {len(claimed)}건")
+                return claimed
+        return await ClickBuffer.read_group(
+            client, self.group, self.consumer,
+            settings.CLICK_INGEST_BATCH_SIZE, settings.CLICK_INGEST_BLOCK_MS
+        )
+
+    async def handle(self, client: redis.Redis, messages: List[Tuple[str, Dict[str, str]]]) -> None:
+        """클릭 배치 적재 → 커밋 → ACK → 인기 카운터 반영"""
+        if not messages:
+            return
+        start_time = time.time()
+        clicks = []
+        for message_id, fields in messages:
+            try:
+                clicks.append(ClickBuffer.decode(fields))
+            except (KeyError, ValueError) as e:
+                # 형식이 깨진 클릭은 재시도해도 같으므로 로그만 남기고 ACK
+                logger.warning(f"[ClickIngest] ⚠️ 잘못된 클릭 건너뜀: id={message_id}, error={e}")
+
+        async with AsyncSessionLocal() as session:
+            try:
+                inserted = await ClickService.ingest_clicks(session, clicks)
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+        await ClickBuffer.ack(client, self.group, [message_id for message_id, _ in messages])
+        # ACK 전에 죽어 다시 처리되더라도 ON CONFLICT로 적재되지 않은 건은 카운터에 반영되지 않음
+        await PopularityService.record_clicks(inserted)
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.info(
+            f"[ClickIngest] 📥 클릭 적재: {len(inserted)}/{len(messages)}건 (소요시간={duration_ms}ms)"
+        )
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        client = create_blocking_redis(settings.CLICK_INGEST_BLOCK_MS / 1000)
+        try:
+            await ClickBuffer.ensure_group(client, self.group)
+            logger.info(f"[ClickIngest] ✅ 워커 시작: group={self.group}, consumer={self.consumer}")
+
+            while not stop_event.is_set():
+                try:
+                    messages = await self._next_messages(client)
+                    await self.handle(client, messages)
+                except redis.RedisError as e:
+                    logger.warning(f"[ClickIngest] Redis 오류, 1초 후 재시도: {e}")
+                    await asyncio.sleep(1)
+                except Exception as e:
+                    # ACK하지 않았으므로 claim idle 이후 다시 처리됨
+                    logger.error(f"[ClickIngest] ❌ 클릭 적재 실패: {e}", exc_info=True)
+                    await asyncio.sleep(1)
+        finally:
+            await client.close()
+            logger.info("[ClickIngest] 워커 종료")
+
+
+async def _main() -> None:
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+    await ClickIngestWorker().run(stop_event)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main())
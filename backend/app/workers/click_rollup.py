@@ -0,0 +1,106 @@
+"""
+클릭/커미션 롤업 워커
+
+CLICK_ROLLUP_INTERVAL_SECONDS마다 워터마크 이후 적재된 클릭을 시간/일 롤업에 더한다
+(ClickAnalyticsService.advance). 구간마다 커밋하므로 중단 후 재시작하면 마지막 워터마크부터 이어서 처리하고,
+밀린 경우에도 트랜잭션 하나가 CLICK_ROLLUP_MAX_WINDOW_HOURS 구간보다 커지지 않는다.
+
+실행:
+    python -m app.workers.click_rollup          # 스케줄러로 상시 실행
+    python -m app.workers.click_rollup --once   # 현재까지 따라잡은 뒤 종료 (백필/수동 실행)
+"""
+import argparse
+import asyncio
+import logging
+import signal
+import time
+from datetime import datetime, timezone
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.services.click_analytics_service import ClickAnalyticsService
+
+logger = logging.getLogger(__name__)
+
+
+class ClickRollupWorker:
+    """클릭 롤업 증분 갱신"""
+
+    @staticmethod
+    async def catch_up() -> int:
+        """워터마크가 따라잡을 때까지 구간 단위로 반영 후 커밋, 처리한 구간 수 반환"""
+        start_time = time.time()
+        windows = 0
+        rows = 0
+        watermark = None
+        while True:
+            async with AsyncSessionLocal() as session:
+                try:
+                    step = await ClickAnalyticsService.advance(session)
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+                    raise
+            if step is None:
+                break
+            windows += 1
+            rows += step["rows"]
+            watermark = step["end"]
+            if step["caught_up"]:
+                break
+            await asyncio.sleep(0)
+
+        if windows:
+            duration_ms = int((time.time() - start_time) * 1000)
+            logger.info(
+                f"[ClickRollup] 📊 롤업 갱신: 구간={windows}, 갱신 행={rows}, "
+                f"워터마크={watermark.isoformat()}, 소요시간={duration_ms}ms"
+            )
+        return windows
+
+    @staticmethod
+    async def run_tick() -> None:
+        """스케줄 작업: 예외가 스케줄러를 멈추지 않도록 로깅만 (워터마크는 마지막 커밋 지점에 남음)"""
+        try:
+            await ClickRollupWorker.catch_up()
+        except Exception as e:
+            logger.error(f"[ClickRollup] ❌ 롤업 갱신 실패: {e}", exc_info=True)
+
+
+async def _main(run_once: bool) -> None:
+    if run_once:
+        await ClickRollupWorker.catch_up()
+        return
+
+    scheduler = AsyncIOScheduler(timezone="UTC")
+    scheduler.add_job(
+        ClickRollupWorker.run_tick,
+        "interval",
+        seconds=settings.CLICK_ROLLUP_INTERVAL_SECONDS,
+        next_run_time=datetime.now(timezone.utc),
+        id="click_rollup",
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.start()
+    logger.info(f"[ClickRollup] ✅ 워커 시작: {settings.CLICK_ROLLUP_INTERVAL_SECONDS}초 주기")
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+    await stop_event.wait()
+
+    scheduler.shutdown(wait=False)
+    logger.info("[ClickRollup] 워커 종료")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="클릭/커미션 롤업 워커")
+    parser.add_argument("--once", action="store_true", help="현재까지 따라잡은 뒤 종료")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main(args.once))
@@ -1,3 +1,387 @@
-# 백그라운드 가격 수집 워커
-# TODO: 구현 필요
+"""
+백그라운드 가격 수집 워커
 
+사용자 요청 경로(상품 상세 등)에서 판매처 API를 호출하지 않도록,
+가격 수집은 이 워커가 별도 프로세스로 전담한다.
+
+1. 수집 대상(due offer) 선정
+   - 기본: Redis 우선순위 큐(PriceRefreshScheduler)에서 due가 지난 오퍼를 꺼냄
+     (트래킹/알림 수요와 가격 변동성이 큰 오퍼일수록 자주 수집)
+   - Redis 사용 불가 시 SQL fallback:
+     last_fetched_at이 없거나 PRICE_COLLECTOR_INTERVAL_MINUTES보다 오래된 활성 오퍼,
+     ACTIVE 트래킹의 next_check_at이 지난 상품의 오퍼
+2. 판매처 API 호출: vendorItemId를 배치 한도(COUPANG_API_BATCH_SIZE)로 묶어 청크당 1회 호출,
+   전체 동시성(Semaphore) + 판매처별 초당 호출 한도(토큰 버킷, 청크 호출 1회 = 토큰 1개).
+   커넥션은 공용 CoupangApiClient의 HTTP/2 keep-alive 풀을 재사용
+3. 결과를 한 트랜잭션에서 bulk 저장 (PriceService.save_fetch_results)
+   - 오퍼별 지문(최종가/품절/할인 구성)이 바뀐 경우만 스냅샷, 오퍼 상태, 롤링 통계, 시간/일 롤업
+   - 지문이 같으면 last_fetched_at만 갱신 (쓰기량이 폴링 횟수가 아니라 가격 변화에 비례)
+   - 커밋 후 변경된 오퍼의 가격 이벤트를 스트림에 발행 (app.workers.alert_evaluator가 알림 평가)
+   - 변경된 상품의 핫딜 인덱스(카테고리별 ZSET) 증분 갱신, 캐시된 상품 상세 읽기 모델 재구성
+4. 보존 기간 정리: 원본 스냅샷/시간 롤업을 배치 단위로 삭제 (일 롤업은 영구 보존)
+
+실행:
+    python -m app.workers.price_collector          # 스케줄러로 상시 실행
+    python -m app.workers.price_collector --once   # 1회 수집 후 종료
+
+로컬 테스트 (가짜 쿠팡 서버):
+    python scripts/fake_coupang_server.py --port 8081
+    COUPANG_API_BASE_URL=http://localhost:8081 COUPANG_ACCESS_KEY=test COUPANG_SECRET_KEY=test \\
+        python -m app.workers.price_collector --once
+"""
+import argparse
+import asyncio
+import logging
+import signal
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy import select, or_, exists
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.offer import ProductOffer, Merchant
+from app.models.tracking import Tracking, TrackingStatus
+from app.services.coupang_api_client import (
+    CoupangApiClient, get_coupang_api_client, close_coupang_api_client
+)
+from app.services.price_service import PriceService
+from app.services.price_event_stream import PriceEventStream
+from app.services.hot_deal_index import HotDealIndex
+from app.services.product_service import ProductService
+from app.services.price_refresh_scheduler import PriceRefreshScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class MerchantRateLimiter:
+    """판매처 단위 토큰 버킷 (초당 rate건, 최대 rate건까지 버스트)"""
+
+    def __init__(self, rate_per_second: float):
+        self.rate = max(rate_per_second, 0.01)
+        self.capacity = max(self.rate, 1.0)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                # 토큰 1개가 찰 때까지 대기 (락을 잡은 채 기다려 순서 보장)
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class PriceCollector:
+    """due offer 선정 → 제한된 동시성으로 가격 조회 → bulk 저장"""
+
+    # 현재 가격 조회를 지원하는 판매처
+    SUPPORTED_MERCHANTS = (Merchant.COUPANG,)
+
+    def __init__(self, coupang_client: Optional[CoupangApiClient]):
+        self.coupang_client = coupang_client
+        self.semaphore = asyncio.Semaphore(settings.PRICE_COLLECTOR_CONCURRENCY)
+        self.rate_limiters: Dict[Merchant, MerchantRateLimiter] = {
+            Merchant.COUPANG: MerchantRateLimiter(settings.PRICE_COLLECTOR_COUPANG_RATE_PER_SECOND),
+        }
+
+    def _get_rate_limiter(self, merchant: Merchant) -> MerchantRateLimiter:
+        if merchant not in self.rate_limiters:
+            self.rate_limiters[merchant] = MerchantRateLimiter(settings.PRICE_COLLECTOR_DEFAULT_RATE_PER_SECOND)
+        return self.rate_limiters[merchant]
+
+    @staticmethod
+    async def get_due_offers(db: AsyncSession, now: datetime, limit: int) -> List[Any]:
+        """수집 대상 오퍼 (오래된 순, 한 번도 수집 안 된 오퍼 우선)"""
+        stale_before = now - timedelta(minutes=settings.PRICE_COLLECTOR_INTERVAL_MINUTES)
+        tracking_due = exists().where(
+            Tracking.product_id == ProductOffer.product_id,
+            Tracking.status == TrackingStatus.ACTIVE,
+            Tracking.next_check_at <= now,
+        )
+
+        result = await db.execute(
+            select(
+                ProductOffer.id,
+                ProductOffer.product_id,
+                ProductOffer.merchant,
+                ProductOffer.vendor_item_id,
+                ProductOffer.price_fingerprint,
+            )
+            .where(
+                ProductOffer.is_active == True,
+                ProductOffer.merchant.in_(PriceCollector.SUPPORTED_MERCHANTS),
+                ProductOffer.vendor_item_id.isnot(None),
+                or_(
+                    ProductOffer.last_fetched_at.is_(None),
+                    ProductOffer.last_fetched_at < stale_before,
+                    tracking_due,
+                ),
+            )
+            .order_by(ProductOffer.last_fetched_at.asc().nulls_first())
+            .limit(limit)
+        )
+        return list(result.all())
+
+    @staticmethod
+    async def get_offers_by_ids(db: AsyncSession, offer_ids: List[UUID]) -> List[Any]:
+        """큐에서 꺼낸 오퍼 조회 (비활성화된 오퍼는 제외)"""
+        if not offer_ids:
+            return []
+        result = await db.execute(
+            select(
+                ProductOffer.id,
+                ProductOffer.product_id,
+                ProductOffer.merchant,
+                ProductOffer.vendor_item_id,
+                ProductOffer.price_fingerprint,
+            )
+            .where(
+                ProductOffer.id.in_(offer_ids),
+                ProductOffer.is_active == True,
+                ProductOffer.merchant.in_(PriceCollector.SUPPORTED_MERCHANTS),
+                ProductOffer.vendor_item_id.isnot(None),
+            )
+        )
+        return list(result.all())
+
+    async def _fetch_chunk(self, merchant: Merchant, offers: List[Any]) -> List[Dict[str, Any]]:
+        """오퍼 청크 가격 조회 (API 호출 1회, 예외는 청크 전체의 error로 변환)"""
+        results = [
+            {
+                "offer_id": offer.id,
+                "product_id": offer.product_id,
+                "source": f"{merchant.value}_API",
+                "price_data": None,
+                "error": None,
+                "previous_fingerprint": offer.price_fingerprint,
+            }
+            for offer in offers
+        ]
+        async with self.semaphore:
+            await self._get_rate_limiter(merchant).acquire()
+            try:
+                if merchant == Merchant.COUPANG:
+                    prices = await self.coupang_client.get_product_prices(
+                        [offer.vendor_item_id for offer in offers]
+                    )
+                    for offer, result in zip(offers, results):
+                        result["price_data"] = prices.get(offer.vendor_item_id)
+                        if result["price_data"] is None:
+                            result["error"] = "응답에 vendor_item_id 없음"
+            except Exception as e:
+                for result in results:
+                    result["error"] = str(e)
+        return results
+
+    def _chunk_offers(self, offers: List[Any]) -> List[tuple]:
+        """판매처별로 묶은 뒤 API 배치 한도 단위로 분할"""
+        by_merchant: Dict[Merchant, List[Any]] = {}
+        for offer in offers:
+            by_merchant.setdefault(offer.merchant, []).append(offer)
+
+        chunks = []
+        batch_size = self.coupang_client.batch_size
+        for merchant, merchant_offers in by_merchant.items():
+            for start in range(0, len(merchant_offers), batch_size):
+                chunks.append((merchant, merchant_offers[start:start + batch_size]))
+        return chunks
+
+    async def collect_once(self) -> Dict[str, int]:
+        """1회 수집 (스케줄러 틱마다 호출)"""
+        if self.coupang_client is None:
+            logger.warning("[PriceCollector] ⚠️ 쿠팡 API 클라이언트 없음, 수집 건너뜀")
+            return {"due": 0, "snapshots": 0, "unchanged": 0, "failed": 0}
+
+        start_time = time.time()
+        now = datetime.now(timezone.utc)
+
+        async with AsyncSessionLocal() as session:
+            claimed_ids = await PriceRefreshScheduler.claim_due(settings.PRICE_COLLECTOR_BATCH_SIZE)
+            if claimed_ids is None:
+                due_offers = await PriceCollector.get_due_offers(
+                    session, now, settings.PRICE_COLLECTOR_BATCH_SIZE
+                )
+            else:
+                due_offers = await PriceCollector.get_offers_by_ids(session, claimed_ids)
+                found_ids = {offer.id for offer in due_offers}
+                await PriceRefreshScheduler.remove([i for i in claimed_ids if i not in found_ids])
+        if not due_offers:
+            logger.debug("[PriceCollector] 수집 대상 없음")
+            return {"due": 0, "snapshots": 0, "unchanged": 0, "failed": 0}
+
+        logger.info(f"[PriceCollector] 🛒 가격 수집 시작: {len(due_offers)}개 오퍼")
+        chunk_results = await asyncio.gather(
+            *(self._fetch_chunk(merchant, offers) for merchant, offers in self._chunk_offers(due_offers))
+        )
+        results = [result for chunk in chunk_results for result in chunk]
+
+        fetched_at = datetime.now(timezone.utc)
+        async with AsyncSessionLocal() as session:
+            try:
+                stats = await PriceService.save_fetch_results(
+                    session,
+                    results,
+                    fetched_at,
+                    timedelta(minutes=settings.PRICE_COLLECTOR_INTERVAL_MINUTES),
+                )
+                # 수집한 오퍼의 다음 due 계산 → 큐/트래킹 next_check_at 반영
+                await PriceRefreshScheduler.schedule_offers(
+                    session, [r["offer_id"] for r in results]
+                )
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+            # 커밋된 가격 변경만 발행 (알림 평가 워커가 소비) + 핫딜 인덱스/상세 읽기 모델 갱신
+            events = stats.pop("events")
+            changed_product_ids = list({event["product_id"] for event in events})
+            await PriceEventStream.publish(events)
+            await HotDealIndex.refresh_products(session, changed_product_ids)
+            await ProductService.refresh_detail_read_models(session, changed_product_ids)
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.info(
+            f"[PriceCollector] ✅ 가격 수집 완료: 대상={len(due_offers)}, "
+            f"스냅샷={stats['snapshots']}, 변경없음={stats['unchanged']}, 실패={stats['failed']}, "
+            f"소요시간={duration_ms}ms"
+        )
+        return {"due": len(due_offers), **stats}
+
+    @staticmethod
+    async def rebuild_queue() -> None:
+        """스케줄 작업: 우선순위 큐 전체 재계산 (수요/변동성 변화 반영, 큐 유실 복구)"""
+        try:
+            async with AsyncSessionLocal() as session:
+                await PriceRefreshScheduler.rebuild_queue(session)
+        except Exception as e:
+            logger.error(f"[PriceCollector] ❌ 우선순위 큐 재구성 실패: {e}", exc_info=True)
+
+    @staticmethod
+    async def rebuild_hot_deals() -> None:
+        """스케줄 작업: 핫딜 인덱스 전체 재구성 (증분 갱신 누락 복구)"""
+        try:
+            async with AsyncSessionLocal() as session:
+                await HotDealIndex.rebuild(session)
+        except Exception as e:
+            logger.error(f"[PriceCollector] ❌ 핫딜 인덱스 재구성 실패: {e}", exc_info=True)
+
+    @staticmethod
+    async def prune_retention() -> None:
+        """스케줄 작업: 보존 기간이 지난 원본 스냅샷/시간 롤업을 배치 단위로 삭제"""
+        now = datetime.now(timezone.utc)
+        targets = (
+            ("price_snapshots", "captured_at", now - timedelta(days=settings.PRICE_SNAPSHOT_RETENTION_DAYS)),
+            ("price_rollups_hourly", "bucket_start", now - timedelta(days=settings.PRICE_ROLLUP_HOURLY_RETENTION_DAYS)),
+        )
+        batch_size = settings.PRICE_RETENTION_BATCH_SIZE
+
+        for table_name, time_column, cutoff in targets:
+            total_deleted = 0
+            try:
+                while True:
+                    # 배치마다 커밋해서 락/WAL이 한 번에 몰리지 않게 함
+                    async with AsyncSessionLocal() as session:
+                        deleted = await PriceService.prune_batch(
+                            session, table_name, time_column, cutoff, batch_size
+                        )
+                        await session.commit()
+                    total_deleted += deleted
+                    if deleted < batch_size:
+                        break
+                    await asyncio.sleep(0)
+                logger.info(f"[PriceCollector] 🗑️ 보존 기간 정리: {table_name} {total_deleted}행 삭제")
+            except Exception as e:
+                logger.error(f"[PriceCollector] ❌ 보존 기간 정리 실패: {table_name}, error={e}", exc_info=True)
+
+    async def run_tick(self) -> None:
+        """스케줄 작업: 예외가 스케줄러를 멈추지 않도록 로깅만"""
+        try:
+            await self.collect_once()
+        except Exception as e:
+            logger.error(f"[PriceCollector] ❌ 가격 수집 실패: {e}", exc_info=True)
+
+
+async def _main(run_once: bool) -> None:
+    # 공용 클라이언트: 워커 수명 동안 HTTP/2 keep-alive 커넥션 재사용
+    collector = PriceCollector(get_coupang_api_client())
+    try:
+        if run_once:
+            if await PriceRefreshScheduler.is_queue_empty():
+                await PriceCollector.rebuild_queue()
+            await collector.collect_once()
+            return
+
+        # 첫 틱 전에 큐/핫딜 인덱스를 채워둠
+        await PriceCollector.rebuild_queue()
+        await PriceCollector.rebuild_hot_deals()
+
+        scheduler = AsyncIOScheduler(timezone="UTC")
+        scheduler.add_job(
+            PriceCollector.rebuild_queue,
+            "interval",
+            minutes=settings.PRICE_REFRESH_REBUILD_MINUTES,
+            id="price_refresh_rebuild",
+            max_instances=1,
+            coalesce=True,
+        )
+        scheduler.add_job(
+            PriceCollector.rebuild_hot_deals,
+            "interval",
+            minutes=settings.HOT_DEAL_REBUILD_MINUTES,
+            id="hot_deal_rebuild",
+            max_instances=1,
+            coalesce=True,
+        )
+        scheduler.add_job(
+            PriceCollector.prune_retention,
+            "interval",
+            hours=settings.PRICE_RETENTION_INTERVAL_HOURS,
+            id="price_retention",
+            max_instances=1,
+            coalesce=True,
+        )
+        scheduler.add_job(
+            collector.run_tick,
+            "interval",
+            seconds=settings.PRICE_COLLECTOR_TICK_SECONDS,
+            next_run_time=datetime.now(timezone.utc),
+            id="price_collector",
+            max_instances=1,
+            coalesce=True,
+        )
+        scheduler.start()
+        logger.info(
+            f"[PriceCollector] ✅ 워커 시작: {settings.PRICE_COLLECTOR_TICK_SECONDS}초 주기, "
+            f"동시성={settings.PRICE_COLLECTOR_CONCURRENCY}, 배치={settings.PRICE_COLLECTOR_BATCH_SIZE}"
+        )
+
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop_event.set)
+        await stop_event.wait()
+
+        scheduler.shutdown(wait=False)
+        logger.info("[PriceCollector] 워커 종료")
+    finally:
+        await close_coupang_api_client()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="가격 수집 워커")
+    parser.add_argument("--once", action="store_true", help="1회 수집 후 종료")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main(args.once))
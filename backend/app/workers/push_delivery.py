@@ -0,0 +1,152 @@
+"""
+알림 푸시 발송 워커
+
+알림 평가 워커가 alert_events(PENDING)를 커밋한 뒤 발행한 발송 건을 소비자 그룹으로 읽어
+배치 단위로 푸시를 보내고 결과를 alert_events에 일괄 기록한다 (PushDeliveryService).
+
+1. 오래 ACK되지 않은 발송 건 회수 (XAUTOCLAIM, 죽은 소비자 복구)
+2. 새 발송 건 읽기 (XREADGROUP BLOCK, 최대 PUSH_DELIVERY_BATCH_SIZE건)
+3. 재시도 시각이 지난 발송 건 꺼내기 (백오프 ZSET)
+4. 병합/중복 방지 → 제공자별 배치 발송 → alert_events/push_tokens 일괄 갱신 → 커밋 → XACK
+5. PUSH_PENDING_RECOVERY_MINUTES마다 발행이 누락된 PENDING 건을 스트림에 다시 넣음
+
+실행:
+    python -m app.workers.push_delivery
+
+로컬 테스트 (가짜 푸시 게이트웨이):
+    python scripts/fake_push_server.py --port 8082 --invalid-rate 0.01 --error-rate 0.05
+    PUSH_API_BASE_URL=http://localhost:8082 python -m app.workers.push_delivery
+"""
+import asyncio
+import logging
+import os
+import signal
+import socket
+import time
+from typing import Dict, List, Tuple
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.core.redis import create_blocking_redis
+from app.db.session import AsyncSessionLocal
+from app.services.push_client import PushClient, get_push_client
+from app.services.push_delivery_queue import PushDeliveryQueue
+from app.services.push_delivery_service import PushDeliveryService
+
+logger = logging.getLogger(__name__)
+
+
+class PushDeliveryWorker:
+    """푸시 발송 소비 루프"""
+
+    def __init__(self, client: PushClient):
+        self.client = client
+        self.group = settings.PUSH_DELIVERY_GROUP
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self.last_claim_at = 0.0
+        self.last_recovery_at = 0.0
+
+    async def _next_messages(self, client: redis.Redis) -> List[Tuple[str, Dict[str, str]]]:
+        """회수할 발송 건이 있으면 먼저, 없으면 새 발송 건 대기"""
+        if time.monotonic() - self.last_claim_at >= settings.PUSH_DELIVERY_CLAIM_IDLE_MS / 1000:
+            self.last_claim_at = time.monotonic()
+            claimed = await PushDeliveryQueue.claim_stale(
+                client, self.group, self.consumer,
+                settings.PUSH_DELIVERY_CLAIM_IDLE_MS, settings.PUSH_DELIVERY_BATCH_SIZE
+            )
+            if claimed:
+                logger.info(f"[PushDelivery] 미처리 발송 건 회수: {len(claimed)}건")
+                return claimed
+        return await PushDeliveryQueue.read_group(
+            client, self.group, self.consumer,
+            settings.PUSH_DELIVERY_BATCH_SIZE, settings.PUSH_DELIVERY_BLOCK_MS
+        )
+
+    async def handle(self, client: redis.Redis, messages: List[Tuple[str, Dict[str, str]]]) -> None:
+        """발송 건 배치 + due 재시도 처리 → 커밋 → ACK"""
+        start_time = time.time()
+        fresh = []
+        for message_id, fields in messages:
+            try:
+                fresh.append(PushDeliveryQueue.decode(fields))
+            except (KeyError, ValueError) as e:
+                # 형식이 깨진 발송 건은 재시도해도 같으므로 로그만 남기고 ACK
+                logger.warning(f"[PushDelivery] ⚠️ 잘못된 발송 건 건너뜀: id={message_id}, error={e}")
+        retries = await PushDeliveryQueue.claim_due_retries(client, settings.PUSH_DELIVERY_BATCH_SIZE)
+        if not fresh and not retries:
+            await PushDeliveryQueue.ack(client, self.group, [message_id for message_id, _ in messages])
+            return
+
+        async with AsyncSessionLocal() as session:
+            try:
+                stats = await PushDeliveryService.deliver(session, self.client, fresh, retries)
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                if retries:
+                    # 꺼낸 재시도 건은 스트림 재전달이 없으므로 바로 다시 예약
+                    await PushDeliveryQueue.schedule_retries(client, [(item, time.time()) for item in retries])
+                raise
+
+        await PushDeliveryQueue.ack(client, self.group, [message_id for message_id, _ in messages])
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.info(
+            f"[PushDelivery] 📤 발송 처리: 발송={stats['sent']}, 실패={stats['failed']}, "
+            f"재시도 예약={stats['retried']}, 중복 생략={stats['deduped']} "
+            f"(발송 건 {len(fresh)}건 + 재시도 {len(retries)}건, 소요시간={duration_ms}ms)"
+        )
+
+    async def recover_unpublished(self) -> None:
+        """스트림 발행이 누락된 PENDING 발송 건 재발행"""
+        if time.monotonic() - self.last_recovery_at < settings.PUSH_PENDING_RECOVERY_MINUTES * 60:
+            return
+        self.last_recovery_at = time.monotonic()
+        async with AsyncSessionLocal() as session:
+            notifications = await PushDeliveryService.find_unpublished(session, settings.PUSH_DELIVERY_BATCH_SIZE)
+        if notifications:
+            published = await PushDeliveryQueue.publish(notifications)
+            logger.info(f"[PushDelivery] 발행 누락 발송 건 재발행: {published}건")
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        client = create_blocking_redis(settings.PUSH_DELIVERY_BLOCK_MS / 1000)
+        try:
+            await PushDeliveryQueue.ensure_group(client, self.group)
+            logger.info(f"[PushDelivery] ✅ 워커 시작: group={self.group}, consumer={self.consumer}")
+
+            while not stop_event.is_set():
+                try:
+                    await self.recover_unpublished()
+                    # 새 발송 건이 없어도 BLOCK 시간마다 한 번씩 재시도 대기열을 확인
+                    messages = await self._next_messages(client)
+                    await self.handle(client, messages)
+                except redis.RedisError as e:
+                    logger.warning(f"[PushDelivery] Redis 오류, 1초 후 재시도: {e}")
+                    await asyncio.sleep(1)
+                except Exception as e:
+                    # ACK하지 않았으므로 claim idle 이후 다시 처리됨
+                    logger.error(f"[PushDelivery] ❌ 발송 처리 실패: {e}", exc_info=True)
+                    await asyncio.sleep(1)
+        finally:
+            await client.close()
+            logger.info("[PushDelivery] 워커 종료")
+
+
+async def _main() -> None:
+    push_client = get_push_client()
+    if push_client is None:
+        return
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+    try:
+        await PushDeliveryWorker(push_client).run(stop_event)
+    finally:
+        await push_client.aclose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main())
@@ -0,0 +1,119 @@
+"""
+가짜 쿠팡 파트너스 API 서버 (가격 수집 워커 로컬 테스트용)
+
+vendor_item_id 기준으로 안정적인 기준 가격을 만들고, 요청마다 약간씩 흔들어서 응답한다.
+지연/에러율/429 비율/품절률은 옵션으로 조절한다.
+배치 조회(/products/prices?vendorItemIds=1,2,3)와 단건 조회를 모두 지원한다.
+
+사용 방법:
+    cd backend
+    python scripts/fake_coupang_server.py --port 8081 --latency-ms 50 --error-rate 0.05 --throttle-rate 0.02
+
+워커를 이 서버로 향하게 하려면:
+    COUPANG_API_BASE_URL=http://localhost:8081 COUPANG_ACCESS_KEY=test COUPANG_SECRET_KEY=test \\
+        python -m app.workers.price_collector --once
+"""
+import argparse
+import asyncio
+import random
+
+import uvicorn
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import JSONResponse
+
+app = FastAPI(title="Fake Coupang Partners API")
+
+config = {
+    "latency_ms": 0,
+    "error_rate": 0.0,
+    "throttle_rate": 0.0,
+    "sold_out_rate": 0.02,
+    "jitter_pct": 0.05,
+}
+request_count = {"total": 0, "items": 0, "throttled": 0}
+
+
+def _base_price(vendor_item_id: int) -> int:
+    """vendor_item_id마다 고정된 기준 가격 (1만~10만원, 100원 단위)"""
+    return 10000 + (vendor_item_id * 7919 % 900) * 100
+
+
+def _fake_item(vendor_item_id: int) -> dict:
+    base = _base_price(vendor_item_id)
+    jitter = 1 + random.uniform(-config["jitter_pct"], config["jitter_pct"])
+    sale_price = int(base * jitter) // 10 * 10
+
+    return {
+        "vendorItemId": vendor_item_id,
+        "rPrice": base,
+        "salePrice": sale_price,
+        "shippingFee": 0 if sale_price >= 19800 else 3000,
+        "couponDiscount": random.choice([0, 0, 1000, 2000]),
+        "cardDiscount": 0,
+        "stockStatus": "SOLD_OUT" if random.random() < config["sold_out_rate"] else "IN_STOCK",
+    }
+
+
+async def _simulate_upstream() -> JSONResponse | None:
+    """지연 + 429/5xx 주입 (정상이면 None)"""
+    request_count["total"] += 1
+
+    if config["latency_ms"]:
+        await asyncio.sleep(config["latency_ms"] / 1000)
+    if random.random() < config["throttle_rate"]:
+        request_count["throttled"] += 1
+        return JSONResponse(status_code=429, content={"rCode": "429"}, headers={"Retry-After": "1"})
+    if random.random() < config["error_rate"]:
+        raise HTTPException(status_code=503, detail="fake upstream error")
+    return None
+
+
+# 배치 조회를 단건 경로보다 먼저 등록 ("prices"가 {vendor_item_id}로 매칭되지 않도록)
+@app.get("/v2/providers/affiliate_open_api/apis/openapi/products/prices")
+async def get_product_prices(vendor_item_ids: str = Query(..., alias="vendorItemIds")):
+    throttled = await _simulate_upstream()
+    if throttled is not None:
+        return throttled
+
+    ids = [int(i) for i in vendor_item_ids.split(",") if i]
+    request_count["items"] += len(ids)
+    return {"rCode": "0", "data": [_fake_item(vendor_item_id) for vendor_item_id in ids]}
+
+
+@app.get("/v2/providers/affiliate_open_api/apis/openapi/products/{vendor_item_id}")
+async def get_product(vendor_item_id: int):
+    throttled = await _simulate_upstream()
+    if throttled is not None:
+        return throttled
+
+    request_count["items"] += 1
+    return {"rCode": "0", "data": _fake_item(vendor_item_id)}
+
+
+@app.get("/_stats")
+async def stats():
+    """수신한 요청/상품/429 수 (워커 동시성/레이트 리밋/배치 효율 확인용)"""
+    return {
+        "requests": request_count["total"],
+        "items": request_count["items"],
+        "throttled": request_count["throttled"],
+        "config": config,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="가짜 쿠팡 API 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency-ms", type=int, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--sold-out-rate", type=float, default=0.02)
+    args = parser.parse_args()
+
+    config["latency_ms"] = args.latency_ms
+    config["error_rate"] = args.error_rate
+    config["throttle_rate"] = args.throttle_rate
+    config["sold_out_rate"] = args.sold_out_rate
+
+    uvicorn.run(app, host=args.host, port=args.port)
@@ -0,0 +1,89 @@
+"""
+가짜 푸시 게이트웨이 (푸시 발송 워커 로컬 테스트용)
+
+POST /v1/push/{provider}/send 로 받은 메시지마다 결과를 돌려준다.
+토큰 문자열로 결과를 고정할 수 있다 ("invalid-"로 시작하면 INVALID_TOKEN, "flaky-"면 UNAVAILABLE).
+지연/요청 단위 5xx·429 비율/메시지 단위 무효 토큰 비율은 옵션으로 조절한다.
+
+사용 방법:
+    cd backend
+    python scripts/fake_push_server.py --port 8082 --latency-ms 30 --error-rate 0.05 --invalid-rate 0.01
+
+워커를 이 서버로 향하게 하려면:
+    PUSH_API_BASE_URL=http://localhost:8082 python -m app.workers.push_delivery
+"""
+import argparse
+import asyncio
+import random
+
+import uvicorn
+from fastapi import Body, FastAPI, HTTPException
+from fastapi.responses import JSONResponse
+
+app = FastAPI(title="Fake Push Gateway")
+
+config = {
+    "latency_ms": 0,
+    "error_rate": 0.0,
+    "throttle_rate": 0.0,
+    "invalid_rate": 0.0,
+}
+counts = {"requests": 0, "messages": 0, "delivered": 0, "invalid": 0, "unavailable": 0, "throttled": 0}
+# 토큰별 수신 횟수 (중복 발송 확인용)
+deliveries_by_token: dict = {}
+
+
+def _result_for(token: str) -> dict:
+    if token.startswith("invalid-") or random.random() < config["invalid_rate"]:
+        counts["invalid"] += 1
+        return {"status": "error", "error": "INVALID_TOKEN"}
+    if token.startswith("flaky-"):
+        counts["unavailable"] += 1
+        return {"status": "error", "error": "UNAVAILABLE"}
+    counts["delivered"] += 1
+    deliveries_by_token[token] = deliveries_by_token.get(token, 0) + 1
+    return {"status": "ok"}
+
+
+@app.post("/v1/push/{provider}/send")
+async def send(provider: str, payload: dict = Body(...)):
+    counts["requests"] += 1
+    if config["latency_ms"]:
+        await asyncio.sleep(config["latency_ms"] / 1000)
+    if random.random() < config["throttle_rate"]:
+        counts["throttled"] += 1
+        return JSONResponse(status_code=429, content={"error": "QUOTA_EXCEEDED"}, headers={"Retry-After": "1"})
+    if random.random() < config["error_rate"]:
+        raise HTTPException(status_code=503, detail="fake gateway error")
+
+    messages = payload.get("messages", [])
+    counts["messages"] += len(messages)
+    return {"results": [_result_for(message["token"]) for message in messages]}
+
+
+@app.get("/_stats")
+async def stats():
+    """요청/메시지/결과 수와 중복 수신 토큰 수 (배치 효율/중복 방지 확인용)"""
+    return {
+        **counts,
+        "duplicate_tokens": sum(1 for count in deliveries_by_token.values() if count > 1),
+        "config": config,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="가짜 푸시 게이트웨이")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8082)
+    parser.add_argument("--latency-ms", type=int, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="요청 단위 503 비율")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="요청 단위 429 비율")
+    parser.add_argument("--invalid-rate", type=float, default=0.0, help="메시지 단위 INVALID_TOKEN 비율")
+    args = parser.parse_args()
+
+    config["latency_ms"] = args.latency_ms
+    config["error_rate"] = args.error_rate
+    config["throttle_rate"] = args.throttle_rate
+    config["invalid_rate"] = args.invalid_rate
+
+    uvicorn.run(app, host=args.host, port=args.port)